@@ -20,6 +20,8 @@ from .engine import Engine, GameState
 from .components import PositionComponent, StatsComponent, MapComponent, MonsterComponent, InventoryComponent, LevelComponent, LootComponent, PlayerComponent
 from .data_manager import ItemDefinition
 from .constants import ELEMENT_NONE
+from .pathfinding import PathCache
+from .clock import FakeClock
 
 class HeadlessUI:
     """UI 메서드를 무시하거나 로그로 남기는 가짜 UI 클래스"""
@@ -31,6 +33,8 @@ class HeadlessUI:
     def show_class_selection(self, class_defs): return "WARRIOR"
     def show_save_list(self, files): return "LOAD", ""
     def show_confirmation_dialog(self, msg): return True
+    def show_repair_menu(self, items, game_renderer=None): return None
+    def show_skill_selection_menu(self, skills, game_renderer=None): return None
     def draw_text(self, x, y, text, color="white"): pass
     def render_all(self, engine): pass
     def trigger_shake(self, intensity=2): pass
@@ -47,22 +51,27 @@ class MockRenderer:
     def draw_text(self, *args, **kwargs): pass
     def draw_box(self, *args, **kwargs): pass
     def render(self): pass
+    def invalidate(self, clear=False): pass
 
 class HeadlessEngine(Engine):
     """터미널 및 입출력 의존성이 없는 시뮬레이션용 엔진"""
-    def __init__(self, player_name="Tester", game_data=None):
+    TURN_SECONDS = 1.0 # 에이전트가 한 번 판단(행동)하는 간격
+    def __init__(self, player_name="Tester", game_data=None, seed=None, floor_cache=None, turbo=False):
         # Renderer 생성을 피하기 위해 Renderer 클래스를 Mock으로 패치
-        from . import renderer
-        original_renderer = renderer.Renderer
-        renderer.Renderer = MockRenderer
+        from . import engine as engine_module
+        original_renderer = engine_module.Renderer
+        engine_module.Renderer = MockRenderer
         
-        super().__init__(player_name, game_data)
+        # seed를 지정하면 층 구조/스폰/함정/전리품이 재현되며, floor_cache로 맵 재생성을 건너뛸 수 있음
+        # 시스템의 action_delay는 가짜 시계로 진행 (time.time 전역 패치 없이 턴 단위로 시간을 흘림)
+        super().__init__(player_name, game_data, seed=seed, floor_cache=floor_cache, clock=FakeClock(1000.0), turbo=turbo)
         
         # 원복 (다른 인스턴스에 영향을 주지 않도록)
-        renderer.Renderer = original_renderer
+        engine_module.Renderer = original_renderer
         
         self.ui = HeadlessUI()
         self.agent_actions = []
+        self.agent_paths = PathCache() # 에이전트 이동 경로 (방 그래프 + A*)
         self.max_turns = 2000 # 넉넉하게
         self.current_turns = 0
         self.is_headless = True
@@ -72,7 +81,6 @@ class HeadlessEngine(Engine):
         """UI 없이 실행되는 메인 루프 오버라이드"""
         self.ui = ui or HeadlessUI()
         self.is_running = True
-        self.fake_time = 1000.0
         self.metrics = {
             "start_time": time.time(),
             "turns": 0,
@@ -88,107 +96,102 @@ class HeadlessEngine(Engine):
             "boss_lv": 0
         }
         
-        # time.time() 패치 (시스템의 action_delay 우회용)
-        import time as true_time
-        from unittest.mock import patch
-        
-        def mock_time():
-            return self.fake_time
-
+        start_clock = self.world.clock.now()
         try:
-            with patch('time.time', side_effect=mock_time):
-                # 0. 여정 시뮬레이션
-                player = self.world.get_player_entity()
-                if player:
-                    stats = player.get_component(StatsComponent)
-                    self.metrics["journey_hp_loss"] = int(stats.max_hp * random.uniform(0.1, 0.2))
-                    self.metrics["journey_mp_loss"] = int(stats.max_mp * random.uniform(0.1, 0.3))
-                    stats.current_hp = max(1, stats.current_hp - self.metrics["journey_hp_loss"])
-                    stats.current_mp = max(0, stats.current_mp - self.metrics["journey_mp_loss"])
-
-                combat_started = False
-                boss_hp = 0 # Initialize here to prevent UnboundLocalError
+            # 0. 여정 시뮬레이션
+            player = self.world.get_player_entity()
+            if player:
+                stats = player.get_component(StatsComponent)
+                self.metrics["journey_hp_loss"] = int(stats.max_hp * random.uniform(0.1, 0.2))
+                self.metrics["journey_mp_loss"] = int(stats.max_mp * random.uniform(0.1, 0.3))
+                stats.current_hp = max(1, stats.current_hp - self.metrics["journey_hp_loss"])
+                stats.current_mp = max(0, stats.current_mp - self.metrics["journey_mp_loss"])
+
+            combat_started = False
+            boss_hp = 0 # Initialize here to prevent UnboundLocalError
+            
+            while self.is_running and self.current_turns < self.max_turns:
+                self.current_turns += 1
+                self.world.clock.advance(self._turn_step()) # 턴마다 TURN_SECONDS씩 진행 (터보: 빈 구간은 한 번에 건너뜀)
+                self.metrics["turns"] = self.current_turns
                 
-                while self.is_running and self.current_turns < self.max_turns:
-                    self.current_turns += 1
-                    self.fake_time += 1.0 # 턴마다 1초씩 진행 가정
-                    self.metrics["turns"] = self.current_turns
-                    
-                    # 1. 에이전트 입력 시뮬레이션
-                    if self.state == GameState.PLAYING:
-                        if self.current_turns == 1 and self.dungeon_map.map_type == "BOSS":
-                            self._teleport_to_boss()
-                            self._scale_boss_level()
-
-                        action = self._get_smart_agent_action()
-                        if action:
-                            self.input_system.handle_input(action)
-                    
-                    # 2. 로직 처리
-                    if self.state == GameState.PLAYING:
-                        self.world.event_manager.process_events()
-                        for system in self.world._systems:
-                            if system: system.process()
-
-                        # 이벤트 스니핑 (패턴 발동 확인) - process_events 전/후에 큐가 비워짐
-                        from .events import MessageEvent, SoundEvent
-                        
-                        # [Debug] Monitor HP
-                        p = self.world.get_player_entity()
-                        if p:
-                            s = p.get_component(StatsComponent)
-                            # sys.stdout.write(f"Turn {self.current_turns} HP: {s.current_hp}/{s.max_hp} MP: {s.current_mp}\n")
-                            if s.current_hp <= 0:
-                                print(f"DEBUG: Player DIED at turn {self.current_turns}")
-
-                        for event in list(self.world.event_manager.event_queue):
-                            if isinstance(event, MessageEvent):
-                                if "[" in event.text and "]" in event.text:
-                                    self.metrics["boss_patterns"].append(event.text)
-                            elif isinstance(event, SoundEvent):
-                                if "BOSS" in event.sound_type:
-                                    self.metrics["boss_patterns"].append(f"Sound: {event.sound_type} - {event.message}")
-
-                        self.world.event_manager.process_events()
-                        self._bypass_obstacles()
-
-                    # 플레이어 사망/생존 체크
-                    player = self.world.get_player_entity()
-                    if not player or not player.get_component(StatsComponent).is_alive:
-                        self.is_running = False
-                        self.game_result = "DEATH"
-                        break
-                    
-                    # 보스 상태 체크 및 교전 시작 인식
-                    boss_alive = False
-                    boss_hp = 0
-                    for m_ent in self.world.get_entities_with_components({MonsterComponent}):
-                        m = m_ent.get_component(MonsterComponent)
-                        s = m_ent.get_component(StatsComponent)
-                        if s and ("BOSS" in s.flags or m.monster_id in ["BUTCHER", "LEORIC", "LICH_KING", "DIABLO"]):
-                            if s.is_alive:
-                                boss_alive = True
-                                boss_hp = s.current_hp
-                                self.metrics["boss_id"] = m.monster_id
-                                # 플레이어와의 거리가 가까우면 교전 중으로 간주
-                                p_pos = player.get_component(PositionComponent)
-                                m_pos = m_ent.get_component(PositionComponent)
-                                dist = abs(p_pos.x - m_pos.x) + abs(p_pos.y - m_pos.y)
-                                if dist < 5:
-                                    combat_started = True
-                                break
+                # 1. 에이전트 입력 시뮬레이션
+                if self.state == GameState.PLAYING:
+                    if self.current_turns == 1 and self.dungeon_map.map_type == "BOSS":
+                        self._teleport_to_boss()
+                        self._scale_boss_level()
+
+                    action = self._get_smart_agent_action()
+                    if action:
+                        self.input_system.handle_input(action)
+                
+                # 2. 로직 처리
+                if self.state == GameState.PLAYING:
+                    self.world.event_manager.process_events()
+                    for system in self.world._systems:
+                        # [Turbo] 이번 턴에 할 일(예약된 행동, 이동 요청 등)이 없는 시스템은 건너뜀
+                        if system and (not self.turbo or system.has_work()): system.process()
+
+                    # 이벤트 스니핑 (패턴 발동 확인) - process_events 전/후에 큐가 비워짐
+                    from .events import MessageEvent, SoundEvent
                     
-                    if combat_started:
-                        self.metrics["combat_turns"] += 1
+                    # [Debug] Monitor HP
+                    p = self.world.get_player_entity()
+                    if p:
+                        s = p.get_component(StatsComponent)
+                        # sys.stdout.write(f"Turn {self.current_turns} HP: {s.current_hp}/{s.max_hp} MP: {s.current_mp}\n")
+                        if s.current_hp <= 0:
+                            print(f"DEBUG: Player DIED at turn {self.current_turns}")
+
+                    for event in list(self.world.event_manager.event_queue):
+                        if isinstance(event, MessageEvent):
+                            if "[" in event.text and "]" in event.text:
+                                self.metrics["boss_patterns"].append(event.text)
+                        elif isinstance(event, SoundEvent):
+                            if "BOSS" in event.sound_type:
+                                self.metrics["boss_patterns"].append(f"Sound: {event.sound_type} - {event.message}")
+
+                    self.world.event_manager.process_events()
+                    self._bypass_obstacles()
+
+                # 플레이어 사망/생존 체크
+                player = self.world.get_player_entity()
+                if not player or not player.get_component(StatsComponent).is_alive:
+                    self.is_running = False
+                    self.game_result = "DEATH"
+                    break
+                
+                # 보스 상태 체크 및 교전 시작 인식
+                boss_alive = False
+                boss_hp = 0
+                for m_ent in self.world.get_entities_with_components({MonsterComponent}):
+                    m = m_ent.get_component(MonsterComponent)
+                    s = m_ent.get_component(StatsComponent)
+                    if s and ("BOSS" in s.flags or m.monster_id in ["BUTCHER", "LEORIC", "LICH_KING", "DIABLO"]):
+                        if s.is_alive:
+                            boss_alive = True
+                            boss_hp = s.current_hp
+                            self.metrics["boss_id"] = m.monster_id
+                            # 플레이어와의 거리가 가까우면 교전 중으로 간주
+                            p_pos = player.get_component(PositionComponent)
+                            m_pos = m_ent.get_component(PositionComponent)
+                            dist = abs(p_pos.x - m_pos.x) + abs(p_pos.y - m_pos.y)
+                            if dist < 5:
+                                combat_started = True
+                            break
+                
+                if combat_started:
+                    self.metrics["combat_turns"] += 1
 
-                    if not boss_alive and self.dungeon_map.map_type == "BOSS":
-                        self.is_running = False
-                        self.game_result = "WIN"
-                        break
+                if not boss_alive and self.dungeon_map.map_type == "BOSS":
+                    self.is_running = False
+                    self.game_result = "WIN"
+                    break
 
-                if self.game_result == "NONE":
-                    self.game_result = "TIMEOUT"
-            
+            if self.game_result == "NONE":
+                self.game_result = "TIMEOUT"
+        
+            self.metrics["sim_seconds"] = self.world.clock.now() - start_clock
             self.metrics["outcome"] = self.game_result
             self.metrics["boss_hp_at_end"] = boss_hp
             return self.game_result
@@ -198,6 +201,23 @@ class HeadlessEngine(Engine):
             traceback.print_exc()
             return "ERROR"
 
+    def _turn_step(self) -> float:
+        """
+        다음 턴까지 진행할 시간. 기본은 TURN_SECONDS (에이전트는 턴마다 한 번 판단).
+        터보 모드에서는 다음 예약 시각(상태 타이머, 몬스터/보스 행동, 에이전트 자신이 다시 행동할 수 있는 시각)까지
+        한 턴으로 건너뜁니다. 플레이어가 기절/수면/석화로 묶여 있고 그 사이 예약된 것도 없으면 빈 구간을 통째로 넘깁니다.
+        """
+        if not self.turbo:
+            return self.TURN_SECONDS
+        next_time = self.next_scheduled_time(include_player=True)
+        if next_time is None:
+            return self.TURN_SECONDS
+        return max(self.TURN_SECONDS, next_time - self.world.clock.now())
+
+    def player_step_interval(self) -> float:
+        """에이전트는 턴마다 한 번만 움직이므로 한 칸에 적어도 한 턴이 걸림"""
+        return max(self.TURN_SECONDS, super().player_step_interval())
+
     def _scale_boss_level(self):
         """보스 레벨을 플레이어 레벨 + 3으로 보정"""
         player = self.world.get_player_entity()
@@ -248,9 +268,10 @@ class HeadlessEngine(Engine):
         if not player: return
         p_pos = player.get_component(PositionComponent)
 
-        # 맵상의 모든 문 개방 (전역 개방)
-        interactables = self.world.get_entities_with_components({PositionComponent})
-        for ent in interactables:
+        # 맵상의 모든 문 개방 (전역 개방) - 문/스위치 색인만 훑음
+        interactables = {e.entity_id: e for e in self.world.get_entities_with_components({PositionComponent, DoorComponent})}
+        interactables.update((e.entity_id, e) for e in self.world.get_entities_with_components({PositionComponent, SwitchComponent}))
+        for ent in interactables.values():
             door = ent.get_component(DoorComponent)
             if door:
                 door.is_open = True
@@ -295,14 +316,7 @@ class HeadlessEngine(Engine):
                 stats.current_hp = min(stats.max_hp, stats.current_hp + healing_amount)
                 
                 target_pot['qty'] -= 1
-                if target_pot['qty'] <= 0:
-                    # Search map items to find which key to delete? 
-                    # inv.items is dict {name: data}.
-                    # p_name key found loop
-                    if target_pot['qty'] <= 0:
-                         del inv.items[target_pot['item'].name] # Use item name from object or key? Key is safer.
-                    # Wait, 'target_pot' is the value. The key is 'pname'.
-                    pass
+                # inv.items is dict {name: data}; the key is 'pname'
                 if target_pot['qty'] <= 0: del inv.items[pname]
                 
                 return '.' # Consume Turn
@@ -368,12 +382,26 @@ class HeadlessEngine(Engine):
                      self.metrics["skills_used"] += 1
                      return '6'
 
+            # 벽을 돌아가는 경로로 접근 (경로를 못 찾으면 직선 접근)
+            step = self._get_agent_step(player, p_pos, target_pos)
+            if step:
+                return {(1, 0): 'd', (-1, 0): 'a', (0, 1): 's', (0, -1): 'w'}[step]
+            if abs(dx) > abs(dy):
                 return 'd' if dx > 0 else 'a'
             else:
                  return 's' if dy > 0 else 'w'
         
         return random.choice(['w', 'a', 's', 'd'])
 
+    def _get_agent_step(self, player, p_pos, target_pos):
+        """방 그래프로 중간 목표를 정하고 A*로 다음 한 걸음을 구합니다 (장거리 이동 시 전체 맵 탐색을 피함)."""
+        map_ents = self.world.get_entities_with_components({MapComponent})
+        if not map_ents: return None
+        mc = map_ents[0].get_component(MapComponent)
+        room_graph = self.dungeon_map.room_graph if self.dungeon_map.map_data is mc.tiles else None
+        return self.agent_paths.next_step(player.entity_id, mc, (p_pos.x, p_pos.y), (target_pos.x, target_pos.y),
+                                          room_graph=room_graph)
+
     def _render(self): pass # 렌더링 스킵
     def _get_input(self): return None
 
@@ -620,7 +648,7 @@ def run_test_scenario(floor: int, player_level: int, iterations: int = 5):
         total_turns = 0
         
         for i in range(iterations):
-            engine = HeadlessEngine()
+            engine = HeadlessEngine(turbo=True)
             engine.current_level = floor
             # 맵 초기화 (해당 층 보스 생성 강제)
             engine._initialize_world()
@@ -109,7 +109,7 @@ def run_tuning_cycle(max_cycles=10):
             iterations = 10
             
             for i in range(iterations):
-                engine = balance_simulator.HeadlessEngine()
+                engine = balance_simulator.HeadlessEngine(turbo=True)
                 engine.current_level = floor
                 engine._initialize_world()
                 balance_simulator.setup_player_for_test(engine, floor, p_level)
@@ -0,0 +1,107 @@
+# dungeon/batch_ai.py - 대규모 무리를 위한 NumPy 일괄 추적 판단
+
+from typing import Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError: # NumPy가 없으면 MonsterAISystem은 기존 스칼라 경로만 사용
+    np = None
+
+from .components import AIComponent
+from .pathfinding import UNREACHED
+
+# 이 플래그가 있는 몬스터는 고유 패턴이 있으므로 항상 스칼라 경로로 처리
+BATCH_SPECIAL_FLAGS = frozenset({"BOSS", "TELEPORT", "RANGED", "RESURRECT", "BUTCHER", "APOCALYPSE"})
+
+# 거리장 패딩/미도달 칸 값 (어떤 실제 거리보다 큼)
+_FAR = 1 << 30
+
+# 후보 방향 순서: 주 축이 x면 (→, ←, ↓, ↑), y면 (↓, ↑, →, ←) - DistanceField._descend와 같은 순서
+_X_MAJOR_DX = (1, -1, 0, 0)
+_X_MAJOR_DY = (0, 0, 1, -1)
+_Y_MAJOR_DX = (0, 0, 1, -1)
+_Y_MAJOR_DY = (1, -1, 0, 0)
+
+
+def batch_available() -> bool:
+    """NumPy를 불러올 수 있으면 True."""
+    return np is not None
+
+
+class BatchPlan:
+    """plan()의 결과. 모든 필드는 입력 몬스터 순서와 같은 길이의 배열입니다."""
+    def __init__(self, dist, idle, drop_chase, chase, attack, step_ok, dx, dy):
+        self.dist = dist             # 목표까지 맨해튼 거리
+        self.idle = idle             # 할 일 없음 (추적 범위 밖 / 탐지 범위 밖)
+        self.drop_chase = drop_chase # 추적 범위를 벗어나 STATIONARY로 돌아감
+        self.chase = chase           # 이번 판단 후 CHASE 상태
+        self.attack = attack         # 인접해서 근접 공격
+        self.step_ok = step_ok       # 거리장에서 내리막 한 걸음을 찾음 (dx, dy 유효)
+        self.dx = dx
+        self.dy = dy
+
+
+class BatchChasePlanner:
+    """
+    평범한 근접 CHASE/STATIONARY 몬스터 여럿의 추적 판단을 배열 연산 한 번으로 계산합니다.
+
+    MonsterAISystem의 스칼라 경로와 같은 규칙을 따릅니다:
+    추적 범위 밖이면 추적 해제, 탐지 범위 안이면 추적 시작, 인접하면 공격, 아니면 거리장 내리막으로 이동.
+    다른 몬스터와의 칸 겹침은 순서에 따라 달라지므로 여기서 다루지 않고, 쓰기 단계에서 막힌 경우만 스칼라로 다시 계산합니다.
+    """
+    def __init__(self):
+        self._field_stamp = None
+        self._padded = None
+
+    def _sync_field(self, field) -> None:
+        """거리장이 다시 계산되었을 때만 패딩된 2차원 배열로 변환합니다."""
+        stamp = (id(field), field.rebuilds)
+        if stamp == self._field_stamp:
+            return
+        values = np.asarray(field.dist, dtype=np.int64).reshape(field.height, field.width)
+        values = np.where(values == UNREACHED, _FAR, values)
+        self._padded = np.pad(values, 1, constant_values=_FAR)
+        self._field_stamp = stamp
+
+    def plan(self, xs: Sequence[int], ys: Sequence[int], behaviors: Sequence[int], detection: Sequence[int],
+             goal: Tuple[int, int], max_chase_range: int, field=None) -> Optional[BatchPlan]:
+        if np is None:
+            return None
+        xs = np.asarray(xs, dtype=np.int64)
+        ys = np.asarray(ys, dtype=np.int64)
+        behaviors = np.asarray(behaviors)
+        detection = np.asarray(detection, dtype=np.int64)
+        gx, gy = goal
+
+        adx, ady = np.abs(gx - xs), np.abs(gy - ys)
+        dist = adx + ady
+        chasing = behaviors == AIComponent.CHASE
+        too_far = dist > max_chase_range
+        idle = too_far | (~chasing & (dist > detection))
+        chase = ~idle
+        attack = chase & (dist == 1)
+        move = chase & (dist > 1)
+
+        n = len(xs)
+        step_ok = np.zeros(n, dtype=bool)
+        dx = np.zeros(n, dtype=np.int64)
+        dy = np.zeros(n, dtype=np.int64)
+        if field is not None and field.goal == goal and n:
+            self._sync_field(field)
+            padded = self._padded
+            px, py = xs + 1, ys + 1
+            here = padded[py, px]
+            right, left = padded[py, px + 1], padded[py, px - 1]
+            down, up = padded[py + 1, px], padded[py - 1, px]
+            x_major = adx >= ady
+            candidates = np.where(x_major[:, None],
+                                  np.stack((right, left, down, up), axis=1),
+                                  np.stack((down, up, right, left), axis=1))
+            # argmin은 같은 값이면 앞의 후보를 고르므로 스칼라의 '주 축 우선'과 같음
+            k = candidates.argmin(axis=1)
+            best = candidates[np.arange(n), k]
+            step_ok = move & (here < _FAR) & (here > 0) & (best <= here)
+            dx = np.where(x_major, np.take(_X_MAJOR_DX, k), np.take(_Y_MAJOR_DX, k)) * step_ok
+            dy = np.where(x_major, np.take(_X_MAJOR_DY, k), np.take(_Y_MAJOR_DY, k)) * step_ok
+
+        return BatchPlan(dist, idle, chasing & too_far, chase, attack, step_ok, dx, dy)
@@ -0,0 +1,187 @@
+# dungeon/boss_patterns.py - boss_patterns.json을 보스별 상태 기계로 컴파일
+
+import logging
+from typing import Dict, Iterable, List, Optional
+
+# HP 비율이 이 값 이하면 분노 상태 (SkillRule.enraged_cooldown 적용)
+ENRAGE_HP = 0.2
+
+# 모든 보스에 공통으로 걸리는 HP 임계값 (대사 / 이전 보스 환영 소환)
+GENERIC_HP_THRESHOLDS = (0.5, 0.33, 0.2)
+DEFAULT_SUMMON_THRESHOLD = 0.33
+
+# 보스별 스킬/트리거/소환 임계값은 모두 data/boss_patterns.json에 있습니다
+# ("skills", "triggers", "summon_threshold", "summon_last_boss"). JSON에 없으면 해당 항목 없이 컴파일합니다.
+
+# 한 틱에 하나씩만 진행하는 트리거 동작 (페이즈 전환, 환영 소환). 여러 임계값을 한 번에 넘으면 다음 틱에 이어서 실행합니다.
+ONE_PER_TICK_ACTIONS = ("PHASE", "SUMMON_PHANTOM")
+
+
+class HpTrigger:
+    """
+    HP 비율이 threshold 이하로 처음 내려갔을 때 한 번 실행되는 동작. key는 BossComponent.triggered_hps에 기록됩니다.
+    strict이면 threshold '미만'일 때 실행합니다.
+    """
+    __slots__ = ("threshold", "key", "action", "params", "strict")
+
+    def __init__(self, threshold: float, key: str, action: str, params: Optional[dict] = None, strict: bool = False):
+        self.threshold = threshold
+        self.key = key
+        self.action = action
+        self.params = params or {}
+        self.strict = strict
+
+
+class SkillRule:
+    """
+    교전 중 매 행동마다 순서대로 검사하는 스킬 조건.
+    거리/HP/직선/부하 수 조건 -> 쿨다운 -> 확률 순으로 확인하고, 스킬이 행동을 소비하면(True) timer 속성에 시각을 기록합니다.
+    """
+    __slots__ = ("skill", "chance", "min_dist", "max_dist", "min_hp", "max_hp", "linear",
+                 "cooldown", "timer", "enraged_cooldown", "minion", "min_minions", "max_minions", "params")
+
+    def __init__(self, skill: str, chance: float = 1.0, min_dist: int = 0, max_dist: Optional[int] = None,
+                 min_hp: Optional[float] = None, max_hp: Optional[float] = None, linear: bool = False,
+                 cooldown: float = 0.0, timer: Optional[str] = None, enraged_cooldown: float = 1.0,
+                 minion: Optional[str] = None, min_minions: Optional[int] = None, max_minions: Optional[int] = None,
+                 params: Optional[dict] = None):
+        self.skill = skill
+        self.chance = chance
+        self.min_dist = min_dist
+        self.max_dist = max_dist
+        self.min_hp = min_hp # 초과 (hp > min_hp)
+        self.max_hp = max_hp # 이하 (hp <= max_hp)
+        self.linear = linear
+        self.cooldown = cooldown
+        self.timer = timer
+        self.enraged_cooldown = enraged_cooldown
+        self.minion = minion
+        self.min_minions = min_minions
+        self.max_minions = max_minions # 미만 (count < max_minions)
+        self.params = params or {}
+
+    def in_range(self, dist: int, hp_percent: float, linear: bool) -> bool:
+        if dist < self.min_dist or (self.max_dist is not None and dist > self.max_dist):
+            return False
+        if self.min_hp is not None and hp_percent <= self.min_hp:
+            return False
+        if self.max_hp is not None and hp_percent > self.max_hp:
+            return False
+        return linear or not self.linear
+
+    def minions_ok(self, count: int) -> bool:
+        if self.min_minions is not None and count < self.min_minions:
+            return False
+        return self.max_minions is None or count < self.max_minions
+
+    def ready(self, boss, now: float, hp_percent: float) -> bool:
+        if not self.timer or self.cooldown <= 0:
+            return True
+        cooldown = self.cooldown * (self.enraged_cooldown if hp_percent <= ENRAGE_HP else 1.0)
+        return now - getattr(boss, self.timer, 0) >= cooldown
+
+
+class BossProgram:
+    """
+    한 보스의 컴파일된 패턴.
+    triggers는 임계값 내림차순이고 보스별 진행 위치(BossComponent.trigger_index)만 보면 되므로,
+    매 틱 검사는 다음 임계값 하나와의 비교입니다.
+    """
+    __slots__ = ("boss_id", "pattern", "triggers", "skills", "minion_types")
+
+    def __init__(self, boss_id: str, pattern: dict, triggers: List[HpTrigger], skills: List[SkillRule]):
+        self.boss_id = boss_id
+        self.pattern = pattern
+        self.triggers = triggers
+        self.skills = skills
+        # 부하 수를 세야 하는 몬스터 종류 (해당 조건이 있을 때만 틱당 한 번 계산)
+        self.minion_types = {rule.minion for rule in skills if rule.minion}
+
+    def crossed(self, boss, hp_percent: float) -> List[HpTrigger]:
+        """
+        이번에 새로 넘어선 임계값의 트리거를 높은 순서로 반환하고 진행 위치를 옮깁니다.
+        ONE_PER_TICK_ACTIONS 동작은 틱당 하나만 실행하고, 미룬 트리거(또는 strict 조건이 아직 안 된 트리거)가 있으면
+        진행 위치를 그 앞에 남겨 다음 틱에 다시 봅니다 (이미 실행한 것은 triggered_hps로 건너뜀).
+        """
+        triggers = self.triggers
+        index = getattr(boss, 'trigger_index', 0)
+        if index >= len(triggers) or hp_percent > triggers[index].threshold:
+            return []
+        fired = []
+        once = set()
+        held = None
+        while index < len(triggers) and hp_percent <= triggers[index].threshold:
+            trigger = triggers[index]
+            index += 1
+            if trigger.key in boss.triggered_hps: # 저장/외부에서 이미 발동된 것은 건너뜀
+                continue
+            if trigger.action in once or (trigger.strict and hp_percent >= trigger.threshold):
+                if held is None:
+                    held = index - 1
+                continue
+            boss.triggered_hps.add(trigger.key)
+            fired.append(trigger)
+            if trigger.action in ONE_PER_TICK_ACTIONS:
+                once.add(trigger.action)
+        boss.trigger_index = index if held is None else held
+        return fired
+
+
+def _compile_triggers(boss_id: str, pattern: dict, known_actions: Optional[Iterable[str]]) -> List[HpTrigger]:
+    known = set(known_actions) if known_actions is not None else None
+    triggers = []
+
+    # 1. 공통 HP 임계값: 소환 임계값이면 이전 보스 환영, 아니면 on_hp_XX 대사
+    summon_at = pattern.get("summon_threshold", DEFAULT_SUMMON_THRESHOLD)
+    summon_last = pattern.get("summon_last_boss", True)
+    for threshold in GENERIC_HP_THRESHOLDS:
+        if threshold == summon_at:
+            if summon_last:
+                triggers.append(HpTrigger(threshold, str(threshold), "SUMMON_LAST_BOSS"))
+        else:
+            params = {"bark": f"on_hp_{int(threshold * 100)}", "shake": 10 if threshold <= ENRAGE_HP else 0}
+            triggers.append(HpTrigger(threshold, str(threshold), "BARK", params))
+
+    # 2. 보스 고유 트리거
+    for spec in pattern.get("triggers", []):
+        if known is not None and spec["action"] not in known:
+            logging.warning(f"[BossPatterns] {boss_id}: 알 수 없는 트리거 동작 '{spec['action']}'을(를) 무시합니다.")
+            continue
+        triggers.append(HpTrigger(spec["threshold"], spec.get("key") or f"{spec['action'].lower()}_{spec['threshold']}",
+                                  spec["action"], spec.get("params"), spec.get("strict", False)))
+
+    # 3. JSON 페이즈 (순서대로 current_phase를 올림)
+    for index, phase in enumerate(pattern.get("phases", [])):
+        triggers.append(HpTrigger(phase.get("hp_threshold", 0), f"phase_{index + 1}", "PHASE", {"phase": phase, "index": index}))
+
+    # 높은 임계값부터 (같은 값이면 위의 순서 유지)
+    triggers.sort(key=lambda trigger: -trigger.threshold)
+    return triggers
+
+
+def _compile_skills(boss_id: str, pattern: dict, known_skills: Optional[Iterable[str]]) -> List[SkillRule]:
+    known = set(known_skills) if known_skills is not None else None
+    rules = []
+    for spec in pattern.get("skills", []):
+        spec = dict(spec)
+        skill = spec.pop("skill")
+        if known is not None and skill not in known:
+            logging.warning(f"[BossPatterns] {boss_id}: 알 수 없는 스킬 '{skill}'을(를) 무시합니다.")
+            continue
+        rules.append(SkillRule(skill, **spec))
+    return rules
+
+
+def compile_boss_patterns(patterns: Dict[str, dict], known_skills: Optional[Iterable[str]] = None,
+                          known_actions: Optional[Iterable[str]] = None) -> Dict[str, BossProgram]:
+    """
+    load_boss_patterns()의 결과를 보스 ID별 BossProgram으로 변환합니다. 로드 시 한 번만 호출합니다.
+    known_skills / known_actions가 주어지면 등록되지 않은 스킬 ID / 트리거 동작은 경고 후 제외합니다.
+    """
+    programs = {}
+    for boss_id, pattern in (patterns or {}).items():
+        if not pattern:
+            continue
+        programs[boss_id] = BossProgram(boss_id, pattern, _compile_triggers(boss_id, pattern, known_actions),
+                                        _compile_skills(boss_id, pattern, known_skills))
+    return programs
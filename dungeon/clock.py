@@ -0,0 +1,140 @@
+# dungeon/clock.py - 게임 로직이 공유하는 시계 (World.clock)
+
+import time
+from collections import deque
+
+
+class Clock:
+    """
+    게임 로직의 현재 시각(초). 시스템은 time.time() 대신 world.clock.now()를 읽습니다.
+    실제 시계/가짜 시계/배속 시계를 바꿔 끼우면 전역 패치 없이 시뮬레이션 시간을 조절할 수 있습니다.
+    """
+    def now(self) -> float:
+        raise NotImplementedError
+
+
+class RealClock(Clock):
+    """벽시계 (time.time). 기본값."""
+    def now(self) -> float:
+        return time.time()
+
+
+class FakeClock(Clock):
+    """직접 진행시키는 시계 (헤드리스 시뮬레이션/테스트). advance()로만 시간이 흐릅니다."""
+    def __init__(self, start: float = 0.0):
+        self._now = float(start)
+
+    def now(self) -> float:
+        return self._now
+
+    def advance(self, seconds: float) -> float:
+        self._now += seconds
+        return self._now
+
+    def set(self, now: float) -> None:
+        self._now = float(now)
+
+
+class ScaledClock(Clock):
+    """기준 시계보다 scale배 빠르게(또는 느리게) 흐르는 시계. scale을 바꿔도 현재 시각은 이어집니다."""
+    def __init__(self, scale: float = 1.0, source: Clock = None):
+        self.source = source or RealClock()
+        self._scale = scale
+        self._origin = self.source.now()
+        self._base = self._origin
+
+    def now(self) -> float:
+        return self._base + (self.source.now() - self._origin) * self._scale
+
+    @property
+    def scale(self) -> float:
+        return self._scale
+
+    @scale.setter
+    def scale(self, scale: float) -> None:
+        self._base = self.now()
+        self._origin = self.source.now()
+        self._scale = scale
+
+
+class MonotonicClock(Clock):
+    """되돌아가지 않는 벽시계 (time.perf_counter). 프레임 페이싱 측정용."""
+    def now(self) -> float:
+        return time.perf_counter()
+
+
+class FramePacer:
+    """
+    고정 시간 간격(fixed timestep) 루프의 페이싱 계산.
+    실제 경과 시간을 누적해 이번 프레임에 돌릴 로직 틱 수를 돌려주고, 렌더링은 render_fps로 따로 제한하며,
+    다음 틱/렌더링까지 남은 시간만큼만 대기하도록 sleep_time()을 제공합니다.
+    """
+    def __init__(self, tick_rate: float, render_fps: float, max_catchup: int = 5, source: Clock = None, window: int = 120):
+        self.tick_dt = 1.0 / tick_rate
+        self.frame_dt = 1.0 / render_fps
+        self.max_catchup = max_catchup
+        self.source = source or MonotonicClock()
+        self._frame_times = deque(maxlen=window) # 렌더링 간격 (초)
+        self._work_times = deque(maxlen=window)  # 루프 1회에서 대기를 뺀 작업 시간 (초)
+        self.ticks = 0
+        self.frames = 0
+        self.dropped_ticks = 0
+        self.start()
+
+    def start(self) -> None:
+        now = self.source.now()
+        self._last = now
+        self._loop_start = now
+        self._last_render = None
+        self._next_render = now
+        self.accumulator = 0.0
+
+    def advance(self) -> int:
+        """경과 시간을 누적하고 이번 프레임에 실행할 로직 틱 수를 반환합니다."""
+        now = self.source.now()
+        self._loop_start = now
+        self.accumulator += now - self._last
+        self._last = now
+        ticks = int(self.accumulator // self.tick_dt)
+        self.accumulator -= ticks * self.tick_dt
+        if ticks > self.max_catchup:
+            self.dropped_ticks += ticks - self.max_catchup
+            ticks = self.max_catchup
+        self.ticks += ticks
+        return ticks
+
+    def render_due(self) -> bool:
+        return self.source.now() >= self._next_render
+
+    def rendered(self) -> None:
+        """렌더링 직후 호출 (입력 직후의 즉시 렌더링 포함). 다음 주기 렌더링 시각을 미룹니다."""
+        now = self.source.now()
+        if self._last_render is not None:
+            self._frame_times.append(now - self._last_render)
+        self._last_render = now
+        self.frames += 1
+        self._next_render = max(self._next_render + self.frame_dt, now)
+
+    def sleep_time(self) -> float:
+        """다음 로직 틱 또는 다음 렌더링 중 빠른 쪽까지 남은 시간 (초)."""
+        now = self.source.now()
+        self._work_times.append(now - self._loop_start)
+        next_tick = self._last + (self.tick_dt - self.accumulator)
+        return max(0.0, min(next_tick, self._next_render) - now)
+
+    @property
+    def stats(self) -> dict:
+        """프레임 페이싱 통계 (최근 window 프레임 기준, ms)"""
+        frames = self._frame_times
+        work = self._work_times
+        avg_frame = sum(frames) / len(frames) if frames else 0.0
+        return {
+            "ticks": self.ticks,
+            "frames": self.frames,
+            "dropped_ticks": self.dropped_ticks,
+            "fps": 1.0 / avg_frame if avg_frame > 0 else 0.0,
+            "avg_frame_ms": avg_frame * 1000,
+            "max_frame_ms": max(frames) * 1000 if frames else 0.0,
+            "avg_work_ms": sum(work) / len(work) * 1000 if work else 0.0,
+            "max_work_ms": max(work) * 1000 if work else 0.0,
+        }
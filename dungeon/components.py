@@ -1,7 +1,9 @@
 # dungeon/components.py - 게임 데이터를 정의하는 모듈
 
 # NOTE: 이 파일은 ECS 코어(.ecs)를 임포트해야 합니다.
-from .ecs import Component
+
+from .ecs import Component, TimedComponent
+from .config import BOSS_BARK_CHARS_PER_SEC
 from typing import List, Dict
 
 # --- 플레이어/몬스터 기본 정보 ---
@@ -18,15 +20,14 @@ class RenderComponent(Component):
         self.color = color
         self.priority = priority
 
-class StatModifierComponent(Component):
+class StatModifierComponent(TimedComponent):
     """일시적인 능력치 증감 (버프/디버프)"""
     def __init__(self, str_mod: int = 0, mag_mod: int = 0, dex_mod: int = 0, vit_bonus: int = 0, duration: float = 0.0, source: str = ""):
         self.str_mod = str_mod
         self.mag_mod = mag_mod
         self.dex_mod = dex_mod
         self.vit_mod = vit_bonus # items.csv 헤더가 vit_bonus이므로 호환성 유지
-        self.duration = duration
-        self.expires_at = 0.0 # TimeSystem에서 설정됨
+        self.duration = duration # 만료 시각(expires_at)은 엔티티에 붙을 때부터 계산됨 (TimedComponent)
         self.source = source
 
 class StatsComponent(Component):
@@ -239,6 +240,8 @@ class MapComponent(Component):
         self.width = width
         self.height = height
         self.tiles = tiles # tiles[y][x]
+        # 타일이 바뀔 때마다 증가 (시야/경로 캐시 무효화 기준)
+        self.version = 0
 
 class MessageComponent(Component):
     """게임 내 메시지 기록 (전역 데이터)"""
@@ -307,17 +310,17 @@ class ShrineComponent(Component):
             "is_used": self.is_used
         }
 
-class EffectComponent(Component):
+class EffectComponent(TimedComponent):
     """임시 시각적 효과 (공격 궤적 등)"""
     def __init__(self, duration: int = 1):
         self.duration = duration # 표시될 턴 수
 
-class StunComponent(Component):
+class StunComponent(TimedComponent):
     """스턴 상태: 일정 턴 동안 행동 불가"""
     def __init__(self, duration: int = 1):
         self.duration = duration
 
-class SkillEffectComponent(Component):
+class SkillEffectComponent(TimedComponent):
     """지속형 스킬 효과 (예: 휠 윈드 오라)"""
     def __init__(self, name: str, duration: int, damage: int, radius: int = 1, effect_type: str = "AURA", flags: set = None):
         self.name = name
@@ -339,7 +342,7 @@ class SkillEffectComponent(Component):
             "tick_count": self.tick_count
         }
 
-class HitFlashComponent(Component):
+class HitFlashComponent(TimedComponent):
     """피격 시 시각적 피드백(번쩍임)을 위한 컴포넌트"""
     def __init__(self, duration: float = 0.15):
         self.duration = duration
@@ -390,42 +393,42 @@ class TrapComponent(Component):
         self.is_triggered = is_triggered
         self.visible = not is_hidden
 
-class SleepComponent(Component):
+class SleepComponent(TimedComponent):
     """수면 상태: 행동 불가, 데미지 입을 시 해제"""
     def __init__(self, duration: float = 5.0):
         self.duration = duration
 
-class PoisonComponent(Component):
+class PoisonComponent(TimedComponent):
     """중독 상태: 일정 시간마다 데미지 입음"""
-    def __init__(self, damage: int = 5, duration: float = 10.0):
+    def __init__(self, damage: int = 5, duration: float = 10.0, tick_interval: float = 1.0):
         self.damage = damage
         self.duration = duration
-        self.tick_timer = 1.0 # 1초마다 데미지
+        self.tick_interval = tick_interval # 피해 주기 (초)
 
-class ManaShieldComponent(Component):
+class ManaShieldComponent(TimedComponent):
     """마나 실드 상태: 데미지를 HP 대신 MP로 흡수"""
     def __init__(self, duration: float = 60.0):
         self.duration = duration
 
-class BleedingComponent(Component):
+class BleedingComponent(TimedComponent):
     """지속 출혈 상태 (DoT)"""
-    def __init__(self, damage: int, duration: int, attacker_id: int = None):
+    def __init__(self, damage: int, duration: int, attacker_id: int = None, tick_interval: float = 1.0):
         self.damage = damage
         self.duration = duration
         self.attacker_id = attacker_id
+        self.tick_interval = tick_interval # 피해 주기 (초)
         
-class SummonComponent(Component):
+class SummonComponent(TimedComponent):
     """소환수 상태: 주인 정보와 남은 수명 관리"""
     def __init__(self, owner_id: int, duration: float = 30.0):
         self.owner_id = owner_id
         self.duration = duration
 
-class PetrifiedComponent(Component):
+class PetrifiedComponent(TimedComponent):
     """석화 상태: 스택에 따라 둔화 -> 약화 -> 기절"""
     def __init__(self, duration: float = 5.0, stacks: int = 1):
         self.duration = duration
         self.stacks = stacks
-        self.max_stacks = 3
 
 class CurseComponent(Component):
     """저주 상태: 공격력/방어력 감소"""
@@ -455,10 +458,23 @@ class BossComponent(Component):
         
         # [Bark System V2]
         self.active_bark = "" # 현재 출력 중인 전체 대사
-        self.visible_bark = "" # 현재 화면에 보이는 부분 (타이핑 효과용)
-        self.bark_type_timer = 0.0 # 타이핑 간격 타이머
-        self.bark_display_timer = 0.0 # 전체 대사 유지 시간
+        self.bark_started_at = 0.0 # 대사 시작 시각 (타이핑/표시 상태는 이 시각으로부터 계산)
+        self.bark_display_timer = 0.0 # 타이핑이 끝난 뒤 대사를 유지하는 시간 (초)
         self.triggered_hps = set() # 이미 발동된 HP 트리거 저장 (0.5, 0.2 등)
+        self.trigger_index = 0 # 컴파일된 HP 트리거(boss_patterns.BossProgram) 중 다음에 검사할 위치
+
+    def bark_at(self, now: float) -> str:
+        """now 시각에 화면에 보이는 대사 (타이핑 효과 반영). 매 프레임 갱신하지 않고 렌더링할 때 계산합니다."""
+        if not self.active_bark:
+            return ""
+        elapsed = now - self.bark_started_at
+        if elapsed < 0:
+            return ""
+        length = len(self.active_bark)
+        typing_time = length / BOSS_BARK_CHARS_PER_SEC
+        if elapsed >= typing_time + self.bark_display_timer:
+            return ""
+        return self.active_bark[:min(length, int(elapsed * BOSS_BARK_CHARS_PER_SEC) + 1)]
 
 class SwitchComponent(Component):
     """문, 레버 등 상호작용 가능한 스위치 (Open/Closed, On/Off)"""
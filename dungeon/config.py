@@ -12,6 +12,36 @@ MAX_ROOMS = 10
 ROOM_MIN_SIZE = 6
 ROOM_MAX_SIZE = 12
 
+# 대형 맵 생성기 설정 (maps.csv map_type: BSP / CAVE)
+BSP_MIN_LEAF_SIZE = 12       # BSP 분할 최소 구역 크기 (방 + 여백)
+CAVE_FILL_PROB = 0.45        # 셀룰러 오토마타 초기 바닥 비율
+CAVE_SMOOTH_STEPS = 4        # 스무딩 반복 횟수
+CAVE_CHAMBER_SPACING = 20    # 동굴 내 공터(방) 배치 간격
+
+# 몬스터 경로 탐색 설정
+CHASE_FIELD_MAX_DISTANCE = 40  # 플레이어 거리장(Dijkstra) 최대 확장 걸음 수 (추적 범위 15 + 우회 여유)
+FLEE_SAFETY_SCALE = 1.2        # 도주 지도: 거리장에 곱하는 음수 배율 (1보다 커야 막다른 곳 대신 멀리 돌아 나감)
+SUMMON_RETREAT_HP_RATIO = 0.3  # 소환수가 플레이어 곁으로 후퇴하는 체력 비율
+ASTAR_NODE_BUDGET = 1500       # A* 1회 탐색에서 확장할 수 있는 최대 노드 수 (초과 시 가장 가까운 지점까지의 부분 경로)
+PATH_GOAL_TOLERANCE = 2        # 목표가 이 거리 이내로 움직였으면 캐시된 경로를 계속 사용
+
+# 몬스터 행동 스케줄링 (다음 행동 시각 힙)
+AI_IDLE_RECHECK = 0.25  # 추적 범위 밖이라 할 일이 없던 몬스터를 다시 살펴보는 간격 (초)
+ALERT_RADIUS = 7         # 추적을 시작한 몬스터가 주변 몬스터를 깨우는 맨해튼 거리 (공간 버킷 한 변의 크기)
+ALERT_SOURCES_PER_TICK = 8  # 틱당 처리할 경보 발신 몬스터 수 상한 (나머지는 다음 틱으로 이월)
+BATCH_AI_MIN_ENTITIES = 64  # 이번 틱에 행동할 몬스터가 이보다 많으면 NumPy 일괄 판단 사용 (NumPy가 있을 때만)
+AI_FRAME_BUDGET_MS = 20.0   # 로직 틱(50ms)당 몬스터 AI에 쓸 시간 한도. 넘치면 남은 몬스터는 다음 프레임으로 (None이면 제한 없음)
+AI_FRAME_ENTITY_BUDGET = None  # 프레임당 처리할 몬스터 수 한도 (None이면 제한 없음)
+
+# 게임 루프 (고정 시간 간격 로직 + 별도 렌더링 상한)
+LOGIC_TICK_RATE = 20     # 초당 로직 틱 수 (틱마다 월드 시계가 1/LOGIC_TICK_RATE초씩 진행)
+RENDER_FPS = 20          # 주기적 렌더링 상한 (입력 직후 렌더링은 별도)
+MAX_CATCHUP_TICKS = 5    # 한 프레임에서 따라잡을 최대 틱 수 (연출 대기 등으로 밀린 나머지 시간은 버림)
+RENDER_FULL_REDRAW_FRAMES = 200  # 변경된 칸만 출력하는 렌더러가 이 프레임 수마다 한 번 전체를 다시 그림 (화면 깨짐 복구)
+
+# 보스 대사 표시 (실제 경과 시간 기준, 루프 속도와 무관)
+BOSS_BARK_CHARS_PER_SEC = 20.0  # 타이핑 효과로 초당 공개되는 글자 수
+
 # -------------------------------------------------------------------------
 # Balance Configuration (Fixed by User Request 2026-01-10)
 # -------------------------------------------------------------------------
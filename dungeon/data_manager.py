@@ -557,7 +557,8 @@ def load_boss_patterns(data_path=None):
     """boss_patterns.json (패턴) 및 boss_dialogues.csv (대사)를 로드하여 병합합니다."""
     import json
     if data_path is None:
-        data_path = os.path.join(os.path.dirname(__file__), '..', 'data')
+        # [Fix] 다른 로더와 같이 패키지 내부 data 폴더 사용 (dungeon/../data에는 패턴 파일이 없음)
+        data_path = os.path.join(os.path.dirname(__file__), 'data')
     
     patterns = {}
     
@@ -1,6 +1,10 @@
 # dungeon/ecs.py
 
-from typing import Dict, List, Set, Type, Any
+import time
+from typing import Any, Callable, Dict, List, Set, Type
+
+from .clock import Clock, RealClock
+from .scheduler import CooldownManager, TimerQueue
 
 # --- 1.1 기본 구성 요소 (Core ECS) ---
 
@@ -8,28 +12,94 @@ class Component:
     """엔티티에 부착되는 데이터 컨테이너"""
     pass
 
+class TimedComponent(Component):
+    """
+    남은 시간(duration)이 있는 컴포넌트 (상태 이상, 버프, 시각 효과 등).
+    월드의 엔티티에 붙는 순간부터 시간이 흐르며, 그때부터는 만료 시각(expires_at)을 저장하고 duration은 현재 시각으로 계산합니다.
+    따라서 TimeSystem이 매 프레임 감액하지 않고 World.timers에 등록된 만료 시각에만 처리합니다.
+    현재 시각은 엔티티가 속한 월드의 시계(World.clock)를 따릅니다.
+    duration / expires_at을 다시 대입하면 (지속시간 갱신) 새 시각으로 다시 등록됩니다.
+    """
+    _timer = None # (TimerQueue, Entity) - 월드 엔티티에 붙었을 때 설정
+    _duration = 0.0
+    _expires_at = 0.0
+
+    def _now(self, entity=None) -> float:
+        entity = entity or (self._timer and self._timer[1])
+        world = getattr(entity, "world", None) if entity else None
+        return world.clock.now() if world is not None else time.time()
+
+    def start_timer(self, queue, entity):
+        if self._timer is None:
+            self._expires_at = self._now(entity) + self._duration
+        self._timer = (queue, entity)
+
+    @property
+    def duration(self) -> float:
+        if self._timer is None:
+            return self._duration
+        return self._expires_at - self._now()
+
+    @duration.setter
+    def duration(self, value: float):
+        if self._timer is None:
+            self._duration = value
+        else:
+            self.expires_at = self._now() + value
+
+    @property
+    def expires_at(self) -> float:
+        if self._timer is None:
+            return self._now() + self._duration
+        return self._expires_at
+
+    @expires_at.setter
+    def expires_at(self, value: float):
+        if self._timer is None:
+            self._duration = value - self._now()
+            return
+        self._expires_at = value
+        queue, entity = self._timer
+        queue.push(value, TimerQueue.EXPIRE, entity, self)
+
+    def to_dict(self):
+        data = {k: (list(v) if isinstance(v, set) else v) for k, v in vars(self).items() if not k.startswith('_')}
+        data["duration"] = self.duration
+        return data
+
 class Entity:
     """게임 내 모든 객체를 나타내며, 컴포넌트들의 묶음"""
     def __init__(self, entity_id: int):
         self.entity_id = entity_id
+        self.world = None # World.create_entity에서 설정 (시간 컴포넌트 등록용)
         # 컴포넌트 타입별로 인스턴스 리스트 저장 (여러 보너스/상태이상 중첩 지원)
         self._components: Dict[Type[Component], List[Component]] = {}
+        self._derived: Dict[Type[Component], Any] = {} # 컴포넌트 타입별 파생 값 캐시 (cached 참고)
 
     def add_component(self, component: Component, overwrite: bool = False):
         """컴포넌트를 추가합니다. overwrite=True이면 기존 동일 타입 컴포넌트를 제거하고 추가합니다."""
         c_type = type(component)
+        self._derived.pop(c_type, None)
         if overwrite or c_type not in self._components:
+            if self.world is not None and c_type not in self._components:
+                self.world._index_add(self, c_type)
             self._components[c_type] = [component]
         else:
             self._components[c_type].append(component)
         # 역방향 참조 (편의용)
         if hasattr(component, 'entity'):
             component.entity = self
+        # 지속 시간 컴포넌트는 월드 타이머에 만료 시각 등록
+        if self.world is not None and isinstance(component, TimedComponent):
+            self.world.timers.track(self, component)
 
     def remove_component(self, component_type: Type[Component]):
         """해당 타입의 모든 컴포넌트를 제거합니다."""
         if component_type in self._components:
             del self._components[component_type]
+            self._derived.pop(component_type, None)
+            if self.world is not None:
+                self.world._index_remove(self, component_type)
 
     def remove_component_instance(self, component: Component):
         """특정 컴포넌트 인스턴스 하나만 제거합니다."""
@@ -37,8 +107,11 @@ class Entity:
         if c_type in self._components:
             if component in self._components[c_type]:
                 self._components[c_type].remove(component)
+                self._derived.pop(c_type, None)
                 if not self._components[c_type]:
                     del self._components[c_type]
+                    if self.world is not None:
+                        self.world._index_remove(self, c_type)
 
     def get_component(self, component_type: Type[Component]) -> Component | None:
         """해당 타입의 첫 번째 컴포넌트를 반환합니다."""
@@ -53,6 +126,16 @@ class Entity:
         """해당 타입의 컴포넌트가 하나라도 있는지 확인합니다."""
         return component_type in self._components and len(self._components[component_type]) > 0
 
+    def cached(self, component_type: Type[Component], build: Callable[[List[Component]], Any]) -> Any:
+        """
+        component_type 인스턴스 목록으로 만든 파생 값(build 결과)을 캐시해 돌려줍니다.
+        해당 타입 컴포넌트가 추가/제거될 때만 다시 계산합니다 (인스턴스 속성 변경은 추적하지 않음).
+        """
+        value = self._derived.get(component_type)
+        if value is None:
+            value = self._derived[component_type] = build(self.get_components(component_type))
+        return value
+
 class Event:
     """시스템 간 통신을 위한 메시지"""
     pass
@@ -68,6 +151,18 @@ class System:
         self.world = world
         self.event_manager = world.event_manager
 
+    def _animate(self, delay: float):
+        """연출 프레임: 즉시 렌더링 후 delay초 대기 (엔진이 터보 모드면 생략)"""
+        engine = self.world.engine
+        if getattr(engine, 'turbo', False):
+            return
+        engine._render()
+        time.sleep(delay)
+
+    def has_work(self) -> bool:
+        """이번 틱에 처리할 것이 있는지. 터보 모드 루프는 False인 시스템을 건너뜁니다 (기본은 항상 처리)."""
+        return True
+
     def process(self):
         """매 턴(프레임)마다 실행될 게임 로직"""
         raise NotImplementedError
@@ -122,16 +217,23 @@ class EventManager:
 
 class World:
     """엔티티, 컴포넌트, 시스템을 통합 관리하는 컨테이너"""
-    def __init__(self, engine: Any):
+    def __init__(self, engine: Any, clock: Clock = None):
         self._next_entity_id = 1
         self._entities: Dict[int, Entity] = {}
         self._systems: List[System] = []
         self.event_manager = EventManager()
         self.engine = engine # Engine 인스턴스 참조
+        self.timers = TimerQueue() # TimedComponent 만료/주기 타이머 (TimeSystem이 처리)
+        self.cooldowns = CooldownManager() # 엔티티별 스킬/아이템 쿨타임 (게임 시계 기준 만료 시각)
+        self.clock = clock or RealClock() # 게임 로직 시계 (시스템은 time.time() 대신 이것을 읽음)
+        self._index: Dict[Type[Component], Dict[int, Entity]] = {} # 컴포넌트 타입 -> 그 컴포넌트를 가진 엔티티
+        self._index_version: Dict[Type[Component], int] = {} # 타입별 색인 변경 횟수 (질의 결과 캐시 무효화)
+        self._query_cache: Dict[frozenset, tuple] = {}
 
     def create_entity(self) -> Entity:
         entity_id = self._next_entity_id
         entity = Entity(entity_id)
+        entity.world = self
         self._entities[entity_id] = entity
         self._next_entity_id += 1
         return entity
@@ -139,12 +241,19 @@ class World:
     def delete_entity(self, entity_id: int):
         """엔티티를 월드에서 영구적으로 제거합니다."""
         if entity_id in self._entities:
-            del self._entities[entity_id]
+            entity = self._entities.pop(entity_id)
+            for c_type in entity._components:
+                self._index_remove(entity, c_type)
+            self.cooldowns.remove_entity(entity_id)
 
     def clear_all_entities(self):
         """모든 엔티티를 제거합니다 (시스템/데이터 초기화용)"""
         self._entities.clear()
+        self._index.clear()
+        self._query_cache.clear()
         self._next_entity_id = 1
+        self.timers.clear()
+        self.cooldowns.clear() # ID가 1부터 다시 쓰이므로 이전 엔티티의 쿨타임이 남지 않게
 
     def add_component(self, entity_id: int, component: Component, overwrite: bool = False):
         if entity_id in self._entities:
@@ -163,18 +272,45 @@ class World:
             return None
         return self._entities.get(1) # 플레이어 ID를 1로 가정
 
+    def index_version(self, component_type: Type[Component]) -> int:
+        """해당 컴포넌트를 가진 엔티티 집합이 바뀔 때마다 증가하는 값 (시스템이 '새로 생기거나 사라진 엔티티'를 확인할 때 사용)"""
+        return self._index_version.get(component_type, 0)
+
+    def _index_add(self, entity: Entity, c_type: Type[Component]):
+        if self._entities.get(entity.entity_id) is entity: # 이미 삭제된 엔티티는 색인하지 않음
+            self._index.setdefault(c_type, {})[entity.entity_id] = entity
+            self._index_version[c_type] = self._index_version.get(c_type, 0) + 1
+
+    def _index_remove(self, entity: Entity, c_type: Type[Component]):
+        bucket = self._index.get(c_type)
+        if bucket and bucket.get(entity.entity_id) is entity:
+            del bucket[entity.entity_id]
+            self._index_version[c_type] = self._index_version.get(c_type, 0) + 1
+
     def get_entities_with_components(self, component_types: Set[Type[Component]]) -> List[Entity]:
-        """필수 컴포넌트를 모두 가진 엔티티 목록을 반환"""
-        results = []
-        for entity in self._entities.values():
-            has_all = True
-            for comp_type in component_types:
-                if not entity.has_component(comp_type):
-                    has_all = False
-                    break
-            if has_all:
-                results.append(entity)
-        return results
+        """필수 컴포넌트를 모두 가진 엔티티 목록을 반환 (생성 순서). 가장 작은 컴포넌트 색인만 훑고, 색인이 그대로면 이전 결과를 재사용합니다."""
+        if not component_types:
+            return list(self._entities.values())
+        key = frozenset(component_types)
+        index_version = self._index_version
+        cached = self._query_cache.get(key)
+        if (cached is not None and cached[1] is self._entities
+                and all(index_version.get(comp_type, 0) == version for comp_type, version in cached[0])):
+            return list(cached[2])
+        buckets = []
+        for comp_type in component_types:
+            bucket = self._index.get(comp_type)
+            if not bucket:
+                return []
+            buckets.append(bucket)
+        buckets.sort(key=len)
+        smallest, rest = buckets[0], buckets[1:]
+        entities = self._entities
+        results = [entity for eid, entity in smallest.items()
+                   if entities.get(eid) is entity and all(eid in bucket for bucket in rest)]
+        results.sort(key=lambda entity: entity.entity_id)
+        self._query_cache[key] = (tuple((comp_type, index_version.get(comp_type, 0)) for comp_type in key), entities, results)
+        return list(results)
 
     def add_system(self, system: System):
         """시스템을 등록하고 이벤트 리스너로 등록"""
@@ -10,7 +10,12 @@ import readchar
 import logging
 import copy
 from typing import Dict, List, Set, Type, Optional, Any
-from .map import DungeonMap
+from .map import DungeonMap, SCALABLE_MAP_TYPES
+from .seeding import FloorRandom, derive_seed, STREAM_LAYOUT, STREAM_SPAWN, STREAM_TRAP, STREAM_LOOT
+from .spawn_plan import (
+    SpawnPlan, SPAWN_MONSTER, SPAWN_BOSS, SPAWN_LEVER, SPAWN_DOOR, SPAWN_SHOP,
+    SPAWN_CHEST, SPAWN_MIMIC, SPAWN_TRAP, SPAWN_SHRINE
+)
 
 # 필요한 모듈 임포트
 from .ecs import World, EventManager, initialize_event_listeners
@@ -19,7 +24,7 @@ from .components import (
     LevelComponent, MapComponent, MessageComponent, MonsterComponent, 
     AIComponent, LootComponent, CorpseComponent, ChestComponent, ShopComponent, ShrineComponent,
     StunComponent, SkillEffectComponent, HitFlashComponent, HiddenComponent, MimicComponent, TrapComponent,
-    SleepComponent, PoisonComponent, StatModifierComponent, BossComponent, PetrifiedComponent, BossGateComponent,
+    SleepComponent, StatModifierComponent, BossComponent, PetrifiedComponent, BossGateComponent,
     DoorComponent, SwitchComponent, InteractableComponent, KeyComponent, BlockMapComponent
 )
 from .systems import (
@@ -29,6 +34,7 @@ from .systems import (
 
 from .events import MessageEvent, DirectionalAttackEvent, MapTransitionEvent, ShopOpenEvent, ShrineOpenEvent, SoundEvent
 from .localization import _
+from .status_effects import modifier_totals, top_status
 from .sound_system import SoundSystem
 from .renderer import Renderer
 from .data_manager import load_item_definitions, load_monster_definitions, load_skill_definitions, load_class_definitions, load_prefixes, load_suffixes, save_ranking
@@ -42,13 +48,15 @@ from .constants import (
 import enum
 
 from .constants import GameState
-from .config import MAP_HEIGHT
+from .config import MAP_HEIGHT, LOGIC_TICK_RATE, RENDER_FPS, MAX_CATCHUP_TICKS
+from .clock import RealClock, FakeClock, FramePacer
 
 class Engine:
     """게임 루프, 초기화, 시스템 관리를 담당하는 메인 클래스"""
-    def __init__(self, player_name="Hero", game_data=None):
+    def __init__(self, player_name="Hero", game_data=None, seed=None, floor_cache=None, clock=None, turbo=False):
         self.is_running = False
-        self.world = World(self) # World 초기화 시 Engine 자신을 참조
+        self.world = World(self, clock=clock) # World 초기화 시 Engine 자신을 참조 (clock: 게임 로직 시계, 기본값은 실제 시각)
+        self.turbo = turbo # [Turbo] 고속 진행: 렌더링/파티클/연출 대기/사운드/메시지 로그 생략 (헤드리스 시뮬레이션용)
         self.turn_number = 0
         self.dungeon_map = None # 현재 층의 맵 인스턴스
         
@@ -112,6 +120,23 @@ class Engine:
 
         self.shake_timer = 0 # Screen shake duration
         self.rng = random.Random() # Initialize RNG for map generation
+        
+        # [Seed] 런 시드: 층별 난수 스트림(구조/스폰/함정/전리품)의 근원
+        # 우선순위: 명시적 seed 인자 > 세이브 데이터 > 무작위
+        self.dungeon_seed = seed
+        if self.dungeon_seed is None and game_data:
+            self.dungeon_seed = game_data.get("dungeon_seed")
+        if self.dungeon_seed is None:
+            self.dungeon_seed = self.rng.getrandbits(32)
+        self.floor_rng = None # 현재 층의 FloorRandom (_initialize_world에서 설정)
+        
+        # [Floor Cache] (seed, floor) 키로 생성된 층 맵을 재사용하는 선택적 디스크 캐시
+        self.floor_cache = floor_cache
+        
+        # [Prefetch] 다음 층 선생성 워커
+        from .floor_prefetch import FloorPrefetcher
+        self.prefetch_enabled = True
+        self.floor_prefetcher = FloorPrefetcher()
 
         self._initialize_world(game_data)
         self._initialize_systems()
@@ -122,44 +147,8 @@ class Engine:
         if game_data and "last_boss_id" in game_data:
             self.last_boss_id = game_data["last_boss_id"]
 
-        # 0. 맵 설정 가져오기 (floor는 1부터 시작하므로 문자열 변환 시 1, 2, ... 확인)
-        map_config = self.map_defs.get(str(self.current_level))
-        if not map_config:
-            # 설정이 없으면 기본값 (또는 가장 가까운 층의 설정)
-            map_config = next(iter(self.map_defs.values())) if self.map_defs else None
-        
-        if map_config:
-            width = map_config.width
-            height = map_config.height
-            map_type = map_config.map_type
-        else:
-            width = 120
-            height = 60
-            # 5의 배수 층 또는 마지막 99층은 보스전으로 설정
-            # [Boss Floor Logic]
-            # Bosses appear at 25, 50, 75, 99
-            is_boss_floor = self.current_level in [25, 50, 75, 99]
-            map_type = "BOSS" if is_boss_floor else "NORMAL"
-        
-        # DungeonMap 인스턴스 생성
-        # [Themed Map Size] Override config based on floor tier
-        floor = 1
-        if getattr(self, 'dungeon', None):
-            floor = self.dungeon.dungeon_level_tuple[0]
-            
-        width, height = 60, 40 # Lv 1-25
-        if floor >= 76:
-            width, height = 100, 80
-        elif floor >= 51:
-            width, height = 80, 60
-        elif floor >= 26:
-            width, height = 70, 50
-            
-        # Ensure we obey the override
-        if map_config:
-            # We don't modify map_config directly to avoid persistent side effects if cached, 
-            # but DungeonMap init takes explicit width/height
-            pass
+        # 0. 맵 설정 가져오기
+        map_config, width, height, map_type = self._get_floor_layout(self.current_level)
 
         level_tuple = (self.current_level, 0)
         if getattr(self, 'dungeon', None):
@@ -176,12 +165,14 @@ class Engine:
         if game_data and "current_map" in game_data:
             logging.info("[Load] Restoring saved map data...")
             dungeon_map = DungeonMap.from_dict(game_data["current_map"], self.rng)
+            spawn_plan = self._plan_floor_spawns(dungeon_map, self.current_level, map_config, map_type, spawn_at,
+                                                 FloorRandom(self.dungeon_seed, self.current_level))
         else:
-            dungeon_map = DungeonMap(width, height, self.rng, 
-                                     dungeon_level_tuple=level_tuple, 
-                                     map_type=map_type)
+            dungeon_map, spawn_plan = self._build_floor(level_tuple[0], map_config, width, height, map_type, spawn_at)
             
         self.dungeon_map = dungeon_map
+        # [Seed] 이 층의 독립 난수 스트림 (배치 계획에 쓴 만큼 진행된 상태로 런타임 스폰이 이어서 사용)
+        self.floor_rng = spawn_plan.floor_rng
         map_data = dungeon_map.map_data
         
         # 1. 플레이어 엔티티 생성 (ID=1)
@@ -201,7 +192,8 @@ class Engine:
             self.world.add_component(player_entity.entity_id, p_level)
         elif game_data and "entities" in game_data:
             # 저장된 데이터에서 엔티티 복원 (플레이어 ID=1 가정)
-            # 저장된 데이터에서 엔티티 복원 (플레이어 ID=1 가정)
+            # [Cooldown] 저장 당시 남은 쿨타임을 현재 시계 기준으로 복원
+            self.world.cooldowns.load(game_data.get("cooldowns"), self.world.clock.now())
             player_data = game_data["entities"].get("1")
             if player_data:
                 logging.info(f"[Load] Found Player Data (ID 1). Components: {list(player_data.keys())}")
@@ -459,6 +451,7 @@ class Engine:
             # 실제 맵 데이터에서 계단 타일을 바닥('.')으로 임시 변경
             if 0 <= dungeon_map.exit_x < width and 0 <= dungeon_map.exit_y < height:
                 map_component.tiles[dungeon_map.exit_y][dungeon_map.exit_x] = '.'
+                map_component.version += 1
                 logging.info(f"Boss Floor {self.current_level}: Hidden exit stairs at ({dungeon_map.exit_x}, {dungeon_map.exit_y})")
         
         # 3. 메시지 로그 엔티티 생성 (ID=3)
@@ -487,83 +480,245 @@ class Engine:
             message_comp.add_message(_("WASD나 방향키로 이동하고 몬스터와 부딪혀 전투하세요."))
         self.world.add_component(message_entity.entity_id, message_comp)
         
-        # 4. 엔티티 배치 (몬스터/보스/오브젝트)
-        # 4. 엔티티 배치 (몬스터/보스/오브젝트)
-        if map_type == "BOSS":
-            self._spawn_boss_room_features(dungeon_map)
+        # 4. 엔티티 배치 (몬스터/보스/오브젝트) - 난수는 맵과 함께 준비된 계획에 이미 뽑혀 있음
+        self._apply_spawn_plan(spawn_plan, message_comp)
+
+        # [Prefetch] 현재 층을 탐험하는 동안 다음 층 맵과 배치 계획을 미리 생성
+        self._prefetch_next_floor()
+
+    def _get_floor_layout(self, level: int):
+        """층 번호에 해당하는 (map_config, width, height, map_type)을 반환합니다."""
+        # floor는 1부터 시작하므로 문자열 변환 시 1, 2, ... 확인
+        map_config = self.map_defs.get(str(level))
+        if not map_config:
+            # 설정이 없으면 기본값 (또는 가장 가까운 층의 설정)
+            map_config = next(iter(self.map_defs.values())) if self.map_defs else None
+        
+        if map_config:
+            map_type = map_config.map_type
         else:
-            has_boss = map_config.has_boss if map_config else False
-            if has_boss:
-                # 보스 설정 가져오기
-                boss_ids = map_config.boss_ids if map_config else []
-                boss_count = map_config.boss_count if map_config and map_config.boss_count > 0 else (len(boss_ids) if boss_ids else 1)
-                attacker_pool = map_config.monster_pool if map_config else []
+            # [Boss Floor Logic]
+            # Bosses appear at 25, 50, 75, 99
+            is_boss_floor = level in [25, 50, 75, 99]
+            map_type = "BOSS" if is_boss_floor else "NORMAL"
+        
+        # [Themed Map Size] Override config based on floor tier
+        floor = 1
+        if getattr(self, 'dungeon', None):
+            floor = self.dungeon.dungeon_level_tuple[0]
+            
+        width, height = 60, 40 # Lv 1-25
+        if floor >= 76:
+            width, height = 100, 80
+        elif floor >= 51:
+            width, height = 80, 60
+        elif floor >= 26:
+            width, height = 70, 50
+
+        # [Large Maps] 선형 생성기(BSP/CAVE)를 쓰는 층은 maps.csv에 지정된 크기를 그대로 사용
+        if map_config and map_type in SCALABLE_MAP_TYPES:
+            width, height = map_config.width, map_config.height
+
+        return map_config, width, height, map_type
+
+    def _get_floor_seed(self, level: int) -> int:
+        """런 시드(dungeon_seed)로부터 층별 맵 구조 시드를 유도합니다."""
+        return derive_seed(self.dungeon_seed, level, STREAM_LAYOUT)
+
+    def _rand(self, stream: str):
+        """현재 층의 난수 스트림을 반환합니다. 층이 준비되기 전에는 전역 random 모듈을 사용합니다."""
+        floor_rng = getattr(self, 'floor_rng', None)
+        return floor_rng.get(stream) if floor_rng else random
+
+    def _build_floor(self, level: int, map_config, width: int, height: int, map_type: str, spawn_at: str = "START"):
+        """
+        층 맵과 엔티티 배치 계획을 (dungeon_map, spawn_plan)으로 반환합니다.
+        백그라운드 워커가 미리 준비해 둔 층이 있으면 그대로 쓰고, 없으면 즉시 준비합니다.
+        """
+        key = (level, self._get_floor_seed(level), width, height, map_type)
+        
+        prepared = self.floor_prefetcher.take(key)
+        if prepared is not None:
+            logging.info(f"[Prefetch] Floor {level} taken from background worker")
+            dungeon_map, spawn_plan = prepared
+            if spawn_plan.spawn_at != spawn_at:
+                # 선생성은 내려가는 경우(START) 기준이므로 도착 위치가 다르면 계획만 다시 세움
+                spawn_plan = self._plan_floor_spawns(dungeon_map, level, map_config, map_type, spawn_at,
+                                                     FloorRandom(self.dungeon_seed, level))
+        else:
+            dungeon_map, spawn_plan = self._prepare_floor(key, map_config, spawn_at)
+        
+        if self.floor_cache:
+            self.floor_cache.store(key, dungeon_map)
+        return dungeon_map, spawn_plan
+
+    def _prepare_floor(self, key, map_config, spawn_at: str):
+        """
+        층 맵(디스크 캐시 > 즉시 생성)과 배치 계획을 만듭니다.
+        엔진 상태와 World를 바꾸지 않으므로 선생성 워커 스레드에서도 호출됩니다.
+        """
+        from .floor_prefetch import build_floor_map
+        level, _seed, _width, _height, map_type = key
+        
+        dungeon_map = self.floor_cache.load(key) if self.floor_cache else None
+        if dungeon_map is not None:
+            logging.info(f"[FloorCache] Floor {level} map loaded from cache")
+        else:
+            dungeon_map = build_floor_map(*key)
+        
+        spawn_plan = self._plan_floor_spawns(dungeon_map, level, map_config, map_type, spawn_at,
+                                             FloorRandom(self.dungeon_seed, level))
+        return dungeon_map, spawn_plan
+
+    def _prefetch_next_floor(self):
+        """다음 층(아래층) 맵 생성과 배치 계획을 백그라운드 워커에 예약합니다."""
+        if not self.prefetch_enabled:
+            return
+        next_level = self.current_level + 1
+        if next_level > 99:
+            return
+        map_config, width, height, map_type = self._get_floor_layout(next_level)
+        key = (next_level, self._get_floor_seed(next_level), width, height, map_type)
+        self.floor_prefetcher.schedule(key, lambda k: self._prepare_floor(k, map_config, "START"))
+
+    def _plan_floor_spawns(self, dungeon_map, level, map_config, map_type, spawn_at, floor_rng) -> SpawnPlan:
+        """
+        층의 몬스터/보스/오브젝트/함정 배치 계획을 세웁니다.
+        World와 현재 층 상태(current_level, floor_rng)를 건드리지 않고 floor_rng에서만 난수를 뽑으므로,
+        선생성 워커에서 세운 계획과 층 진입 시 바로 세운 계획이 항상 같습니다.
+        """
+        if spawn_at == "EXIT":
+            player_pos = (dungeon_map.exit_x, dungeon_map.exit_y)
+        else:
+            player_pos = (dungeon_map.start_x, dungeon_map.start_y)
+        plan = SpawnPlan(level, spawn_at, floor_rng, occupied=[player_pos])
+
+        if map_type == "BOSS":
+            self._plan_boss_room_features(plan, dungeon_map)
+            return plan
+
+        rng = floor_rng.spawn
+        has_boss = map_config.has_boss if map_config else False
+        if has_boss:
+            # 보스 설정 가져오기
+            boss_ids = map_config.boss_ids
+            boss_count = map_config.boss_count if map_config.boss_count > 0 else (len(boss_ids) if boss_ids else 1)
+            attacker_pool = map_config.monster_pool
+            
+            # 보스 스폰 (진입 시 즉각 알림)
+            for i in range(boss_count):
+                # 보스 ID 결정 (리스트 순환하거나 없으면 랜덤)
+                b_id = boss_ids[i % len(boss_ids)] if boss_ids else None
                 
-                # 보스 스폰 및 즉각 알림
-                for i in range(boss_count):
-                    # 보스 ID 결정 (리스트 순환하거나 없으면 랜덤)
-                    b_id = boss_ids[i % len(boss_ids)] if boss_ids else None
-                    
-                    # 출구 주변에 분산 배치
-                    spawn_x = dungeon_map.exit_x - 3 - (i % 3)
-                    spawn_y = dungeon_map.exit_y + (i // 3) - (boss_count // 6)
+                # 출구 주변에 분산 배치
+                spawn_x = dungeon_map.exit_x - 3 - (i % 3)
+                spawn_y = dungeon_map.exit_y + (i // 3) - (boss_count // 6)
+                
+                boss_def = self._plan_boss(rng, attacker_pool, boss_name=b_id)
+                if boss_def:
+                    plan.add(SPAWN_BOSS, spawn_x, spawn_y, {'def': boss_def, 'announce': True})
                     
-                    boss_ent = self._spawn_boss(spawn_x, spawn_y, attacker_pool, boss_name=b_id)
-                    if boss_ent:
-                        m_comp = boss_ent.get_component(MonsterComponent)
-                        name = m_comp.type_name if m_comp else _("강력한 적")
-                        message_comp.add_message(_("​[경고] {}이(가) 나타났습니다!").format(name), "red")
-                        
-                # 주변 호위병 몇 기
-                for _i in range(3):
-                    rx = dungeon_map.exit_x - random.randint(3, 6)
-                    ry = dungeon_map.exit_y + random.randint(-3, 3)
-                    self._spawn_monster_at(rx, ry, pool=attacker_pool)
-
-            # [Safe Zone] Determine safe room index
-            safe_room_index = None
-            if spawn_at == "START":
-                safe_room_index = 0
-            elif spawn_at == "EXIT":
-                safe_room_index = len(dungeon_map.rooms) - 1
-
-            self._spawn_monsters(dungeon_map, map_config, safe_room_index=safe_room_index)
-            self._spawn_objects(dungeon_map, map_config)
-
+            # 주변 호위병 몇 기
+            for _i in range(3):
+                rx = dungeon_map.exit_x - rng.randint(3, 6)
+                ry = dungeon_map.exit_y + rng.randint(-3, 3)
+                self._plan_monster_at(plan, rng, rx, ry, pool=attacker_pool)
+
+        # [Safe Zone] Determine safe room index
+        safe_room_index = None
+        if spawn_at == "START":
+            safe_room_index = 0
+        elif spawn_at == "EXIT":
+            safe_room_index = len(dungeon_map.rooms) - 1
+
+        self._plan_monsters(plan, dungeon_map, map_config, safe_room_index=safe_room_index)
+        self._plan_objects(plan, dungeon_map, map_config)
+        return plan
+
+    def _apply_spawn_plan(self, plan, message_comp=None):
+        """배치 계획대로 엔티티를 생성합니다. 난수는 계획 단계에서 모두 뽑았으므로 여기서는 World만 변경합니다."""
+        for kind, x, y, data in plan.ops:
+            if kind == SPAWN_MONSTER:
+                self._create_monster(x, y, data)
+            elif kind == SPAWN_BOSS:
+                boss = self._create_boss(x, y, data['def'])
+                if data['announce'] and message_comp:
+                    name = boss.get_component(MonsterComponent).type_name
+                    message_comp.add_message(_("​[경고] {}이(가) 나타났습니다!").format(name), "red")
+            elif kind == SPAWN_TRAP:
+                self._create_trap(x, y, data)
+            elif kind == SPAWN_CHEST:
+                self._create_chest(x, y, data)
+            elif kind == SPAWN_MIMIC:
+                self._spawn_mimic(x, y)
+            elif kind == SPAWN_SHRINE:
+                self._spawn_shrine(x, y)
+            elif kind == SPAWN_SHOP:
+                shop = self.world.create_entity()
+                self.world.add_component(shop.entity_id, PositionComponent(x=x, y=y))
+                self.world.add_component(shop.entity_id, RenderComponent(char='S', color='magenta'))
+                self.world.add_component(shop.entity_id, ShopComponent(items=data))
+                self.world.add_component(shop.entity_id, MonsterComponent(type_name=_("상인")))
+            elif kind == SPAWN_LEVER:
+                lever = self.world.create_entity()
+                self.world.add_component(lever.entity_id, PositionComponent(x=x, y=y))
+                self.world.add_component(lever.entity_id, RenderComponent(char='&', color='yellow'))
+                # Lever toggles the door
+                self.world.add_component(lever.entity_id, InteractableComponent(
+                    interaction_type="LEVER", 
+                    data={"target_id": "BOSS_DOOR_KEY", "is_one_time": True}
+                ))
+            elif kind == SPAWN_DOOR:
+                door = self.world.create_entity()
+                self.world.add_component(door.entity_id, PositionComponent(x=x, y=y))
+                self.world.add_component(door.entity_id, RenderComponent(char='+', color='brown'))
+                self.world.add_component(door.entity_id, DoorComponent(is_open=False, is_locked=True, key_id="BOSS_DOOR_KEY")) # Locked, opened by lever
     def _spawn_monster_at(self, x, y, monster_def=None, pool=None):
         """지정된 위치에 몬스터 한 마리를 생성합니다."""
+        spawn = self._plan_monster(self._rand(STREAM_SPAWN), monster_def, pool)
+        return self._create_monster(x, y, spawn) if spawn else None
+
+    def _plan_monster(self, rng, monster_def=None, pool=None):
+        """몬스터 한 마리의 종류, 속성, 접두어, 행동 패턴을 뽑습니다 (World는 건드리지 않음)."""
         if not monster_def and self.monster_defs:
             if pool:
                 # 풀에서 유효한 몬스터 선택
                 candidates = [self.monster_defs[name] for name in pool if name in self.monster_defs]
                 if candidates:
-                    monster_def = random.choice(candidates)
+                    monster_def = rng.choice(candidates)
             
             if not monster_def:
                 # 보스 제외한 랜덤 몬스터 선택
                 normal_monsters = [m for m in self.monster_defs.values() if 'BOSS' not in m.flags]
-                monster_def = random.choice(normal_monsters if normal_monsters else list(self.monster_defs.values()))
+                monster_def = rng.choice(normal_monsters if normal_monsters else list(self.monster_defs.values()))
         
         if not monster_def: return None
 
+        # 상성 및 플래그 설정
+        all_elements = [ELEMENT_NONE, ELEMENT_WATER, ELEMENT_FIRE, ELEMENT_WOOD, ELEMENT_EARTH, ELEMENT_POISON]
+        monster_el = rng.choice(all_elements)
+
+        # 접두어 적용 (30%)
+        prefix_def = None
+        if rng.random() < 0.3:
+            prefix_def = self.modifier_manager.apply_monster_prefix(monster_def, rng=rng)
+
+        return {'def': monster_def, 'element': monster_el, 'prefix': prefix_def, 'behavior': rng.randint(1, 2)}
+
+    def _create_monster(self, x, y, spawn):
+        """_plan_monster가 뽑은 결과로 몬스터 엔티티를 생성합니다."""
+        monster_def, monster_el, mod_def = spawn['def'], spawn['element'], spawn['prefix']
         monster = self.world.create_entity()
         self.world.add_component(monster.entity_id, PositionComponent(x=x, y=y))
         
-        # 상성 및 플래그 설정
-        # 상성 및 플래그 설정
-        from .constants import ELEMENT_NONE, ELEMENT_WATER, ELEMENT_FIRE, ELEMENT_WOOD, ELEMENT_EARTH, ELEMENT_POISON, RARITY_NORMAL, RARITY_MAGIC, RARITY_UNIQUE
-        all_elements = [ELEMENT_NONE, ELEMENT_WATER, ELEMENT_FIRE, ELEMENT_WOOD, ELEMENT_EARTH, ELEMENT_POISON]
-        monster_el = random.choice(all_elements)
         # color = ELEMENT_COLORS.get(monster_el, "white") # REMOVED: Color now depends on Rarity
         color = RARITY_NORMAL
         
         m_flags = monster_def.flags.copy()
         if monster_el != "NONE": m_flags.add(monster_el.upper())
 
-        # 접두어 적용 (30%)
         m_name, m_hp, m_atk, m_def = monster_def.name, monster_def.hp, monster_def.attack, monster_def.defense
-        if random.random() < 0.3:
-            mod_def = self.modifier_manager.apply_monster_prefix(monster_def)
+        if mod_def:
             m_name, m_hp, m_atk, m_def = mod_def.name, mod_def.hp, mod_def.attack, mod_def.defense
             m_flags.update(mod_def.flags)
             # if mod_def.color != "white": color = mod_def.color # REMOVED: Prefix color logic overridden
@@ -571,7 +726,7 @@ class Engine:
 
         self.world.add_component(monster.entity_id, RenderComponent(char=monster_def.symbol, color=color))
         self.world.add_component(monster.entity_id, MonsterComponent(type_name=m_name, monster_id=monster_def.ID))
-        self.world.add_component(monster.entity_id, AIComponent(behavior=random.randint(1, 2), detection_range=8))
+        self.world.add_component(monster.entity_id, AIComponent(behavior=spawn['behavior'], detection_range=8))
         
         stats = StatsComponent(
             max_hp=m_hp, current_hp=m_hp, attack=m_atk, defense=m_def, 
@@ -586,8 +741,9 @@ class Engine:
         self.world.add_component(monster.entity_id, stats)
         return monster
 
-    def _spawn_monsters(self, dungeon_map, map_config=None, safe_room_index=None):
-        """일반 층의 몬스터들을 스폰합니다."""
+    def _plan_monsters(self, plan, dungeon_map, map_config=None, safe_room_index=None):
+        """일반 층의 몬스터 배치를 계획합니다."""
+        rng = plan.floor_rng.spawn
         pool = map_config.monster_pool if map_config else None
         
         starting_room = dungeon_map.rooms[0] if dungeon_map.rooms else None
@@ -601,142 +757,95 @@ class Engine:
                 continue
             
             # [Hack & Slash] Increase density and add 'Monster Nest' chance
-            if random.random() < 0.2: # 20% chance for Monster Nest
-                num = random.randint(15, 25)
+            if rng.random() < 0.2: # 20% chance for Monster Nest
+                num = rng.randint(15, 25)
             else:
-                num = random.randint(5, 12)
+                num = rng.randint(5, 12)
                 
+            if not room.floor_tiles:
+                continue
             for _i in range(num):
-                mx = random.randint(room.x1 + 1, room.x2 - 1)
-                my = random.randint(room.y1 + 1, room.y2 - 1)
+                # [Connectivity] 도달 가능한 바닥 타일에서 바로 선택 (벽/고립 지역 재시도 없음)
+                mx, my = rng.choice(room.floor_tiles)
                 
                 # [Fix] Safe zone check - don't spawn too close to start
                 dist_to_start = (mx - dungeon_map.start_x)**2 + (my - dungeon_map.start_y)**2
                 if dist_to_start < 400:  # 20 tile radius
                     continue
                     
-                self._spawn_monster_at(mx, my, pool=pool)
+                self._plan_monster_at(plan, rng, mx, my, pool=pool)
 
         # [Hack & Slash] Corridors
-        for cx, cy in dungeon_map.corridors:
-            if random.random() < 0.15:
+        for cx, cy in dungeon_map.reachable_corridors:
+            if rng.random() < 0.15:
                 if (cx - dungeon_map.start_x)**2 + (cy - dungeon_map.start_y)**2 < 400: continue
-                self._spawn_monster_at(cx, cy, pool=pool)
-
-        # [Balance] Monster Density Minimum Guarantee
-        # 1-25: 40, 26-50: 60, 51-75: 80, 76-99: 100
-        current_floor = self.current_level
-        target_count = 40
-        if current_floor >= 76: target_count = 100
-        elif current_floor >= 51: target_count = 80
-        elif current_floor >= 26: target_count = 60
-        
-        # Count existing monsters
-        existing_monsters = len(self.world.get_entities_with_components({MonsterComponent}))
-        
-        # Fill remaining
-        attempts = 0
-        while existing_monsters < target_count and attempts < 200:
-            attempts += 1
-            # Random room spawn
-            room = random.choice(dungeon_map.rooms)
-            if safe_room_index is not None and dungeon_map.rooms.index(room) == safe_room_index: continue
-            
-            rx = random.randint(room.x1 + 1, room.x2 - 1)
-            ry = random.randint(room.y1 + 1, room.y2 - 1)
-            
-            if (rx - dungeon_map.start_x)**2 + (ry - dungeon_map.start_y)**2 < 400: continue
-            
-            # Check occupancy
-            occupied = False
-            for e in self.world.get_entities_with_components({PositionComponent}):
-                p = e.get_component(PositionComponent)
-                if p.x == rx and p.y == ry:
-                    occupied = True
-                    break
-            if occupied: continue
-            
-            self._spawn_monster_at(rx, ry, pool=pool)
-            existing_monsters += 1
+                self._plan_monster_at(plan, rng, cx, cy, pool=pool)
 
         # [Balance] Monster Density Minimum Guarantee
         # 1-25: 40, 26-50: 60, 51-75: 80, 76-99: 100
-        current_floor = self.current_level
+        current_floor = plan.level
         target_count = 40
         if current_floor >= 76: target_count = 100
         elif current_floor >= 51: target_count = 80
         elif current_floor >= 26: target_count = 60
         
-        # Count existing monsters
-        existing_monsters = len(self.world.get_entities_with_components({MonsterComponent}))
+        # [Connectivity] 스폰 가능한 방만 추려 두고, 점유 위치는 계획이 모아 둔 집합을 사용
+        spawn_rooms = [room for i, room in enumerate(dungeon_map.rooms)
+                       if room.floor_tiles and i != safe_room_index]
         
         # Fill remaining
         attempts = 0
-        while existing_monsters < target_count and attempts < 200:
+        while spawn_rooms and plan.monster_count < target_count and attempts < 400:
             attempts += 1
-            # Random room spawn
-            room = random.choice(dungeon_map.rooms)
-            if safe_room_index is not None and dungeon_map.rooms.index(room) == safe_room_index: continue
-            
-            rx = random.randint(room.x1 + 1, room.x2 - 1)
-            ry = random.randint(room.y1 + 1, room.y2 - 1)
+            rx, ry = rng.choice(rng.choice(spawn_rooms).floor_tiles)
             
             if (rx - dungeon_map.start_x)**2 + (ry - dungeon_map.start_y)**2 < 400: continue
+            if (rx, ry) in plan.occupied: continue
             
-            # Check occupancy
-            occupied = False
-            for e in self.world.get_entities_with_components({PositionComponent}):
-                p = e.get_component(PositionComponent)
-                if p.x == rx and p.y == ry:
-                    occupied = True
-                    break
-            if occupied: continue
-            
-            self._spawn_monster_at(rx, ry, pool=pool)
-            existing_monsters += 1
+            self._plan_monster_at(plan, rng, rx, ry, pool=pool)
 
+    def _plan_monster_at(self, plan, rng, x, y, monster_def=None, pool=None):
+        """몬스터 한 마리를 뽑아 계획에 추가합니다."""
+        spawn = self._plan_monster(rng, monster_def, pool)
+        if spawn:
+            plan.add(SPAWN_MONSTER, x, y, spawn)
 
-    def _spawn_boss_room_features(self, dungeon_map):
-        """보스 방의 특징물(레버, 문, 보스 등)을 배치합니다."""
+    def _plan_boss_room_features(self, plan, dungeon_map):
+        """보스 방의 특징물(레버, 문, 보스 등) 배치를 계획합니다."""
         if not dungeon_map.map_type == "BOSS": return # Safety check
 
-        # 1. Spawn Lever (in Lever Room)
-        lx, ly = dungeon_map.lever_pos
-        lever = self.world.create_entity()
-        self.world.add_component(lever.entity_id, PositionComponent(x=lx, y=ly))
-        self.world.add_component(lever.entity_id, RenderComponent(char='&', color='yellow'))
-        # Lever toggles the door
-        self.world.add_component(lever.entity_id, InteractableComponent(
-            interaction_type="LEVER", 
-            data={"target_id": "BOSS_DOOR_KEY", "is_one_time": True}
-        ))
+        # 1. Spawn Lever (in Lever Room) - Lever toggles the door
+        plan.add(SPAWN_LEVER, *dungeon_map.lever_pos)
         
         # 2. Spawn Door (Locked) - Created in map generation? 
         # Actually dungeon_map.boss_door_pos is just a coordinate. We need to place a Door Entity there.
-        dx, dy = dungeon_map.boss_door_pos
-        door = self.world.create_entity()
-        self.world.add_component(door.entity_id, PositionComponent(x=dx, y=dy))
-        self.world.add_component(door.entity_id, RenderComponent(char='+', color='brown'))
-        self.world.add_component(door.entity_id, DoorComponent(is_open=False, is_locked=True, key_id="BOSS_DOOR_KEY")) # Locked, opened by lever
+        plan.add(SPAWN_DOOR, *dungeon_map.boss_door_pos)
         
         # 3. Spawn Boss (Specific to Floor)
         bx, by = dungeon_map.boss_spawn_pos
         boss_pool = None
         
-        if self.current_level == 25:
+        if plan.level == 25:
             boss_pool = ["BUTCHER"]
-        elif self.current_level == 50:
+        elif plan.level == 50:
             boss_pool = ["LEORIC"]
-        elif self.current_level == 75:
+        elif plan.level == 75:
             boss_pool = ["LICH_KING"]
-        elif self.current_level == 99:
+        elif plan.level == 99:
             boss_pool = ["DIABLO"]
             
-        self._spawn_boss(bx, by, pool=boss_pool)
+        boss_def = self._plan_boss(plan.floor_rng.spawn, pool=boss_pool)
+        if boss_def:
+            plan.add(SPAWN_BOSS, bx, by, {'def': boss_def, 'announce': False})
 
     def _spawn_boss(self, x, y, pool=None, boss_name=None, is_summoned=False):
         """지정된 위치에 보스를 스폰합니다."""
-        if not self.monster_defs: return
+        boss_def = self._plan_boss(self._rand(STREAM_SPAWN), pool, boss_name)
+        return self._create_boss(x, y, boss_def, is_summoned) if boss_def else None
+
+    def _plan_boss(self, rng, pool=None, boss_name=None):
+        """스폰할 보스 정의를 뽑습니다. 후보가 없으면 None을 반환합니다."""
+        if not self.monster_defs: return None
         
         boss_defs = []
         if boss_name and boss_name in self.monster_defs:
@@ -747,9 +856,12 @@ class Engine:
         if not boss_defs:
             boss_defs = [m for m in self.monster_defs.values() if 'BOSS' in m.flags]
             
-        if not boss_defs: return
+        if not boss_defs: return None
         
-        boss_def = random.choice(boss_defs)
+        return rng.choice(boss_defs)
+
+    def _create_boss(self, x, y, boss_def, is_summoned=False):
+        """보스 엔티티를 생성합니다."""
         boss = self.world.create_entity()
         self.world.add_component(boss.entity_id, PositionComponent(x=x, y=y))
         
@@ -801,16 +913,14 @@ class Engine:
         return boss
 
 
-    def _spawn_objects(self, dungeon_map, map_config=None):
-        """상자, 상인 등 오브젝트를 스폰합니다."""
+    def _plan_objects(self, plan, dungeon_map, map_config=None):
+        """상자, 상인, 함정, 신전 등 오브젝트 배치를 계획합니다."""
+        rng = plan.floor_rng.spawn
         starting_room = dungeon_map.rooms[0] if dungeon_map.rooms else None
         
         # 상인 (시작 방 고정)
         if starting_room:
             sx, sy = starting_room.x1 + 1, starting_room.y1 + 1
-            shop = self.world.create_entity()
-            self.world.add_component(shop.entity_id, PositionComponent(x=sx, y=sy))
-            self.world.add_component(shop.entity_id, RenderComponent(char='S', color='magenta'))
             shop_items = [
                 {'item': self.item_defs.get('체력 물약'), 'price': 20},
                 {'item': self.item_defs.get('마력 물약'), 'price': 20},
@@ -826,15 +936,14 @@ class Engine:
                 and item.required_level <= 5
             ]
             if equipment_candidates:
-                selected_gear = random.sample(equipment_candidates, min(3, len(equipment_candidates)))
+                selected_gear = rng.sample(equipment_candidates, min(3, len(equipment_candidates)))
                 for gear in selected_gear:
                     # 상점 가격 대략적 책정 (레벨 * 50 + 기본값)
-                    price = gear.required_level * 50 + random.randint(50, 150)
+                    price = gear.required_level * 50 + rng.randint(50, 150)
                     shop_items.append({'item': gear, 'price': price})
 
             shop_items = [si for si in shop_items if si['item'] is not None]
-            self.world.add_component(shop.entity_id, ShopComponent(items=shop_items))
-            self.world.add_component(shop.entity_id, MonsterComponent(type_name=_("상인")))
+            plan.add(SPAWN_SHOP, sx, sy, shop_items)
 
         # 보물 상자 (CSV 설정 기반)
         chest_count = map_config.chest_count if map_config and map_config.chest_count != -1 else 2
@@ -845,15 +954,16 @@ class Engine:
         floor = dungeon_map.dungeon_level_tuple[0]
             
         for _i in range(chest_count):
-            room = random.choice(other_rooms)
-            cx = random.randint(room.x1 + 1, room.x2 - 1)
-            cy = random.randint(room.y1 + 1, room.y2 - 1)
+            pos = dungeon_map.random_room_tile(rng.choice(other_rooms), rng)
+            if not pos:
+                continue
+            cx, cy = pos
             
             # 미믹 여부 결정
-            if random.random() < mimic_prob:
-                self._spawn_mimic(cx, cy)
+            if rng.random() < mimic_prob:
+                plan.add(SPAWN_MIMIC, cx, cy)
             else:
-                self._spawn_chest(cx, cy, floor, item_pool)
+                plan.add(SPAWN_CHEST, cx, cy, self._plan_chest(plan.floor_rng.loot, floor, item_pool))
 
 
         # 함정 (고정 개수 배치, 레벨 기반 필터링)
@@ -864,18 +974,17 @@ class Engine:
             # trap_count가 없으면 trap_prob 기반으로 추정
             trap_count = int(len(other_rooms) * map_config.trap_prob * 20)
         
-        self._spawn_traps_for_map(dungeon_map, trap_count, other_rooms)
+        self._plan_traps_for_map(plan, dungeon_map, trap_count, other_rooms)
         
         # [Shrine] 신전 (2층마다 1개, 보스 층 제외)
-        is_boss_floor = self.current_level % 5 == 0
-        if self.current_level % 2 == 0 and not is_boss_floor and other_rooms:
-            shrine_room = random.choice(other_rooms)
-            shrine_x = random.randint(shrine_room.x1 + 1, shrine_room.x2 - 1)
-            shrine_y = random.randint(shrine_room.y1 + 1, shrine_room.y2 - 1)
-            self._spawn_shrine(shrine_x, shrine_y)
-
+        is_boss_floor = plan.level % 5 == 0
+        if plan.level % 2 == 0 and not is_boss_floor and other_rooms:
+            pos = dungeon_map.random_room_tile(rng.choice(other_rooms), rng)
+            if pos:
+                plan.add(SPAWN_SHRINE, *pos)
     def _spawn_trap(self, x, y):
         """함정 엔티티 생성 (CSV 데이터 기반)"""
+        rng = self._rand(STREAM_TRAP)
         if not self.trap_defs:
             return  # 함정 정의가 없으면 생성하지 않음
         
@@ -885,7 +994,7 @@ class Engine:
         # CSV에서 로드한 함정 정의 중 가중치 기반 선택
         trap_list = list(self.trap_defs.values())
         weights = [t.weight for t in trap_list]
-        selected_trap = random.choices(trap_list, weights=weights, k=1)[0]
+        selected_trap = rng.choices(trap_list, weights=weights, k=1)[0]
         
         # TrapComponent 생성
         self.world.add_component(trap.entity_id, TrapComponent(
@@ -904,8 +1013,35 @@ class Engine:
                 color=selected_trap.color
             ))
     
-    def _spawn_traps_for_map(self, dungeon_map, trap_count: int, rooms: list):
-        """맵에 레벨에 맞는 함정을 고정 개수만큼 배치"""
+    def _trap_spawn(self, trap_def, **overrides):
+        """함정 정의로부터 TrapComponent 인자와 표시 정보(숨겨진 함정은 None)를 만듭니다."""
+        trap_kwargs = dict(
+            trap_type=trap_def.id,
+            damage_min=trap_def.damage_min,
+            damage_max=trap_def.damage_max,
+            effect=trap_def.status_effect,
+            is_hidden='HIDDEN' in trap_def.flags,
+            auto_reset='AUTO_RESET' in trap_def.flags
+        )
+        trap_kwargs.update(overrides)
+        render = None if 'HIDDEN' in trap_def.flags else (trap_def.symbol, trap_def.color)
+        return {'trap': trap_kwargs, 'render': render}
+
+    def _create_trap(self, x, y, trap_spawn):
+        """_trap_spawn이 만든 정보로 함정 엔티티를 생성합니다."""
+        trap = self.world.create_entity()
+        self.world.add_component(trap.entity_id, PositionComponent(x=x, y=y))
+        self.world.add_component(trap.entity_id, TrapComponent(**trap_spawn['trap']))
+        
+        # RenderComponent 추가 (숨겨진 함정은 나중에 발견 시 표시)
+        if trap_spawn['render']:
+            char, color = trap_spawn['render']
+            self.world.add_component(trap.entity_id, RenderComponent(char=char, color=color))
+        return trap
+    
+    def _plan_traps_for_map(self, plan, dungeon_map, trap_count: int, rooms: list):
+        """맵에 레벨에 맞는 함정을 고정 개수만큼 배치하도록 계획"""
+        rng = plan.floor_rng.trap
         if not self.trap_defs or trap_count <= 0:
             return
         
@@ -937,23 +1073,23 @@ class Engine:
             attempts += 1
             
             # 배치 위치 타입 선택 (바닥 70%, 복도 30%)
-            if random.random() < 0.7 and rooms:
+            if rng.random() < 0.7 and rooms:
                 # 방 바닥에 배치
                 # [Fix] 첫 번째 방(시작 방)은 제외하고 랜덤 선택
                 candidate_rooms = rooms[1:] if len(rooms) > 1 else rooms
                 if not candidate_rooms: continue
                 
-                room = random.choice(candidate_rooms)
-                x = random.randint(room.x1 + 1, room.x2 - 1)
-                y = random.randint(room.y1 + 1, room.y2 - 1)
-            elif dungeon_map.corridors:
+                pos = dungeon_map.random_room_tile(rng.choice(candidate_rooms), rng)
+                if not pos: continue
+                x, y = pos
+            elif dungeon_map.reachable_corridors:
                 # 복도에 배치
-                x, y = random.choice(dungeon_map.corridors)
+                x, y = rng.choice(dungeon_map.reachable_corridors)
             else:
                 continue
             
             # 중복 체크 (이미 함정이 있는 위치는 제외)
-            if not self._is_trap_at(x, y):
+            if not plan.has_trap_at(x, y):
                 # [Fix] Safe Zone Check - Don't spawn traps inside Start Room
                 if start_room and start_room.x1 <= x <= start_room.x2 and start_room.y1 <= y <= start_room.y2:
                      continue
@@ -962,23 +1098,24 @@ class Engine:
                 if (x - dungeon_map.start_x)**2 + (y - dungeon_map.start_y)**2 < 100: # 10 radius
                     continue
                 
-                self._spawn_trap_at(x, y, eligible_traps)
+                self._plan_trap_at(plan, rng, x, y, eligible_traps)
                 placed += 1
         
         # 2. 벽 함정 배치 (PROXIMITY)
         if wall_trap_count > 0:
-            self._spawn_wall_traps(dungeon_map, wall_trap_count)
+            self._plan_wall_traps(plan, dungeon_map, wall_trap_count)
 
         # 3. 연쇄 함정 구역 (Trap Gauntlet) 배치
         # 복도 중 일부를 선택하여 함정을 밀집 배치
-        self._spawn_trap_gauntlets(dungeon_map, eligible_traps)
+        self._plan_trap_gauntlets(plan, dungeon_map, eligible_traps)
 
         # 4. 압력판 배치 (10-20% 확률로 바닥 함정 대신 압력판 생성)
         # 이미 배치된 벽 함정 중 일부를 압력판으로 제어하도록 설정
-        self._link_pressure_plates(dungeon_map, rooms)
+        self._plan_pressure_plates(plan, dungeon_map, rooms)
 
-    def _spawn_trap_gauntlets(self, dungeon_map, eligible_traps: list):
-        """복도에 연쇄 함정 구역 생성"""
+    def _plan_trap_gauntlets(self, plan, dungeon_map, eligible_traps: list):
+        """복도에 연쇄 함정 구역 계획"""
+        rng = plan.floor_rng.trap
         if not dungeon_map.corridors or not eligible_traps:
             return
             
@@ -988,11 +1125,11 @@ class Engine:
         
         # 간단한 구현: 무작위 복도 타일을 선택하고 그 주변 복도 타일들에 함정 배치
         num_gauntlets = max(1, len(dungeon_map.corridors) // 100) # 맵 크기에 비례
-        if random.random() > 0.3: # 30% 확률로만 생성 (너무 자주 나오면 고통스러움)
+        if rng.random() > 0.3: # 30% 확률로만 생성 (너무 자주 나오면 고통스러움)
             num_gauntlets = 0
             
         for _i in range(num_gauntlets):
-            start_node = random.choice(dungeon_map.corridors)
+            start_node = rng.choice(dungeon_map.reachable_corridors or dungeon_map.corridors)
             gx, gy = start_node
             
             # [Fix] Safe Zone Check (Start Room + Radius)
@@ -1005,21 +1142,16 @@ class Engine:
                 continue
             
             # 주변 3x3 범위 내의 모든 복도 타일에 함정 배치 시도
-            traps_placed = 0
             for dy in range(-2, 3):
                 for dx in range(-2, 3):
                     tx, ty = gx + dx, gy + dy
-                    if (tx, ty) in dungeon_map.corridors:
-                        if not self._is_trap_at(tx, ty) and random.random() < 0.6:
-                            self._spawn_trap_at(tx, ty, eligible_traps)
-                            traps_placed += 1
-            
-            if traps_placed > 0:
-                # [DEBUG] print(f"Trap Gauntlet spawned at {gx}, {gy} with {traps_placed} traps")
-                pass
+                    if (tx, ty) in dungeon_map.corridor_set:
+                        if not plan.has_trap_at(tx, ty) and rng.random() < 0.6:
+                            self._plan_trap_at(plan, rng, tx, ty, eligible_traps)
 
-    def _link_pressure_plates(self, dungeon_map, rooms):
-        """벽 함정 중 일부를 압력판으로 제어하도록 링크 설정"""
+    def _plan_pressure_plates(self, plan, dungeon_map, rooms):
+        """벽 함정 중 일부를 압력판으로 제어하도록 링크 계획"""
+        rng = plan.floor_rng.trap
         if not self.trap_defs or not rooms:
             return
             
@@ -1033,104 +1165,57 @@ class Engine:
         if not pressure_defs:
             return
             
-        # 맵에 있는 모든 벽 함정 찾기
-        traps = self.world.get_entities_with_components({PositionComponent, TrapComponent})
-        wall_traps = []
-        for tent in traps:
-            tc = tent.get_component(TrapComponent)
-            if tc.trigger_type == 'PROXIMITY':
-                wall_traps.append(tent)
-        
+        # 계획된 모든 벽 함정 (생성 순서)
+        wall_traps = list(plan.wall_traps)
         if not wall_traps:
             return
             
         # 약 20%의 벽 함정을 압력판으로 제어
         num_to_link = max(1, len(wall_traps) // 5)
-        random.shuffle(wall_traps)
+        rng.shuffle(wall_traps)
         
         for i in range(min(num_to_link, len(wall_traps))):
-            target_trap = wall_traps[i]
-            t_pos = target_trap.get_component(PositionComponent)
-            t_comp = target_trap.get_component(TrapComponent)
+            tx, ty = wall_traps[i]
             
             # 압력판 위치 선정 (벽 함정 근처 방 바닥)
-            found_pos = False
             for _i in range(10): # 최대 10번 시도
-                room = random.choice(rooms)
-                px = random.randint(room.x1 + 1, room.x2 - 1)
-                py = random.randint(room.y1 + 1, room.y2 - 1)
+                pos = dungeon_map.random_room_tile(rng.choice(rooms), rng)
+                if not pos:
+                    continue
+                px, py = pos
                 
                 # 거리 체크 (너무 멀면 안됨)
-                dist = abs(px - t_pos.x) + abs(py - t_pos.y)
+                dist = abs(px - tx) + abs(py - ty)
                 
                 # [Fix] Safe Zone Check
                 if (px - dungeon_map.start_x)**2 + (py - dungeon_map.start_y)**2 < 400:
                     continue
 
-                if 2 < dist < 8 and not self._is_trap_at(px, py):
+                if 2 < dist < 8 and not plan.has_trap_at(px, py):
                     # 압력판 생성
-                    selected_p = random.choice(pressure_defs)
-                    pp = self.world.create_entity()
-                    self.world.add_component(pp.entity_id, PositionComponent(x=px, y=py))
-                    
-                    self.world.add_component(pp.entity_id, TrapComponent(
-                        trap_type=selected_p.id,
+                    selected_p = rng.choice(pressure_defs)
+                    plan.add(SPAWN_TRAP, px, py, self._trap_spawn(
+                        selected_p,
                         damage_min=0,
                         damage_max=0,
-                        is_hidden='HIDDEN' in selected_p.flags,
+                        effect=None,
                         trigger_type='STEP_ON',
-                        linked_trap_pos=(t_pos.x, t_pos.y),
-                        auto_reset='AUTO_RESET' in selected_p.flags,
+                        linked_trap_pos=(tx, ty),
                         reset_delay=2.0
                     ))
                     
-                    if 'HIDDEN' not in selected_p.flags:
-                        self.world.add_component(pp.entity_id, RenderComponent(
-                            char=selected_p.symbol,
-                            color=selected_p.color
-                        ))
-                    
                     # 연결된 원격 함정은 이제 근접 감지를 하지 않고 압력판에 의해서만 발동됨
                     # (여기서는 트리거 타입을 REMOTE로 유지하거나 그냥 둠. TrapSystem logic에 따라)
                     # 벽 함정의 trigger_type을 STEP_ON으로 바꿔서 플레이어가 밟아도 발동하게 할 수도 있음
                     # 또는 플레이어 감지 범위를 0으로 만들거나 hidden 처리
-                    found_pos = True
                     break
     
-    def _is_trap_at(self, x: int, y: int) -> bool:
-        """지정된 위치에 함정이 있는지 확인"""
-        traps = self.world.get_entities_with_components({PositionComponent, TrapComponent})
-        for trap in traps:
-            pos = trap.get_component(PositionComponent)
-            if pos.x == x and pos.y == y:
-                return True
-        return False
-    
-    def _spawn_trap_at(self, x: int, y: int, eligible_traps: list):
-        """지정된 위치에 적격 함정 중 하나를 배치"""
-        trap = self.world.create_entity()
-        self.world.add_component(trap.entity_id, PositionComponent(x=x, y=y))
-        
+    def _plan_trap_at(self, plan, rng, x: int, y: int, eligible_traps: list):
+        """지정된 위치에 적격 함정 중 하나를 배치하도록 계획"""
         # 가중치 기반 선택
         weights = [t.weight for t in eligible_traps]
-        selected_trap = random.choices(eligible_traps, weights=weights, k=1)[0]
-        
-        # TrapComponent 생성
-        self.world.add_component(trap.entity_id, TrapComponent(
-            trap_type=selected_trap.id,
-            damage_min=selected_trap.damage_min,
-            damage_max=selected_trap.damage_max,
-            effect=selected_trap.status_effect,
-            is_hidden="HIDDEN" in selected_trap.flags,
-            auto_reset="AUTO_RESET" in selected_trap.flags
-        ))
-        
-        # RenderComponent 추가 (숨겨진 함정은 나중에 발견 시 표시)
-        if 'HIDDEN' not in selected_trap.flags:
-            self.world.add_component(trap.entity_id, RenderComponent(
-                char=selected_trap.symbol,
-                color=selected_trap.color
-            ))
+        selected_trap = rng.choices(eligible_traps, weights=weights, k=1)[0]
+        plan.add(SPAWN_TRAP, x, y, self._trap_spawn(selected_trap))
     
     def _get_wall_adjacent_tiles(self, dungeon_map):
         """벽에 인접한 바닥 타일 반환 (x, y, direction)"""
@@ -1138,7 +1223,7 @@ class Engine:
         
         for y in range(1, dungeon_map.height - 1):
             for x in range(1, dungeon_map.width - 1):
-                if dungeon_map.map_data[y][x] == '.':  # 바닥 타일
+                if dungeon_map.map_data[y][x] == '.' and dungeon_map.is_reachable(x, y):  # 도달 가능한 바닥 타일
                     # 벽 인접성 확인 (4방향) - 벽 주변 바닥에 함정 설치
                     if dungeon_map.map_data[y-1][x] == '#':  # 북쪽 벽
                         adjacent_tiles.append((x, y, 'SOUTH'))
@@ -1151,8 +1236,9 @@ class Engine:
         
         return adjacent_tiles
     
-    def _spawn_wall_traps(self, dungeon_map, count: int):
-        """벽에 인접한 위치에 벽 함정 배치"""
+    def _plan_wall_traps(self, plan, dungeon_map, count: int):
+        """벽에 인접한 위치에 벽 함정 배치 계획"""
+        rng = plan.floor_rng.trap
         if not self.trap_defs or count <= 0:
             return
         
@@ -1173,7 +1259,7 @@ class Engine:
         
         # 랜덤하게 선택하여 배치
         placed = 0
-        random.shuffle(wall_tiles)
+        rng.shuffle(wall_tiles)
         
         for x, y, direction in wall_tiles:
             if placed >= count:
@@ -1190,35 +1276,18 @@ class Engine:
             if (x - dungeon_map.start_x)**2 + (y - dungeon_map.start_y)**2 < 100:
                 continue
 
-            if not self._is_trap_at(x, y):
-                # 벽 함정 배치
-                trap = self.world.create_entity()
-                self.world.add_component(trap.entity_id, PositionComponent(x=x, y=y))
-                
+            if not plan.has_trap_at(x, y):
                 # 가중치 기반 선택
                 weights = [t.weight for t in wall_traps]
-                selected_trap = random.choices(wall_traps, weights=weights, k=1)[0]
+                selected_trap = rng.choices(wall_traps, weights=weights, k=1)[0]
                 
-                # TrapComponent 생성 (direction 포함)
-                self.world.add_component(trap.entity_id, TrapComponent(
-                    trap_type=selected_trap.id,
-                    damage_min=selected_trap.damage_min,
-                    damage_max=selected_trap.damage_max,
-                    effect=selected_trap.status_effect,
-                    is_hidden='HIDDEN' in selected_trap.flags,
+                # 벽 함정 배치 (direction 포함)
+                plan.add(SPAWN_TRAP, x, y, self._trap_spawn(
+                    selected_trap,
                     trigger_type='PROXIMITY',
                     direction=direction,
-                    detection_range=5,
-                    auto_reset='AUTO_RESET' in selected_trap.flags
+                    detection_range=5
                 ))
-                
-                # RenderComponent 추가
-                if 'HIDDEN' not in selected_trap.flags:
-                    self.world.add_component(trap.entity_id, RenderComponent(
-                        char=selected_trap.symbol,
-                        color=selected_trap.color
-                    ))
-                
                 placed += 1
     
     def _spawn_shrine(self, x, y):
@@ -1250,35 +1319,26 @@ class Engine:
         self.world.add_component(monster.entity_id, stats)
 
 
-    def _spawn_chest(self, x, y, floor, item_pool=None):
-        """일반 보물상자 스폰"""
-        chest = self.world.create_entity()
-        self.world.add_component(chest.entity_id, PositionComponent(x=x, y=y))
-        self.world.add_component(chest.entity_id, RenderComponent(char='[', color='gold_bg'))
-        self.world.add_component(chest.entity_id, ChestComponent())
-        
+    def _plan_chest(self, rng, floor, item_pool=None):
+        """일반 보물상자의 내용물(아이템, 골드, 숨김 여부)을 뽑습니다."""
         loot_items = []
         
         # 1. Determine Item
-        item_id = None
         if item_pool:
-            # print(f"DEBUG: Using item pool: {item_pool}")
             candidates = [self.item_defs[name] for name in item_pool if name in self.item_defs]
         else:
             candidates = self._get_eligible_items(floor)
         
         if not candidates:
-             print(f"DEBUG: No candidates for floor {floor}. ItemDef count: {len(self.item_defs)}")
+            logging.debug(f"[Chest] No candidates for floor {floor}. ItemDef count: {len(self.item_defs)}")
         
         if candidates:
-            print(f"DEBUG: Chest Candidates: {len(candidates)}")
-            item = random.choice(candidates)
+            item = rng.choice(candidates)
             # [Fix] Clone item to avoid modifying the definition
             item = copy.deepcopy(item)
-            item_id = item.name
             
             # 2. Determine Rarity
-            rarity = self._get_rarity(floor)
+            rarity = self._get_rarity(floor, rng=rng)
             item.rarity = rarity
             
             # [Endgame] 95-99F: Force Magic+ or higher chance
@@ -1287,9 +1347,9 @@ class Engine:
                 pass 
 
             if rarity == "MAGIC" or rarity == "UNIQUE":
-                prefix_id, suffix_id = self._roll_magic_affixes(item.type, floor)
+                prefix_id, suffix_id = self._roll_magic_affixes(item.type, floor, rng=rng)
                 if prefix_id or suffix_id:
-                     affixed = self._create_item_with_affix(item.name, prefix_id, suffix_id, floor) # Pass floor
+                     affixed = self._create_item_with_affix(item.name, prefix_id, suffix_id, floor, rng=rng) # Pass floor
                      if affixed:
                          item = affixed
             
@@ -1299,11 +1359,20 @@ class Engine:
             
             loot_items.append({'item': item, 'qty': 1})
             
-        self.world.add_component(chest.entity_id, LootComponent(items=loot_items, gold=random.randint(10, 50)))
-        
+        gold = rng.randint(10, 50)
         # 20% 확률로 숨겨진 상자 설정
-        if random.random() < 0.2:
+        return {'items': loot_items, 'gold': gold, 'hidden': rng.random() < 0.2}
+
+    def _create_chest(self, x, y, loot):
+        """_plan_chest가 뽑은 내용물로 보물상자를 생성합니다."""
+        chest = self.world.create_entity()
+        self.world.add_component(chest.entity_id, PositionComponent(x=x, y=y))
+        self.world.add_component(chest.entity_id, RenderComponent(char='[', color='gold_bg'))
+        self.world.add_component(chest.entity_id, ChestComponent())
+        self.world.add_component(chest.entity_id, LootComponent(items=loot['items'], gold=loot['gold']))
+        if loot['hidden']:
             self.world.add_component(chest.entity_id, HiddenComponent(blink=True))
+        return chest
 
     def _spawn_minion(self, x, y, m_id):
         """보스 등이 소환하는 미니언 생성"""
@@ -1364,8 +1433,8 @@ class Engine:
     def _get_input(self) -> Optional[str]:
         """사용자 입력을 받음 (os.read를 사용한 저수준 정밀 파싱)"""
         fd = sys.stdin.fileno()
-        # 데이터가 있는지 확인
-        dr, dw, de = select.select([fd], [], [], 0.005)
+        # 데이터가 있는지 확인 (대기는 메인 루프의 _wait_for_input이 담당)
+        dr, dw, de = select.select([fd], [], [], 0)
         if not dr:
             return None
 
@@ -1398,8 +1467,9 @@ class Engine:
         except:
             return None
             
-    def _get_rarity(self, floor: int, magic_find: int = 0) -> str:
+    def _get_rarity(self, floor: int, magic_find: int = 0, rng=None) -> str:
         """층수와 Magic Find에 따른 아이템 등급 결정 (Top-Down: UNIQUE -> MAGIC -> NORMAL)"""
+        rng = rng or self._rand(STREAM_LOOT)
         # [Themed Rarity Rates]
         # Lv 1-25: Normal 85%, Magic 14.5%, Unique 0.5%
         # Lv 26-50: Normal 70%, Magic 24.5%, Unique 5.5%
@@ -1436,24 +1506,25 @@ class Engine:
         p_magic = min(1.0, base_magic * mf_factor)
         
         # 1. Check Unique
-        if random.random() < p_unique:
+        if rng.random() < p_unique:
             return "UNIQUE" # 실제 데이터가 없으면 아래에서 MAGIC으로 처리될 수 있음 (시스템에 따라)
             
         # 2. Check Magic (Failed Unique)
-        if random.random() < p_magic:
+        if rng.random() < p_magic:
             return "MAGIC"
             
         # 3. Else Normal
         return "NORMAL"
 
-    def _roll_magic_affixes(self, item_type: str, floor: int) -> tuple:
+    def _roll_magic_affixes(self, item_type: str, floor: int, rng=None) -> tuple:
         """Magic 아이템의 접두사/접미사 결정"""
+        rng = rng or self._rand(STREAM_LOOT)
         prefix_id = None
         suffix_id = None
         
         # 1. Combination Roll
         # Prefix Only (40%), Suffix Only (40%), Both (20%)
-        roll = random.random()
+        roll = rng.random()
         want_prefix = False
         want_suffix = False
         
@@ -1478,7 +1549,7 @@ class Engine:
                 if item_type in pdef.allowed_types and pdef.min_level <= floor:
                     valid_p.append(pid)
             if valid_p:
-                prefix_id = random.choice(valid_p)
+                prefix_id = rng.choice(valid_p)
                 
                 # [CURSED] If prefix is Cursed, force suffix
                 if prefix_id == "Cursed":
@@ -1490,7 +1561,7 @@ class Engine:
                 if item_type in sdef.allowed_types and sdef.min_level <= floor:
                     valid_s.append(sid)
             if valid_s:
-                suffix_id = random.choice(valid_s)
+                suffix_id = rng.choice(valid_s)
                 
         return prefix_id, suffix_id
 
@@ -1511,8 +1582,9 @@ class Engine:
                 valid.append(sid)
         return valid
 
-    def _create_item_with_affix(self, item_id: str, prefix_id: str = None, suffix_id: str = None, floor: int = 1) -> Any:
+    def _create_item_with_affix(self, item_id: str, prefix_id: str = None, suffix_id: str = None, floor: int = 1, rng=None) -> Any:
         """접두사/접미사가 적용된 아이템 인스턴스(복제본) 생성"""
+        rng = rng or self._rand(STREAM_LOOT)
         original = self.item_defs.get(item_id)
         if not original: return None
         
@@ -1530,21 +1602,21 @@ class Engine:
             
             # 1. Attack / Hit
             if pdef.damage_percent_min or pdef.damage_percent_max:
-                item.damage_percent += random.randint(pdef.damage_percent_min, pdef.damage_percent_max)
+                item.damage_percent += rng.randint(pdef.damage_percent_min, pdef.damage_percent_max)
             if pdef.to_hit_bonus_min or pdef.to_hit_bonus_max:
-                item.to_hit_bonus += random.randint(pdef.to_hit_bonus_min, pdef.to_hit_bonus_max)
+                item.to_hit_bonus += rng.randint(pdef.to_hit_bonus_min, pdef.to_hit_bonus_max)
             # 2. MP
             if pdef.mp_bonus_min or pdef.mp_bonus_max:
-                item.mp_bonus += random.randint(pdef.mp_bonus_min, pdef.mp_bonus_max)
+                item.mp_bonus += rng.randint(pdef.mp_bonus_min, pdef.mp_bonus_max)
             # 3. Resists
             if pdef.res_fire_min or pdef.res_fire_max:
-                item.res_fire += random.randint(pdef.res_fire_min, pdef.res_fire_max)
+                item.res_fire += rng.randint(pdef.res_fire_min, pdef.res_fire_max)
             if pdef.res_ice_min or pdef.res_ice_max:
-                item.res_ice += random.randint(pdef.res_ice_min, pdef.res_ice_max)
+                item.res_ice += rng.randint(pdef.res_ice_min, pdef.res_ice_max)
             if pdef.res_lightning_min or pdef.res_lightning_max:
-                item.res_lightning += random.randint(pdef.res_lightning_min, pdef.res_lightning_max)
+                item.res_lightning += rng.randint(pdef.res_lightning_min, pdef.res_lightning_max)
             if pdef.res_all_min or pdef.res_all_max:
-                item.res_all += random.randint(pdef.res_all_min, pdef.res_all_max)
+                item.res_all += rng.randint(pdef.res_all_min, pdef.res_all_max)
 
 
         # 2. Suffix Application
@@ -1582,14 +1654,14 @@ class Engine:
                           possible_skills.append(s_id)
                           
              if possible_skills:
-                 new_skill = random.choice(possible_skills)
+                 new_skill = rng.choice(possible_skills)
                  item.skill_id = new_skill
                  # 이름 변경 (옵션)
                  # item.name = f"{item.name} [{self.skill_defs[new_skill].name}]"
 
         # 4. Identification Chance (Affixed items and magical staves)
         if (prefix_id or suffix_id or (item.type == 'WEAPON' and '지팡이' in item.name)):
-            if random.random() < 0.7: # 70% chance to be unidentified
+            if rng.random() < 0.7: # 70% chance to be unidentified
                 item.is_identified = False
 
         return item
@@ -1615,17 +1687,17 @@ class Engine:
             sys.stdout.write("\033[?25l")
             sys.stdout.flush()
             
+            # [Loop] 고정 시간 간격: 로직은 LOGIC_TICK_RATE로, 주기적 렌더링은 RENDER_FPS 상한으로 분리
+            # 실시간 시계를 쓰고 있으면 틱마다 정확히 1틱만큼 진행하는 시계로 바꿔 로직 시간을 틱 단위로 맞춤
+            if isinstance(self.world.clock, RealClock):
+                self.world.clock = FakeClock(self.world.clock.now())
+            pacer = self.frame_pacer = FramePacer(LOGIC_TICK_RATE, RENDER_FPS, MAX_CATCHUP_TICKS)
+            
             # 첫 렌더링
             self._render()
-            
-            last_frame_time = time.time()
-            target_fps = 20
-            frame_duration = 1.0 / target_fps
+            pacer.rendered()
             
             while self.is_running:
-                current_time = time.time()
-                elapsed_since_frame = current_time - last_frame_time
-                
                 # 1. 사용자 입력 처리 (비차단)
                 action = self._get_input()
                 
@@ -1663,7 +1735,7 @@ class Engine:
                         
                         # 입력 직후 즉시 렌더링
                         self._render()
-                        last_frame_time = current_time
+                        pacer.rendered()
                     
                     elif self.state == GameState.INVENTORY:
                         if action_lower in ['i', 'b', 'q', '\x1b']:
@@ -1671,21 +1743,21 @@ class Engine:
                         else:
                             self._handle_inventory_input(action)
                         self._render()
-                        last_frame_time = current_time
+                        pacer.rendered()
                     elif self.state == GameState.CHARACTER_SHEET:
                         if action_lower in ['c', 'b', 'q', '\x1b']:
                             self.state = GameState.PLAYING
                         else:
                             self._handle_character_sheet_input(action)
                         self._render()
-                        last_frame_time = current_time
+                        pacer.rendered()
                     elif self.state == GameState.SHOP:
                         if action_lower in ['q', 'b', '\x1b']:
                             self.state = GameState.PLAYING
                         else:
                             self._handle_shop_input(action)
                         self._render()
-                        last_frame_time = current_time
+                        pacer.rendered()
                     
                     elif self.state == GameState.SHRINE:
                         if action_lower in ['q', 'b', 'esc', '\x1b']:
@@ -1693,47 +1765,43 @@ class Engine:
                         else:
                             self._handle_shrine_input(action)
                         self._render()
-                        last_frame_time = current_time
+                        pacer.rendered()
                     
                     # [Enhancement] Oil Selection Input
                     elif self.oil_selection_open:
                         self._handle_oil_selection_input(action)
                         self._render()
-                        last_frame_time = current_time
+                        pacer.rendered()
                 
-                # 2. 실시간 로직 처리 (PLAYING 상태일 때만)
+                # 2. 고정 간격 로직 틱 (PLAYING 상태일 때만, 밀린 틱은 MAX_CATCHUP_TICKS까지 따라잡음)
+                ticks = pacer.advance()
                 if self.state == GameState.PLAYING:
-                    # 이벤트 처리
-                    self.world.event_manager.process_events()
-                    
-                    # 모든 시스템 실행 (실시간)
-                    for system in self.world._systems:
-                        if system is not None:
-                            system.process()
-                    
-                    # 이벤트 재처리
-                    self.world.event_manager.process_events()
-
-                    # 플레이어 사망 체크
-                    player_entity = self.world.get_player_entity()
-                    if player_entity:
-                        stats = player_entity.get_component(StatsComponent)
-                        if stats and stats.current_hp <= 0:
+                    for _tick in range(ticks):
+                        if hasattr(self.world.clock, 'advance'):
+                            self.world.clock.advance(pacer.tick_dt)
+                        if self._logic_tick():
                             game_result = "DEATH"
                             self.is_running = False
+                            break
 
-                # 3. 주기적 렌더링
-                if elapsed_since_frame >= frame_duration:
+                # 3. 주기적 렌더링 (RENDER_FPS 상한)
+                if self.is_running and pacer.render_due():
                     self._render()
-                    last_frame_time = current_time
+                    pacer.rendered()
                     if self.shake_timer > 0:
                         self.shake_timer -= 1
                 
-                time.sleep(0.05)  # 20 FPS for game logic
+                # 4. 다음 틱/렌더링까지 남은 시간만 대기 (입력이 들어오면 즉시 깨어남)
+                if self.is_running:
+                    self._wait_for_input(pacer.sleep_time())
 
         except KeyboardInterrupt:
             game_result = "QUIT"
         finally:
+            # 백그라운드 층 생성 워커 정리
+            self.floor_prefetcher.shutdown()
+            # [Render] 프레임당 출력량 기록 (변경된 칸만 출력하는 렌더러)
+            logging.info(f"[Render] {self.renderer.stats}")
             # 설정 복구 및 커서 보이기
             termios.tcsetattr(fd, termios.TCSADRAIN, self.old_settings)
             sys.stdout.write("\033[?25h")
@@ -1752,6 +1820,32 @@ class Engine:
             
         return game_result
 
+    def _logic_tick(self) -> bool:
+        """로직 1틱 (이벤트 처리 + 모든 시스템 실행). 플레이어가 사망했으면 True를 반환합니다."""
+        self.world.event_manager.process_events()
+        
+        # 모든 시스템 실행
+        for system in self.world._systems:
+            if system is not None:
+                system.process()
+        
+        # 이벤트 재처리
+        self.world.event_manager.process_events()
+
+        # 플레이어 사망 체크
+        player_entity = self.world.get_player_entity()
+        if player_entity:
+            stats = player_entity.get_component(StatsComponent)
+            if stats and stats.current_hp <= 0:
+                return True
+        return False
+
+    def _wait_for_input(self, timeout: float):
+        """입력이 들어오거나 timeout(초)이 지날 때까지 대기합니다."""
+        if timeout <= 0:
+            return
+        select.select([sys.stdin.fileno()], [], [], timeout)
+
     def _record_ranking(self, outcome: str):
         """현재 캐릭터의 기록을 랭킹에 저장합니다."""
         player = self.world.get_player_entity() # EntityId
@@ -1869,7 +1963,9 @@ class Engine:
             "selected_class": selected_class,
             "current_level": self.current_level,
             "turn_number": self.turn_number,
+            "cooldowns": self.world.cooldowns.to_dict(self.world.clock.now(), [player_entity.entity_id]), # 남은 시간으로 저장
             "last_boss_id": self.last_boss_id,
+            "dungeon_seed": self.dungeon_seed,
             "current_map": self.dungeon_map.to_dict() if self.dungeon_map else None # [Map Persistence]
         }
         
@@ -1901,11 +1997,14 @@ class Engine:
         inv = player_entity.get_component(InventoryComponent)
         level_comp = player_entity.get_component(LevelComponent)
         
+        cooldowns = self.world.cooldowns.to_dict(self.world.clock.now(), [player_entity.entity_id])
+        
         # 2. 월드 초기화 (모든 엔티티 삭제)
         self.world.clear_all_entities()
 
-        # 3. 새로운 층 생성 (플레이어 복원 포함)
+        # 3. 새로운 층 생성 (플레이어 복원 포함, 플레이어 ID는 다시 1)
         self._initialize_world(preserve_player=(stats, inv, level_comp), spawn_at=spawn_at)
+        self.world.cooldowns.load(cooldowns, self.world.clock.now())
 
     def handle_shop_open_event(self, event: ShopOpenEvent):
         """플레이어가 상인과 충돌 시 상점 모드로 전환"""
@@ -2430,6 +2529,7 @@ class Engine:
                 
                 # Show selection menu (with game screen overlay)
                 selected = self.ui.show_identify_menu(unidentified, game_renderer=self._render)
+                self.renderer.invalidate() # 메뉴가 화면에 직접 그렸으므로 다음 프레임은 전체 다시 그리기
                 
                 if selected is None:
                     # User cancelled
@@ -2464,11 +2564,11 @@ class Engine:
                 if "VISION_UP" not in stats.flags:
                     stats.flags.add("VISION_UP")
                     # 만료 시간을 StatsComponent에 저장 (초 단위)
-                    stats.vision_expires_at = time.time() + float(duration)
+                    stats.vision_expires_at = self.world.clock.now() + float(duration)
                 
                 # [추가] 숨겨진 아이템 감지 효과
                 stats.sees_hidden = True
-                stats.sees_hidden_expires_at = time.time() + float(duration)
+                stats.sees_hidden_expires_at = self.world.clock.now() + float(duration)
                 
                 msg += " 어둠이 걷히며 숨겨진 기운들이 느껴집니다!"
                 
@@ -2502,18 +2602,16 @@ class Engine:
             # [Stat Buff] 능력치 버약/버프 적용
             if any(v != 0 for v in [item.str_bonus, item.mag_bonus, item.dex_bonus, item.vit_bonus]) and item.duration > 0:
                 from .components import StatModifierComponent
-                modifiers = player_entity.get_components(StatModifierComponent)
                 buff_source = f"ITEM_{item.name}"
-                existing = next((m for m in modifiers if m.source == buff_source), None)
+                existing = modifier_totals(player_entity).sources.get(buff_source)
                 if existing:
-                    existing.expires_at = time.time() + item.duration
+                    existing.duration = item.duration
                 else:
                     new_mod = StatModifierComponent(
                         str_mod=item.str_bonus, mag_mod=item.mag_bonus, 
                         dex_mod=item.dex_bonus, vit_bonus=item.vit_bonus, 
                         duration=item.duration, source=buff_source
                     )
-                    new_mod.expires_at = time.time() + item.duration
                     self.world.add_component(player_entity.entity_id, new_mod)
                 
                 msg += f" {item.name}의 효과가 나타납니다!"
@@ -2849,21 +2947,16 @@ class Engine:
         reduction = stats.attack_speed * 0.05
         stats.action_delay = max(0.05, 0.2 - reduction)
 
-        # 3. 일시적 버프(StatModifierComponent) 합산
-        modifiers = player_entity.get_components(StatModifierComponent)
-        at_mult = 1.0
-        df_mult = 1.0
-        for mod in modifiers:
-            stats.str += mod.str_mod
-            stats.mag += mod.mag_mod
-            stats.dex += mod.dex_mod
-            stats.vit += mod.vit_mod
-            at_mult *= getattr(mod, 'attack_multiplier', 1.0)
-            df_mult *= getattr(mod, 'defense_multiplier', 1.0)
+        # 3. 일시적 버프(StatModifierComponent) 합산 (캐시된 합산값)
+        totals = modifier_totals(player_entity)
+        stats.str += totals.str_mod
+        stats.mag += totals.mag_mod
+        stats.dex += totals.dex_mod
+        stats.vit += totals.vit_mod
         
         # Apply Multipliers to Final Stats for UI display
-        stats.attack = int(stats.attack * at_mult)
-        stats.defense = int(stats.defense * df_mult)
+        stats.attack = int(stats.attack * totals.attack_multiplier)
+        stats.defense = int(stats.defense * totals.defense_multiplier)
         
         # [Derived Stats Calculation] (New Implementation)
         hp_ratio = 2.0
@@ -2997,8 +3090,40 @@ class Engine:
         """샌드박스 모드 등에서 특수 입력을 처리하기 위한 훅. (기본은 처리하지 않음)"""
         return False
 
+    def player_step_interval(self) -> float:
+        """플레이어가 한 칸 걷는 데 걸리는 가장 짧은 시간 (멀리서 쉬는 몬스터를 언제 다시 살펴볼지 정할 때 사용)"""
+        player = self.world.get_player_entity()
+        stats = player.get_component(StatsComponent) if player else None
+        return stats.action_delay if stats else 0.0
+
+    def next_scheduled_time(self, include_player: bool = True) -> Optional[float]:
+        """
+        다음에 무언가 일어날 수 있는 가장 이른 월드 시각
+        (상태 타이머, 몬스터/보스 행동 예약, 플레이어 행동 가능 시각). 예약된 것이 없으면 None.
+        플레이어가 기절/수면/완전 석화(3스택) 중이면 풀리는 시각까지는 행동할 수 없는 것으로 봅니다 (InputSystem과 같은 기준).
+        """
+        times = [self.world.timers.next_due()]
+        for system_type in (MonsterAISystem, BossSystem):
+            system = self.world.get_system(system_type)
+            if system:
+                times.append(system.scheduler.next_due())
+        player = self.world.get_player_entity() if include_player else None
+        stats = player.get_component(StatsComponent) if player else None
+        if stats:
+            ready = stats.last_action_time + stats.action_delay
+            petrified = player.get_component(PetrifiedComponent)
+            for comp in (player.get_component(StunComponent), player.get_component(SleepComponent),
+                         petrified if petrified is not None and petrified.stacks >= 3 else None):
+                if comp is not None:
+                    ready = max(ready, self.world.clock.now() + (comp.duration or 0))
+            times.append(ready)
+        times = [t for t in times if t is not None]
+        return min(times) if times else None
+
     def _render(self):
         """World 상태를 기반으로 Renderer를 사용하여 화면을 그립니다."""
+        if self.turbo:
+            return
         from .data_manager import ItemDefinition
         
         # 1. 사이드바 영역 계산
@@ -3031,10 +3156,12 @@ class Engine:
         # [Boss Bark] 보스 대사 추출 (타이핑 효과 반영된 것)
         boss_bark = None
         boss_ent_list = self.world.get_entities_with_components({BossComponent})
+        bark_now = self.world.clock.now()
         for be in boss_ent_list:
             b_comp = be.get_component(BossComponent)
-            if b_comp.visible_bark:
-                boss_bark = f"[{b_comp.boss_id}] {b_comp.visible_bark}"
+            visible = b_comp.bark_at(bark_now)
+            if visible:
+                boss_bark = f"[{b_comp.boss_id}] {visible}"
                 break
         
         map_comp_list = self.world.get_entities_with_components([MapComponent])
@@ -3191,55 +3318,12 @@ class Engine:
 
                 self.renderer.draw_char(screen_x, screen_y, char, color)
 
-                # 2-0. 상태 이상 시각 효과 (오버헤드 아이콘) - 우선순위 순서로 표시
+                # 2-0. 상태 이상 시각 효과 (오버헤드 아이콘) - 효과 표의 우선순위 순서로 표시
                 # Priority: Petrified > Stun > Sleep > Poison > Bleeding > Mana Shield
-                from .components import (BleedingComponent, ManaShieldComponent)
-                
-                status_icon = None
-                status_color = "white"
-                status_duration = 0
-                
-                # 석화 (Petrified): 최우선 - 회색 돌 아이콘
-                if entity.has_component(PetrifiedComponent):
-                    comp = entity.get_component(PetrifiedComponent)
-                    status_icon = "◆"  # Diamond shape for stone
-                    status_color = "dark_grey"
-                    status_duration = comp.duration
-                
-                # 기절 (Stun): 별 아이콘
-                elif entity.has_component(StunComponent):
-                    comp = entity.get_component(StunComponent)
-                    status_icon = "*"  # Star for stun
-                    status_color = "yellow"
-                    status_duration = comp.duration
-                
-                # 수면 (Sleep): zZ 번갈아 표시
-                elif entity.has_component(SleepComponent):
-                    comp = entity.get_component(SleepComponent)
-                    status_icon = "z" if int(time.time() * 2) % 2 == 0 else "Z"
-                    status_color = "light_cyan"
-                    status_duration = comp.duration
-                
-                # 중독 (Poison): P (보라색)
-                elif entity.has_component(PoisonComponent):
-                    comp = entity.get_component(PoisonComponent)
-                    status_icon = "P"
-                    status_color = "magenta"
-                    status_duration = comp.duration
-                
-                # 출혈 (Bleeding): 물방울 아이콘
-                elif entity.has_component(BleedingComponent):
-                    comp = entity.get_component(BleedingComponent)
-                    status_icon = "~"  # Wave for bleeding
-                    status_color = "red"
-                    status_duration = comp.duration
-                
-                # 마나 쉴드 (Mana Shield): 방패 아이콘
-                elif entity.has_component(ManaShieldComponent):
-                    comp = entity.get_component(ManaShieldComponent)
-                    status_icon = "◇"  # Shield diamond
-                    status_color = "light_cyan"
-                    status_duration = comp.duration
+                effect, comp = top_status(entity)
+                status_icon = effect.icon_at(time.time()) if effect else None
+                status_color = effect.color if effect else "white"
+                status_duration = comp.duration if effect else 0
                 
                 # 상태 아이콘 및 지속시간 표시
                 if status_icon:
@@ -3377,8 +3461,7 @@ class Engine:
                 def_color = "white"
                 
                 # Check for Rage buff to highlight red
-                modifiers = player_entity.get_components(StatModifierComponent)
-                if any(mod.source == "레이지" for mod in modifiers):
+                if "레이지" in modifier_totals(player_entity).sources:
                     atk_color = "red"
                     def_color = "red"
 
@@ -3496,17 +3579,15 @@ class Engine:
         if player_entity:
             # 1. 활성화된 버프 확인 및 Duration 매핑 (Item Slots 용)
             active_item_buffs = {}
-            if hasattr(player_entity, 'components'):
-                 for comp in player_entity.components.values():
-                     if isinstance(comp, StatModifierComponent) and comp.source.startswith("ITEM_"):
-                         item_source_name = comp.source.replace("ITEM_", "")
-                         active_item_buffs[item_source_name] = comp.expires_at - time.time()
+            for source, comp in modifier_totals(player_entity).sources.items():
+                if source.startswith("ITEM_"):
+                    active_item_buffs[source.replace("ITEM_", "")] = comp.duration
             
             # 특수 효과 (VISION_UP 등)
             stats = player_entity.get_component(StatsComponent)
             if stats:
                 if "VISION_UP" in stats.flags and hasattr(stats, 'vision_expires_at'):
-                    active_item_buffs["횃불"] = stats.vision_expires_at - time.time()
+                    active_item_buffs["횃불"] = stats.vision_expires_at - self.world.clock.now()
 
             inv_comp = player_entity.get_component(InventoryComponent)
             if inv_comp and hasattr(inv_comp, 'item_slots'):
@@ -3528,15 +3609,16 @@ class Engine:
         if player_entity:
             inv_comp = player_entity.get_component(InventoryComponent)
             if inv_comp and hasattr(inv_comp, 'skill_slots'):
+                 # [Skill Cooldown] 진행 중인 쿨타임을 한 번에 조회
+                 active_cooldowns = self.combat_system.get_cooldowns(player_entity.entity_id) if hasattr(self, 'combat_system') else {}
                  for i, skill in enumerate(inv_comp.skill_slots):
                     skill_name = skill if skill else "----"
                     
                     # [Skill Cooldown] Display
                     cd_str = ""
-                    if hasattr(self, 'combat_system') and skill:
-                        current_cd = self.combat_system.get_cooldown(player_entity.entity_id, skill)
-                        if current_cd > 0:
-                            cd_str = f" ({int(current_cd)}s)"
+                    current_cd = active_cooldowns.get(skill, 0) if skill else 0
+                    if current_cd > 0:
+                        cd_str = f" ({int(current_cd)}s)"
                     
                     key_char = str((i + 6) % 10)
                     self.renderer.draw_text(RIGHT_SIDEBAR_X + 2, skill_y + i, f"{key_char}: {skill_name}{cd_str}", "white")
@@ -3568,11 +3650,7 @@ class Engine:
         sk_y = skill_start_y + 1
         if player_entity:
             # 1. 활성화된 버프 확인 및 Duration 매핑
-            active_buffs = {}
-            if hasattr(player_entity, 'components'):
-                 for comp in player_entity.components.values():
-                     if isinstance(comp, StatModifierComponent):
-                         active_buffs[comp.source] = comp.duration
+            active_buffs = {source: comp.duration for source, comp in modifier_totals(player_entity).sources.items()}
 
             inv_comp = player_entity.get_component(InventoryComponent)
             if inv_comp and hasattr(inv_comp, 'skill_slots'):
@@ -0,0 +1,75 @@
+# dungeon/floor_cache.py - 생성된 층 맵의 디스크 캐시
+
+import json
+import logging
+import os
+import random
+from typing import Optional, Tuple
+
+from .map import DungeonMap
+
+# (층, 구조 시드, 너비, 높이, 맵 타입) - floor_prefetch.FloorKey와 동일한 형식
+FloorKey = Tuple[int, int, int, int, str]
+
+DEFAULT_CACHE_DIR = os.path.join("game_data", "floor_cache")
+
+
+class FloorCache:
+    """
+    (시드, 층) 키로 생성된 DungeonMap을 JSON 파일로 보관하는 선택적 캐시.
+    같은 시드로 반복 실행하는 벤치마크, 버그 재현, 시뮬레이터에서 맵 재생성을 건너뛸 수 있습니다.
+    키에 크기와 맵 타입이 포함되므로 maps.csv가 바뀌면 자연스럽게 새 항목이 만들어집니다.
+    """
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR):
+        self.cache_dir = cache_dir
+        self.hits = 0
+        self.misses = 0
+
+    def _path(self, key: FloorKey) -> str:
+        level, seed, width, height, map_type = key
+        return os.path.join(self.cache_dir, f"floor_{seed}_{level}_{width}x{height}_{map_type}.json")
+
+    def contains(self, key: FloorKey) -> bool:
+        return os.path.exists(self._path(key))
+
+    def load(self, key: FloorKey) -> Optional[DungeonMap]:
+        """캐시된 맵을 불러옵니다. 없거나 손상된 경우 None을 반환합니다."""
+        path = self._path(key)
+        if not os.path.exists(path):
+            self.misses += 1
+            return None
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            # 방문 기록은 캐시하지 않으므로 매번 새 안개 상태로 시작
+            dungeon_map = DungeonMap.from_dict(data, random.Random(key[1]))
+        except (OSError, ValueError, KeyError) as e:
+            logging.warning(f"[FloorCache] Ignoring unreadable cache entry {path}: {e}")
+            self.misses += 1
+            return None
+        self.hits += 1
+        return dungeon_map
+
+    def store(self, key: FloorKey, dungeon_map: DungeonMap):
+        """맵을 캐시에 기록합니다. 이미 있으면 덮어쓰지 않습니다."""
+        path = self._path(key)
+        if os.path.exists(path):
+            return
+        data = dungeon_map.to_dict()
+        data["visited"] = []
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp_path = path + ".tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logging.warning(f"[FloorCache] Failed to write {path}: {e}")
+
+    def clear(self):
+        """캐시 디렉토리의 모든 층 파일을 삭제합니다."""
+        if not os.path.isdir(self.cache_dir):
+            return
+        for name in os.listdir(self.cache_dir):
+            if name.startswith("floor_") and name.endswith(".json"):
+                os.remove(os.path.join(self.cache_dir, name))
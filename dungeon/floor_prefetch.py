@@ -0,0 +1,89 @@
+# dungeon/floor_prefetch.py - 다음 층 백그라운드 선생성
+
+import logging
+import random
+import threading
+from concurrent.futures import ThreadPoolExecutor, Future
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from .map import DungeonMap
+
+# (층, 시드, 너비, 높이, 맵 타입)
+FloorKey = Tuple[int, int, int, int, str]
+
+
+def build_floor_map(level: int, seed: int, width: int, height: int, map_type: str) -> DungeonMap:
+    """
+    층 시드로부터 DungeonMap을 생성합니다.
+    동기 생성과 백그라운드 생성이 모두 이 함수를 거치므로, 같은 키에 대해 결과가 항상 같습니다.
+    엔진 상태(전역 random, World)에는 손대지 않으므로 워커 스레드에서 안전하게 호출할 수 있습니다.
+    """
+    return DungeonMap(width, height, random.Random(seed),
+                      dungeon_level_tuple=(level, 0),
+                      map_type=map_type)
+
+
+def _build_from_key(key: FloorKey) -> DungeonMap:
+    return build_floor_map(*key)
+
+
+class FloorPrefetcher:
+    """
+    플레이어가 현재 층을 탐험하는 동안 다음 층을 워커 스레드에서 미리 준비해 두는 관리자.
+    엔진은 맵과 함께 엔티티 배치 계획(SpawnPlan)까지 워커에서 만들어 두므로,
+    계단을 밟는 순간에는 계획대로 엔티티를 생성하기만 하면 되어 층 이동 시 멈춤이 줄어듭니다.
+    """
+    def __init__(self):
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending: Dict[FloorKey, Future] = {}
+        self._lock = threading.Lock()
+
+    def schedule(self, key: FloorKey, build: Optional[Callable[[FloorKey], Any]] = None):
+        """
+        해당 키의 층 생성을 예약합니다. 이미 예약된 키는 무시합니다.
+        build를 주면 맵 대신 build(key)의 결과를 준비합니다 (엔진은 (맵, 배치 계획)을 만듦).
+        """
+        with self._lock:
+            if key in self._pending:
+                return
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="floor-prefetch")
+            self._pending[key] = self._executor.submit(build or _build_from_key, key)
+        logging.debug(f"[Prefetch] Scheduled floor {key[0]} ({key[3]}x{key[2]}, {key[4]})")
+
+    def is_ready(self, key: FloorKey) -> bool:
+        """해당 키의 층 준비가 끝났는지 확인합니다."""
+        with self._lock:
+            future = self._pending.get(key)
+        return future is not None and future.done()
+
+    def take(self, key: FloorKey) -> Optional[Any]:
+        """
+        미리 준비된 결과를 꺼냅니다. 예약되지 않은 키면 None을 반환합니다.
+        아직 생성 중이면 완료될 때까지 기다립니다 (처음부터 새로 만드는 것보다 항상 빠름).
+        다른 키로 예약된 작업은 더 이상 쓸 일이 없으므로 함께 폐기합니다.
+        """
+        with self._lock:
+            future = self._pending.pop(key, None)
+            stale = list(self._pending.values())
+            self._pending.clear()
+        for f in stale:
+            f.cancel()
+
+        if future is None:
+            return None
+        try:
+            return future.result()
+        except Exception as e:
+            logging.error(f"[Prefetch] Background generation failed for floor {key[0]}: {e}")
+            return None
+
+    def shutdown(self):
+        """대기 중인 작업을 버리고 워커를 종료합니다."""
+        with self._lock:
+            for f in self._pending.values():
+                f.cancel()
+            self._pending.clear()
+            executor, self._executor = self._executor, None
+        if executor:
+            executor.shutdown(wait=False)
@@ -437,6 +437,8 @@ TRANSLATIONS = {
         "{}가 벽에 부딪혀 피해를 입었습니다!": "{} hit the wall and took damage!",
         "체력이 1 회복되었습니다.": "Recovered 1 HP.",
         "마력이 1 회복되었습니다.": "Recovered 1 MP.",
+        "체력이 {} 회복되었습니다.": "Recovered {} HP.",
+        "마력이 {} 회복되었습니다.": "Recovered {} MP.",
         "이전 보스 1마리 소환": "Summon previous boss", # Not used directly in message but good to have
         "알 수 없는 엔티티와 충돌했습니다.": "Collided with unknown entity.",
         "충돌 발생: {}": "Collision: {}",
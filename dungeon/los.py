@@ -0,0 +1,79 @@
+# dungeon/los.py - 시야(Line of Sight) 질의 서비스
+
+from typing import Dict, Iterable, Optional, Set, Tuple
+
+from .constants import WALL
+from .map import bresenham_line
+
+# 캐시 항목 수 상한. 몬스터가 움직일 때마다 새 좌표 쌍이 생기므로 무한히 커지지 않도록 비웁니다.
+LOS_CACHE_LIMIT = 50000
+
+Point = Tuple[int, int]
+
+
+class LineOfSight:
+    """
+    "(x1, y1)에서 (x2, y2)가 보이는가"에 답하는 시야 서비스.
+
+    DungeonMap의 시야(reveal_tiles)와 같은 브레젠험 선과 같은 규칙(양 끝점을 제외한 선상에 벽이 없으면 보임)을 사용합니다.
+    결과는 (맵 컴포넌트, 맵 버전) 단위로 캐시되며 MapComponent.version이 바뀌면 전부 버립니다.
+    선은 두 점 중 작은 좌표에서 큰 좌표 방향으로 그리므로 A→B와 B→A의 결과가 항상 같고 캐시 항목도 공유됩니다.
+    """
+    def __init__(self, cache_limit: int = LOS_CACHE_LIMIT):
+        self.cache_limit = cache_limit
+        self._cache: Dict[Tuple[Point, Point], bool] = {}
+        self._stamp: Optional[Tuple[int, int]] = None
+        self._map = None
+        self.hits = 0
+        self.misses = 0
+
+    def sync(self, map_comp) -> None:
+        """맵이 교체되었거나 타일이 바뀌었으면 캐시를 비웁니다."""
+        stamp = (id(map_comp), map_comp.version)
+        if stamp != self._stamp:
+            self._cache.clear()
+            self._stamp = stamp
+        self._map = map_comp
+
+    def can_see(self, map_comp, x1: int, y1: int, x2: int, y2: int) -> bool:
+        """두 점 사이에 시야를 가리는 벽이 없으면 True를 반환합니다."""
+        if map_comp is not self._map or (id(map_comp), map_comp.version) != self._stamp:
+            self.sync(map_comp)
+
+        a, b = (x1, y1), (x2, y2)
+        if b < a:
+            a, b = b, a
+        key = (a, b)
+        cached = self._cache.get(key)
+        if cached is not None:
+            self.hits += 1
+            return cached
+
+        self.misses += 1
+        tiles = map_comp.tiles
+        visible = True
+        for x, y in bresenham_line(a[0], a[1], b[0], b[1])[:-1]:
+            if tiles[y][x] == WALL:
+                visible = False
+                break
+
+        if len(self._cache) >= self.cache_limit:
+            self._cache.clear()
+        self._cache[key] = visible
+        return visible
+
+    def visible_from(self, map_comp, origin: Point, points: Iterable[Tuple[int, Point]], radius: int) -> Set[int]:
+        """
+        origin에서 보이는 대상들의 ID 집합을 한 번에 계산합니다.
+        points는 (ID, (x, y)) 쌍이며, 맨해튼 거리 radius 밖의 대상은 선을 그리지 않고 제외합니다.
+        MonsterAISystem이 틱마다 한 번 호출해 플레이어 주변 몬스터 전체의 시야를 미리 구해 둡니다.
+        """
+        self.sync(map_comp)
+        ox, oy = origin
+        visible = set()
+        for ident, (x, y) in points:
+            if abs(x - ox) + abs(y - oy) > radius:
+                continue
+            if self.can_see(map_comp, ox, oy, x, y):
+                visible.add(ident)
+        return visible
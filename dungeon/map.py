@@ -4,6 +4,8 @@ import random
 import logging
 from typing import List, Tuple, Dict, Any, Optional
 from .constants import WALL, FLOOR, UNKNOWN_CHAR # 상수 임포트
+from .room_graph import RoomGraph
+from .config import BSP_MIN_LEAF_SIZE, CAVE_FILL_PROB, CAVE_SMOOTH_STEPS, CAVE_CHAMBER_SPACING
 
 # --- Tile Definitions ---
 DOOR_CLOSED_CHAR = '+'
@@ -12,6 +14,46 @@ KEY_CHAR = 'k'
 EXIT_CHAR = '>' 
 START_CHAR = '<'
 
+# 보스 맵 생성 시 기록되는 배치 마커 속성 이름
+BOSS_MARKERS = ("shrine_pos", "lever_pos", "boss_door_pos", "boss_spawn_pos")
+
+# 맵 크기에 비례(선형)하는 대형 맵 생성기 타입. 이 타입은 maps.csv의 width/height를 그대로 사용합니다.
+SCALABLE_MAP_TYPES = ("BSP", "CAVE")
+
+# 평면 타일 버퍼(bytearray)에서 사용하는 바이트 값
+_WALL_B = ord(WALL)
+_FLOOR_B = ord(FLOOR)
+
+
+def bresenham_line(x1: int, y1: int, x2: int, y2: int) -> List[Tuple[int, int]]:
+    """
+    두 점을 잇는 선의 모든 타일 좌표를 반환합니다 (시작점 제외).
+    시야(FOV) 계산과 los.LineOfSight가 같은 선을 사용하도록 모듈 함수로 분리되어 있습니다.
+    """
+    line = []
+    dx = abs(x2 - x1)
+    dy = -abs(y2 - y1)
+    sx = 1 if x1 < x2 else -1
+    sy = 1 if y1 < y2 else -1
+    err = dx + dy
+
+    x, y = x1, y1
+
+    while True:
+        if x != x1 or y != y1:
+            line.append((x, y))
+
+        if x == x2 and y == y2:
+            break
+        e2 = 2 * err
+        if e2 >= dy:
+            err += dy
+            x += sx
+        if e2 <= dx:
+            err += dx
+            y += sy
+    return line
+
 class Rect:
     """A rectangular room or corridor."""
     def __init__(self, x, y, w, h):
@@ -19,6 +61,8 @@ class Rect:
         self.y1 = y
         self.x2 = x + w
         self.y2 = y + h
+        # 시작점에서 도달 가능한 내부 바닥 타일 (DungeonMap.analyze_connectivity에서 채움)
+        self.floor_tiles: List[Tuple[int, int]] = []
 
     @property
     def center(self):
@@ -60,6 +104,13 @@ class DungeonMap:
         self.visited: set[Tuple[int, int]] = set() 
         self.fog_enabled = True # 전장의 안개 기본 활성화
         
+        # [Connectivity] 생성 직후 계산되는 연결 정보 (analyze_connectivity 참고)
+        self.component_of: List[int] = []            # 평면 인덱스(y * width + x)별 연결 요소 번호, 벽은 -1
+        self.main_component = -1                      # 시작점이 속한 연결 요소
+        self.reachable_corridors: List[Tuple[int, int]] = []
+        self.corridor_set: set[Tuple[int, int]] = set()
+        self.room_graph: Optional[RoomGraph] = None      # 장거리 경로 계획용 방/통로 영역 그래프
+        
         # [Map Persistence] Only generate if not loading
         if map_type != "LOADED":
              self.generate_map(self.map_type) 
@@ -123,8 +174,91 @@ class DungeonMap:
 
         if map_type == "BOSS":
             self.generate_boss_map()
+        elif map_type == "BSP":
+            self._generate_bsp_map()
+        elif map_type == "CAVE":
+            self._generate_cave_map()
         else:
             self._generate_normal_map()
+        
+        self.analyze_connectivity()
+
+    def analyze_connectivity(self):
+        """
+        바닥 타일의 연결 요소를 계산합니다 (맵 면적에 선형).
+        - 시작점과 출구가 서로 다른 요소에 있으면 L자 통로를 파서 반드시 연결합니다.
+        - 방마다 시작점에서 도달 가능한 내부 바닥 타일 목록(Rect.floor_tiles)을 만들어
+          스폰 시 재시도 없이 O(1)로 무작위 위치를 고를 수 있게 합니다.
+        - 장거리 경로 계획용 방/통로 영역 그래프(room_graph)를 만듭니다.
+        생성 시점의 지형 기준이므로 이후 문/벽이 바뀌어도 다시 계산하지 않습니다.
+        """
+        self._label_components()
+        
+        start_idx = self.start_y * self.width + self.start_x
+        exit_idx = self.exit_y * self.width + self.exit_x
+        if self.component_of[start_idx] != self.component_of[exit_idx]:
+            logging.info(f"[Map] Exit not reachable from start on {self.dungeon_level_tuple}; carving link tunnel")
+            start_tile = self.map_data[self.start_y][self.start_x]
+            exit_tile = self.map_data[self.exit_y][self.exit_x]
+            self._create_h_tunnel(self.start_x, self.exit_x, self.start_y)
+            self._create_v_tunnel(self.start_y, self.exit_y, self.exit_x)
+            # 통로가 양 끝의 계단('<', '>')을 바닥으로 덮어쓰므로 원래 타일로 복구
+            self.map_data[self.start_y][self.start_x] = start_tile
+            self.map_data[self.exit_y][self.exit_x] = exit_tile
+            self._label_components()
+        
+        self.main_component = self.component_of[start_idx]
+        w, main = self.width, self.main_component
+        component_of = self.component_of
+        map_data = self.map_data
+        
+        for room in self.rooms:
+            room.floor_tiles = [
+                (x, y)
+                for y in range(max(0, room.y1 + 1), min(self.height, room.y2))
+                for x in range(max(0, room.x1 + 1), min(self.width, room.x2))
+                if map_data[y][x] == FLOOR and component_of[y * w + x] == main
+            ]
+        
+        self.corridor_set = set(self.corridors)
+        self.reachable_corridors = [c for c in dict.fromkeys(self.corridors)
+                                    if component_of[c[1] * w + c[0]] == main]
+        self.room_graph = RoomGraph(self.width, self.height, map_data, self.rooms)
+
+    def _label_components(self):
+        """벽이 아닌 모든 타일에 4방향 연결 요소 번호를 매깁니다 (반복형 flood fill)."""
+        w, h = self.width, self.height
+        labels = [-1] * (w * h)
+        passable = [tile != WALL for row in self.map_data for tile in row]
+        label = 0
+        for seed in range(w * h):
+            if not passable[seed] or labels[seed] != -1:
+                continue
+            labels[seed] = label
+            stack = [seed]
+            while stack:
+                idx = stack.pop()
+                x = idx % w
+                if x > 0 and passable[idx - 1] and labels[idx - 1] == -1:
+                    labels[idx - 1] = label; stack.append(idx - 1)
+                if x < w - 1 and passable[idx + 1] and labels[idx + 1] == -1:
+                    labels[idx + 1] = label; stack.append(idx + 1)
+                if idx >= w and passable[idx - w] and labels[idx - w] == -1:
+                    labels[idx - w] = label; stack.append(idx - w)
+                if idx + w < w * h and passable[idx + w] and labels[idx + w] == -1:
+                    labels[idx + w] = label; stack.append(idx + w)
+            label += 1
+        self.component_of = labels
+
+    def is_reachable(self, x: int, y: int) -> bool:
+        """시작점과 같은 연결 요소에 속한 타일인지 확인합니다."""
+        if not self.is_valid_tile(x, y) or not self.component_of:
+            return False
+        return self.component_of[y * self.width + x] == self.main_component
+
+    def random_room_tile(self, room: Rect, rng) -> Optional[Tuple[int, int]]:
+        """방 안의 도달 가능한 바닥 타일 하나를 무작위로 반환합니다. 없으면 None."""
+        return rng.choice(room.floor_tiles) if room.floor_tiles else None
 
     def generate_boss_map(self):
         """
@@ -246,6 +380,175 @@ class DungeonMap:
                 self.map_data[y][x] = FLOOR
                 self.corridors.append((x, y))
 
+    # --- 대형 맵 생성기 (평면 버퍼) ---
+    # 2차원 리스트 대신 width * height 크기의 bytearray 하나에 파내고, 마지막에 map_data로 한 번만 변환합니다.
+    # 모든 단계가 맵 면적에 선형이므로 300x300 이상의 맵도 생성할 수 있습니다.
+
+    def _carve_rect(self, buf: bytearray, room: Rect):
+        w = self.width
+        row = FLOOR * (room.x2 - room.x1)
+        for y in range(room.y1, room.y2):
+            buf[y * w + room.x1:y * w + room.x2] = row.encode()
+
+    def _carve_tunnel(self, buf: bytearray, x1, y1, x2, y2, horizontal_first: bool):
+        """L자 통로를 파냅니다. 새로 뚫린 칸만 corridors에 기록합니다."""
+        w = self.width
+        if horizontal_first:
+            points = [(x, y1) for x in range(min(x1, x2), max(x1, x2) + 1)]
+            points += [(x2, y) for y in range(min(y1, y2), max(y1, y2) + 1)]
+        else:
+            points = [(x1, y) for y in range(min(y1, y2), max(y1, y2) + 1)]
+            points += [(x, y2) for x in range(min(x1, x2), max(x1, x2) + 1)]
+        for x, y in points:
+            idx = y * w + x
+            if buf[idx] == _WALL_B:
+                buf[idx] = _FLOOR_B
+                self.corridors.append((x, y))
+
+    def _commit_buffer(self, buf: bytearray):
+        """평면 버퍼를 map_data(2차원 문자 리스트)로 변환하고 시작/출구 타일을 기록합니다."""
+        w = self.width
+        buf[self.start_y * w + self.start_x] = ord(START_CHAR)
+        buf[self.exit_y * w + self.exit_x] = ord(self.exit_type)
+        text = buf.decode('ascii')
+        self.map_data = [list(text[y * w:(y + 1) * w]) for y in range(self.height)]
+
+    def _generate_bsp_map(self):
+        """BSP(이진 공간 분할) 기반 맵. 구역을 재귀적으로 나누고 각 말단 구역에 방을 하나씩 배치합니다."""
+        w, h = self.width, self.height
+        buf = bytearray(WALL * (w * h), 'ascii')
+        min_leaf = BSP_MIN_LEAF_SIZE
+        
+        # 노드: [x, y, w, h, left, right] (부모가 항상 자식보다 앞에 오도록 리스트에 추가)
+        nodes = [[1, 1, w - 2, h - 2, None, None]]
+        stack = [0]
+        leaf_order = []
+        while stack:
+            idx = stack.pop()
+            nx, ny, nw, nh, _l, _r = nodes[idx]
+            can_h = nh >= min_leaf * 2
+            can_v = nw >= min_leaf * 2
+            if not can_h and not can_v:
+                leaf_order.append(idx)
+                continue
+            # 긴 축을 우선 분할 (비슷하면 무작위)
+            if can_h and can_v:
+                split_h = nh > nw if abs(nh - nw) > min_leaf // 2 else self.rng.random() < 0.5
+            else:
+                split_h = can_h
+            if split_h:
+                cut = self.rng.randint(min_leaf, nh - min_leaf)
+                children = ([nx, ny, nw, cut, None, None], [nx, ny + cut, nw, nh - cut, None, None])
+            else:
+                cut = self.rng.randint(min_leaf, nw - min_leaf)
+                children = ([nx, ny, cut, nh, None, None], [nx + cut, ny, nw - cut, nh, None, None])
+            nodes[idx][4], nodes[idx][5] = len(nodes), len(nodes) + 1
+            nodes.extend(children)
+            # 오른쪽을 먼저 push해야 왼쪽부터 처리됨 (방 순서가 공간적으로 이어지도록)
+            stack.append(len(nodes) - 1)
+            stack.append(len(nodes) - 2)
+        
+        # 말단 구역마다 방 생성
+        room_of = {}
+        for idx in leaf_order:
+            nx, ny, nw, nh, _l, _r = nodes[idx]
+            rw = self.rng.randint(max(4, nw // 2), max(4, nw - 2))
+            rh = self.rng.randint(max(4, nh // 2), max(4, nh - 2))
+            rx = nx + self.rng.randint(1, max(1, nw - rw - 1))
+            ry = ny + self.rng.randint(1, max(1, nh - rh - 1))
+            room = Rect(rx, ry, min(rw, w - 1 - rx), min(rh, h - 1 - ry))
+            room_of[idx] = room
+            self.rooms.append(room)
+            self._carve_rect(buf, room)
+        
+        # 자식 구역의 대표 방끼리 연결 (자식부터 처리하기 위해 역순 순회)
+        for idx in range(len(nodes) - 1, -1, -1):
+            left, right = nodes[idx][4], nodes[idx][5]
+            if left is None:
+                continue
+            (ax, ay), (bx, by) = room_of[left].center, room_of[right].center
+            self._carve_tunnel(buf, ax, ay, bx, by, self.rng.random() < 0.5)
+            room_of[idx] = room_of[left] if self.rng.random() < 0.5 else room_of[right]
+        
+        self.start_x, self.start_y = self.rooms[0].center
+        self.exit_x, self.exit_y = self.rooms[-1].center
+        self._commit_buffer(buf)
+        logging.debug(f"DungeonMap._generate_bsp_map: {len(self.rooms)} rooms")
+
+    def _generate_cave_map(self):
+        """
+        셀룰러 오토마타 기반 동굴 맵.
+        무작위 채움 -> 스무딩 -> 공터(방) 배치 및 연결 -> 시작점과 이어지지 않은 고립 공간 제거 순으로 생성합니다.
+        """
+        w, h = self.width, self.height
+        rng = self.rng
+        
+        # 1. 무작위 채움 (1: 바닥, 0: 벽). 외곽은 항상 벽
+        cells = [[0] * w for _ in range(h)]
+        for y in range(1, h - 1):
+            row = cells[y]
+            for x in range(1, w - 1):
+                if rng.random() < CAVE_FILL_PROB:
+                    row[x] = 1
+        
+        # 2. 스무딩: 3x3 합을 가로/세로 누적으로 계산 (칸당 상수 시간)
+        for _step in range(CAVE_SMOOTH_STEPS):
+            hsum = [[0] + [r[x - 1] + r[x] + r[x + 1] for x in range(1, w - 1)] + [0] for r in cells]
+            new_cells = [[0] * w]
+            for y in range(1, h - 1):
+                up, mid, down = hsum[y - 1], hsum[y], hsum[y + 1]
+                # 자신 포함 3x3 바닥 수 5 이상이면 바닥 (4-5 규칙)
+                new_cells.append([0] + [1 if up[x] + mid[x] + down[x] >= 5 else 0 for x in range(1, w - 1)] + [0])
+            new_cells.append([0] * w)
+            cells = new_cells
+        
+        buf = bytearray(WALL * (w * h), 'ascii')
+        for y in range(1, h - 1):
+            row = cells[y]
+            base = y * w
+            for x in range(1, w - 1):
+                if row[x]:
+                    buf[base + x] = _FLOOR_B
+        
+        # 3. 일정 간격 격자마다 공터(방)를 파고 이전 공터와 연결 (지그재그 순서라 처음과 끝이 멀리 떨어짐)
+        spacing = min(CAVE_CHAMBER_SPACING, max(8, min(w, h) // 3)) # 작은 맵에서도 공터가 여러 개 생기도록
+        grid_rows = range(spacing // 2, h - spacing // 2, spacing) or [h // 2]
+        for gy_index, gy in enumerate(grid_rows):
+            xs = list(range(spacing // 2, w - spacing // 2, spacing)) or [w // 2]
+            if gy_index % 2 == 1:
+                xs.reverse()
+            for gx in xs:
+                rw, rh = rng.randint(4, 7), rng.randint(4, 6)
+                rx = max(1, min(w - rw - 1, gx - rw // 2 + rng.randint(-2, 2)))
+                ry = max(1, min(h - rh - 1, gy - rh // 2 + rng.randint(-2, 2)))
+                room = Rect(rx, ry, rw, rh)
+                self._carve_rect(buf, room)
+                if self.rooms:
+                    (ax, ay), (bx, by) = self.rooms[-1].center, room.center
+                    self._carve_tunnel(buf, ax, ay, bx, by, rng.random() < 0.5)
+                self.rooms.append(room)
+        
+        self.start_x, self.start_y = self.rooms[0].center
+        self.exit_x, self.exit_y = self.rooms[-1].center
+        
+        # 4. 시작점에서 도달할 수 없는 바닥은 벽으로 메움 (반복형 flood fill)
+        reached = bytearray(w * h)
+        start_idx = self.start_y * w + self.start_x
+        reached[start_idx] = 1
+        stack = [start_idx]
+        while stack:
+            idx = stack.pop()
+            for n in (idx - 1, idx + 1, idx - w, idx + w):
+                if not reached[n] and buf[n] == _FLOOR_B:
+                    reached[n] = 1
+                    stack.append(n)
+        for idx in range(w * h):
+            if buf[idx] == _FLOOR_B and not reached[idx]:
+                buf[idx] = _WALL_B
+        
+        self._commit_buffer(buf)
+        logging.debug(f"DungeonMap._generate_cave_map: {len(self.rooms)} chambers")
+
     def is_valid_tile(self, x: int, y: int) -> bool:
         return 0 <= x < self.width and 0 <= y < self.height
 
@@ -285,29 +588,7 @@ class DungeonMap:
 
     def _get_line(self, x1, y1, x2, y2) -> List[Tuple[int, int]]:
         """두 점을 잇는 선의 모든 타일 좌표를 반환합니다 (시작점 제외)."""
-        line = []
-        dx = abs(x2 - x1)
-        dy = -abs(y2 - y1)
-        sx = 1 if x1 < x2 else -1
-        sy = 1 if y1 < y2 else -1
-        err = dx + dy
-        
-        x, y = x1, y1
-        
-        while True:
-            if x != x1 or y != y1: 
-                 line.append((x, y))
-            
-            if x == x2 and y == y2:
-                break
-            e2 = 2 * err
-            if e2 >= dy:
-                err += dy
-                x += sx
-            if e2 <= dx:
-                err += dx
-                y += sy
-        return line
+        return bresenham_line(x1, y1, x2, y2)
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -324,11 +605,18 @@ class DungeonMap:
             "fog_enabled": self.fog_enabled,
             "rooms": [{"x1": r.x1, "y1": r.y1, "x2": r.x2, "y2": r.y2} for r in self.rooms],
             "corridors": self.corridors,
+            "map_type": self.map_type,
+            # 보스 맵 전용 마커 (엔진이 신전/레버/보스 문/보스 위치 배치에 사용)
+            "markers": {name: getattr(self, name) for name in BOSS_MARKERS if hasattr(self, name)},
         }
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any], rng):
-        d_map = cls(data["width"], data["height"], rng, data["dungeon_level_tuple"])
+        # LOADED 타입으로 생성해야 __init__에서 맵을 새로 생성하지 않음
+        d_map = cls(data["width"], data["height"], rng, tuple(data["dungeon_level_tuple"]), map_type="LOADED")
+        d_map.map_type = data.get("map_type", "NORMAL")
+        for name, pos in data.get("markers", {}).items():
+            setattr(d_map, name, tuple(pos))
         d_map.map_data = data["map_data"]
         d_map.start_x = data["start_x"]
         d_map.start_y = data["start_y"]
@@ -338,5 +626,6 @@ class DungeonMap:
         d_map.visited = set(tuple(v) for v in data["visited"])
         d_map.fog_enabled = data["fog_enabled"]
         d_map.rooms = [Rect(r["x1"], r["y1"], r["x2"] - r["x1"], r["y2"] - r["y1"]) for r in data["rooms"]]
-        d_map.corridors = data["corridors"]
+        d_map.corridors = [tuple(c) for c in data["corridors"]]
+        d_map.analyze_connectivity()
         return d_map
\ No newline at end of file
@@ -18,9 +18,9 @@ class ModifierManager:
         except Exception as e:
             print(f"Error loading prefixes: {e}")
 
-    def get_random_prefix(self):
+    def get_random_prefix(self, rng=None):
         if not self.prefixes: return None
-        return random.choice(list(self.prefixes.keys()))
+        return (rng or random).choice(list(self.prefixes.keys()))
 
     def apply_item_prefix(self, item_def: ItemDefinition, prefix_name: str = None) -> ItemDefinition:
         """아이템에 접두어 적용 (ItemDefinition 복제본 반환)"""
@@ -57,18 +57,19 @@ class ModifierManager:
             
         return new_item
 
-    def apply_monster_prefix(self, monster_def: MonsterDefinition, prefix_name: str = None) -> MonsterDefinition:
+    def apply_monster_prefix(self, monster_def: MonsterDefinition, prefix_name: str = None, rng=None) -> MonsterDefinition:
         """몬스터에 접두어 적용 (MonsterDefinition 복제본 반환)"""
         if not self.prefixes: return monster_def
 
         if prefix_name is None:
-            prefix_name = self.get_random_prefix()
+            prefix_name = self.get_random_prefix(rng)
             
         if prefix_name not in self.prefixes:
             return monster_def
             
         prefix_data = self.prefixes[prefix_name]
         new_mon = copy.copy(monster_def)
+        new_mon.flags = set(monster_def.flags) # 얕은 복사는 원본 정의와 플래그 집합을 공유하므로 분리
         
         # 이름 변경
         new_mon.name = f"{prefix_data['name_kr']} {monster_def.name}"
@@ -90,7 +91,6 @@ class ModifierManager:
 
         # 플래그 적용
         p_flags = prefix_data.get('flags', [])
-        new_mon.flags = new_mon.flags.copy()
         for f in p_flags:
             new_mon.flags.add(f.strip().upper())
             
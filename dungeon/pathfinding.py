@@ -0,0 +1,419 @@
+# dungeon/pathfinding.py - 몬스터 경로 탐색 (거리장, A*)
+
+import heapq
+from collections import deque
+from typing import List, Optional, Set, Tuple
+
+from .config import CHASE_FIELD_MAX_DISTANCE, FLEE_SAFETY_SCALE, ASTAR_NODE_BUDGET, PATH_GOAL_TOLERANCE
+from .constants import WALL
+from .room_graph import ROOM_GRAPH_MIN_DISTANCE
+
+UNREACHED = -1
+# 도주 지도 값은 음수가 될 수 있으므로 별도의 '미도달' 값을 사용
+SAFETY_UNREACHED = 1 << 30
+
+Point = Tuple[int, int]
+
+
+def build_passable(map_comp) -> bytearray:
+    """MapComponent 타일을 평면 통행 버퍼(y * width + x, 1 = 통행 가능)로 변환합니다."""
+    passable = bytearray(map_comp.width * map_comp.height)
+    i = 0
+    for row in map_comp.tiles:
+        for tile in row:
+            if tile != WALL:
+                passable[i] = 1
+            i += 1
+    return passable
+
+
+class DistanceField:
+    """
+    목표 지점(플레이어)에서 각 타일까지의 걸음 수를 담은 Dijkstra 거리장.
+
+    이동 비용이 모두 1이므로 Dijkstra는 너비 우선 탐색과 같고, 평면 리스트에 저장해 조회는 O(1)입니다.
+    목표 타일, 맵 컴포넌트, MapComponent.version 중 하나라도 바뀔 때만 다시 계산하므로
+    추적 몬스터가 아무리 많아도 틱당 비용은 (재계산 1회 + 몬스터당 이웃 4칸 조회)입니다.
+    max_distance 걸음 밖은 계산하지 않으며, 그 타일에서는 downhill_step이 None을 반환합니다.
+
+    with_safety가 켜져 있으면 같은 재계산에서 도주 지도(safety)도 만듭니다 (Brogue 방식).
+    거리에 -FLEE_SAFETY_SCALE을 곱한 뒤 다시 완화(relax)하므로, 도주자는 단순히 반대 방향 벽에 붙는 대신
+    플레이어 옆을 스쳐서라도 더 멀리 빠져나갈 수 있는 길을 따라 내려갑니다.
+    """
+    def __init__(self, max_distance: int = CHASE_FIELD_MAX_DISTANCE, with_safety: bool = False):
+        self.max_distance = max_distance
+        self.with_safety = with_safety
+        self.width = 0
+        self.height = 0
+        self.goal: Optional[Point] = None
+        self.dist: List[int] = []
+        self.safety: List[int] = []
+        self.passable = bytearray()
+        self._map_stamp = None
+        self._stamp = None
+        self.rebuilds = 0
+
+    def update(self, map_comp, goal: Point) -> bool:
+        """필요할 때만 거리장을 다시 계산합니다. 다시 계산했으면 True를 반환합니다."""
+        map_stamp = (id(map_comp), map_comp.version)
+        if map_stamp != self._map_stamp:
+            self.width, self.height = map_comp.width, map_comp.height
+            self.passable = build_passable(map_comp)
+            self._map_stamp = map_stamp
+        stamp = (map_stamp, goal)
+        if stamp == self._stamp:
+            return False
+        self._stamp = stamp
+        self.goal = goal
+        self._build(goal)
+        self.rebuilds += 1
+        return True
+
+    def _build(self, goal: Point):
+        w, h = self.width, self.height
+        self.dist = [UNREACHED] * (w * h)
+        reached = []
+        gx, gy = goal
+        if 0 <= gx < w and 0 <= gy < h:
+            start = gy * w + gx
+            self.dist[start] = 0
+            self._bfs(start, reached)
+        if self.with_safety:
+            self._build_safety(reached)
+
+    def _bfs(self, start: int, reached: List[int]):
+        w, h = self.width, self.height
+        passable = self.passable
+        dist = self.dist
+        queue = deque([start])
+        limit = self.max_distance
+        while queue:
+            i = queue.popleft()
+            reached.append(i)
+            d = dist[i]
+            if d >= limit:
+                continue
+            d += 1
+            x = i % w
+            # 좌/우는 행 경계를, 상/하는 맵 경계를 확인
+            if x > 0 and passable[i - 1] and dist[i - 1] == UNREACHED:
+                dist[i - 1] = d
+                queue.append(i - 1)
+            if x < w - 1 and passable[i + 1] and dist[i + 1] == UNREACHED:
+                dist[i + 1] = d
+                queue.append(i + 1)
+            if i >= w and passable[i - w] and dist[i - w] == UNREACHED:
+                dist[i - w] = d
+                queue.append(i - w)
+            j = i + w
+            if j < w * h and passable[j] and dist[j] == UNREACHED:
+                dist[j] = d
+                queue.append(j)
+
+    def _build_safety(self, reached: List[int]):
+        """거리장에 음수 배율을 곱한 초기값을 Dijkstra로 다시 완화해 도주 지도를 만듭니다."""
+        w = self.width
+        n = w * self.height
+        dist = self.dist
+        safety = [SAFETY_UNREACHED] * n
+        self.safety = safety
+        heap = []
+        for i in reached:
+            v = -int(dist[i] * FLEE_SAFETY_SCALE)
+            safety[i] = v
+            heap.append((v, i))
+        heapq.heapify(heap)
+        while heap:
+            v, i = heapq.heappop(heap)
+            if v > safety[i]:
+                continue
+            v += 1
+            x = i % w
+            # 거리장이 계산된 타일(=통행 가능) 안에서만 완화
+            for j, inside in ((i - 1, x > 0), (i + 1, x < w - 1), (i - w, i >= w), (i + w, i + w < n)):
+                if inside and dist[j] != UNREACHED and v < safety[j]:
+                    safety[j] = v
+                    heapq.heappush(heap, (v, j))
+
+    def distance_at(self, x: int, y: int) -> int:
+        """(x, y)에서 목표까지의 걸음 수. 범위 밖이거나 도달 불가면 UNREACHED(-1)."""
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return UNREACHED
+        return self.dist[y * self.width + x]
+
+    def downhill_step(self, x: int, y: int, blocked: Optional[Set[Point]] = None) -> Optional[Point]:
+        """
+        목표에 한 걸음 더 가까워지는 이동 방향 (dx, dy)를 반환합니다.
+        같은 거리의 후보가 여럿이면 목표와의 차이가 큰 축을 우선합니다 (기존 축 미끄러짐과 같은 느낌).
+        blocked 타일(다른 몬스터)은 건너뛰며, 내려갈 칸이 모두 막혔으면 같은 거리의 옆 칸으로 비켜 갑니다.
+        """
+        return self._descend(self.dist, UNREACHED, x, y, blocked, stop_at_zero=True)
+
+    def flee_step(self, x: int, y: int, blocked: Optional[Set[Point]] = None) -> Optional[Point]:
+        """도주 지도를 따라 한 걸음 내려가는 방향을 반환합니다. with_safety가 꺼져 있으면 None."""
+        if not self.safety:
+            return None
+        return self._descend(self.safety, SAFETY_UNREACHED, x, y, blocked, stop_at_zero=False)
+
+    def _descend(self, values: List[int], unreached: int, x: int, y: int,
+                 blocked: Optional[Set[Point]], stop_at_zero: bool) -> Optional[Point]:
+        w = self.width
+        if not (0 <= x < w and 0 <= y < self.height):
+            return None
+        i = y * w + x
+        here = values[i]
+        if here == unreached or (stop_at_zero and here == 0):
+            return None
+
+        gx, gy = self.goal
+        # 주 축(목표와 차이가 큰 축)을 먼저 검사하므로 같은 값이면 먼저 찾은 후보가 유지됨
+        n = len(values)
+        if abs(gx - x) >= abs(gy - y):
+            candidates = ((1, 0, x < w - 1, i + 1), (-1, 0, x > 0, i - 1),
+                          (0, 1, i + w < n, i + w), (0, -1, i >= w, i - w))
+        else:
+            candidates = ((0, 1, i + w < n, i + w), (0, -1, i >= w, i - w),
+                          (1, 0, x < w - 1, i + 1), (-1, 0, x > 0, i - 1))
+        best = None
+        best_v = here + 1
+        for dx, dy, inside, j in candidates:
+            if not inside:
+                continue
+            v = values[j]
+            if v == unreached or v >= best_v:
+                continue
+            if blocked and (x + dx, y + dy) in blocked:
+                continue
+            best, best_v = (dx, dy), v
+        return best
+
+
+# A* 이동 비용 (대각선 허용 시 옥타일 거리: 10 / 14 ≈ 10√2)
+_ORTHO_STEPS = ((1, 0, 10), (-1, 0, 10), (0, 1, 10), (0, -1, 10))
+_DIAG_STEPS = _ORTHO_STEPS + ((1, 1, 14), (1, -1, 14), (-1, 1, 14), (-1, -1, 14))
+
+
+def astar(passable: bytearray, width: int, start: Point, goal: Point,
+          max_nodes: int = ASTAR_NODE_BUDGET, diagonal: bool = False,
+          blocked: Optional[Set[Point]] = None, allow_partial: bool = False) -> Optional[List[Point]]:
+    """
+    평면 통행 버퍼 위에서 이진 힙 A*로 start → goal 경로를 찾습니다.
+    반환값은 시작점을 제외하고 목표를 포함한 좌표 리스트이며, 경로가 없으면 None입니다.
+
+    diagonal이 False면 4방향 + 맨해튼 휴리스틱, True면 8방향 + 옥타일 휴리스틱을 사용합니다 (벽 모서리 가로지르기 금지).
+    blocked 좌표(다른 엔티티 등)는 목표 지점을 제외하고 통과하지 않습니다.
+    max_nodes개를 확장해도 목표에 닿지 못하면 탐색을 멈추며, allow_partial이면 휴리스틱상 목표에 가장 가까웠던 지점까지의 경로를 반환합니다.
+    """
+    height = len(passable) // width
+    sx, sy = start
+    gx, gy = goal
+    if not (0 <= sx < width and 0 <= sy < height and 0 <= gx < width and 0 <= gy < height):
+        return None
+    if start == goal:
+        return []
+    s = sy * width + sx
+    g = gy * width + gx
+    if not passable[g]:
+        return None
+
+    steps = _DIAG_STEPS if diagonal else _ORTHO_STEPS
+
+    def heuristic(x, y):
+        dx, dy = abs(x - gx), abs(y - gy)
+        if diagonal:
+            return 10 * (dx + dy) - 6 * min(dx, dy)
+        return 10 * (dx + dy)
+
+    g_cost = {s: 0}
+    came_from = {}
+    h0 = heuristic(sx, sy)
+    heap = [(h0, h0, s)]
+    best, best_h = s, h0
+    expanded = 0
+    found = False
+    while heap:
+        f, h, i = heapq.heappop(heap)
+        if i == g:
+            found = True
+            break
+        cost = g_cost[i]
+        if f - h > cost:
+            continue # 더 싼 경로로 이미 처리된 노드
+        expanded += 1
+        if expanded > max_nodes:
+            break
+        x, y = i % width, i // width
+        for dx, dy, step_cost in steps:
+            nx, ny = x + dx, y + dy
+            if not (0 <= nx < width and 0 <= ny < height):
+                continue
+            j = ny * width + nx
+            if not passable[j]:
+                continue
+            if dx and dy and not (passable[y * width + nx] and passable[ny * width + x]):
+                continue
+            if blocked and j != g and (nx, ny) in blocked:
+                continue
+            new_cost = cost + step_cost
+            if new_cost < g_cost.get(j, new_cost + 1):
+                g_cost[j] = new_cost
+                came_from[j] = i
+                hj = heuristic(nx, ny)
+                heapq.heappush(heap, (new_cost + hj, hj, j))
+                if hj < best_h:
+                    best, best_h = j, hj
+
+    if found:
+        end = g
+    elif allow_partial and best != s:
+        end = best
+    else:
+        return None
+
+    path = []
+    while end != s:
+        path.append((end % width, end // width))
+        end = came_from[end]
+    path.reverse()
+    return path
+
+
+class _CachedPath:
+    """PathCache 항목: 목표, 경로, 다음에 밟을 칸의 인덱스, 경로를 검증한 맵 버전"""
+    def __init__(self, goal: Point, path: List[Point], stamp):
+        self.goal = goal
+        self.path = path
+        self.index = 0
+        self.stamp = stamp
+
+
+class _CachedRoute:
+    """PathCache 항목: 영역 그래프로 계획한 중간 목표(포털) 목록과 현재 진행 위치"""
+    def __init__(self, goal: Point, waypoints: List[Point], room_graph):
+        self.goal = goal
+        self.waypoints = waypoints
+        self.index = 0
+        self.room_graph = room_graph
+
+
+class PathCache:
+    """
+    플레이어가 아닌 목표(소환수의 공격 대상, 보스 돌진 지점 등)를 향한 엔티티별 A* 경로 캐시.
+
+    한 번 찾은 경로는 다음 경우에만 다시 계산합니다.
+      - 다음 칸이 벽이 되었거나(맵 버전 변경 후 남은 경로 재검증) 다른 엔티티가 막고 있을 때
+      - 엔티티가 경로를 벗어났을 때 (밀려남, 순간이동 등)
+      - 목표가 PATH_GOAL_TOLERANCE보다 멀리 움직였거나, 남은 경로가 목표 이동 거리보다 짧아졌을 때
+    """
+    def __init__(self, max_nodes: int = ASTAR_NODE_BUDGET, diagonal: bool = False):
+        self.max_nodes = max_nodes
+        self.diagonal = diagonal
+        self.width = 0
+        self.passable = bytearray()
+        self._map_stamp = None
+        self._paths = {}
+        self._routes = {}
+        self.replans = 0
+        self.reuses = 0
+
+    def _sync(self, map_comp):
+        stamp = (id(map_comp), map_comp.version)
+        if stamp != self._map_stamp:
+            self.width = map_comp.width
+            self.passable = build_passable(map_comp)
+            self._map_stamp = stamp
+
+    def _is_valid(self, entry: _CachedPath, start: Point, goal: Point, blocked: Optional[Set[Point]]) -> bool:
+        path = entry.path
+        # 지난번 이동이 성공했으면 다음 칸으로 진행
+        if entry.index < len(path) and path[entry.index] == start:
+            entry.index += 1
+        remaining = len(path) - entry.index
+        if remaining <= 0:
+            return False
+
+        drift = abs(goal[0] - entry.goal[0]) + abs(goal[1] - entry.goal[1])
+        if drift > PATH_GOAL_TOLERANCE or (drift and remaining <= drift):
+            return False
+
+        nx, ny = path[entry.index]
+        if max(abs(nx - start[0]), abs(ny - start[1])) != 1:
+            return False # 경로에서 벗어남
+        if blocked and (nx, ny) != goal and (nx, ny) in blocked:
+            return False
+
+        if entry.stamp != self._map_stamp:
+            # 맵이 바뀌었으면 남은 경로가 여전히 통행 가능한지만 확인
+            w, passable = self.width, self.passable
+            if any(not passable[y * w + x] for x, y in path[entry.index:]):
+                return False
+            entry.stamp = self._map_stamp
+        return True
+
+    def next_step(self, entity_id: int, map_comp, start: Point, goal: Point,
+                  blocked: Optional[Set[Point]] = None, room_graph=None) -> Optional[Point]:
+        """
+        캐시된(또는 새로 찾은) 경로의 다음 이동 방향 (dx, dy)를 반환합니다. 경로가 없으면 None.
+        room_graph(room_graph.RoomGraph)를 주면 먼 목표는 영역 그래프로 경로를 계획하고,
+        타일 단위 A*는 현재 영역을 벗어나는 다음 포털까지만 수행합니다.
+        """
+        self._sync(map_comp)
+        if room_graph is not None:
+            goal = self._waypoint(entity_id, room_graph, start, goal)
+        entry = self._paths.get(entity_id)
+        if entry and self._is_valid(entry, start, goal, blocked):
+            self.reuses += 1
+        else:
+            self.replans += 1
+            path = astar(self.passable, self.width, start, goal, self.max_nodes,
+                         self.diagonal, blocked, allow_partial=True)
+            if not path:
+                self._paths.pop(entity_id, None)
+                return None
+            entry = _CachedPath(goal, path, self._map_stamp)
+            self._paths[entity_id] = entry
+
+        nx, ny = entry.path[entry.index]
+        return nx - start[0], ny - start[1]
+
+    def _waypoint(self, entity_id: int, room_graph, start: Point, goal: Point) -> Point:
+        """
+        영역 그래프 경로의 현재 중간 목표를 반환합니다. 가까운 목표는 그대로 반환합니다.
+        경로는 엔티티마다 한 번 계획해 포털을 순서대로 밟아 나가며(영역을 옮길 때마다 다시 계획하지 않음),
+        목표가 PATH_GOAL_TOLERANCE보다 멀리 움직였을 때만 다시 계획합니다.
+        """
+        if abs(goal[0] - start[0]) + abs(goal[1] - start[1]) < ROOM_GRAPH_MIN_DISTANCE:
+            self._routes.pop(entity_id, None)
+            return goal
+
+        route = self._routes.get(entity_id)
+        if (route is None or route.room_graph is not room_graph
+                or abs(goal[0] - route.goal[0]) + abs(goal[1] - route.goal[1]) > PATH_GOAL_TOLERANCE):
+            waypoints = room_graph.route(start, goal)
+            if not waypoints:
+                self._routes.pop(entity_id, None)
+                return goal
+            route = _CachedRoute(goal, waypoints, room_graph)
+            self._routes[entity_id] = route
+
+        route.waypoints[-1] = goal
+        while route.index < len(route.waypoints) - 1 and start == route.waypoints[route.index]:
+            route.index += 1
+        return route.waypoints[route.index]
+
+    def reachable(self, map_comp, start: Point, goal: Point, max_steps: int) -> bool:
+        """start에서 goal까지 max_steps 걸음 이내의 경로가 있는지 확인합니다 (캐시에는 저장하지 않음)."""
+        self._sync(map_comp)
+        path = astar(self.passable, self.width, start, goal, (2 * max_steps + 1) ** 2, self.diagonal)
+        return path is not None and len(path) <= max_steps
+
+    def forget(self, entity_id: int):
+        self._paths.pop(entity_id, None)
+        self._routes.pop(entity_id, None)
+
+    def prune(self, alive_ids: Set[int]):
+        """더 이상 존재하지 않는 엔티티의 경로를 버립니다."""
+        for entity_id in [eid for eid in self._paths if eid not in alive_ids]:
+            del self._paths[entity_id]
+        for entity_id in [eid for eid in self._routes if eid not in alive_ids]:
+            del self._routes[entity_id]
@@ -1,6 +1,8 @@
 import os
 import sys
 
+from .config import RENDER_FULL_REDRAW_FRAMES
+
 # 터미널 색상 코드
 COLOR_MAP = {
     "white": "\033[97m",
@@ -23,13 +25,22 @@ COLOR_MAP = {
     "red_bg": "\033[41m\033[97m",   # 위험/함정용: 빨간 배경 + 흰 글씨
     "reset": "\033[0m"
 }
+RESET = COLOR_MAP["reset"]
+# 배경/반전 속성은 다음 글자색 코드로 덮이지 않으므로 색상을 바꿀 때 먼저 초기화해야 함
+_NEEDS_RESET = {code for name, code in COLOR_MAP.items() if name == "invert" or name.endswith("_bg")}
 
 class Renderer:
     """
     화면 깜빡임을 방지하기 위한 더블 버퍼링 렌더러.
-    프레임 버퍼를 메모리에 생성하고, 변경된 부분(또는 전체)을 한 번에 출력합니다.
+    프레임 버퍼를 메모리에 생성하고, 직전에 출력한 프레임과 비교해 바뀐 칸만 커서 이동 + 쓰기로 출력합니다.
+    터미널 크기가 바뀌었거나 invalidate()가 호출되면(다른 코드가 화면에 직접 쓴 경우 등) 전체를 다시 그리고,
+    화면 깨짐에 대비해 RENDER_FULL_REDRAW_FRAMES 프레임마다 한 번은 전체를 다시 그립니다.
+    stats는 프레임당 출력 바이트 수를 보고합니다.
+
+    버퍼는 문자(chars)와 색상 코드(colors)를 칸별로 따로 저장하고 (색상 없는 칸은 RESET),
+    출력할 때 한 줄 안에서 색상이 바뀌는 곳에만 색상 코드를 넣습니다.
     """
-    def __init__(self, width=None, height=None):
+    def __init__(self, width=None, height=None, stream=None):
         # 터미널 크기 자동 감지
         try:
             ts = os.get_terminal_size()
@@ -41,41 +52,82 @@ class Renderer:
 
         self.width = width if width is not None else detected_width
         self.height = height if height is not None else detected_height
-        self.buffer = [[" " for _ in range(self.width)] for _ in range(self.height)]
+        self._auto_size = width is None and height is None # 크기를 지정하지 않았으면 터미널 크기를 따라감
+        self._new_buffer()
         self.clear_command = 'cls' if os.name == 'nt' else 'clear'
+        self.stream = stream or sys.stdout
+        
+        self._front = None # 마지막으로 출력한 프레임 (None이면 다음 render는 전체 출력)
+        self._clear_screen = False
+        self._frames_since_full = 0
+        self.frames = 0
+        self.full_redraws = 0
+        self.last_bytes = 0
+        self.total_bytes = 0
         
         # 최초 실행 시 화면 지우기
-        os.system(self.clear_command)
+        if self.stream is sys.stdout:
+            os.system(self.clear_command)
         # 커서 숨기기 (선택적)
-        sys.stdout.write("\033[?25l")
+        self.stream.write("\033[?25l")
 
     def clear_buffer(self):
-        """버퍼를 공백으로 초기화"""
-        self.buffer = [[" " for _ in range(self.width)] for _ in range(self.height)]
+        """버퍼를 공백으로 초기화 (프레임 시작). 터미널 크기가 바뀌었으면 새 크기로 맞추고 전체를 다시 그립니다."""
+        if self._auto_size:
+            try:
+                ts = os.get_terminal_size()
+                if (ts.columns, ts.lines) != (self.width, self.height):
+                    self.width, self.height = ts.columns, ts.lines
+                    self.invalidate(clear=True)
+            except OSError:
+                pass
+        self._new_buffer()
+
+    def _new_buffer(self):
+        self.chars = [[" "] * self.width for _ in range(self.height)]
+        self.colors = [[RESET] * self.width for _ in range(self.height)]
+
+    def invalidate(self, clear=False):
+        """화면 내용이 버퍼와 달라졌을 수 있음 (직접 출력한 메뉴, 크기 변경 등). 다음 render는 전체를 다시 그립니다."""
+        self._front = None
+        self._clear_screen = self._clear_screen or clear
 
     def draw_char(self, x, y, char, color="white"):
         """특정 위치에 문자 하나를 버퍼에 기록"""
         if 0 <= x < self.width and 0 <= y < self.height:
             color_code = COLOR_MAP.get(color, COLOR_MAP["white"])
-            self.buffer[y][x] = f"{color_code}{char}{COLOR_MAP['reset']}"
+            self.chars[y][x] = char
+            self.colors[y][x] = color_code
             
             # 한글(광폭 문자)인 경우 다음 칸을 "폭 없는 문자"로 채워 렌더링 시 너비 맞춤
             if ord(char) > 127: # 단순화된 광폭 문자 체크
                 if x + 1 < self.width:
-                    self.buffer[y][x+1] = "" # 다음 칸을 비움 (이미 char가 2칸 차지함)
+                    self.chars[y][x+1] = "" # 다음 칸을 비움 (이미 char가 2칸 차지함)
+                    self.colors[y][x+1] = color_code
 
     def draw_text(self, x, y, text, color="white"):
         """특정 위치에 문자열을 버퍼에 기록"""
         if 0 <= y < self.height:
             color_code = COLOR_MAP.get(color, COLOR_MAP["white"])
+            row_chars = self.chars[y]
+            row_colors = self.colors[y]
+            if text.isascii():
+                # 광폭 문자가 없으면 슬라이스로 한 번에 기록
+                if 0 <= x < self.width:
+                    end = min(x + len(text), self.width)
+                    row_chars[x:end] = text[:end - x]
+                    row_colors[x:end] = [color_code] * (end - x)
+                return
             current_x = x
             for char in text:
                 if 0 <= current_x < self.width:
-                    self.buffer[y][current_x] = f"{color_code}{char}{COLOR_MAP['reset']}"
+                    row_chars[current_x] = char
+                    row_colors[current_x] = color_code
                     
                     if ord(char) > 127: # 한글 등 광폭 문자
                         if current_x + 1 < self.width:
-                            self.buffer[y][current_x+1] = "" # 점유 처리
+                            row_chars[current_x+1] = "" # 점유 처리
+                            row_colors[current_x+1] = color_code
                         current_x += 2
                     else:
                         current_x += 1
@@ -112,20 +164,94 @@ class Renderer:
         self.draw_text(x, y + height - 1, BL + H * (width - 2) + BR, color)
 
     def render(self):
-        """버퍼의 내용을 터미널에 출력"""
-        # 커서를 (0,0)으로 이동
-        sys.stdout.write("\033[H")
+        """버퍼의 내용을 터미널에 출력 (직전 프레임과 다른 칸만, 필요하면 전체)"""
+        front = self._front
+        if (front is None or len(front[0]) != len(self.chars)
+                or self._frames_since_full >= RENDER_FULL_REDRAW_FRAMES):
+            output = self._full_frame()
+        else:
+            output = self._diff_frame(*front)
+            self._frames_since_full += 1
         
-        output_lines = []
-        for row in self.buffer:
-            # 각 행을 하나의 문자열로 결합 (이미 색상 코드가 포함됨)
-            output_lines.append("".join(row))
+        # 한 번에 출력
+        self.stream.write(output)
+        self.stream.flush()
+        # 다음 프레임에서 그리기 호출이 버퍼를 고쳐 써도 안전하도록 복사
+        self._front = ([row[:] for row in self.chars], [row[:] for row in self.colors])
         
-        # 전체 화면을 한 번에 출력
-        sys.stdout.write("\n".join(output_lines))
-        sys.stdout.flush()
+        self.frames += 1
+        self.last_bytes = len(output.encode("utf-8"))
+        self.total_bytes += self.last_bytes
+
+    def _row_text(self, y, start, end) -> str:
+        """한 줄의 [start, end) 구간. 색상이 바뀔 때만 색상 코드를 넣고, 색상이 남아 있으면 끝에서 초기화합니다."""
+        chars = self.chars[y]
+        colors = self.colors[y]
+        out = []
+        current = RESET
+        run_start = start
+        for x in range(start, end):
+            color = colors[x]
+            if color != current:
+                out.append("".join(chars[run_start:x]))
+                if current in _NEEDS_RESET and color != RESET:
+                    out.append(RESET)
+                out.append(color)
+                current = color
+                run_start = x
+        out.append("".join(chars[run_start:end]))
+        if current != RESET:
+            out.append(RESET)
+        return "".join(out)
+
+    def _full_frame(self) -> str:
+        # 커서를 (0,0)으로 이동 (크기가 바뀐 경우 이전 화면 잔상을 지움)
+        prefix = "\033[2J\033[H" if self._clear_screen else "\033[H"
+        self._clear_screen = False
+        self._frames_since_full = 0
+        self.full_redraws += 1
+        return prefix + "\n".join(self._row_text(y, 0, self.width) for y in range(self.height))
+
+    def _diff_frame(self, front_chars, front_colors) -> str:
+        """바뀐 칸 구간마다 커서 이동(\033[행;열H) + 해당 칸들만 출력"""
+        out = []
+        for y in range(self.height):
+            chars, prev_chars = self.chars[y], front_chars[y]
+            colors, prev_colors = self.colors[y], front_colors[y]
+            if chars == prev_chars and colors == prev_colors:
+                continue
+            width = min(len(chars), len(prev_chars))
+            changed = [chars[x] != prev_chars[x] or colors[x] != prev_colors[x] for x in range(width)]
+            x = 0
+            while x < width:
+                if not changed[x]:
+                    x += 1
+                    continue
+                start = x
+                # 광폭 문자 오른쪽 칸("")이 바뀌었으면 왼쪽 칸(광폭 문자)부터 다시 씀
+                if start > 0 and (chars[start] == "" or prev_chars[start] == ""):
+                    start -= 1
+                # 한 칸짜리 틈은 커서 이동보다 그냥 쓰는 편이 짧으므로 이어서 씀
+                end = x + 1
+                while end < width and (changed[end] or (end + 1 < width and changed[end + 1])):
+                    end += 1
+                out.append(f"\033[{y + 1};{start + 1}H")
+                out.append(self._row_text(y, start, end))
+                x = end
+        return "".join(out)
+
+    @property
+    def stats(self) -> dict:
+        """출력 통계 (바이트는 UTF-8 기준)"""
+        return {
+            "frames": self.frames,
+            "full_redraws": self.full_redraws,
+            "last_bytes": self.last_bytes,
+            "avg_bytes": self.total_bytes / self.frames if self.frames else 0.0,
+            "total_bytes": self.total_bytes,
+        }
 
     def __del__(self):
         # 종료 시 커서 보이기 및 색상 초기화
-        sys.stdout.write("\033[?25h")
-        sys.stdout.write("\033[0m")
+        self.stream.write("\033[?25h")
+        self.stream.write("\033[0m")
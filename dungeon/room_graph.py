@@ -0,0 +1,149 @@
+# dungeon/room_graph.py - 방/통로 영역 그래프 (계층형 경로 탐색)
+
+import heapq
+from typing import Dict, List, Optional, Tuple
+
+from .constants import WALL
+
+Point = Tuple[int, int]
+
+# 같은 영역에 있거나 이보다 가까우면 그래프를 거치지 않고 바로 타일 단위 A*를 사용
+ROOM_GRAPH_MIN_DISTANCE = 12
+
+
+class RoomGraph:
+    """
+    DungeonMap의 rooms와 나머지 바닥(통로/동굴) 연결 요소로 만든 추상 영역 그래프.
+
+    - 영역: 방 내부 타일은 해당 방, 방에 속하지 않은 바닥은 4방향으로 이어진 덩어리마다 하나의 통로 영역
+    - 포털: 서로 맞닿은 두 영역 사이의 경계 타일 쌍 (영역 쌍마다 경계의 가운데 한 쌍)
+    장거리 이동은 영역 그래프 위에서 경로(포털 순서)를 먼저 정하고,
+    타일 단위 탐색은 다음 포털까지만 수행합니다 (pathfinding.PathCache).
+    영역 내부 이동 비용은 포털 간 맨해튼 거리로 근사합니다 (직사각형 방에서는 정확).
+    생성 시점 지형 기준으로 만들어지며 이후 벽이 바뀌지 않는다고 가정합니다.
+    """
+    def __init__(self, width: int, height: int, map_data: List[List[str]], rooms):
+        self.width = width
+        self.height = height
+        self.region_of: List[int] = [-1] * (width * height)
+        self.room_count = 0
+        self.region_count = 0
+        # 영역 -> [(이웃 영역, 내 쪽 포털 타일, 이웃 쪽 포털 타일)]
+        self.links: Dict[int, List[Tuple[int, Point, Point]]] = {}
+        self._route_cache: Dict[Tuple[int, int], Optional[List[Point]]] = {}
+        self._build(map_data, rooms)
+
+    def _build(self, map_data, rooms):
+        w, h = self.width, self.height
+        region_of = self.region_of
+        passable = [tile != WALL for row in map_data for tile in row]
+
+        # 1. 방 내부
+        for room_id, room in enumerate(rooms):
+            x1, x2 = max(0, room.x1 + 1), min(w, room.x2)
+            for y in range(max(0, room.y1 + 1), min(h, room.y2)):
+                a, b = y * w + x1, y * w + x2
+                region_of[a:b] = [room_id if p and r == -1 else r for p, r in zip(passable[a:b], region_of[a:b])]
+        self.room_count = len(rooms)
+
+        # 2. 방에 속하지 않은 바닥 덩어리 = 통로 영역
+        label = self.room_count
+        n = w * h
+        for seed in [i for i in range(n) if passable[i] and region_of[i] == -1]:
+            if region_of[seed] != -1:
+                continue
+            region_of[seed] = label
+            stack = [seed]
+            while stack:
+                i = stack.pop()
+                x = i % w
+                for j, inside in ((i - 1, x > 0), (i + 1, x < w - 1), (i - w, i >= w), (i + w, i + w < n)):
+                    if inside and passable[j] and region_of[j] == -1:
+                        region_of[j] = label
+                        stack.append(j)
+            label += 1
+        self.region_count = label
+
+        # 3. 포털: 행 단위로 오른쪽/아래 이웃과 영역이 다른 지점을 찾음
+        borders: Dict[Tuple[int, int], List[Tuple[int, int]]] = {}
+        for y in range(h):
+            base = y * w
+            row = region_of[base:base + w]
+            below = region_of[base + w:base + 2 * w] if y < h - 1 else None
+            edges = [(base + x, base + x + 1, a, b) for x, (a, b) in enumerate(zip(row, row[1:]))
+                     if a != b and a >= 0 and b >= 0]
+            if below:
+                edges += [(base + x, base + w + x, a, b) for x, (a, b) in enumerate(zip(row, below))
+                          if a != b and a >= 0 and b >= 0]
+            for i, j, a, b in edges:
+                if a < b:
+                    borders.setdefault((a, b), []).append((i, j))
+                else:
+                    borders.setdefault((b, a), []).append((j, i))
+
+        for (a, b), pairs in borders.items():
+            ia, ib = pairs[len(pairs) // 2]
+            pa, pb = (ia % w, ia // w), (ib % w, ib // w)
+            self.links.setdefault(a, []).append((b, pa, pb))
+            self.links.setdefault(b, []).append((a, pb, pa))
+
+    def region_at(self, x: int, y: int) -> int:
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return -1
+        return self.region_of[y * self.width + x]
+
+    def route(self, start: Point, goal: Point) -> Optional[List[Point]]:
+        """
+        start에서 goal까지 거쳐야 할 포털(다음 영역 쪽 타일) 목록을 반환합니다. 마지막 원소는 goal입니다.
+        같은 영역이면 [goal], 이어져 있지 않으면 None.
+        결과는 (출발 영역, 도착 영역) 단위로 캐시되므로 같은 방의 몬스터들은 계획을 공유합니다.
+        """
+        sr, gr = self.region_at(*start), self.region_at(*goal)
+        if sr < 0 or gr < 0:
+            return None
+        if sr == gr:
+            return [goal]
+        key = (sr, gr)
+        if key not in self._route_cache:
+            self._route_cache[key] = self._search(sr, start, gr, goal)
+        portals = self._route_cache[key]
+        return None if portals is None else portals + [goal]
+
+    def _search(self, sr: int, start: Point, gr: int, goal: Point) -> Optional[List[Point]]:
+        """
+        포털을 노드로 하는 A*. 영역 내부 이동 비용은 맨해튼 거리, 경계 통과는 1.
+        각 구간 비용이 맨해튼 거리 이상이므로 목표까지의 맨해튼 거리는 일관된(consistent) 휴리스틱입니다.
+        """
+        gx, gy = goal
+        best = {start: 0}
+        came_from = {}
+        heap = [(abs(gx - start[0]) + abs(gy - start[1]), 0, start, sr)]
+        goal_cost, goal_entry = None, None
+        while heap:
+            f, cost, entry, region = heapq.heappop(heap)
+            if goal_cost is not None and f >= goal_cost:
+                break
+            if cost > best.get(entry, cost):
+                continue
+            if region == gr:
+                total = cost + abs(gx - entry[0]) + abs(gy - entry[1])
+                if goal_cost is None or total < goal_cost:
+                    goal_cost, goal_entry = total, entry
+                continue
+            for neighbour, exit_tile, next_entry in self.links.get(region, ()):
+                new_cost = cost + abs(exit_tile[0] - entry[0]) + abs(exit_tile[1] - entry[1]) + 1
+                if new_cost < best.get(next_entry, new_cost + 1):
+                    best[next_entry] = new_cost
+                    came_from[next_entry] = entry
+                    heapq.heappush(heap, (new_cost + abs(gx - next_entry[0]) + abs(gy - next_entry[1]),
+                                          new_cost, next_entry, neighbour))
+
+        if goal_entry is None:
+            return None
+        portals = []
+        node = goal_entry
+        while node != start:
+            portals.append(node)
+            node = came_from[node]
+        portals.reverse()
+        return portals
@@ -0,0 +1,248 @@
+# dungeon/scheduler.py - 다음 행동 시각 기반 스케줄러
+
+import heapq
+import time
+from itertools import count
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+
+class ActionScheduler:
+    """
+    엔티티별 '다음 행동 시각'을 최소 힙으로 관리합니다.
+
+    매 틱 모든 몬스터의 쿨다운(time - last_action_time < action_delay)을 비교하는 대신,
+    행동 시각이 된 엔티티만 pop_due로 꺼내 처리하고 처리 후 다시 schedule합니다.
+    일정이 바뀌면 힙에서 지우지 않고 새 항목을 넣으며, 오래된 항목은 꺼낼 때 버립니다(lazy deletion).
+    꺼낸 엔티티는 일정에서 빠지므로 호출 측이 반드시 다시 schedule해야 합니다.
+    """
+    def __init__(self):
+        self._heap: List[Tuple[float, int, int]] = []
+        self._due: Dict[int, float] = {}
+        self._seq = count() # 같은 시각이면 먼저 예약한 엔티티부터
+
+    def __len__(self) -> int:
+        return len(self._due)
+
+    def __contains__(self, entity_id: int) -> bool:
+        return entity_id in self._due
+
+    def schedule(self, entity_id: int, due: float) -> None:
+        """entity_id의 다음 행동 시각을 due로 (다시) 설정합니다."""
+        if self._due.get(entity_id) == due:
+            return
+        self._due[entity_id] = due
+        heapq.heappush(self._heap, (due, next(self._seq), entity_id))
+        # 오래된 항목이 쌓이면 한 번에 정리
+        if len(self._heap) > 2 * len(self._due) + 64:
+            self._compact()
+
+    def due_at(self, entity_id: int):
+        return self._due.get(entity_id)
+
+    def remove(self, entity_id: int) -> None:
+        self._due.pop(entity_id, None)
+
+    def next_due(self) -> Optional[float]:
+        """가장 이른 행동 시각 (오래된 항목은 버림). 예약이 없으면 None."""
+        heap, due_map = self._heap, self._due
+        while heap and due_map.get(heap[0][2]) != heap[0][0]:
+            heapq.heappop(heap)
+        return heap[0][0] if heap else None
+
+    def sync(self, entity_ids: Iterable[int], now: float) -> None:
+        """살아 있는 엔티티 목록에 맞춥니다. 새 엔티티는 now에 예약하고 사라진 엔티티는 제거합니다."""
+        alive = set(entity_ids)
+        for eid in [eid for eid in self._due if eid not in alive]:
+            del self._due[eid]
+        for eid in alive:
+            if eid not in self._due:
+                self.schedule(eid, now)
+
+    def pop_due(self, now: float) -> List[int]:
+        """행동 시각이 now 이하인 엔티티를 예약 시각 순으로 꺼냅니다."""
+        heap, due_map = self._heap, self._due
+        ready = []
+        while heap and heap[0][0] <= now:
+            due, _seq, eid = heapq.heappop(heap)
+            if due_map.get(eid) != due:
+                continue # 다시 예약되었거나 제거된 항목
+            del due_map[eid]
+            ready.append(eid)
+        return ready
+
+    def _compact(self) -> None:
+        due_map = self._due
+        self._heap = [entry for entry in self._heap if due_map.get(entry[2]) == entry[0]]
+        heapq.heapify(self._heap)
+
+
+class FrameBudget:
+    """
+    한 프레임에 AI가 쓸 수 있는 시간(ms)과 엔티티 수 한도. 둘 다 None이면 제한 없음.
+
+    start()로 프레임을 시작하고 엔티티 하나를 처리할 때마다 spend()를 부르며,
+    exhausted()가 True가 되면 남은 엔티티는 다음 프레임으로 넘깁니다.
+    report()는 이번 프레임의 사용량을 돌려줍니다 (시간은 time.perf_counter 기준).
+    """
+    def __init__(self, time_ms: Optional[float] = None, max_entities: Optional[int] = None):
+        self.time_ms = time_ms
+        self.max_entities = max_entities
+        self.processed = 0
+        self.deferred = 0
+        self._start = 0.0
+        self._end = None
+
+    def start(self) -> None:
+        self.processed = 0
+        self.deferred = 0
+        self._start = time.perf_counter()
+        self._end = None
+
+    def spend(self, entities: int = 1) -> None:
+        self.processed += entities
+
+    def defer(self, entities: int = 1) -> None:
+        self.deferred += entities
+
+    def finish(self) -> None:
+        self._end = time.perf_counter()
+
+    @property
+    def elapsed_ms(self) -> float:
+        end = self._end if self._end is not None else time.perf_counter()
+        return (end - self._start) * 1000
+
+    def exhausted(self) -> bool:
+        if self.max_entities is not None and self.processed >= self.max_entities:
+            return True
+        return self.time_ms is not None and self.elapsed_ms >= self.time_ms
+
+    def report(self) -> Dict[str, float]:
+        """이번 프레임 사용량. used는 두 한도 중 더 많이 쓴 쪽의 비율 (제한이 없으면 0)."""
+        elapsed = self.elapsed_ms
+        used = 0.0
+        if self.time_ms:
+            used = elapsed / self.time_ms
+        if self.max_entities:
+            used = max(used, self.processed / self.max_entities)
+        return {"elapsed_ms": elapsed, "processed": self.processed, "deferred": self.deferred, "used": used}
+
+
+class TimerQueue:
+    """
+    지속 시간이 있는 컴포넌트(ecs.TimedComponent)의 만료/주기 타이머를 시각 순 최소 힙으로 관리합니다.
+
+    컴포넌트가 월드의 엔티티에 붙을 때 track()으로 만료 시각이 등록되고, 만료 시각이 바뀌면 새 항목이 추가됩니다.
+    오래된 항목은 꺼낸 쪽(TimeSystem)이 컴포넌트의 현재 시각과 비교해 버리므로(lazy deletion),
+    매 프레임 비용은 활성 상태 개수가 아니라 실제로 발동하는 타이머 수에 비례합니다.
+    같은 시각이면 주기 틱(TICK)이 만료(EXPIRE)보다 먼저 나옵니다.
+    """
+    TICK = 0
+    EXPIRE = 1
+
+    def __init__(self):
+        self._heap: List[Tuple[float, int, int, Any, Any]] = []
+        self._seq = count()
+        self.added: List[Tuple[Any, Any]] = [] # 새로 등록된 (엔티티, 컴포넌트) - TimeSystem이 주기 타이머를 붙임
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def track(self, entity, component) -> None:
+        """엔티티에 붙은 컴포넌트의 시간을 흐르게 하고 만료 타이머를 등록합니다."""
+        component.start_timer(self, entity)
+        self.added.append((entity, component))
+        self.push(component.expires_at, self.EXPIRE, entity, component)
+
+    def push(self, due: float, kind: int, entity, component) -> None:
+        heapq.heappush(self._heap, (due, kind, next(self._seq), entity, component))
+
+    def pop_due(self, now: float) -> List[Tuple[float, int, Any, Any]]:
+        """시각이 now 이하인 (시각, 종류, 엔티티, 컴포넌트)를 시각 순으로 꺼냅니다. 유효성은 호출 측이 확인합니다."""
+        heap = self._heap
+        ready = []
+        while heap and heap[0][0] <= now:
+            due, kind, _seq, entity, component = heapq.heappop(heap)
+            ready.append((due, kind, entity, component))
+        return ready
+
+    def next_due(self) -> Optional[float]:
+        return self._heap[0][0] if self._heap else None
+
+    def clear(self) -> None:
+        self._heap.clear()
+        self.added.clear()
+
+
+class CooldownManager:
+    """
+    엔티티별 쿨타임 (이름 -> 만료 시각). 만료 시각은 게임 시계(World.clock) 기준 절대값입니다.
+
+    조회할 때마다 시계와 비교해 지우는 대신, 만료 순 최소 힙으로 지난 항목을 purge()에서 한 번에 정리합니다.
+    active()는 한 엔티티의 남은 쿨타임 전체를 한 번에 돌려주므로 UI가 스킬마다 따로 묻지 않아도 됩니다.
+    엔티티가 삭제되면 World.delete_entity가 remove_entity()로 항목을 지웁니다.
+    to_dict()/load()는 남은 시간으로 저장하므로 불러온 뒤 시계 기준이 달라도 쿨타임이 어긋나지 않습니다.
+    """
+    def __init__(self):
+        self._expiry: Dict[int, Dict[str, float]] = {}
+        self._heap: List[Tuple[float, int, str]] = []
+
+    def __len__(self) -> int:
+        return sum(len(names) for names in self._expiry.values())
+
+    def set(self, entity_id: int, name: str, duration: float, now: float) -> None:
+        """now부터 duration초 쿨타임을 겁니다 (기존 쿨타임은 덮어씀)."""
+        if duration <= 0:
+            return
+        expiry = now + duration
+        self._expiry.setdefault(entity_id, {})[name] = expiry
+        heapq.heappush(self._heap, (expiry, entity_id, name))
+
+    def remaining(self, entity_id: int, name: str, now: float) -> float:
+        """남은 쿨타임(초). 없거나 끝났으면 0."""
+        expiry = self._expiry.get(entity_id, {}).get(name)
+        if expiry is None or expiry <= now:
+            return 0
+        return expiry - now
+
+    def active(self, entity_id: int, now: float) -> Dict[str, float]:
+        """엔티티의 진행 중인 쿨타임 전체 (이름 -> 남은 초)"""
+        return {name: expiry - now for name, expiry in self._expiry.get(entity_id, {}).items() if expiry > now}
+
+    def purge(self, now: float) -> int:
+        """만료 시각이 지난 항목을 지우고 지운 개수를 반환합니다."""
+        heap, expiry_map = self._heap, self._expiry
+        removed = 0
+        while heap and heap[0][0] <= now:
+            expiry, entity_id, name = heapq.heappop(heap)
+            names = expiry_map.get(entity_id)
+            if names is None or names.get(name) != expiry:
+                continue # 다시 걸렸거나 엔티티와 함께 지워진 항목
+            del names[name]
+            removed += 1
+            if not names:
+                del expiry_map[entity_id]
+        return removed
+
+    def remove_entity(self, entity_id: int) -> None:
+        self._expiry.pop(entity_id, None)
+
+    def clear(self) -> None:
+        self._expiry.clear()
+        self._heap.clear()
+
+    def to_dict(self, now: float, entity_ids: Iterable[int] = None) -> Dict[str, Dict[str, float]]:
+        """저장용: {엔티티 ID(str): {이름: 남은 초}}. entity_ids를 주면 해당 엔티티만."""
+        ids = self._expiry.keys() if entity_ids is None else entity_ids
+        data = {}
+        for entity_id in ids:
+            active = self.active(entity_id, now)
+            if active:
+                data[str(entity_id)] = active
+        return data
+
+    def load(self, data: Dict[str, Dict[str, float]], now: float) -> None:
+        """to_dict() 결과를 now 기준으로 다시 겁니다."""
+        for entity_id, names in (data or {}).items():
+            for name, remaining in names.items():
+                self.set(int(entity_id), name, remaining, now)
@@ -0,0 +1,32 @@
+# dungeon/seeding.py - 런 시드 기반 결정적 난수 스트림
+
+import random
+
+# 층마다 독립적으로 유도되는 난수 스트림 이름
+# 한 스트림의 소비량이 달라져도 (예: 함정 수 변경) 다른 스트림의 결과는 바뀌지 않습니다.
+STREAM_LAYOUT = "layout"   # 맵 구조 (방, 복도, 계단)
+STREAM_SPAWN = "spawn"     # 몬스터/보스/오브젝트 배치
+STREAM_TRAP = "trap"       # 함정, 함정 지대, 압력판
+STREAM_LOOT = "loot"       # 상자 내용물, 희귀도, 접사
+
+FLOOR_STREAMS = (STREAM_LAYOUT, STREAM_SPAWN, STREAM_TRAP, STREAM_LOOT)
+
+
+def derive_seed(run_seed: int, floor: int, stream: str) -> int:
+    """(런 시드, 층, 스트림 이름)으로부터 32비트 시드를 유도합니다. 플랫폼/실행과 무관하게 항상 같은 값입니다."""
+    return random.Random(f"{run_seed}:{floor}:{stream}").getrandbits(32)
+
+
+class FloorRandom:
+    """
+    한 층에서 사용하는 독립 난수 스트림 묶음.
+    같은 (run_seed, floor)이면 층 구조, 몬스터 배치, 함정, 전리품이 모두 동일하게 재현됩니다.
+    """
+    def __init__(self, run_seed: int, floor: int):
+        self.run_seed = run_seed
+        self.floor = floor
+        for stream in FLOOR_STREAMS:
+            setattr(self, stream, random.Random(derive_seed(run_seed, floor, stream)))
+
+    def get(self, stream: str) -> random.Random:
+        return getattr(self, stream)
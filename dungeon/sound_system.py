@@ -85,6 +85,8 @@ class SoundSystem(System):
 
     def _play_sound(self, sound_type, message=""):
         """시각적 피드백 출력 및 실제 파일 재생 시도"""
+        if getattr(self.world.engine, 'turbo', False):
+            return # [Turbo] 고속 진행 중에는 소리/로그 생략
         import time
         current_time = time.time()
         
@@ -0,0 +1,47 @@
+# dungeon/spawn_plan.py - 층 엔티티 배치 계획
+
+from typing import Any, Iterable, List, Optional, Tuple
+
+from .seeding import FloorRandom
+
+# 배치 항목 종류
+SPAWN_MONSTER = "MONSTER"
+SPAWN_BOSS = "BOSS"
+SPAWN_LEVER = "LEVER"
+SPAWN_DOOR = "DOOR"
+SPAWN_SHOP = "SHOP"
+SPAWN_CHEST = "CHEST"
+SPAWN_MIMIC = "MIMIC"
+SPAWN_TRAP = "TRAP"
+SPAWN_SHRINE = "SHRINE"
+
+
+class SpawnPlan:
+    """
+    한 층에 놓일 몬스터, 보스, 상인, 상자, 함정, 신전의 배치 계획.
+    위치, 몬스터 종류, 접두어, 함정 종류, 상자 내용물 등 난수 결과를 모두 미리 뽑아 두므로
+    World 없이 백그라운드 워커에서 만들 수 있고, 메인 스레드는 순서대로 엔티티만 생성하면 됩니다.
+    """
+    def __init__(self, level: int, spawn_at: str, floor_rng: FloorRandom, occupied: Iterable[Tuple[int, int]] = ()):
+        self.level = level
+        self.spawn_at = spawn_at
+        self.floor_rng = floor_rng # 계획을 마친 뒤의 난수 스트림 (층 진입 후 런타임 스폰이 이어서 사용)
+        self.ops: List[Tuple[str, int, int, Any]] = [] # (종류, x, y, 데이터) - 생성 순서대로
+        self.monster_count = 0
+        self.occupied = set(occupied) # 플레이어와 몬스터가 차지한 위치
+        self.trap_positions = set()
+        self.wall_traps: List[Tuple[int, int]] = [] # PROXIMITY 함정 위치 (생성 순서, 압력판 연결용)
+
+    def add(self, kind: str, x: int, y: int, data: Optional[Any] = None):
+        """배치 항목을 추가하고 이후 계획 단계가 참고하는 점유 정보를 갱신합니다."""
+        self.ops.append((kind, x, y, data))
+        if kind in (SPAWN_MONSTER, SPAWN_BOSS):
+            self.monster_count += 1
+            self.occupied.add((x, y))
+        elif kind == SPAWN_TRAP:
+            self.trap_positions.add((x, y))
+            if data["trap"].get("trigger_type") == "PROXIMITY":
+                self.wall_traps.append((x, y))
+
+    def has_trap_at(self, x: int, y: int) -> bool:
+        return (x, y) in self.trap_positions
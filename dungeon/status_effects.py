@@ -0,0 +1,152 @@
+# dungeon/status_effects.py - 상태 이상 효과 표 (우선순위/아이콘/중첩/틱/만료 규칙)
+
+from typing import Dict, List, Optional, Tuple
+
+from .components import (
+    StunComponent, SleepComponent, PetrifiedComponent, PoisonComponent, BleedingComponent,
+    ManaShieldComponent, CurseComponent, StatModifierComponent, SkillEffectComponent
+)
+
+
+class StatusEffect:
+    """
+    상태 이상 하나의 데이터 정의. 표시/중첩/틱/만료 동작은 이 값으로만 결정됩니다.
+
+    stacking:
+      - IGNORE      : 이미 걸려 있으면 새로 걸지 않음
+      - REFRESH     : 이미 걸려 있으면 남은 시간을 둘 중 긴 쪽으로 갱신
+      - STACK       : 스택 +1 (max_stacks까지) 후 지속시간 갱신
+      - INDEPENDENT : 인스턴스마다 따로 중첩 (버프 등)
+    icon이 두 글자 이상이면 0.5초마다 번갈아 표시합니다.
+    """
+    def __init__(self, effect_id: str, component: type, priority: int, icon: str = None, color: str = "white",
+                 stacking: str = "IGNORE", max_stacks: int = 1, disables: bool = False, magnitude: str = None,
+                 dot: Tuple[float, str, Optional[str]] = None, expire_message: Tuple[str, Optional[str]] = None):
+        self.effect_id = effect_id
+        self.component = component
+        self.priority = priority             # 높을수록 먼저 표시
+        self.icon = icon                     # 머리 위 아이콘 (None이면 표시 안 함)
+        self.color = color
+        self.stacking = stacking
+        self.max_stacks = max_stacks         # STACK 규칙의 최대 스택
+        self.disables = disables             # 몬스터 행동 불가 여부
+        self.magnitude = magnitude           # 세기로 보고할 컴포넌트 속성 (피해량 등)
+        self.dot = dot                       # 지속 피해: (피격 깜빡임 시간, 사망 메시지, 색상)
+        self.expire_message = expire_message # 만료 메시지: (엔티티 이름으로 포맷, 색상)
+
+    def icon_at(self, now: float) -> Optional[str]:
+        if not self.icon or len(self.icon) == 1:
+            return self.icon
+        return self.icon[int(now * 2) % len(self.icon)]
+
+
+# 우선순위 순서 (아이콘은 가장 높은 하나만 표시)
+STATUS_EFFECTS: List[StatusEffect] = sorted([
+    StatusEffect("PETRIFIED", PetrifiedComponent, 90, "◆", "dark_grey", stacking="STACK", max_stacks=3,
+                 disables=True, magnitude="stacks", expire_message=("{}의 석화가 해제되었습니다!", None)),
+    StatusEffect("STUN", StunComponent, 80, "*", "yellow", disables=True,
+                 expire_message=("{}의 기절이 해제되었습니다!", None)),
+    StatusEffect("SLEEP", SleepComponent, 70, "zZ", "light_cyan", stacking="REFRESH", disables=True,
+                 expire_message=("{}가 잠에서 깨어났습니다!", None)),
+    StatusEffect("POISON", PoisonComponent, 60, "P", "magenta", magnitude="damage",
+                 dot=(0.15, "{}이(가) 독에 의해 쓰러졌습니다!", None),
+                 expire_message=("{}의 중독 상태가 해제되었습니다.", None)),
+    StatusEffect("BLEEDING", BleedingComponent, 50, "~", "red", magnitude="damage",
+                 dot=(0.1, "{}이(가) 과다출혈로 사망했습니다!", "red"),
+                 expire_message=("{}의 출혈이 멈췄습니다.", None)),
+    StatusEffect("MANA_SHIELD", ManaShieldComponent, 40, "◇", "light_cyan",
+                 expire_message=("{}의 마법 장막이 사라졌습니다.", "cyan")),
+    StatusEffect("CURSE", CurseComponent, 30, magnitude="attack_penalty"),
+    StatusEffect("STAT_MODIFIER", StatModifierComponent, 20, stacking="INDEPENDENT"),
+    StatusEffect("SKILL_EFFECT", SkillEffectComponent, 10, stacking="INDEPENDENT", magnitude="damage"),
+], key=lambda effect: -effect.priority)
+
+STATUS_BY_COMPONENT: Dict[type, StatusEffect] = {effect.component: effect for effect in STATUS_EFFECTS}
+DOT_EFFECTS: List[StatusEffect] = [effect for effect in STATUS_EFFECTS if effect.dot]
+
+
+def active_statuses(entity) -> List[Tuple[StatusEffect, object]]:
+    """엔티티에 걸린 (효과, 컴포넌트) 목록을 우선순위 순으로 한 번에 모읍니다."""
+    found = []
+    for effect in STATUS_EFFECTS:
+        for comp in entity.get_components(effect.component):
+            found.append((effect, comp))
+    return found
+
+
+def top_status(entity) -> Tuple[Optional[StatusEffect], object]:
+    """아이콘으로 표시할 가장 우선순위가 높은 상태 (없으면 (None, None))"""
+    for effect in STATUS_EFFECTS:
+        if effect.icon:
+            comp = entity.get_component(effect.component)
+            if comp:
+                return effect, comp
+    return None, None
+
+
+def status_snapshot(entity) -> List[Tuple[str, float, int, float]]:
+    """(effect_id, 남은 시간, 스택, 세기) 목록. UI/디버그/저장용 요약."""
+    return [(effect.effect_id, getattr(comp, 'duration', 0) or 0, getattr(comp, 'stacks', 1),
+             getattr(comp, effect.magnitude, 0) if effect.magnitude else 0)
+            for effect, comp in active_statuses(entity)]
+
+
+def disabled_remaining(entity) -> float:
+    """행동 불가 상태(스턴/수면/석화)의 가장 긴 남은 시간. 걸려 있지 않으면 0."""
+    remaining = 0.0
+    for effect in STATUS_EFFECTS:
+        if effect.disables:
+            comp = entity.get_component(effect.component)
+            if comp:
+                # 지속시간이 없거나 이미 0 이하면 TimeSystem이 곧 제거하므로 다음 틱에 다시 확인
+                remaining = max(remaining, getattr(comp, 'duration', 0) or 0, 1e-6)
+    return remaining
+
+
+def apply_status(entity, comp):
+    """
+    효과 표의 중첩 규칙에 따라 상태를 겁니다.
+    실제로 걸리거나 갱신된 컴포넌트를 반환하고, 무시되었으면 None을 반환합니다.
+    """
+    effect = STATUS_BY_COMPONENT.get(type(comp))
+    existing = entity.get_component(type(comp)) if effect else None
+    if existing is None or effect.stacking == "INDEPENDENT":
+        entity.add_component(comp)
+        return comp
+    if effect.stacking == "REFRESH":
+        if comp.duration > existing.duration:
+            existing.duration = comp.duration
+        return existing
+    if effect.stacking == "STACK":
+        existing.stacks = min(existing.stacks + getattr(comp, 'stacks', 1), effect.max_stacks)
+        existing.duration = comp.duration
+        return existing
+    return None
+
+
+def clear_statuses(entity) -> None:
+    """모든 상태 이상 제거 (사망 등)"""
+    for effect in STATUS_EFFECTS:
+        entity.remove_component(effect.component)
+
+
+class ModifierTotals:
+    """엔티티에 걸린 StatModifierComponent의 합산 결과 (능력치 합, 공격/방어 배율 곱, 출처별 인스턴스)"""
+    def __init__(self, modifiers):
+        self.str_mod = self.mag_mod = self.dex_mod = self.vit_mod = 0
+        self.attack_multiplier = 1.0
+        self.defense_multiplier = 1.0
+        self.sources = {} # 출처 -> 컴포넌트 (남은 시간은 컴포넌트에서 바로 읽음)
+        for mod in modifiers:
+            self.str_mod += mod.str_mod
+            self.mag_mod += mod.mag_mod
+            self.dex_mod += mod.dex_mod
+            self.vit_mod += mod.vit_mod
+            self.attack_multiplier *= getattr(mod, 'attack_multiplier', 1.0)
+            self.defense_multiplier *= getattr(mod, 'defense_multiplier', 1.0)
+            self.sources.setdefault(mod.source, mod)
+
+
+def modifier_totals(entity) -> ModifierTotals:
+    """버프/디버프 합산값. 수정자가 붙거나 만료될 때만 다시 계산합니다 (Entity.cached)."""
+    return entity.cached(StatModifierComponent, ModifierTotals)
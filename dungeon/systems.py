@@ -1,6 +1,6 @@
 # dungeon/systems.py - 게임 로직을 실행하는 모듈
 
-from typing import Set, Tuple, List, Any
+from typing import Dict, Set, Tuple, List, Any
 from .ecs import System, Entity, Event, EventManager # EventManager는 필요 없음
 from .components import (
     PositionComponent, DesiredPositionComponent, MapComponent, MonsterComponent, 
@@ -14,9 +14,19 @@ from .components import (
 )
 import readchar
 import random
-import time
 import logging
+from collections import deque
 from .ui import COLOR_MAP
+from .los import LineOfSight
+from .pathfinding import DistanceField, PathCache
+from .scheduler import ActionScheduler, FrameBudget
+from .status_effects import DOT_EFFECTS, STATUS_BY_COMPONENT, apply_status, clear_statuses, disabled_remaining, modifier_totals
+from .boss_patterns import compile_boss_patterns
+from .batch_ai import BATCH_SPECIAL_FLAGS, BatchChasePlanner, batch_available
+from .config import (
+    SUMMON_RETREAT_HP_RATIO, AI_IDLE_RECHECK, ALERT_RADIUS, ALERT_SOURCES_PER_TICK, BATCH_AI_MIN_ENTITIES,
+    AI_FRAME_BUDGET_MS, AI_FRAME_ENTITY_BUDGET
+)
 from .localization import _
 from .events import (
     MoveSuccessEvent, CollisionEvent, MessageEvent, MapTransitionEvent,
@@ -45,7 +55,7 @@ class InputSystem(System):
         if not stats: return False
 
         # 1. 쿨다운 확인 (실시간 이동/공격 제한)
-        current_time = time.time()
+        current_time = self.world.clock.now()
         
         # [Petrified] 1스택 이상: Action Delay 50% 증가 (Slow)
         # 3스택: 행동 불가 (Stunned)
@@ -287,6 +297,16 @@ class InputSystem(System):
 class MovementSystem(System):
     """이동 요청 처리, 맵 충돌 및 상호작용 후 위치 업데이트."""
     _required_components: Set = {PositionComponent, DesiredPositionComponent}
+    # 이동을 막는지 판단하는 컴포넌트 (이 색인들이 그대로면 막는 엔티티 목록도 그대로)
+    _blocker_types = (PositionComponent, MapComponent, MessageComponent, LootComponent, CorpseComponent, TrapComponent)
+
+    def __init__(self, world):
+        super().__init__(world)
+        self._blockers = None # (색인 버전, 이동을 막는 엔티티 목록)
+
+    def has_work(self) -> bool:
+        """이동 요청이 있을 때만"""
+        return bool(self.world.get_entities_with_components({DesiredPositionComponent}))
 
     def process(self):
         """매 턴(프레임)마다 모든 이동 요청을 처리"""
@@ -297,6 +317,9 @@ class MovementSystem(System):
         map_entity_list = self.world.get_entities_with_components({MapComponent})
         if not map_entity_list: return
         map_component = map_entity_list[0].get_component(MapComponent)
+        # 이동을 막는 엔티티의 위치 색인 (이동자마다 전체 엔티티를 다시 훑지 않도록 한 번만 만들고 이동 시 갱신)
+        occupants = self._build_occupants() if entities_to_move else {}
+        hidden_entities = None
 
         for entity in entities_to_move:
             position = entity.get_component(PositionComponent)
@@ -320,7 +343,7 @@ class MovementSystem(System):
                 is_collision = True
             
             if not is_collision:
-                collision_data = self._check_entity_collision(entity, new_x, new_y)
+                collision_data = self._check_entity_collision(entity, new_x, new_y, occupants)
                 if collision_data:
                     collided_id, collision_type = collision_data
                     
@@ -336,6 +359,9 @@ class MovementSystem(System):
             if not is_collision:
                 old_x, old_y = position.x, position.y
                 position.x, position.y = new_x, new_y
+                if entity in occupants.get((old_x, old_y), ()):
+                    occupants[(old_x, old_y)].remove(entity)
+                    occupants.setdefault((new_x, new_y), []).append(entity)
                 self.event_manager.push(MoveSuccessEvent(entity.entity_id, old_x, old_y, new_x, new_y))
                 
                 # 플레이어 이동 소리
@@ -363,7 +389,8 @@ class MovementSystem(System):
 
             # 5. 숨겨진 아이템 발견 시 메시지
             if not is_collision:
-                hidden_entities = self.world.get_entities_with_components({PositionComponent, HiddenComponent})
+                if hidden_entities is None:
+                    hidden_entities = self.world.get_entities_with_components({PositionComponent, HiddenComponent})
                 for h_ent in hidden_entities:
                     h_pos = h_ent.get_component(PositionComponent)
                     if h_pos.x == new_x and h_pos.y == new_y:
@@ -386,21 +413,32 @@ class MovementSystem(System):
              return False # 벽 타일
         return True
 
-    def _check_entity_collision(self, moving_entity: Entity, x: int, y: int) -> Tuple[int, str] | None:
-        """이동할 위치에 다른 엔티티가 있는지 확인"""
-        
+    @staticmethod
+    def _blocks_movement(e: Entity) -> bool:
         # 맵 관련 엔티티는 무시 (MapComponent, MessageComponent 등)
-        entities_at_position = [
-            e for e in self.world.get_entities_with_components({PositionComponent}) 
-            if e.get_component(PositionComponent).x == x 
-            and e.get_component(PositionComponent).y == y
-            and e.entity_id != moving_entity.entity_id
-            and e.get_component(MapComponent) is None  # 맵 엔티티 제외
-            and e.get_component(MessageComponent) is None # 메시지 엔티티 제외
-            and e.get_component(LootComponent) is None # 루팅 가능한 엔티티(시체, 상자)는 통과 가능
-            and e.get_component(CorpseComponent) is None # 시체는 통과 가능
-            and e.get_component(TrapComponent) is None # 함정도 통과 가능
-        ]
+        return (e.get_component(MapComponent) is None  # 맵 엔티티 제외
+                and e.get_component(MessageComponent) is None # 메시지 엔티티 제외
+                and e.get_component(LootComponent) is None # 루팅 가능한 엔티티(시체, 상자)는 통과 가능
+                and e.get_component(CorpseComponent) is None # 시체는 통과 가능
+                and e.get_component(TrapComponent) is None) # 함정도 통과 가능
+
+    def _build_occupants(self) -> Dict[Tuple[int, int], List[Entity]]:
+        """이동을 막는 엔티티의 (x, y) -> 엔티티 목록 (막는 엔티티 목록은 관련 색인이 바뀔 때만 다시 고름)"""
+        version = tuple(self.world.index_version(c_type) for c_type in self._blocker_types)
+        if self._blockers is None or self._blockers[0] != version:
+            blockers = [e for e in self.world.get_entities_with_components({PositionComponent}) if self._blocks_movement(e)]
+            self._blockers = (version, blockers)
+        occupants = {}
+        for e in self._blockers[1]:
+            pos = e.get_component(PositionComponent)
+            occupants.setdefault((pos.x, pos.y), []).append(e)
+        return occupants
+
+    def _check_entity_collision(self, moving_entity: Entity, x: int, y: int, occupants=None) -> Tuple[int, str] | None:
+        """이동할 위치에 다른 엔티티가 있는지 확인 (occupants: _build_occupants 색인, 없으면 전체 탐색)"""
+        if occupants is None:
+            occupants = self._build_occupants()
+        entities_at_position = [e for e in occupants.get((x, y), ()) if e.entity_id != moving_entity.entity_id]
         
         if not entities_at_position:
             return None
@@ -435,6 +473,82 @@ class MovementSystem(System):
 class MonsterAISystem(System):
     """몬스터의 행동 패턴에 따라 DesiredPositionComponent를 추가합니다."""
     _required_components: Set = {MonsterComponent, PositionComponent, AIComponent}
+    max_chase_range = 15  # Maximum distance to chase (even in CHASE mode)
+
+    def __init__(self, world):
+        super().__init__(world)
+        # 원거리 몬스터용 시야 질의 (맵 버전 단위 캐시)
+        self.los = LineOfSight()
+        # 플레이어 추적용 공유 거리장 (플레이어 타일 또는 맵 버전이 바뀔 때만 재계산)
+        # 도주 지도(safety)도 같은 재계산에서 함께 만듦
+        self.chase_field = DistanceField(with_safety=True)
+        self.use_flow_field = True
+        # 플레이어가 아닌 목표를 향한 엔티티별 A* 경로
+        self.path_cache = PathCache()
+        # 다음 행동 시각 힙: 행동할 때가 된 몬스터만 꺼내 처리
+        self.scheduler = ActionScheduler()
+        # [Alert] 추적을 막 시작해 주변에 경보를 보낼 몬스터 대기열과, 이번 추적에서 이미 경보를 보낸 몬스터
+        self._alert_queue = deque()
+        self._alerted = set()
+        # [Batch] 평범한 근접 추적 몬스터가 많으면 NumPy로 한 번에 판단 (NumPy가 없으면 꺼짐)
+        self.use_batch_ai = batch_available()
+        self.batch_planner = BatchChasePlanner()
+        # [Budget] 프레임당 AI 시간/엔티티 한도. 다 쓰면 남은 몬스터는 다음 프레임에 먼저 처리
+        self.budget = FrameBudget(AI_FRAME_BUDGET_MS, AI_FRAME_ENTITY_BUDGET)
+        self.last_budget_report = self.budget.report()
+        # [Turbo] 멀리서 쉬느라 AI_IDLE_RECHECK보다 늦게 예약한 몬스터와, 그 판단에 쓴 플레이어 위치/시각
+        self._idle_ids = set()
+        self._last_player_seen = None
+        self._ai_version = None
+
+    def wake(self, entity_id: int):
+        """수면 해제 등으로 상태이상이 예정보다 일찍 풀렸을 때 다음 틱에 바로 행동하도록 다시 예약합니다."""
+        if entity_id in self.scheduler:
+            self.scheduler.schedule(entity_id, self.world.clock.now())
+
+    def has_work(self) -> bool:
+        """예약 시각이 된 몬스터, 보낼 경보, 새로 생기거나 사라진 AI 엔티티, 플레이어의 순간이동이 있을 때만"""
+        if self._alert_queue or self._ai_version != self.world.index_version(AIComponent):
+            return True
+        now = self.world.clock.now()
+        next_due = self.scheduler.next_due()
+        if next_due is not None and next_due <= now:
+            return True
+        player = self.world.get_player_entity()
+        return player is not None and self._player_jumped(player, now)
+
+    def _player_step_interval(self, player) -> float:
+        """플레이어가 한 칸 걷는 데 걸리는 가장 짧은 시간 (엔진이 알려주지 않으면 행동 지연)"""
+        step_interval = getattr(self.world.engine, 'player_step_interval', None)
+        if step_interval:
+            return step_interval()
+        return player.get_component(StatsComponent).action_delay
+
+    def _player_jumped(self, player, now: float) -> bool:
+        """마지막 처리 이후 플레이어가 걸어서는 갈 수 없는 거리만큼 이동했는지 (멀리서 쉬는 몬스터 예약의 전제)"""
+        if not self._idle_ids or self._last_player_seen is None:
+            return False
+        pos = player.get_component(PositionComponent)
+        (x, y), seen_at = self._last_player_seen
+        steps = abs(pos.x - x) + abs(pos.y - y)
+        return steps > 1 + (now - seen_at) / max(self._player_step_interval(player), 0.01)
+
+    def _idle_until(self, entity_id: int, dist: int, reach: int, current_time: float, step_interval: float) -> float:
+        """
+        할 일이 없던 몬스터를 다시 살펴볼 시각 (기본은 AI_IDLE_RECHECK 뒤).
+        [Turbo] 터보 모드에서는 플레이어가 쉬지 않고 걸어와도 reach(추적/감지 범위) 안에 들 수 없는 동안을 한 번에 건너뜁니다.
+        """
+        gap = dist - reach
+        if gap <= 0 or not getattr(self.world.engine, 'turbo', False):
+            return current_time + AI_IDLE_RECHECK
+        self._idle_ids.add(entity_id)
+        return current_time + max(AI_IDLE_RECHECK, gap * step_interval)
+
+    @staticmethod
+    def _disabled_until(entity, now: float) -> float:
+        """스턴/수면/석화 중이면 가장 늦게 풀리는 시각을, 아니면 0을 반환합니다."""
+        remaining = disabled_remaining(entity)
+        return now + remaining if remaining else 0.0
 
     def process(self):
         player_entity = self.world.get_player_entity()
@@ -442,17 +556,82 @@ class MonsterAISystem(System):
         
         player_pos = player_entity.get_component(PositionComponent)
         if not player_pos: return
+        self.budget.start()
 
         # 모든 AI 엔티티와 전투 가능 엔티티 미리 수집
         all_ai_entities = self.world.get_entities_with_components({AIComponent, PositionComponent, StatsComponent})
         all_combat_entities = self.world.get_entities_with_components({PositionComponent, StatsComponent})
-        
-        for entity in all_ai_entities:
-            # 안전장치: 플레이어는 제외
-            if entity.entity_id == player_entity.entity_id: continue
 
-            # 스턴/수면/석화 상태 확인 (TimeSystem에서 시간 감액 처리함)
-            if entity.has_component(StunComponent) or entity.has_component(SleepComponent) or entity.has_component(PetrifiedComponent):
+        map_ent = self.world.get_entities_with_components({MapComponent})
+        mc = map_ent[0].get_component(MapComponent) if map_ent else None
+        # 장거리 경로 계획용 방/통로 그래프 (현재 맵과 같은 타일을 쓰는 경우에만)
+        d_map = getattr(self.world.engine, 'dungeon_map', None)
+        room_graph = d_map.room_graph if d_map is not None and mc is not None and d_map.map_data is mc.tiles else None
+
+        ai_positions = [(e.entity_id, (e.get_component(PositionComponent).x, e.get_component(PositionComponent).y)) for e in all_ai_entities]
+        # 이번 틱에 다른 AI가 서 있거나 이동하기로 한 타일 (거리장 추적 시 겹침 방지)
+        occupied = {p for _eid, p in ai_positions}
+        alive_ids = {eid for eid, _p in ai_positions}
+        self.path_cache.prune(alive_ids)
+        self._alerted &= alive_ids
+
+        # [Scheduler] 행동 시각이 된 몬스터만 꺼냄 (새로 생긴 몬스터는 즉시 예약, 사라진 몬스터는 제거)
+        current_time = self.world.clock.now()
+        self.scheduler.sync((eid for eid, _p in ai_positions if eid != player_entity.entity_id), current_time)
+        self._ai_version = self.world.index_version(AIComponent)
+        # [Turbo] 순간이동 등으로 플레이어가 예상보다 멀리 움직였으면 멀리서 쉬던 몬스터를 바로 다시 살펴봄
+        if self._player_jumped(player_entity, current_time):
+            for eid in self._idle_ids:
+                self.wake(eid)
+            self._idle_ids.clear()
+        self._last_player_seen = ((player_pos.x, player_pos.y), current_time)
+        step_interval = self._player_step_interval(player_entity)
+        due_order = self.scheduler.pop_due(current_time)
+        self._idle_ids.difference_update(due_order)
+        due_ids = set(due_order)
+        # 이번 틱 처리 후 다시 예약할 시각 (지정하지 않으면 쿨다운 기준으로 계산)
+        next_due = {}
+
+        # [Budget] 플레이어 바로 옆(8방향) 몬스터는 예산과 상관없이 먼저, 나머지는 예약 순서(이월된 몬스터가 앞)대로
+        entity_by_id = {e.entity_id: e for e in all_ai_entities}
+        position_of = dict(ai_positions)
+        urgent_ids = {eid for eid in due_order
+                      if abs(position_of[eid][0] - player_pos.x) <= 1 and abs(position_of[eid][1] - player_pos.y) <= 1}
+        due_entities = ([entity_by_id[eid] for eid in due_order if eid in urgent_ids]
+                        + [entity_by_id[eid] for eid in due_order if eid not in urgent_ids])
+        deferred = []
+        # [Turbo] 프레임이 없는 고속 진행에서는 예산을 쓰지 않음 (벽시계 예산은 결과를 기계 속도에 의존하게 만듦)
+        budgeted = not getattr(self.world.engine, 'turbo', False)
+        if budgeted and self.budget.max_entities is not None and len(due_entities) > max(self.budget.max_entities, len(urgent_ids)):
+            limit = max(self.budget.max_entities, len(urgent_ids))
+            deferred = due_entities[limit:]
+            due_entities = due_entities[:limit]
+
+        if mc and self.use_flow_field:
+            self.chase_field.update(mc, (player_pos.x, player_pos.y))
+
+        batch_ids = set()
+        if self.use_batch_ai and len(due_entities) >= BATCH_AI_MIN_ENTITIES:
+            batch_ids = self._process_batch(due_entities, player_entity, player_pos, mc, room_graph,
+                                            current_time, occupied, next_due, step_interval)
+            self.budget.spend(len(batch_ids))
+
+        # [LOS] 추적 범위 안의 행동할 AI(일괄 처리분 제외)에 대해 플레이어 시야를 틱당 한 번만 계산
+        player_visible = set()
+        if mc:
+            due_positions = [(eid, p) for eid, p in ai_positions if eid in due_ids and eid not in batch_ids]
+            player_visible = self.los.visible_from(mc, (player_pos.x, player_pos.y), due_positions, self.max_chase_range)
+
+        for entity in due_entities:
+            if entity.entity_id in batch_ids: continue
+            if budgeted and entity.entity_id not in urgent_ids and self.budget.exhausted():
+                deferred.append(entity)
+                continue
+            self.budget.spend()
+            # 스턴/수면/석화 상태면 풀리는 시각으로 미룸 (TimeSystem에서 시간 감액 처리함)
+            disabled_until = self._disabled_until(entity, current_time)
+            if disabled_until:
+                next_due[entity.entity_id] = disabled_until
                 continue
             
             ai = entity.get_component(AIComponent)
@@ -460,8 +639,7 @@ class MonsterAISystem(System):
             stats = entity.get_component(StatsComponent)
             if not ai or not pos or not stats: continue
 
-            # 실시간 행동 지연(Cooldown) 확인
-            current_time = time.time()
+            # 실시간 행동 지연(Cooldown) 확인 (다른 시스템이 last_action_time을 갱신했을 수 있음)
             # 몬스터는 플레이어보다 약간 느리게 설정 (기본 0.6초 지연)
             monster_delay = getattr(stats, 'action_delay', 0.6)
             if current_time - stats.last_action_time < monster_delay:
@@ -515,9 +693,11 @@ class MonsterAISystem(System):
             dist = abs(target_pos.x - pos.x) + abs(target_pos.y - pos.y)
 
             # [Update] Check Rage Aura (Continuous Provocation) - Only for Monsters VS Player
+            rage_radius = 0
             if ai.faction == "MONSTER" and target == player_entity:
                 player_auras = player_entity.get_components(SkillEffectComponent)
                 rage_aura = next((a for a in player_auras if a.name == "RAGE_AURA"), None)
+                rage_radius = rage_aura.radius if rage_aura else 0
                 
                 if rage_aura and dist <= rage_aura.radius:
                     if ai.behavior != AIComponent.CHASE:
@@ -527,11 +707,11 @@ class MonsterAISystem(System):
             # 5. 행동 결정 (플래그 기반 확장)
             if "TELEPORT" in stats.flags and random.random() < 0.2:
                 # 30% 확률로 타겟 근처로 순간이동
-                map_ent = self.world.get_entities_with_components({MapComponent})
-                if map_ent:
-                    mc = map_ent[0].get_component(MapComponent)
+                if mc:
                     tx, ty = target_pos.x + random.randint(-1, 1), target_pos.y + random.randint(-1, 1)
-                    if 0 <= tx < mc.width and 0 <= ty < mc.height and mc.tiles[ty][tx] == '.':
+                    # 벽 모서리 너머(다른 복도)로 넘어가지 않도록 타겟에서 실제로 몇 걸음 안에 닿는 칸만 허용
+                    if (0 <= tx < mc.width and 0 <= ty < mc.height and mc.tiles[ty][tx] == '.'
+                            and self.path_cache.reachable(mc, (target_pos.x, target_pos.y), (tx, ty), 3)):
                         pos.x, pos.y = tx, ty
                         self.event_manager.push(MessageEvent(_("{}가 갑자기 이동했습니다!").format(self.world.engine._get_entity_name(entity))))
                         stats.last_action_time = current_time
@@ -548,16 +728,23 @@ class MonsterAISystem(System):
             # [Fix] Detection Range - Monsters should only engage when player is nearby
             # This prevents invisible monsters from attacking from across the map
             detection_range = getattr(ai, 'detection_range', 10)  # Default 10 tiles
-            max_chase_range = 15  # Maximum distance to chase (even in CHASE mode)
+            max_chase_range = self.max_chase_range
             
+            # 쉬는 동안 건너뛸 수 있는 건 플레이어를 노리는 몬스터뿐 (순간이동 몬스터는 거리와 상관없이 매번 굴림)
+            chases_player = target == player_entity and "TELEPORT" not in stats.flags
+            reach = max(max_chase_range, detection_range, rage_radius) if chases_player else dist
+
             # If monster is too far away (beyond max chase range), reset to STATIONARY
             if dist > max_chase_range:
                 if ai.behavior == AIComponent.CHASE:
                     ai.behavior = AIComponent.STATIONARY  # Stop chasing if too far
+                self._alerted.discard(entity.entity_id) # 다시 발견하면 다시 경보
+                next_due[entity.entity_id] = self._idle_until(entity.entity_id, dist, reach, current_time, step_interval)
                 continue  # Skip this monster entirely
             
             # If monster is not in CHASE mode and target is out of detection range, skip
             if ai.behavior != AIComponent.CHASE and dist > detection_range:
+                next_due[entity.entity_id] = self._idle_until(entity.entity_id, dist, reach, current_time, step_interval)
                 continue
 
             # [Hack & Slash] Swarm AI: Auto-chase within detection range
@@ -565,19 +752,10 @@ class MonsterAISystem(System):
                 ai.behavior = AIComponent.CHASE
             
             # [Hack & Slash] Alert neighbors if chasing
-            if ai.behavior == AIComponent.CHASE and ai.faction == "MONSTER":
-                # 30% chance per frame to alert nearby monsters
-                if random.random() < 0.3:
-                    nearby_monsters = [
-                        m for m in all_ai_entities 
-                        if m.entity_id != entity.entity_id 
-                        and m.get_component(AIComponent).faction == "MONSTER"
-                        and abs(m.get_component(PositionComponent).x - pos.x) + abs(m.get_component(PositionComponent).y - pos.y) <= 7
-                    ]
-                    for nm in nearby_monsters:
-                        nm_ai = nm.get_component(AIComponent)
-                        if nm_ai and nm_ai.behavior != AIComponent.CHASE:
-                            nm_ai.behavior = AIComponent.CHASE
+            # 추적을 시작한 몬스터는 한 번만 경보를 보냄 (틱 끝에서 공간 버킷으로 전파)
+            if ai.behavior == AIComponent.CHASE and ai.faction == "MONSTER" and entity.entity_id not in self._alerted:
+                self._alerted.add(entity.entity_id)
+                self._alert_queue.append(entity.entity_id)
 
             # 탐지 범위 밖이면 무시 (단, 추적 중에는 거리 무시하고 계속 추적)
             # 소환수는 플레이어를 따라다녀야 하므로 예외
@@ -587,11 +765,16 @@ class MonsterAISystem(System):
             # 만약 소환수가 타겟이 없거나 너무 멀면 플레이어 옆으로 CHASE
             if ai.faction == "PLAYER" and target == player_entity and dist > 2:
                  ai.behavior = AIComponent.CHASE
+
+            # [Retreat] 체력이 낮은 소환수는 싸우지 않고 거리장을 따라 플레이어 곁으로 후퇴
+            retreating = (ai.faction == "PLAYER" and self.use_flow_field and mc is not None
+                          and stats.current_hp < stats.max_hp * SUMMON_RETREAT_HP_RATIO
+                          and self.chase_field.distance_at(pos.x, pos.y) > 1)
             
             dx, dy = 0, 0
             
             # 공격 시야 확보 (가디언 등을 위해 distance 1 이상에서도 공격 트리거 가능하게 설계)
-            if dist == 1 and ai.behavior == AIComponent.CHASE:
+            if dist == 1 and ai.behavior == AIComponent.CHASE and not retreating:
                 # 인접한 경우 공격 시도 (이동 대신)
                 combat_sys = self.world.get_system(CombatSystem)
                 if combat_sys:
@@ -600,8 +783,13 @@ class MonsterAISystem(System):
                     continue
             
             # [NEW] 원거리 공격 (가디언 또는 RANGED 플래그가 있고 사거리 내인 경우)
-            if dist > 1 and dist <= ai.detection_range and ("RANGED" in stats.flags or "가디언" in getattr(entity.get_component(MonsterComponent), 'type_name', "")):
-                combat_sys = self.world.get_system(CombatSystem)
+            if not retreating and dist > 1 and dist <= ai.detection_range and ("RANGED" in stats.flags or "가디언" in getattr(entity.get_component(MonsterComponent), 'type_name', "")):
+                # 벽 너머로는 쏘지 않음 (시야가 없으면 아래 CHASE로 넘어가 접근)
+                if target is player_entity:
+                    has_los = mc is None or entity.entity_id in player_visible
+                else:
+                    has_los = mc is None or self.los.can_see(mc, pos.x, pos.y, target_pos.x, target_pos.y)
+                combat_sys = self.world.get_system(CombatSystem) if has_los else None
                 if combat_sys:
                     # [Guardian Tier 4+] Check for CopiedSkillComponent
                     from .components import CopiedSkillComponent
@@ -624,45 +812,29 @@ class MonsterAISystem(System):
                     stats.last_action_time = current_time
                     continue
 
-            if ai.behavior == AIComponent.CHASE:
-                # [Fix] Smart Pathfinding (Axis Sliding)
-                # Instead of blindly choosing the primary axis, check if it's blocked.
-                # If blocked, try the secondary axis.
-                
-                diff_x = target_pos.x - pos.x
-                diff_y = target_pos.y - pos.y
-                
-                # Retrieve map for collision check
-                map_ent = self.world.get_entities_with_components({MapComponent})
-                mc = map_ent[0].get_component(MapComponent) if map_ent else None
-                
-                def is_walkable(tx, ty):
-                    if not mc: return True # Assume walkable if no map (fallback)
-                    if tx < 0 or tx >= mc.width or ty < 0 or ty >= mc.height: return False
-                    return mc.tiles[ty][tx] != '#'
-
-                # Determine Primary and Secondary moves
-                move_x = 1 if diff_x > 0 else -1
-                move_y = 1 if diff_y > 0 else -1
-                
-                moved = False
-                
-                # Prioritize larger distance axis
-                if abs(diff_x) >= abs(diff_y):
-                    # Try X first
-                    if diff_x != 0 and is_walkable(pos.x + move_x, pos.y):
-                        dx = move_x
-                    elif diff_y != 0 and is_walkable(pos.x, pos.y + move_y): # Slide Y
-                        dy = move_y
+            step = None
+            if retreating:
+                step = self.chase_field.downhill_step(pos.x, pos.y, occupied)
+            elif self.use_flow_field and mc and target is player_entity:
+                if ai.behavior == AIComponent.CHASE:
+                    # [Flow Field] 공유 거리장에서 내리막 방향으로 한 걸음 (O(1) 조회)
+                    step = self.chase_field.downhill_step(pos.x, pos.y, occupied)
+                elif ai.behavior == AIComponent.FLEE:
+                    # [Flee Map] 같은 재계산에서 만든 도주 지도를 따라 후퇴 (벽에 붙지 않고 열린 쪽으로 빠짐)
+                    step = self.chase_field.flee_step(pos.x, pos.y, occupied)
+
+            if step:
+                dx, dy = step
+            elif ai.behavior == AIComponent.CHASE and not retreating:
+                # [A*] 거리장 밖이거나 플레이어가 아닌 타겟(소환수의 공격 대상 등)은 엔티티별 캐시 경로를 따라감
+                step = self.path_cache.next_step(entity.entity_id, mc, (pos.x, pos.y), (target_pos.x, target_pos.y), occupied, room_graph) if mc else None
+                if step:
+                    dx, dy = step
                 else:
-                    # Try Y first
-                    if diff_y != 0 and is_walkable(pos.x, pos.y + move_y):
-                        dy = move_y
-                    elif diff_x != 0 and is_walkable(pos.x + move_x, pos.y): # Slide X
-                        dx = move_x
+                    dx, dy = self._greedy_step(mc, pos.x, pos.y, target_pos.x, target_pos.y)
                 
             elif ai.behavior == AIComponent.FLEE:
-                # 타겟 반대 방향으로 이동 결정
+                # 타겟 반대 방향으로 이동 결정 (도주 지도 밖일 때)
                 if target_pos.x > pos.x: dx = -1
                 elif target_pos.x < pos.x: dx = 1
                 elif target_pos.y > pos.y: dy = -1
@@ -672,6 +844,8 @@ class MonsterAISystem(System):
                 if entity.has_component(DesiredPositionComponent):
                     entity.remove_component(DesiredPositionComponent)
                 entity.add_component(DesiredPositionComponent(dx=dx, dy=dy))
+                occupied.discard((pos.x, pos.y))
+                occupied.add((pos.x + dx, pos.y + dy))
                 # 행동 수행 시간 기록
                 stats.last_action_time = current_time
 
@@ -739,39 +913,197 @@ class MonsterAISystem(System):
                              if combat_sys:
                                  combat_sys._handle_death(entity, target)
 
+        if self._alert_queue:
+            self._propagate_alerts(all_ai_entities, current_time, next_due, player_pos)
+
+        # [Budget] 처리하지 못한 몬스터는 지금 시각으로 먼저 다시 예약 → 다음 프레임 맨 앞에서 꺼내짐 (라운드 로빈)
+        deferred_ids = set()
+        for entity in deferred:
+            if self.world.get_entity(entity.entity_id) is not None:
+                self.scheduler.schedule(entity.entity_id, current_time)
+                deferred_ids.add(entity.entity_id)
+        self.budget.defer(len(deferred_ids))
+
+        # [Scheduler] 처리한 몬스터 재예약: 행동했으면 쿨다운이 끝나는 시각, 행동하지 못했으면 다음 틱
+        for entity in due_entities:
+            eid = entity.entity_id
+            if eid in deferred_ids or self.world.get_entity(eid) is None:
+                continue
+            due = next_due.get(eid)
+            if due is None:
+                stats = entity.get_component(StatsComponent)
+                due = max(current_time, stats.last_action_time + getattr(stats, 'action_delay', 0.6)) if stats else current_time
+            self.scheduler.schedule(eid, due)
+
+        self.budget.finish()
+        self.last_budget_report = self.budget.report()
+        if deferred_ids:
+            logging.debug("MonsterAISystem budget: %.1fms, %d processed, %d deferred",
+                          self.last_budget_report["elapsed_ms"], self.budget.processed, len(deferred_ids))
+
+    def _process_batch(self, due_entities, player_entity, player_pos, mc, room_graph,
+                       current_time: float, occupied: set, next_due: dict, step_interval: float = 0.2) -> Set[int]:
+        """
+        [Batch] 특수 플래그 없는 MONSTER 진영 근접 몬스터(STATIONARY/CHASE)를 NumPy로 한꺼번에 판단하고
+        결과(추적 상태, 공격, DesiredPositionComponent)를 엔티티에 기록합니다. 처리한 엔티티 ID 집합을 반환합니다.
+        분노 오라, 상태이상, 쿨다운 중인 몬스터 등 나머지는 모두 스칼라 경로에 남깁니다.
+        """
+        # 분노 오라는 메시지와 함께 강제 추적시키므로 스칼라 경로에서만 처리
+        if any(a.name == "RAGE_AURA" for a in player_entity.get_components(SkillEffectComponent)):
+            return set()
+
+        batch = []
+        for entity in due_entities:
+            ai = entity.get_component(AIComponent)
+            stats = entity.get_component(StatsComponent)
+            if ai.faction != "MONSTER" or ai.behavior == AIComponent.FLEE:
+                continue
+            if not BATCH_SPECIAL_FLAGS.isdisjoint(stats.flags) or "가디언" in getattr(entity.get_component(MonsterComponent), 'type_name', ""):
+                continue
+            if current_time - stats.last_action_time < getattr(stats, 'action_delay', 0.6):
+                continue
+            if self._disabled_until(entity, current_time):
+                continue
+            batch.append((entity, ai, entity.get_component(PositionComponent), stats))
+        if not batch:
+            return set()
+
+        field = self.chase_field if self.use_flow_field and mc else None
+        plan = self.batch_planner.plan([p.x for _e, _a, p, _s in batch], [p.y for _e, _a, p, _s in batch],
+                                       [a.behavior for _e, a, _p, _s in batch], [a.detection_range for _e, a, _p, _s in batch],
+                                       (player_pos.x, player_pos.y), self.max_chase_range, field)
+        if plan is None:
+            return set()
+
+        combat_sys = self.world.get_system(CombatSystem)
+        idle, drop_chase, chase, attack = plan.idle.tolist(), plan.drop_chase.tolist(), plan.chase.tolist(), plan.attack.tolist()
+        step_ok, step_dx, step_dy = plan.step_ok.tolist(), plan.dx.tolist(), plan.dy.tolist()
+        for i, (entity, ai, pos, stats) in enumerate(batch):
+            eid = entity.entity_id
+            if idle[i]:
+                if drop_chase[i]:
+                    ai.behavior = AIComponent.STATIONARY
+                    self._alerted.discard(eid)
+                dist = abs(pos.x - player_pos.x) + abs(pos.y - player_pos.y)
+                next_due[eid] = self._idle_until(eid, dist, max(self.max_chase_range, ai.detection_range), current_time, step_interval)
+                continue
+            ai.behavior = AIComponent.CHASE
+            if eid not in self._alerted:
+                self._alerted.add(eid)
+                self._alert_queue.append(eid)
+
+            if attack[i]:
+                if combat_sys:
+                    combat_sys._apply_damage(entity, player_entity, 1)
+                    stats.last_action_time = current_time
+                continue
+
+            # 배열에서 고른 칸이 이번 틱에 먼저 움직인 몬스터와 겹치면 스칼라 경로와 같은 순서로 다시 고름
+            step = None
+            if step_ok[i] and (pos.x + step_dx[i], pos.y + step_dy[i]) not in occupied:
+                step = (step_dx[i], step_dy[i])
+            elif field is not None:
+                step = self.chase_field.downhill_step(pos.x, pos.y, occupied)
+            if not step and mc:
+                step = self.path_cache.next_step(eid, mc, (pos.x, pos.y), (player_pos.x, player_pos.y), occupied, room_graph)
+            dx, dy = step if step else self._greedy_step(mc, pos.x, pos.y, player_pos.x, player_pos.y)
+            if dx != 0 or dy != 0:
+                if entity.has_component(DesiredPositionComponent):
+                    entity.remove_component(DesiredPositionComponent)
+                entity.add_component(DesiredPositionComponent(dx=dx, dy=dy))
+                occupied.discard((pos.x, pos.y))
+                occupied.add((pos.x + dx, pos.y + dy))
+                stats.last_action_time = current_time
+        return {entity.entity_id for entity, _a, _p, _s in batch}
+
+    def _propagate_alerts(self, all_ai_entities, current_time: float, next_due: dict, player_pos=None):
+        """
+        [Alert] 대기열의 몬스터 주변(맨해튼 ALERT_RADIUS 이내) MONSTER 진영을 추적 상태로 바꿉니다.
+        몬스터를 ALERT_RADIUS 크기의 격자 버킷에 한 번 나눠 담고 발신자 주변 3x3 버킷만 확인하며,
+        새로 깨어난 몬스터도 대기열에 넣어 둥지 전체로 연쇄 전파합니다.
+        틱당 발신자는 ALERT_SOURCES_PER_TICK마리까지만 처리하고 나머지는 다음 틱으로 넘깁니다.
+        [Turbo] 플레이어가 추적 범위 밖인 몬스터는 깨워도 곧바로 추적을 그만두므로 예약을 앞당기지 않습니다 (경보 전달은 그대로).
+        """
+        radius = ALERT_RADIUS
+        lazy_far = player_pos is not None and getattr(self.world.engine, 'turbo', False)
+        buckets = {}
+        for e in all_ai_entities:
+            e_ai = e.get_component(AIComponent)
+            if e_ai.faction != "MONSTER":
+                continue
+            e_pos = e.get_component(PositionComponent)
+            buckets.setdefault((e_pos.x // radius, e_pos.y // radius), []).append((e.entity_id, e_ai, e_pos))
+
+        queue = self._alert_queue
+        for _i in range(min(len(queue), ALERT_SOURCES_PER_TICK)):
+            source = self.world.get_entity(queue.popleft())
+            pos = source.get_component(PositionComponent) if source else None
+            if not pos:
+                continue
+            bx, by = pos.x // radius, pos.y // radius
+            for key in ((bx + i, by + j) for j in (-1, 0, 1) for i in (-1, 0, 1)):
+                for eid, e_ai, e_pos in buckets.get(key, ()):
+                    if e_ai.behavior == AIComponent.CHASE or abs(e_pos.x - pos.x) + abs(e_pos.y - pos.y) > radius:
+                        continue
+                    e_ai.behavior = AIComponent.CHASE
+                    self._alerted.add(eid)
+                    queue.append(eid)
+                    if lazy_far and abs(e_pos.x - player_pos.x) + abs(e_pos.y - player_pos.y) > self.max_chase_range:
+                        continue
+                    # 한가하게 재확인을 기다리던 몬스터는 다음 틱에 바로 움직이도록
+                    next_due.pop(eid, None)
+                    self.wake(eid)
+
+    def _greedy_step(self, mc, x: int, y: int, tx: int, ty: int) -> Tuple[int, int]:
+        """[Fix] Smart Pathfinding (Axis Sliding)
+        Instead of blindly choosing the primary axis, check if it's blocked.
+        If blocked, try the secondary axis.
+        """
+        diff_x = tx - x
+        diff_y = ty - y
+        
+        def is_walkable(wx, wy):
+            if not mc: return True # Assume walkable if no map (fallback)
+            if wx < 0 or wx >= mc.width or wy < 0 or wy >= mc.height: return False
+            return mc.tiles[wy][wx] != '#'
+
+        # Determine Primary and Secondary moves
+        move_x = 1 if diff_x > 0 else -1
+        move_y = 1 if diff_y > 0 else -1
+        
+        # Prioritize larger distance axis
+        if abs(diff_x) >= abs(diff_y):
+            # Try X first
+            if diff_x != 0 and is_walkable(x + move_x, y):
+                return move_x, 0
+            elif diff_y != 0 and is_walkable(x, y + move_y): # Slide Y
+                return 0, move_y
+        else:
+            # Try Y first
+            if diff_y != 0 and is_walkable(x, y + move_y):
+                return 0, move_y
+            elif diff_x != 0 and is_walkable(x + move_x, y): # Slide X
+                return move_x, 0
+        return 0, 0
+
 
 class CombatSystem(System):
     """엔티티 간 충돌 시 전투(데미지 계산)를 처리합니다."""
-    def __init__(self, world):
-        super().__init__(world)
-        self.cooldowns = {} # Dict[entity_id, Dict[skill_name, expiry_time]]
-
     def get_cooldown(self, entity_id, skill_name):
         """남은 쿨타임(초)을 반환합니다."""
-        import time
-        if entity_id not in self.cooldowns: return 0
-        if skill_name not in self.cooldowns[entity_id]: return 0
-        
-        expiry = self.cooldowns[entity_id][skill_name]
-        remaining = expiry - time.time()
-        
-        if remaining <= 0:
-            del self.cooldowns[entity_id][skill_name]
-            return 0
-        return remaining
+        return self.world.cooldowns.remaining(entity_id, skill_name, self.world.clock.now())
+
+    def get_cooldowns(self, entity_id):
+        """진행 중인 쿨타임 전체 (이름 -> 남은 초). UI는 프레임마다 이것을 한 번만 조회합니다."""
+        return self.world.cooldowns.active(entity_id, self.world.clock.now())
 
     def set_cooldown(self, entity_id, skill_name, duration):
         """쿨타임을 설정합니다."""
-        import time
-        if duration <= 0: return
-        
-        if entity_id not in self.cooldowns:
-            self.cooldowns[entity_id] = {}
-        
-        self.cooldowns[entity_id][skill_name] = time.time() + duration
+        self.world.cooldowns.set(entity_id, skill_name, duration, self.world.clock.now())
 
     def process(self):
         """매 턴 지속형 스킬 효과(오라) 처리"""
+        self.world.cooldowns.purge(self.world.clock.now()) # 끝난 쿨타임 정리
         aura_entities = self.world.get_entities_with_components({SkillEffectComponent, PositionComponent})
         for entity in aura_entities:
             self._handle_skill_aura(entity)
@@ -868,8 +1200,7 @@ class CombatSystem(System):
 
             # 즉시 렌더링 호출 (애니메이션 느낌 유도)
             if hasattr(self.world, 'engine'):
-                self.world.engine._render()
-                time.sleep(0.08) # 80ms 대기 (User fedback: animation not visible)
+                self._animate(0.08) # 80ms 대기 (User fedback: animation not visible)
 
             if map_comp.tiles[target_y][target_x] == '#':
                 self.event_manager.push(MessageEvent(_("공격이 벽에 막혔습니다.")))
@@ -1063,15 +1394,14 @@ class CombatSystem(System):
         damage_multiplier = 1.0
         
         # [Modifier] Attacker Damage Bonus
-        if hasattr(attacker, 'components'):
+        if hasattr(attacker, 'get_component'):
              # [Petrified] 2스택 이상: 공격력 50% 감소 (Weaken)
              p_comp = attacker.get_component(PetrifiedComponent)
              if p_comp and p_comp.stacks >= 2:
                  damage_multiplier *= 0.5
 
-             for comp in attacker.components.values():
-                 if isinstance(comp, StatModifierComponent) and hasattr(comp, 'attack_multiplier'):
-                     damage_multiplier *= comp.attack_multiplier
+             # 버프/디버프 배율 (수정자가 바뀔 때만 다시 합산된 캐시)
+             damage_multiplier *= modifier_totals(attacker).attack_multiplier
         
         advantage_msg = ""
         
@@ -1118,10 +1448,8 @@ class CombatSystem(System):
         
         if not is_magic:
             defense_mult = 1.0
-            if hasattr(target, 'components'):
-                 for comp in target.components.values():
-                     if isinstance(comp, StatModifierComponent) and hasattr(comp, 'defense_multiplier'):
-                         defense_mult *= comp.defense_multiplier
+            if hasattr(target, 'get_component'):
+                 defense_mult = modifier_totals(target).defense_multiplier
             
             d_min = getattr(t_stats, 'defense_min', t_stats.defense)
             d_max = getattr(t_stats, 'defense_max', t_stats.defense)
@@ -1218,15 +1546,14 @@ class CombatSystem(System):
             
             # [HP Bar Display] Track combat for monsters
             if target.has_component(MonsterComponent) and final_damage > 0:
-                import time
                 from .components import CombatTrackerComponent
                 
                 # Add or update combat tracker
                 tracker = target.get_component(CombatTrackerComponent)
                 if tracker:
-                    tracker.last_damaged_time = time.time()
+                    tracker.last_damaged_time = self.world.clock.now()
                 else:
-                    target.add_component(CombatTrackerComponent(last_damaged_time=time.time()))
+                    target.add_component(CombatTrackerComponent(last_damaged_time=self.world.clock.now()))
             
             # [Boss Overhaul] 지원군 소환 트리거 (체력 50% 이하)
             if target.has_component(MonsterComponent):
@@ -1369,6 +1696,10 @@ class CombatSystem(System):
         if target.has_component(SleepComponent):
             target.remove_component(SleepComponent)
             self.event_manager.push(MessageEvent(_("{}이(가) 공격을 받아 잠에서 깨어났습니다!").format(target_name)))
+            # 수면 종료 시각으로 미뤄 둔 행동 예약을 앞당김
+            ai_sys = self.world.get_system(MonsterAISystem)
+            if ai_sys:
+                ai_sys.wake(target.entity_id)
 
         # 4. 사망 처리
         if t_stats.current_hp <= 0:
@@ -1433,13 +1764,9 @@ class CombatSystem(System):
                 target.remove_component(StatsComponent) 
                 
                 # [Fix] Remove all existing status effect components
-                status_components = [
-                    StunComponent, PoisonComponent, SleepComponent, BleedingComponent,
-                    PetrifiedComponent, ManaShieldComponent, StatModifierComponent,
-                    SkillEffectComponent, CombatTrackerComponent, HitFlashComponent
-                ]
-                for comp_type in status_components:
-                    target.remove_component(comp_type)
+                clear_statuses(target)
+                target.remove_component(CombatTrackerComponent)
+                target.remove_component(HitFlashComponent)
 
                 # [Boss] Handle Boss Death Patterns
                 boss_comp = target.get_component(BossComponent)
@@ -1486,6 +1813,7 @@ class CombatSystem(System):
                                 if 0 <= ex < map_comp.width and 0 <= ey < map_comp.height:
                                     from .constants import EXIT_NORMAL
                                     map_comp.tiles[ey][ex] = EXIT_NORMAL
+                                    map_comp.version += 1
                                     
                                     region = boss_gate.next_region_name
                                     if region == "승리":
@@ -1722,8 +2050,9 @@ class CombatSystem(System):
         # [Cooldown Check] Global check before any specific logic
         # Charge/Repair are special cases, but can still respect cooldown if needed.
         # Here we only check generic cooldown if set.
-        if self.get_cooldown(attacker.entity_id, event.skill_name) > 0:
-            remaining = int(self.get_cooldown(attacker.entity_id, event.skill_name)) + 1
+        cooldown = self.get_cooldown(attacker.entity_id, event.skill_name)
+        if cooldown > 0:
+            remaining = int(cooldown) + 1
             self.event_manager.push(MessageEvent(_("기술이 준비되지 않았습니다! ({}초)").format(remaining), "white"))
             return
         
@@ -1735,6 +2064,7 @@ class CombatSystem(System):
              # Show UI
              if hasattr(self.world.engine, 'ui'):
                  selected_skill = self.world.engine.ui.show_skill_selection_menu(known_skills, self.world.engine._render)
+                 self.world.engine.renderer.invalidate() # 메뉴가 화면에 직접 그렸으므로 다음 프레임은 전체 다시 그리기
                  
                  if selected_skill:
                      # Add ChargeComponent
@@ -1787,6 +2117,7 @@ class CombatSystem(System):
             # Show UI
             if hasattr(self.world.engine, 'ui'):
                 selected_item = self.world.engine.ui.show_repair_menu(repairable_items, self.world.engine._render)
+                self.world.engine.renderer.invalidate() # 메뉴가 화면에 직접 그렸으므로 다음 프레임은 전체 다시 그리기
                 
                 if selected_item:
                     # Repair Attempt (60% Chance)
@@ -1926,18 +2257,16 @@ class CombatSystem(System):
         # [Buff] 능력치 버프 스킬 처리
         if any(v != 0 for v in [getattr(skill, 'str_bonus', 0), getattr(skill, 'mag_bonus', 0), 
                                 getattr(skill, 'dex_bonus', 0), getattr(skill, 'vit_bonus', 0)]) and getattr(skill, 'duration', 0) > 0:
-            modifiers = attacker.get_components(StatModifierComponent)
             buff_source = f"SKILL_{skill.name}"
-            existing = next((m for m in modifiers if m.source == buff_source), None)
+            existing = modifier_totals(attacker).sources.get(buff_source)
             if existing:
-                existing.expires_at = time.time() + skill.duration
+                existing.duration = skill.duration
             else:
                 new_mod = StatModifierComponent(
                     str_mod=skill.str_bonus, mag_mod=skill.mag_bonus, 
                     dex_mod=skill.dex_bonus, vit_bonus=skill.vit_bonus, 
                     duration=skill.duration, source=buff_source
                 )
-                new_mod.expires_at = time.time() + skill.duration
                 attacker.add_component(new_mod)
             
             if hasattr(self.world.engine, '_recalculate_stats'):
@@ -2018,8 +2347,8 @@ class CombatSystem(System):
                 flags=effective_skill.flags
             ))
         elif effective_skill.id == "MANA_SHIELD" or effective_skill.name == "마나 실드":
-            # 마나 실드 컴포넌트 추가/갱신
-            attacker.add_component(ManaShieldComponent(duration=effective_skill.duration))
+            # 마나 실드 컴포넌트 추가 (이미 있으면 효과 표의 IGNORE 규칙대로 기존 장막 유지)
+            apply_status(attacker, ManaShieldComponent(duration=effective_skill.duration))
             self.event_manager.push(MessageEvent(_("마법 장막이 생겨나 데미지를 마나로 흡수합니다! (지속 {}초)").format(int(effective_skill.duration)), "light_cyan"))
         else:
             self._handle_self_skill(attacker, effective_skill)
@@ -2087,9 +2416,7 @@ class CombatSystem(System):
 
                 # [Animation] Render frame immediately to show projectile moving
                 if hasattr(self.world, 'engine'):
-                    self.world.engine._render()
-                    import time
-                    time.sleep(0.03) # Adjust speed as needed
+                    self._animate(0.03) # Adjust speed as needed
 
                 # [NEW] Inferno: 투사체가 지나간 자리에 지속 화염 장판 생성
                 if skill.id == "INFERNO" or skill.name == "인페르노":
@@ -2104,8 +2431,7 @@ class CombatSystem(System):
 
             # 애니메이션 렌더링
             if hasattr(self.world, 'engine'):
-                self.world.engine._render()
-                time.sleep(0.04)
+                self._animate(0.04)
 
             # 적 충돌 체크 (모든 발사 위치에서 체크)
             hit_target = False
@@ -2231,8 +2557,7 @@ class CombatSystem(System):
             self.world.add_component(e_id, EffectComponent(duration=0.1))
             
         if hasattr(self.world.engine, '_render'):
-            self.world.engine._render()
-            time.sleep(0.04)
+            self._animate(0.04)
             
         # 데미지 적용 (전이될 때마다 20%씩 감소)
         factor = 0.8 ** depth
@@ -2268,8 +2593,7 @@ class CombatSystem(System):
         
         # 폭발 애니메이션 표시
         if hasattr(self.world, 'engine'):
-            self.world.engine._render()
-            time.sleep(0.15) # 폭발 연출을 위해 잠시 대기
+            self._animate(0.15) # 폭발 연출을 위해 잠시 대기
             
             # 폭발 이펙트 엔티티 정리
             effect_entities = self.world.get_entities_with_components({EffectComponent})
@@ -2576,8 +2900,7 @@ class CombatSystem(System):
                                     self._apply_skill_damage(attacker, target, skill, dx, dy)
                     
                     if hasattr(self.world.engine, '_render'):
-                        self.world.engine._render()
-                        time.sleep(0.05)
+                        self._animate(0.05)
 
             # 시각 효과 (초록색 반짝임)
             pos = attacker.get_component(PositionComponent)
@@ -2626,11 +2949,9 @@ class CombatSystem(System):
                 old_x = pos.x
                 for _i in range(3): # 3번 흔들림
                     pos.x = old_x + 1
-                    self.world.engine._render()
-                    time.sleep(0.03)
+                    self._animate(0.03)
                     pos.x = old_x - 1
-                    self.world.engine._render()
-                    time.sleep(0.03)
+                    self._animate(0.03)
                 pos.x = old_x # 원래 위치 복구
             
             # 2. 시각 효과 (머리 위 '?' 마크)
@@ -2900,6 +3221,8 @@ class RenderSystem(System):
     
     def handle_message_event(self, event: MessageEvent):
         """MessageEvent를 받아 메시지 로그에 추가"""
+        if getattr(self.world.engine, 'turbo', False):
+            return # [Turbo] 아무도 보지 않는 메시지 로그는 건너뜀
         message_comp_list = self.world.get_entities_with_components({MessageComponent})
         if message_comp_list:
             message_comp = message_comp_list[0].get_component(MessageComponent)
@@ -2907,6 +3230,8 @@ class RenderSystem(System):
 
     def handle_collision_event(self, event: CollisionEvent):
         """충돌 이벤트 발생 시 메시지 로그 업데이트"""
+        if event.collision_type == "WALL":
+            return # 벽 충돌은 메시지를 남기지 않음 (아래 [Fix]) - 메시지 로그 탐색도 생략
         message_comp_list = self.world.get_entities_with_components({MessageComponent})
         if message_comp_list:
             message_comp = message_comp_list[0].get_component(MessageComponent)
@@ -2939,6 +3264,8 @@ class RenderSystem(System):
                          # 렌더링 변경은 Engine._render에서 MimicComponent.is_disguised를 보고 처리할 예정
                          return
 
+                     if getattr(self.world.engine, 'turbo', False):
+                         return # [Turbo] 이하 메시지 로그 전용
                      monster_comp = target_entity.get_component(MonsterComponent)
                      if monster_comp:
                          if monster_comp.type_name == "상인":
@@ -2955,15 +3282,16 @@ class RegenerationSystem(System):
     """실시간 HP/MP/Stamina 회복 및 소모를 처리하는 시스템"""
     def __init__(self, world):
         super().__init__(world)
-        self.last_hp_regen_time = time.time()
-        self.last_mp_regen_time = time.time()
+        self.last_hp_regen_time = self.world.clock.now()
+        self.last_mp_regen_time = self.world.clock.now()
 
     def process(self):
-        current_time = time.time()
+        current_time = self.world.clock.now()
         
-        # 1. HP 자연 회복 (1초마다)
-        if current_time - self.last_hp_regen_time >= 1.0:
-            self.last_hp_regen_time = current_time
+        # 1. HP 자연 회복 (1초마다, 프레임이 길었거나 시계를 건너뛰었으면 밀린 만큼 한 번에)
+        hp_ticks = int(current_time - self.last_hp_regen_time)
+        if hp_ticks >= 1:
+            self.last_hp_regen_time += hp_ticks
             for entity in self.world.get_entities_with_components({StatsComponent}):
                 stats = entity.get_component(StatsComponent)
                 if stats.current_hp > 0 and stats.current_hp < stats.max_hp:
@@ -2972,174 +3300,80 @@ class RegenerationSystem(System):
                     if monster_comp and monster_comp.is_summoned:
                         continue
                         
-                    stats.current_hp = min(stats.max_hp, stats.current_hp + 1)
+                    stats.current_hp = min(stats.max_hp, stats.current_hp + hp_ticks)
                     # 플레이어인 경우 메시지 출력
                     if entity == self.world.get_player_entity():
-                         self.world.event_manager.push(MessageEvent(_("체력이 1 회복되었습니다.")))
+                         self.world.event_manager.push(MessageEvent(_("체력이 1 회복되었습니다.") if hp_ticks == 1 else _("체력이 {} 회복되었습니다.").format(hp_ticks)))
 
         # 2. MP 자연 회복 (2초마다)
-        if current_time - self.last_mp_regen_time >= 2.0:
-            self.last_mp_regen_time = current_time
+        mp_ticks = int((current_time - self.last_mp_regen_time) / 2.0)
+        if mp_ticks >= 1:
+            self.last_mp_regen_time += mp_ticks * 2.0
             for entity in self.world.get_entities_with_components({StatsComponent}):
                 stats = entity.get_component(StatsComponent)
                 if stats.current_mp < stats.max_mp:
-                    stats.current_mp = min(stats.max_mp, stats.current_mp + 1)
+                    stats.current_mp = min(stats.max_mp, stats.current_mp + mp_ticks)
                     # 플레이어인 경우 메시지 출력
                     if entity == self.world.get_player_entity():
-                         self.world.event_manager.push(MessageEvent(_("마력이 1 회복되었습니다.")))
+                         self.world.event_manager.push(MessageEvent(_("마력이 1 회복되었습니다.") if mp_ticks == 1 else _("마력이 {} 회복되었습니다.").format(mp_ticks)))
 
         # 3. 스테미너 자연 회복: 제거됨 (아이템으로만 회복)
 
 class TimeSystem(System):
-    """지속 시간(Duration)이 있는 컴포넌트들을 실시간으로 관리하는 시스템"""
+    """
+    지속 시간(Duration)이 있는 컴포넌트들을 실시간으로 관리하는 시스템.
+    TimedComponent는 붙을 때 World.timers에 만료 시각이 등록되므로, 매 프레임 모든 상태를 감액하지 않고
+    이번 프레임에 만료되거나 주기 틱(중독/출혈 피해, 오라 깜빡임)이 돌아온 타이머만 처리합니다.
+    만료 메시지와 지속 피해 규칙은 상태 효과 표(status_effects.STATUS_EFFECTS)를 따릅니다.
+    """
     def __init__(self, world):
         super().__init__(world)
-        self.last_tick = time.time()
-        self.regen_timer = 0.0 # 자동 회복 타이머
+        # 주기 틱이 필요한 컴포넌트: 타입 -> (첫 틱까지의 시간(None이면 틱 없음), 처리 함수)
+        # 처리 함수는 (엔티티, 컴포넌트, 예약 시각, 현재 시각)을 받아 예약 시각부터 다음 틱까지의 시간을 반환합니다.
+        self._tick_rules = {
+            SkillEffectComponent: (lambda skill: 0.0 if skill.name == "RAGE_AURA" else None, self._tick_rage_aura),
+        }
+        # 지속 피해(DoT)는 상태 효과 표에서
+        for effect in DOT_EFFECTS:
+            self._tick_rules[effect.component] = (lambda dot: dot.tick_interval, self._tick_dot)
+        self._expire_handlers = {
+            StatModifierComponent: self._expire_stat_modifier,
+            SummonComponent: self._expire_summon,
+            EffectComponent: self._expire_effect,
+            SkillEffectComponent: self._expire_skill_effect,
+        }
 
     def process(self):
-        current_time = time.time()
-        dt = current_time - self.last_tick
-        self.last_tick = current_time
-
-        # 0. 자동 회복 (RegenerationSystem으로 이동됨 - 중복 제거)
-        # self.regen_timer += dt ... 로직 삭제
-
-        # 1. 스턴(Stun) 시간 감액
-        stun_entities = self.world.get_entities_with_components({StunComponent})
-        for entity in list(stun_entities):
-            stun = entity.get_component(StunComponent)
-            stun.duration -= dt
-            if stun.duration <= 0:
-                entity.remove_component(StunComponent)
-                self.world.event_manager.push(MessageEvent(f"{self.world.engine._get_entity_name(entity)}의 기절이 해제되었습니다!"))
-
-        # 1-1. 수면(Sleep) 시간 감액
-        sleep_entities = self.world.get_entities_with_components({SleepComponent})
-        for entity in list(sleep_entities):
-            sleep = entity.get_component(SleepComponent)
-            sleep.duration -= dt
-            if sleep.duration <= 0:
-                entity.remove_component(SleepComponent)
-                self.world.event_manager.push(MessageEvent(f"{self.world.engine._get_entity_name(entity)}가 잠에서 깨어났습니다!"))
-
-        # 1-2. 석화(Petrified) 시간 감액
-        petrified_entities = self.world.get_entities_with_components({PetrifiedComponent})
-        for entity in list(petrified_entities):
-            petrified = entity.get_component(PetrifiedComponent)
-            petrified.duration -= dt
-            if petrified.duration <= 0:
-                entity.remove_component(PetrifiedComponent)
-                self.world.event_manager.push(MessageEvent(f"{self.world.engine._get_entity_name(entity)}의 석화가 해제되었습니다!"))
-
-        # 1-2. 중독(Poison) 시간 감액 및 데미지 처리
-        poison_entities = self.world.get_entities_with_components({PoisonComponent})
-        for entity in list(poison_entities):
-            poison = entity.get_component(PoisonComponent)
-            poison.duration -= dt
-            poison.tick_timer -= dt
-            
-            if poison.tick_timer <= 0:
-                poison.tick_timer = 1.0 # 1초 주기로 리셋
-                stats = entity.get_component(StatsComponent)
-                if stats:
-                    damage = poison.damage
-                    stats.current_hp -= damage
-                    # 피격 애니메이션(HitFlash) 추가
-                    if not entity.has_component(HitFlashComponent):
-                        entity.add_component(HitFlashComponent(duration=0.15))
-                    
-                    # 사망 체크 등은 CombatSystem._apply_damage와 유사하게 처리해야 하지만 
-                    # 여기서는 간단히 HP 차감만 하고 사망 시 처리는 다음 턴이나 헬퍼 함수로 처리 가능
-                    # 일단 직관적인 사망 처리 로직 추가
-                    if stats.current_hp <= 0:
-                        stats.current_hp = 0
-                        entity_name = self.world.engine._get_entity_name(entity)
-                        self.event_manager.push(MessageEvent(f"{entity_name}이(가) 독에 의해 쓰러졌습니다!"))
-                        
-                        # [Fix] DoT 사망 시에도 정식 사망 로직 트리거
-                        combat_sys = self.world.get_system(CombatSystem)
-                        if combat_sys:
-                            # attacker=None으로 전달하여 플레이어 존재 시 XP 부여되게 함
-                            combat_sys._handle_death(None, entity)
-                        else:
-                            # Fallback: 직접 삭제 (시스템 부재 시)
-                            self.world.delete_entity(entity.entity_id)
-                        # 안전을 위해 시체 변환 로직은 CombatSystem의 로직을 재사용하는 것이 좋음.
-            
-            if poison.duration <= 0:
-                entity.remove_component(PoisonComponent)
-                self.world.event_manager.push(MessageEvent(f"{self.world.engine._get_entity_name(entity)}의 중독 상태가 해제되었습니다."))
-
-        # 1-3. 출혈(Bleeding) 시간 감액 및 데미지 처리
-        bleeding_entities = self.world.get_entities_with_components({BleedingComponent})
-        for entity in list(bleeding_entities):
-            bleed = entity.get_component(BleedingComponent)
-            bleed.duration -= dt
-            
-            # 출혈은 매 1초마다 데미지를 입힘 (Tick Timer 단순화: 매 프레임 확률적 처리보다는 Time accumulation 방식 권장)
-            # 여기서는 편의상 Poison과 달리 1초마다 정기적으로 처리하기 위해 tick_timer를 추가하거나
-            # 단순히 duration이 감소할 때마다 데미지를 입히는 방식을 사용할 수 있음.
-            # Poison 코드를 참조하여 tick_timer를 동적으로 관리하는 것이 좋음. BleedingComponent에 tick_timer가 없으므로 추가 필요할 수 있음.
-            # 하지만 Component 구조 변경 없이 하려면, duration의 정수부가 바뀔 때마다 데미지를 입히는 trick 사용.
-            
-            # [Fix] BleedingComponent should track tick. For now, assume simplified 1 dmg per sec roughly?
-            # Or assume dt ~ 0.016. Let's rely on adding tick_timer attribute strictly, 
-            # BUT since modifying Component __init__ affects existing pickles/instantiations potentially (though unlikely here),
-            # I will dynamically add attribute if missing or use random chance scaled by dt.
-            
-            # Deterministic approach: store last_tick_time in component or engine? No.
-            # Probabilistic approach: Expectation 1 dmg/sec -> prob = dt.
-            if random.random() < dt: # 1 damage per second on average check
-                stats = entity.get_component(StatsComponent)
-                if stats:
-                    stats.current_hp -= bleed.damage
-                    if not entity.has_component(HitFlashComponent):
-                        entity.add_component(HitFlashComponent(duration=0.1))
-                    if stats.current_hp <= 0:
-                        stats.current_hp = 0
-                        self.event_manager.push(MessageEvent(f"{self.world.engine._get_entity_name(entity)}이(가) 과다출혈로 사망했습니다!", "red"))
-                        
-                        # [Fix] Bleeding 사망 시에도 정식 사망 로직 트리거
-                        combat_sys = self.world.get_system(CombatSystem)
-                        if combat_sys:
-                            combat_sys._handle_death(None, entity)
-                        else:
-                            self.world.delete_entity(entity.entity_id)
-            
-            if bleed.duration <= 0:
-                entity.remove_component(BleedingComponent)
-                self.event_manager.push(MessageEvent(f"{self.world.engine._get_entity_name(entity)}의 출혈이 멈췄습니다."))
-
-        # 1-3. StatModifier (Buff/Debuff) 시간 감액
-        stat_mod_entities = self.world.get_entities_with_components({StatModifierComponent})
-        for entity in list(stat_mod_entities):
-            mod = entity.get_component(StatModifierComponent)
-            mod.duration -= dt
-            if mod.duration <= 0:
-                entity.remove_component(StatModifierComponent)
-                name = self.world.engine._get_entity_name(entity)
-                self.event_manager.push(MessageEvent(f"{name}의 '{mod.source}' 효과가 끝났습니다.", "blue"))
-                if hasattr(self.world.engine, '_recalculate_stats'):
-                    self.world.engine._recalculate_stats()
-
-        # 1-4. ManaShield 시간 감액
-        ms_entities = self.world.get_entities_with_components({ManaShieldComponent})
-        for entity in list(ms_entities):
-            ms = entity.get_component(ManaShieldComponent)
-            ms.duration -= dt
-            if ms.duration <= 0:
-                entity.remove_component(ManaShieldComponent)
-                self.event_manager.push(MessageEvent(f"{self.world.engine._get_entity_name(entity)}의 마법 장막이 사라졌습니다.", "cyan"))
-
-        # 1-5. 소환수(Summon) 시간 감액 및 소멸 처리
-        summon_entities = self.world.get_entities_with_components({SummonComponent})
-        for entity in list(summon_entities):
-            summon = entity.get_component(SummonComponent)
-            summon.duration -= dt
-            if summon.duration <= 0:
-                self.event_manager.push(MessageEvent(_("{}의 소환 시간이 만료되어 사라집니다.").format(self.world.engine._get_entity_name(entity)), "gray"))
-                self.world.delete_entity(entity.entity_id)
+        current_time = self.world.clock.now()
+        timers = self.world.timers
+
+        # 0. 새로 붙은 컴포넌트에 주기 틱 예약
+        if timers.added:
+            added, timers.added = timers.added, []
+            for entity, comp in added:
+                rule = self._tick_rules.get(type(comp))
+                if rule:
+                    delay = rule[0](comp)
+                    if delay is not None:
+                        comp._next_tick = current_time + delay
+                        timers.push(comp._next_tick, timers.TICK, entity, comp)
+
+        # 1. 시각이 된 타이머만 처리 (다시 예약되었거나 이미 떨어진 컴포넌트의 항목은 버림)
+        needs_recalc = False
+        for due, kind, entity, comp in timers.pop_due(current_time):
+            if not self._is_attached(entity, comp):
+                continue
+            if kind == timers.TICK:
+                if due != getattr(comp, '_next_tick', None) or due > comp.expires_at:
+                    continue
+                delay = self._tick_rules[type(comp)][1](entity, comp, due, current_time)
+                if delay is not None and self._is_attached(entity, comp): # 틱 처리 중 사망 등으로 떨어질 수 있음
+                    comp._next_tick = due + delay
+                    timers.push(comp._next_tick, timers.TICK, entity, comp)
+            else:
+                if due != comp.expires_at:
+                    continue
+                needs_recalc |= self._expire(entity, comp)
 
         # 2. 횃불(VISION_UP) 시간 감액
         player_entity = self.world.get_player_entity()
@@ -3156,68 +3390,86 @@ class TimeSystem(System):
                     stats.sees_hidden = False
                     self.world.event_manager.push(MessageEvent(_("영험한 기운이 사라져 숨겨진 것들이 보이지 않게 되었습니다.")))
 
-        # 2. 시각 효과(Effect) 시간 감액
-        effect_entities = self.world.get_entities_with_components({EffectComponent})
-        for entity in list(effect_entities):
-            effect = entity.get_component(EffectComponent)
-            effect.duration -= dt
-            if effect.duration <= 0:
-                self.world.delete_entity(entity.entity_id)
-
-        # 3. 지속 스킬(SkillEffect) 시간 감액
-        skill_entities = self.world.get_entities_with_components({SkillEffectComponent})
-        for entity in list(skill_entities):
-            skill = entity.get_component(SkillEffectComponent)
-            skill.duration -= dt
-            
-            # [Visual] Rage Aura Blink (User Request: Blue Blink on Character)
-            if skill.name == "RAGE_AURA":
-                skill.tick_count += dt
-                render = entity.get_component(RenderComponent)
-                if render:
-                    # Toggle every 0.5s
-                    if int(skill.tick_count * 2) % 2 == 0:
-                        render.color = 'blue'
-                    else:
-                        render.color = 'white'
+        if needs_recalc and hasattr(self.world.engine, '_recalculate_stats'):
+            self.world.engine._recalculate_stats()
 
-            if skill.duration <= 0:
-                entity.remove_component(SkillEffectComponent)
-                # Reset Color
-                render = entity.get_component(RenderComponent)
-                if render: render.color = 'white'
-                
-                self.event_manager.push(MessageEvent(_("{} 효과가 끝났습니다.").format(skill.name)))
+    def _is_attached(self, entity, comp) -> bool:
+        """컴포넌트가 아직 월드에 살아 있는 엔티티에 붙어 있는지"""
+        return self.world.get_entity(entity.entity_id) is entity and comp in entity.get_components(type(comp))
+
+    def _expire(self, entity, comp) -> bool:
+        """만료 처리. 능력치 재계산이 필요하면 True"""
+        handler = self._expire_handlers.get(type(comp))
+        if handler:
+            return handler(entity, comp)
+        entity.remove_component_instance(comp)
+        effect = STATUS_BY_COMPONENT.get(type(comp))
+        if effect and effect.expire_message:
+            text, color = effect.expire_message
+            self.event_manager.push(MessageEvent(text.format(self.world.engine._get_entity_name(entity)), color))
+        return False
 
-        # 4. 피격 피드백(HitFlash) 시간 감액
-        flash_entities = self.world.get_entities_with_components({HitFlashComponent})
-        for entity in list(flash_entities):
-            flash = entity.get_component(HitFlashComponent)
-            flash.duration -= dt
-            if flash.duration <= 0:
-                entity.remove_component(HitFlashComponent)
+    def _expire_stat_modifier(self, entity, mod) -> bool:
+        entity.remove_component_instance(mod)
+        if entity is self.world.get_player_entity():
+            self.world.event_manager.push(MessageEvent(_("{} 효과가 만료되었습니다.").format(mod.source)))
+        return True
 
-        # 1-3. 능력치 버강/버프(StatModifier) 만료 체크
-        needs_recalc = False
-        current_time = time.time()
-        player_ent = self.world.get_player_entity()
+    def _expire_summon(self, entity, summon) -> bool:
+        # 소환수(Summon) 수명 만료 시 소멸
+        self.event_manager.push(MessageEvent(_("{}의 소환 시간이 만료되어 사라집니다.").format(self.world.engine._get_entity_name(entity)), "gray"))
+        self.world.delete_entity(entity.entity_id)
+        return False
 
-        for entity in list(self.world._entities.values()):
-            modifiers = entity.get_components(StatModifierComponent)
-            if not modifiers: continue
-            
-            for mod in list(modifiers):
-                # Duration based logic
-                mod.duration -= dt
-                
-                if mod.duration <= 0:
-                    entity.remove_component_instance(mod)
-                    needs_recalc = True
-                    if entity == player_ent:
-                        self.world.event_manager.push(MessageEvent(_("{} 효과가 만료되었습니다.").format(mod.source)))
-        
-        if needs_recalc and hasattr(self.world.engine, '_recalculate_stats'):
-            self.world.engine._recalculate_stats()
+    def _expire_effect(self, entity, effect) -> bool:
+        # 시각 효과(Effect) 엔티티 제거
+        self.world.delete_entity(entity.entity_id)
+        return False
+
+    def _expire_skill_effect(self, entity, skill) -> bool:
+        entity.remove_component_instance(skill)
+        # Reset Color
+        render = entity.get_component(RenderComponent)
+        if render: render.color = 'white'
+        self.event_manager.push(MessageEvent(_("{} 효과가 끝났습니다.").format(skill.name)))
+        return False
+
+    def _tick_dot(self, entity, dot, due, now):
+        """
+        지속 피해 (중독/출혈): tick_interval마다 정확히 damage.
+        긴 프레임 뒤에는 만료 전까지 밀린 틱을 한 번에 적용하므로 결과가 틱 레이트와 무관합니다.
+        """
+        interval = dot.tick_interval
+        ticks = int((min(now, dot.expires_at) - due) / interval + 1e-9) + 1
+        stats = entity.get_component(StatsComponent)
+        if not stats: return ticks * interval
+        stats.current_hp -= dot.damage * ticks
+        flash, death_message, color = STATUS_BY_COMPONENT[type(dot)].dot
+        # 피격 애니메이션(HitFlash) 추가
+        if not entity.has_component(HitFlashComponent):
+            entity.add_component(HitFlashComponent(duration=flash))
+        if stats.current_hp <= 0:
+            stats.current_hp = 0
+            self.event_manager.push(MessageEvent(death_message.format(self.world.engine._get_entity_name(entity)), color))
+            self._dot_death(entity)
+        return ticks * interval
+
+    def _tick_rage_aura(self, entity, skill, due, now):
+        """[Visual] Rage Aura Blink (User Request: Blue Blink on Character) - 0.5초마다 색 전환"""
+        render = entity.get_component(RenderComponent)
+        if render:
+            render.color = 'white' if render.color == 'blue' else 'blue'
+        return 0.5
+
+    def _dot_death(self, entity):
+        # [Fix] DoT 사망 시에도 정식 사망 로직 트리거
+        combat_sys = self.world.get_system(CombatSystem)
+        if combat_sys:
+            # attacker=None으로 전달하여 플레이어 존재 시 XP 부여되게 함
+            combat_sys._handle_death(None, entity)
+        else:
+            # Fallback: 직접 삭제 (시스템 부재 시)
+            self.world.delete_entity(entity.entity_id)
 
 class LevelSystem(System):
     """경험치 획득 및 레벨업 로직을 처리하는 시스템"""
@@ -3300,7 +3552,24 @@ class BossSystem(System):
 
     def __init__(self, world):
         super().__init__(world)
+        # 패턴 데이터가 참조하는 스킬 / HP 트리거 동작 (새 보스는 JSON에서 이 이름들만 조합하면 됨)
+        self.skill_handlers = {
+            "HOOK": self._skill_hook, "SLAM": self._skill_slam, "CHARGE": self._skill_charge,
+            "RAISE_SKELETONS": self._skill_raise_skeletons, "PETRIFY": self._skill_petrify,
+            "GAZE": self._skill_gaze, "CURSE": self._skill_curse, "HASTE_MINIONS": self._skill_haste_minions,
+            "DASH": self._skill_dash, "SPIN": self._skill_spin,
+        }
+        self.trigger_handlers = {
+            "BARK": self._on_hp_bark, "SUMMON_LAST_BOSS": self._on_hp_summon_last_boss,
+            "SUMMON_BOSS": self._on_hp_summon_boss, "SUMMON_PHANTOM": self._on_hp_summon_phantom,
+            "ENRAGE": self._on_hp_enrage, "SMITE": self._on_hp_smite, "PHASE": self._on_hp_phase,
+        }
+        # 로드 시 한 번 상태 기계로 컴파일 (self.programs)
         self.patterns = self.world.engine.boss_patterns
+        # 돌진 등 보스 이동용 경로 (보스는 대각선으로도 움직이므로 옥타일 A*)
+        self.path_cache = PathCache(diagonal=True)
+        # 다음 행동 시각 힙 (쿨다운 중인 보스는 꺼내지 않음)
+        self.scheduler = ActionScheduler()
         
         # 이벤트 리스너 등록
         from .events import CombatResultEvent, MapTransitionEvent, BossBarkEvent
@@ -3372,6 +3641,8 @@ class BossSystem(System):
         """UI에 중앙 알림을 띄웁니다. (파파팍 효과)"""
         if hasattr(self.world.engine, 'ui') and self.world.engine.ui:
              self.world.engine.ui.show_center_dialogue(text, color)
+             if getattr(self.world.engine, 'renderer', None):
+                 self.world.engine.renderer.invalidate() # 화면에 직접 그린 알림 상자를 다음 프레임에 지움
 
     def process(self):
         player = self.world.get_player_entity()
@@ -3385,43 +3656,37 @@ class BossSystem(System):
         map_comp = map_ent[0].get_component(MapComponent) if map_ent else None
         if not map_comp: return
         
-        # 델타 타임 (턴 베이스이므로 고정값 사용하거나 타이핑 간격 조절)
-        # 렌더 스테이트에서 계속 호출된다면 더 좋겠지만, 여기서는 process 호출 시마다 한 자씩 공개
-        
-        for boss_ent in list(boss_entities):
+        # [Scheduler] 행동 시각이 된 보스만 처리
+        current_time = self.world.clock.now()
+        self.scheduler.sync((e.entity_id for e in boss_entities), current_time)
+        for boss_ent in boss_entities:
+            # 외부에서 쿨다운을 되돌렸으면 (스크립트/디버그) 예약도 앞당김
+            stats = boss_ent.get_component(StatsComponent)
+            ready_at = stats.last_action_time + getattr(stats, 'action_delay', 0.6)
+            if ready_at < self.scheduler.due_at(boss_ent.entity_id):
+                self.scheduler.schedule(boss_ent.entity_id, ready_at)
+        due_ids = set(self.scheduler.pop_due(current_time))
+        due_bosses = [e for e in boss_entities if e.entity_id in due_ids]
+
+        for boss_ent in due_bosses:
             boss = boss_ent.get_component(BossComponent)
             pos = boss_ent.get_component(PositionComponent)
             stats = boss_ent.get_component(StatsComponent)
             
-            # 몬스터 행동 지연(Cooldown) 확인
-            current_time = time.time()
+            # 몬스터 행동 지연(Cooldown) 확인 (MonsterAISystem도 같은 last_action_time을 갱신함)
             monster_delay = getattr(stats, 'action_delay', 0.6)
             if current_time - stats.last_action_time < monster_delay:
                 continue
             
-            pattern = self.patterns.get(boss.boss_id)
-            if not pattern: continue
+            program = self.programs.get(boss.boss_id)
+            if not program: continue
+            pattern = program.pattern
 
             # [Ghost Refinement] 소환된 환영 보스는 10~20% 확률로 너프된 위력 사용
             monster_comp = boss_ent.get_component(MonsterComponent)
             is_ghost = monster_comp.is_summoned if monster_comp else False
             nerf_factor = random.uniform(0.8, 0.9) if is_ghost else 1.0
 
-            # --- 1. 대사 타이핑/표시 로직 ---
-            if boss.active_bark:
-                # 타이핑 진행
-                if len(boss.visible_bark) < len(boss.active_bark):
-                    # 다음 문자 추가
-                    boss.visible_bark = boss.active_bark[:len(boss.visible_bark) + 1]
-                    # 타이핑 중에는 지속 시간 리셋
-                    # (bark_display_timer는 _trigger_bark에서 이미 설정됨)
-                else:
-                    # 타이핑 완료 후 대기
-                    boss.bark_display_timer -= 0.1 # 대략적인 감쇠 (턴 기반 한계)
-                    if boss.bark_display_timer <= 0:
-                        boss.active_bark = ""
-                        boss.visible_bark = ""
-
             # --- 2. 조우 및 접근 대사 ---
             dist = abs(p_pos.x - pos.x) + abs(p_pos.y - pos.y)
             
@@ -3448,118 +3713,11 @@ class BossSystem(System):
             if stats.current_hp > 0:
                 hp_percent = stats.current_hp / stats.max_hp
                 
-                # HP 임계값 대사 (50%, 20% 등)
-                for threshold in [0.5, 0.33, 0.2]:
-                    t_str = str(threshold)
-                    if hp_percent <= threshold and t_str not in boss.triggered_hps:
-                        boss.triggered_hps.add(t_str)
-                        
-                        # [Boss Summon] 이전 보스 소환 트리거
-                        is_summon_threshold = (threshold == 0.5 if boss.boss_id == "LEORIC" else threshold == 0.33)
-                        
-                        if is_summon_threshold:
-                            # [Boss Summon] 마지막 보스 환영 소환 (첫 번째 보스인 도살자는 제외)
-                            last_id = getattr(self.world.engine, 'last_boss_id', None)
-                            if last_id and last_id != boss.boss_id and boss.boss_id != "BUTCHER":
-                                # 소환 대사
-                                summon_bark = pattern.get("summon_bark", "과거의 영혼이여, 나를 도우라!")
-                                self._trigger_bark(boss_ent, summon_bark)
-                                self._announce_skill(summon_bark, "purple") # Center Alert
-                                # 근처에 소환
-                                self.world.engine._spawn_boss(pos.x + 1, pos.y + 1, boss_name=last_id, is_summoned=True)
-                                self.event_manager.push(MessageEvent(_("!!! {}이(가) 이전의 적 {}의 환영을 불러냅니다! !!!").format(boss.boss_id, last_id), "purple"))
-                        else:
-                            bark_key = f"on_hp_{int(threshold*100)}"
-                            bark = pattern.get(bark_key)
-                            if bark:
-                                 self._trigger_bark(boss_ent, bark)
-                                 # HP 20% 임계값 돌파 시 화면 흔들림 효과 추가
-                                 if threshold == 0.2 and hasattr(self.world.engine, 'trigger_shake'):
-                                     self.world.engine.trigger_shake(10)
-
-                if boss.boss_id == "DIABLO":
-                    # [DIABLO] Sequential Summoning (85% -> BUTCHER, 70% -> LEORIC, 55% -> LICH_KING)
-                    # 20% -> Enrage (All Shall Suffer)
-                    diablo_thresholds = {
-                        0.85: "BUTCHER",
-                        0.70: "LEORIC",
-                        0.55: "LICH_KING"
-                    }
-                    
-                    for th, spawn_boss in diablo_thresholds.items():
-                        t_str = f"diablo_summon_{int(th*100)}"
-                        # print(f"DEBUG: Checking {t_str}, hp={hp_percent}, th={th}, triggered={boss.triggered_hps}")
-                        if hp_percent <= th and t_str not in boss.triggered_hps:
-                            boss.triggered_hps.add(t_str)
-                            bark_key = f"on_hp_{int(th*100)}"
-                            bark = pattern.get(bark_key)
-                            if bark: 
-                                self._trigger_bark(boss_ent, bark)
-                                self._announce_skill(bark, "red") # Center Alert
-                            
-                            # Specific Summon
-                            self._trigger_boss_summon(None, boss_ent, specific_boss_id=spawn_boss)
-                            if hasattr(self.world.engine, 'trigger_shake'):
-                                self.world.engine.trigger_shake(8)
-
-                    # 20% Threshold (Enrage)
-                    if hp_percent <= 0.2 and "diablo_enrage" not in boss.triggered_hps:
-                        boss.triggered_hps.add("diablo_enrage")
-                        bark = pattern.get("on_hp_20") # ALL SHALL SUFFER
-                        if bark:
-                            self._announce_skill(bark, "red") # Center Alert
-                            self.event_manager.push(MessageEvent(f"!!! {boss.boss_id}: {bark} !!!", "red"))
-                            # 광폭화: 본체 행동 속도 증가
-                            stats.action_delay *= 0.5
-                            if hasattr(self.world.engine, 'trigger_shake'):
-                                self.world.engine.trigger_shake(15)
-
-                # [LEORIC] 10% HP Interval Smite
-                if boss.boss_id == "LEORIC":
-                    for interval in [0.9, 0.8, 0.7, 0.6, 0.5, 0.4, 0.3, 0.2, 0.1]:
-                        s_key = f"smite_{int(interval*100)}"
-                        if hp_percent <= interval and s_key not in boss.triggered_hps:
-                            boss.triggered_hps.add(s_key)
-                            bark = pattern.get("on_skill_smite")
-                            if bark:
-                                self._trigger_bark(boss_ent, bark)
-                                self._announce_skill(bark, "red") # Center Alert
-                            self.event_manager.push(MessageEvent(_("!!! {}의 광역 강타! !!!").format(boss.boss_id), "red"))
-                            
-                            from .events import DirectionalAttackEvent
-                            for ddy in range(-4, 5):
-                                for ddx in range(-4, 5):
-                                    if ddx == 0 and ddy == 0: continue
-                                    if abs(ddx) + abs(ddy) <= 4:
-                                         self.event_manager.push(DirectionalAttackEvent(boss_ent.entity_id, ddx, ddy, range_dist=1, damage_factor=0.8))
-                            
-                            if hasattr(self.world.engine, 'trigger_shake'):
-                                self.world.engine.trigger_shake(8)
-
-                # 기존 페이즈 로직 (동작 유지)
-                phase_list = pattern.get("phases", [])
-                if boss.current_phase < len(phase_list):
-                    next_phase = phase_list[boss.current_phase]
-                    if hp_percent <= next_phase.get("hp_threshold", 0):
-                        boss.current_phase += 1
-                        bark = next_phase.get("bark")
-                        if bark: 
-                            self._trigger_bark(boss_ent, bark)
-                            self._announce_skill(bark, "yellow") # Center Alert
-                            # 분노 페이즈(20% 이하) 진입 시 화면 흔들림
-                            if next_phase.get("hp_threshold", 0) <= 0.2 and hasattr(self.world.engine, 'trigger_shake'):
-                                self.world.engine.trigger_shake(10)
-                        
-                        boost = next_phase.get("stat_boost")
-                        if boost:
-                            if "attack" in boost:
-                                stats.attack = int(stats.attack * boost["attack"])
-                                stats.attack_min = int(getattr(stats, 'attack_min', stats.attack) * boost["attack"])
-                                stats.attack_max = int(getattr(stats, 'attack_max', stats.attack) * boost["attack"])
-                            if "action_delay" in boost:
-                                stats.action_delay *= boost["action_delay"]
-                            self.event_manager.push(MessageEvent(_("!!! {}이(가) 분노하여 더욱 강력해집니다! !!!").format(boss.boss_id), "red"))
-                            stats.last_action_time = current_time # 페이즈 전환도 행동으로 간주하거나 쿨다운 갱신
+                # 컴파일된 임계값(내림차순) 중 새로 넘어선 것만 실행 - 평소에는 다음 임계값 하나와 비교
+                acted = False
+                for trigger in program.crossed(boss, hp_percent):
+                    if self.trigger_handlers[trigger.action](boss_ent, trigger, current_time):
+                        acted = True
 
                 # --- 4. 스킬 및 행동 AI (Logic) ---
                 # 매 턴 10% 확률로 특수 패턴 발동 (Engagement 상태일 때만)
@@ -3570,441 +3728,391 @@ class BossSystem(System):
                         self.world.engine.trigger_shake(5)
                     stats.last_action_time = current_time
 
-                # 거리 기반 스킬 AI
-                dist = abs(p_pos.x - pos.x) + abs(p_pos.y - pos.y)
-                if boss.is_engaged:
-                    # 도살자(BUTCHER) 고유 스킬 셋
-                    if boss.boss_id == "BUTCHER":
-                        if self._process_butcher_logic(boss_ent, p_pos, dist, map_comp, nerf_factor):
-                            stats.last_action_time = current_time
-                    elif boss.boss_id == "LEORIC":
-                        if self._process_leoric_logic(boss_ent, p_pos, dist, map_comp):
-                            stats.last_action_time = current_time
-                    elif boss.boss_id == "LICH_KING":
-                        if self._process_lich_king_logic(boss_ent, p_pos, dist, map_comp):
-                            stats.last_action_time = current_time
-                    elif boss.boss_id == "DIABLO":
-                        if self._process_diablo_logic(boss_ent, p_pos, dist, map_comp):
-                            stats.last_action_time = current_time
-                    else:
-                        # 일반 보스 AI (Dash/Spin)
-                        if dist > 3 and random.random() < 0.2:
-                            # [Dash] 돌진
-                            self._trigger_bark(boss_ent, "거기 서라!")
-                            self.event_manager.push(MessageEvent(_("{}이(가) 당신을 향해 급격히 돌진합니다!").format(boss.boss_id), "red"))
-                            dx = 1 if p_pos.x > pos.x else (-1 if p_pos.x < pos.x else 0)
-                            dy = 1 if p_pos.y > pos.y else (-1 if p_pos.y < pos.y else 0)
-                            if map_comp.tiles[pos.y + dy][pos.x + dx] == '.':
-                                pos.x += dx
-                                pos.y += dy
-                                stats.last_action_time = current_time
-
-                        elif dist <= 1 and random.random() < 0.3:
-                            # [AoE] 대회전
-                            self._trigger_bark(boss_ent, "모두 사라져라!")
-                            from .events import DirectionalAttackEvent
-                            self.event_manager.push(MessageEvent(_("{}의 대회전 공격!").format(boss.boss_id), "red"))
-                            if is_ghost:
-                                self.event_manager.push(MessageEvent(_("환영의 일격이라 위력이 약합니다."), "gray"))
-                            
-                            for ddy in [-1, 0, 1]:
-                                for ddx in [-1, 0, 1]:
-                                    if ddx == 0 and ddy == 0: continue
-                                    self.event_manager.push(DirectionalAttackEvent(boss_ent.entity_id, ddx, ddy, range_dist=1))
-                            stats.last_action_time = current_time
-
-    def _process_butcher_logic(self, boss_ent, p_pos, dist, map_comp, nerf_factor=1.0):
-        """도살자의 특수 AI 로직: 훅, 슬램, 분노의 돌진 (nerf_factor 적용)"""
+                # 거리 기반 스킬 AI (소환 등 트리거가 행동을 소비했으면 이번 턴은 생략)
+                if boss.is_engaged and not acted:
+                    acted = self._run_skills(boss_ent, program, p_pos, dist, map_comp, nerf_factor, hp_percent, current_time)
+                if acted:
+                    stats.last_action_time = current_time
+
+        # [Scheduler] 행동했으면 쿨다운이 끝나는 시각, 아니면 다음 틱에 다시
+        for boss_ent in due_bosses:
+            if self.world.get_entity(boss_ent.entity_id) is None:
+                continue
+            stats = boss_ent.get_component(StatsComponent)
+            self.scheduler.schedule(boss_ent.entity_id, max(current_time, stats.last_action_time + getattr(stats, 'action_delay', 0.6)))
+
+    @property
+    def patterns(self):
+        return self._patterns
+
+    @patterns.setter
+    def patterns(self, patterns):
+        """패턴이 바뀌면 (로드/테스트 교체) 바로 다시 컴파일합니다."""
+        self._patterns = patterns
+        self.programs = compile_boss_patterns(patterns, self.skill_handlers.keys(), self.trigger_handlers.keys())
+
+    def _count_monsters(self, monster_ids) -> Dict[str, int]:
+        counts = dict.fromkeys(monster_ids, 0)
+        for m_ent in self.world.get_entities_with_components({MonsterComponent}):
+            monster_id = m_ent.get_component(MonsterComponent).monster_id
+            if monster_id in counts:
+                counts[monster_id] += 1
+        return counts
+
+    def _run_skills(self, boss_ent, program, p_pos, dist, map_comp, nerf_factor, hp_percent, current_time):
+        """컴파일된 스킬 규칙을 순서대로 검사해 처음으로 행동을 소비한 스킬에서 멈춥니다."""
         boss = boss_ent.get_component(BossComponent)
         pos = boss_ent.get_component(PositionComponent)
-        stats = boss_ent.get_component(StatsComponent)
-        pattern = self.patterns.get(boss.boss_id)
-        current_time = time.time()
-        
-        # [Cooldown] Boss breathing room (User Request: Skill Cooldown 1.5x~2x)
-        # Butcher skills now share a 2.5s cooldown
-        if current_time - getattr(boss, 'last_skill_time', 0) < 2.5:
-            return False
+        is_linear = (p_pos.x == pos.x or p_pos.y == pos.y)
+        minion_counts = None
+        for rule in program.skills:
+            if not rule.in_range(dist, hp_percent, is_linear):
+                continue
+            if rule.minion:
+                if minion_counts is None: # 부하 수는 필요할 때 틱당 한 번만 셈
+                    minion_counts = self._count_monsters(program.minion_types)
+                if not rule.minions_ok(minion_counts[rule.minion]):
+                    continue
+            if not rule.ready(boss, current_time, hp_percent):
+                continue
+            if rule.chance < 1.0 and random.random() >= rule.chance:
+                continue
+            if self.skill_handlers[rule.skill](boss_ent, rule, p_pos, dist, map_comp, nerf_factor):
+                if rule.timer:
+                    setattr(boss, rule.timer, current_time)
+                return True
+        return False
+
+    # --- HP 트리거 동작 (boss_patterns.HpTrigger.action) ---
+    # 반환값: 이번 턴 행동을 소비했는지
 
-        # 1. 훅 (Hook): 거리가 벌어졌을 때 (3~6 타일)
-        if 3 <= dist <= 6 and random.random() < 0.25:
-            boss.last_skill_time = current_time
-            bark = pattern.get("on_skill_hook", "Come here!")
+    def _on_hp_bark(self, boss_ent, trigger, current_time):
+        """on_hp_XX 대사 (+ 화면 흔들림)"""
+        pattern = self.patterns.get(boss_ent.get_component(BossComponent).boss_id)
+        bark = pattern.get(trigger.params.get("bark"))
+        if bark:
             self._trigger_bark(boss_ent, bark)
-            self._announce_skill(f"'{bark}'", "red") # Center Alert
-            self.event_manager.push(MessageEvent(_("!!! 도살자가 피 묻은 갈고리를 던집니다! !!!"), "red"))
-            
-            # 플레이어를 보스 바로 앞으로 끌어당김
-            player_ent = self.world.get_player_entity()
-            p_pos_comp = player_ent.get_component(PositionComponent)
-            
-            # 방향 계산
-            dx = 1 if p_pos.x > pos.x else (-1 if p_pos.x < pos.x else 0)
-            dy = 1 if p_pos.y > pos.y else (-1 if p_pos.y < pos.y else 0)
-            
-            target_x, target_y = pos.x + dx, pos.y + dy
-            if map_comp.tiles[target_y][target_x] == '.':
-                p_pos_comp.x, p_pos_comp.y = target_x, target_y
-                # 짧은 기절 부여 (nerf_factor 반영)
-                from .components import StunComponent
-                player_ent.add_component(StunComponent(duration=1.0 * nerf_factor))
-                self.event_manager.push(MessageEvent(_("갈고리에 끌려가 기절했습니다!"), "yellow"))
-            return True
-        
-        # 2. 슬램 (Slam): 인접했을 때
-        if dist <= 1 and random.random() < 0.3:
-            boss.last_skill_time = current_time
-            bark = pattern.get("on_skill_slam", "Fresh Meat!")
+            # HP 20% 임계값 돌파 시 화면 흔들림 효과 추가
+            if trigger.params.get("shake") and hasattr(self.world.engine, 'trigger_shake'):
+                self.world.engine.trigger_shake(trigger.params["shake"])
+        return False
+
+    def _on_hp_summon_last_boss(self, boss_ent, trigger, current_time):
+        """[Boss Summon] 마지막으로 쓰러뜨린 보스의 환영 소환"""
+        boss = boss_ent.get_component(BossComponent)
+        pos = boss_ent.get_component(PositionComponent)
+        last_id = getattr(self.world.engine, 'last_boss_id', None)
+        if last_id and last_id != boss.boss_id:
+            # 소환 대사
+            summon_bark = self.patterns.get(boss.boss_id).get("summon_bark", "과거의 영혼이여, 나를 도우라!")
+            self._trigger_bark(boss_ent, summon_bark)
+            self._announce_skill(summon_bark, "purple") # Center Alert
+            # 근처에 소환
+            self.world.engine._spawn_boss(pos.x + 1, pos.y + 1, boss_name=last_id, is_summoned=True)
+            self.event_manager.push(MessageEvent(_("!!! {}이(가) 이전의 적 {}의 환영을 불러냅니다! !!!").format(boss.boss_id, last_id), "purple"))
+        return False
+
+    def _on_hp_summon_boss(self, boss_ent, trigger, current_time):
+        """[DIABLO] 정해진 보스를 순서대로 소환"""
+        pattern = self.patterns.get(boss_ent.get_component(BossComponent).boss_id)
+        bark = pattern.get(trigger.params.get("bark"))
+        if bark:
             self._trigger_bark(boss_ent, bark)
-            self._announce_skill(f"'{bark}'", "red") # Center Alert
-            self.event_manager.push(MessageEvent(_("!!! 도살자의 강력한 내려치기! !!!"), "red"))
-            
-            player_ent = self.world.get_player_entity()
-            # 넉백 처리
-            self._apply_manual_knockback(boss_ent, player_ent, map_comp)
-            # 데미지 부여
-            p_stats = player_ent.get_component(StatsComponent)
-            if p_stats:
-                damage = int(stats.attack * 1.5 * nerf_factor)
-                p_stats.current_hp -= max(1, damage - p_stats.defense)
-            return True
+            self._announce_skill(bark, "red") # Center Alert
+        self._trigger_boss_summon(None, boss_ent, specific_boss_id=trigger.params["boss"])
+        if hasattr(self.world.engine, 'trigger_shake'):
+            self.world.engine.trigger_shake(8)
+        return False
 
-        # 3. 분노의 돌진 (Frenzy Charge): 직선상에 있을 때
-        is_linear = (p_pos.x == pos.x or p_pos.y == pos.y)
-        if is_linear and dist >= 2 and random.random() < 0.15:
-            boss.last_skill_time = current_time
-            bark = pattern.get("on_skill_charge", "RRRRAAAARRRRGH!")
+    def _on_hp_enrage(self, boss_ent, trigger, current_time):
+        """광폭화: 본체 행동 속도 증가 (ALL SHALL SUFFER)"""
+        boss = boss_ent.get_component(BossComponent)
+        stats = boss_ent.get_component(StatsComponent)
+        bark = self.patterns.get(boss.boss_id).get(trigger.params.get("bark"))
+        if bark:
+            self._announce_skill(bark, "red") # Center Alert
+            self.event_manager.push(MessageEvent(f"!!! {boss.boss_id}: {bark} !!!", "red"))
+        stats.action_delay *= trigger.params.get("action_delay", 0.5)
+        if hasattr(self.world.engine, 'trigger_shake'):
+            self.world.engine.trigger_shake(trigger.params.get("shake", 15))
+        return False
+
+    def _on_hp_smite(self, boss_ent, trigger, current_time):
+        """[LEORIC] 광역 강타: 맨해튼 반경 안 모든 방향으로 공격"""
+        boss = boss_ent.get_component(BossComponent)
+        bark = self.patterns.get(boss.boss_id).get("on_skill_smite")
+        if bark:
             self._trigger_bark(boss_ent, bark)
-            self._announce_skill(f"'{bark}'", "red") # Center Alert
-            self.event_manager.push(MessageEvent(_("!!! 도살자가 미친 듯이 돌진합니다! !!!"), "red"))
-            
-            dx = 1 if p_pos.x > pos.x else (-1 if p_pos.x < pos.x else 0)
-            dy = 1 if p_pos.y > pos.y else (-1 if p_pos.y < pos.y else 0)
-            
-            # 직선 돌진 로직
-            curr_x, curr_y = pos.x, pos.y
-            hit_wall = False
-            hit_player = False
-            
-            # 최대 10칸 돌진
-            for _i in range(10):
-                nx, ny = curr_x + dx, curr_y + dy
-                if map_comp.tiles[ny][nx] == '#':
-                    hit_wall = True
-                    break
-                
-                # 플레이어 충돌 체크
-                if nx == p_pos.x and ny == p_pos.y:
-                    hit_player = True
-                    # 플레이어 위치 업데이트 (치여서 밀려남)
-                    p_pos.x += dx
-                    p_pos.y += dy
-                    break
-                
-                curr_x, curr_y = nx, ny
-            
-            pos.x, pos.y = curr_x, curr_y
-            
-            if hit_player:
-                self.event_manager.push(MessageEvent(_("도살자의 돌진에 치여 큰 피해를 입었습니다!"), "red"))
-                player_ent = self.world.get_player_entity()
-                p_stats = player_ent.get_component(StatsComponent) if player_ent else None
-                if p_stats:
-                    p_stats.current_hp -= int(stats.attack * 2.0 * nerf_factor)
-            
-            if hit_wall:
-                self.event_manager.push(MessageEvent(_("도살자가 벽에 들이받고 기절했습니다!"), "yellow"))
-                from .components import StunComponent
-                boss_ent.add_component(StunComponent(duration=2.0))
-            return True
+            self._announce_skill(bark, "red") # Center Alert
+        self.event_manager.push(MessageEvent(_("!!! {}의 광역 강타! !!!").format(boss.boss_id), "red"))
+        
+        from .events import DirectionalAttackEvent
+        radius = trigger.params.get("radius", 4)
+        factor = trigger.params.get("damage_factor", 0.8)
+        for ddy in range(-radius, radius + 1):
+            for ddx in range(-radius, radius + 1):
+                if ddx == 0 and ddy == 0: continue
+                if abs(ddx) + abs(ddy) <= radius:
+                    self.event_manager.push(DirectionalAttackEvent(boss_ent.entity_id, ddx, ddy, range_dist=1, damage_factor=factor))
         
+        if trigger.params.get("shake") and hasattr(self.world.engine, 'trigger_shake'):
+            self.world.engine.trigger_shake(trigger.params["shake"])
         return False
-        # 1. 훅 (Hook): 거리가 벌어졌을 때 (3~6 타일)
-        if 3 <= dist <= 6 and random.random() < 0.25:
-            bark = pattern.get("on_skill_hook", "Come here!")
-            self._trigger_bark(boss_ent, bark)
-            self._announce_skill(f"'{bark}'", "red") # Center Alert
-            self.event_manager.push(MessageEvent(_("!!! 도살자가 피 묻은 갈고리를 던집니다! !!!"), "red"))
-            
-            # 플레이어를 보스 바로 앞으로 끌어당김
-            player_ent = self.world.get_player_entity()
-            p_pos_comp = player_ent.get_component(PositionComponent)
-            
-            # 방향 계산
-            dx = 1 if p_pos.x > pos.x else (-1 if p_pos.x < pos.x else 0)
-            dy = 1 if p_pos.y > pos.y else (-1 if p_pos.y < pos.y else 0)
-            
-            target_x, target_y = pos.x + dx, pos.y + dy
-            if map_comp.tiles[target_y][target_x] == '.':
-                p_pos_comp.x, p_pos_comp.y = target_x, target_y
-                # 짧은 기절 부여 (nerf_factor 반영)
-                from .components import StunComponent
-                player_ent.add_component(StunComponent(duration=1.0 * nerf_factor))
-                self.event_manager.push(MessageEvent(_("갈고리에 끌려가 기절했습니다!"), "yellow"))
-            return True
 
-        # 2. 슬램 (Slam): 인접했을 때
-        if dist <= 1 and random.random() < 0.3:
-            bark = pattern.get("on_skill_slam", "Fresh Meat!")
-            self._trigger_bark(boss_ent, bark)
-            self._announce_skill(f"'{bark}'", "red") # Center Alert
-            self.event_manager.push(MessageEvent(_("!!! 도살자의 강력한 내려치기! !!!"), "red"))
-            
-            player_ent = self.world.get_player_entity()
-            # 1.5배 데미지 적용 (CombatSystem의 로직을 간소하게 재현하거나 이벤트를 보내야 함)
-            # 여기서는 직접 stats를 깎거나 이벤트를 발행. 
-            # 일관성을 위해 _apply_damage를 호출하고 싶지만 CombatSystem 메서드임.
-            # 임시로 메시지와 함께 데미지 부여 로직 (CombatSystem 접근 권한 확인 필요)
-            self.event_manager.push(MessageEvent(_("큰 충격과 함께 뒤로 밀려납니다!"), "yellow"))
-            # 넉백 처리 (AI 단에서 직접 수행)
-            self._apply_manual_knockback(boss_ent, player_ent, map_comp)
-            # 데미지 이벤트는 없으므로 직접 처리 (stats 깎기, nerf_factor 반영)
-            p_stats = player_ent.get_component(StatsComponent)
-            if p_stats:
-                damage = int(stats.attack * 1.5 * nerf_factor)
-                p_stats.current_hp -= max(1, damage - p_stats.defense)
-            return True
+    def _on_hp_summon_phantom(self, boss_ent, trigger, current_time):
+        """보스 근처에 다른 보스의 영혼(일반 스폰) 소환"""
+        boss = boss_ent.get_component(BossComponent)
+        pos = boss_ent.get_component(PositionComponent)
+        params = trigger.params
+        if params.get("bark_text"):
+            self.event_manager.push(MessageEvent(f"[{boss.boss_id}] \"{params['bark_text']}\"", "red"))
+        if params.get("message"):
+            self.event_manager.push(MessageEvent(_(params["message"]), "red"))
+        
+        tx, ty = self._find_spawn_pos(pos.x, pos.y)
+        if self.world.engine._spawn_monster_at(tx, ty, pool=[params["monster"]]) and params.get("spawned_message"):
+            self.event_manager.push(MessageEvent(_(params["spawned_message"]).format(params["monster"]), "red"))
+        return params.get("acts", True)
 
-        # 3. 분노의 돌진 (Frenzy Charge): 직선상에 있을 때
-        is_linear = (p_pos.x == pos.x or p_pos.y == pos.y)
-        if is_linear and dist >= 2 and random.random() < 0.15:
-            bark = pattern.get("on_skill_charge", "RRRRAAAARRRRGH!")
+    def _on_hp_phase(self, boss_ent, trigger, current_time):
+        """JSON 페이즈 진입: 대사 + stat_boost"""
+        boss = boss_ent.get_component(BossComponent)
+        stats = boss_ent.get_component(StatsComponent)
+        next_phase = trigger.params["phase"]
+        boss.current_phase = max(boss.current_phase, trigger.params["index"] + 1)
+        bark = next_phase.get("bark")
+        if bark: 
             self._trigger_bark(boss_ent, bark)
-            self._announce_skill(f"'{bark}'", "red") # Center Alert
-            self.event_manager.push(MessageEvent(_("!!! 도살자가 미친 듯이 돌진합니다! !!!"), "red"))
-            
-            dx = 1 if p_pos.x > pos.x else (-1 if p_pos.x < pos.x else 0)
-            dy = 1 if p_pos.y > pos.y else (-1 if p_pos.y < pos.y else 0)
-            
-            # 직선 돌진 로직
-            curr_x, curr_y = pos.x, pos.y
-            hit_wall = False
-            hit_player = False
-            
-            # 최대 10칸 돌진
-            for _i in range(10):
-                nx, ny = curr_x + dx, curr_y + dy
-                if map_comp.tiles[ny][nx] == '#':
-                    hit_wall = True
-                    break
-                
-                # 플레이어 충돌 체크
-                if nx == p_pos.x and ny == p_pos.y:
-                    hit_player = True
-                    # 플레이어 위치 업데이트 (치여서 밀려남)
-                    p_pos.x += dx
-                    p_pos.y += dy
-                    break
-                
-                curr_x, curr_y = nx, ny
-            
-            pos.x, pos.y = curr_x, curr_y
-            
-            if hit_player:
-                self.event_manager.push(MessageEvent(_("도살자의 돌진에 치여 큰 피해를 입었습니다!"), "red"))
-                player_ent = self.world.get_player_entity()
-                p_stats = player_ent.get_component(StatsComponent) if player_ent else None
-                if p_stats:
-                    p_stats.current_hp -= int(stats.attack * 2.0 * nerf_factor)
-            
-            if hit_wall:
-                self.event_manager.push(MessageEvent(_("도살자가 벽에 들이받고 기절했습니다!"), "yellow"))
-                from .components import StunComponent
-                # 보스 기절 시간은 너프하지 않음 (오히려 패널티니까)
-                boss_ent.add_component(StunComponent(duration=2.0))
-            return True
+            self._announce_skill(bark, "yellow") # Center Alert
+            # 분노 페이즈(20% 이하) 진입 시 화면 흔들림
+            if next_phase.get("hp_threshold", 0) <= 0.2 and hasattr(self.world.engine, 'trigger_shake'):
+                self.world.engine.trigger_shake(10)
         
+        boost = next_phase.get("stat_boost")
+        if boost:
+            if "attack" in boost:
+                stats.attack = int(stats.attack * boost["attack"])
+                stats.attack_min = int(getattr(stats, 'attack_min', stats.attack) * boost["attack"])
+                stats.attack_max = int(getattr(stats, 'attack_max', stats.attack) * boost["attack"])
+            if "action_delay" in boost:
+                stats.action_delay *= boost["action_delay"]
+            self.event_manager.push(MessageEvent(_("!!! {}이(가) 분노하여 더욱 강력해집니다! !!!").format(boss.boss_id), "red"))
+            stats.last_action_time = current_time # 페이즈 전환도 행동으로 간주하거나 쿨다운 갱신
         return False
 
-    def _process_leoric_logic(self, boss_ent, p_pos, dist, map_comp):
-        """레오닉의 특수 AI 로직: 군단 소환, 석화 마법"""
+    # --- 스킬 (boss_patterns.SkillRule.skill) ---
+    # 조건/쿨다운/확률은 _run_skills에서 이미 확인됨. 반환값: 이번 턴 행동을 소비했는지
+
+    def _skill_hook(self, boss_ent, rule, p_pos, dist, map_comp, nerf_factor):
+        """[BUTCHER] 훅: 플레이어를 보스 바로 앞으로 끌어당기고 짧게 기절"""
         boss = boss_ent.get_component(BossComponent)
         pos = boss_ent.get_component(PositionComponent)
+        bark = self.patterns.get(boss.boss_id).get("on_skill_hook", "Come here!")
+        self._trigger_bark(boss_ent, bark)
+        self._announce_skill(f"'{bark}'", "red") # Center Alert
+        self.event_manager.push(MessageEvent(_("!!! 도살자가 피 묻은 갈고리를 던집니다! !!!"), "red"))
+        
+        player_ent = self.world.get_player_entity()
+        p_pos_comp = player_ent.get_component(PositionComponent)
+        
+        # 방향 계산
+        dx = 1 if p_pos.x > pos.x else (-1 if p_pos.x < pos.x else 0)
+        dy = 1 if p_pos.y > pos.y else (-1 if p_pos.y < pos.y else 0)
+        
+        target_x, target_y = pos.x + dx, pos.y + dy
+        if map_comp.tiles[target_y][target_x] == '.':
+            p_pos_comp.x, p_pos_comp.y = target_x, target_y
+            # 짧은 기절 부여 (nerf_factor 반영)
+            apply_status(player_ent, StunComponent(duration=1.0 * nerf_factor))
+            self.event_manager.push(MessageEvent(_("갈고리에 끌려가 기절했습니다!"), "yellow"))
+        return True
+
+    def _skill_slam(self, boss_ent, rule, p_pos, dist, map_comp, nerf_factor):
+        """[BUTCHER] 슬램: 인접한 플레이어를 내려쳐 넉백 + 1.5배 피해"""
+        boss = boss_ent.get_component(BossComponent)
         stats = boss_ent.get_component(StatsComponent)
-        pattern = self.patterns.get(boss.boss_id)
-        current_time = time.time()
+        bark = self.patterns.get(boss.boss_id).get("on_skill_slam", "Fresh Meat!")
+        self._trigger_bark(boss_ent, bark)
+        self._announce_skill(f"'{bark}'", "red") # Center Alert
+        self.event_manager.push(MessageEvent(_("!!! 도살자의 강력한 내려치기! !!!"), "red"))
+        
+        player_ent = self.world.get_player_entity()
+        # 넉백 처리
+        self._apply_manual_knockback(boss_ent, player_ent, map_comp)
+        # 데미지 부여
+        p_stats = player_ent.get_component(StatsComponent)
+        if p_stats:
+            damage = int(stats.attack * 1.5 * nerf_factor)
+            p_stats.current_hp -= max(1, damage - p_stats.defense)
+        return True
 
-        # 1. 군단 소환 (HP > 50% 구간에서 몬스터 수가 15마리 미만일 때)
-        hp_percent = stats.current_hp / stats.max_hp
+    def _skill_charge(self, boss_ent, rule, p_pos, dist, map_comp, nerf_factor):
+        """[BUTCHER] 분노의 돌진: 직선상의 플레이어에게 최대 10칸 돌진"""
+        boss = boss_ent.get_component(BossComponent)
+        pos = boss_ent.get_component(PositionComponent)
+        stats = boss_ent.get_component(StatsComponent)
+        bark = self.patterns.get(boss.boss_id).get("on_skill_charge", "RRRRAAAARRRRGH!")
+        self._trigger_bark(boss_ent, bark)
+        self._announce_skill(f"'{bark}'", "red") # Center Alert
+        self.event_manager.push(MessageEvent(_("!!! 도살자가 미친 듯이 돌진합니다! !!!"), "red"))
         
-        # 현재 맵의 모든 해골(SKELETON) 수 파악
-        all_monsters = self.world.get_entities_with_components({MonsterComponent})
-        skeletons = [m for m in all_monsters if m.get_component(MonsterComponent).monster_id == "SKELETON"]
+        dx = 1 if p_pos.x > pos.x else (-1 if p_pos.x < pos.x else 0)
+        dy = 1 if p_pos.y > pos.y else (-1 if p_pos.y < pos.y else 0)
         
-        if hp_percent > 0.5 and len(skeletons) < 15 and random.random() < 0.3:
-            # 소환 대사 (쿨다운 15초)
-            if current_time - getattr(boss, 'last_swarm_time', 0) > 15.0:
-                bark = pattern.get("on_skill_swarm")
-                if bark:
-                    self._trigger_bark(boss_ent, bark)
-                boss.last_swarm_time = current_time
+        # 직선 돌진 로직
+        curr_x, curr_y = pos.x, pos.y
+        hit_wall = False
+        hit_player = False
+        
+        # 최대 10칸 돌진
+        for _i in range(10):
+            nx, ny = curr_x + dx, curr_y + dy
+            if map_comp.tiles[ny][nx] == '#':
+                hit_wall = True
+                break
             
-            # 부족한 만큼 또는 최대 5마리 소환
-            num_to_spawn = min(5, 15 - len(skeletons))
-            spawned_any = False
-            for _i in range(num_to_spawn):
-                tx, ty = self._find_spawn_pos(pos.x, pos.y)
-                if self.world.engine._spawn_monster_at(tx, ty, pool=["SKELETON"]):
-                    spawned_any = True
+            # 플레이어 충돌 체크
+            if nx == p_pos.x and ny == p_pos.y:
+                hit_player = True
+                # 플레이어 위치 업데이트 (치여서 밀려남)
+                p_pos.x += dx
+                p_pos.y += dy
+                break
             
-            if spawned_any:
-                self._announce_skill("깨어나라, 나의 군대여!", "gray") # Center Alert
-                self.event_manager.push(MessageEvent(_("{}이(가) 해골 군단을 소환합니다!").format(boss.boss_id), "gray"))
-                return True
+            curr_x, curr_y = nx, ny
+        
+        pos.x, pos.y = curr_x, curr_y
+        
+        if hit_player:
+            self.event_manager.push(MessageEvent(_("도살자의 돌진에 치여 큰 피해를 입었습니다!"), "red"))
+            player_ent = self.world.get_player_entity()
+            p_stats = player_ent.get_component(StatsComponent) if player_ent else None
+            if p_stats:
+                p_stats.current_hp -= int(stats.attack * 2.0 * nerf_factor)
+        
+        if hit_wall:
+            self.event_manager.push(MessageEvent(_("도살자가 벽에 들이받고 기절했습니다!"), "yellow"))
+            # 보스 기절 시간은 너프하지 않음 (오히려 패널티니까)
+            apply_status(boss_ent, StunComponent(duration=2.0))
+        return True
 
-        # 2. 석화 마법 (소환수가 15마리 이상일 때)
-        if len(skeletons) >= 15 and random.random() < 0.3:
-            player = self.world.get_player_entity()
-            if player and dist <= 10:
-                # 쿨다운 25초
-                if current_time - getattr(boss, 'last_petrify_time', 0) > 25.0:
-                    bark = pattern.get("on_skill_petrify")
-                    if bark:
-                        self._trigger_bark(boss_ent, bark)
-                    boss.last_petrify_time = current_time
-                    
-                    if not player.has_component(PetrifiedComponent):
-                        self._announce_skill("굳어버려라!", "yellow") # Center Alert
-                        player.add_component(PetrifiedComponent(duration=3.0))
-                        self.event_manager.push(MessageEvent(_("!!! {}의 마법으로 전신이 석화되었습니다! !!!").format(boss.boss_id), "yellow"))
-                        # 석화 시 이펙트
-                        if hasattr(self.world.engine, 'trigger_shake'):
-                            self.world.engine.trigger_shake(5)
-                    return True
+    def _skill_raise_skeletons(self, boss_ent, rule, p_pos, dist, map_comp, nerf_factor):
+        """[LEORIC] 군단 소환: 부하 수가 한도에 찰 때까지 최대 max_spawn마리"""
+        boss = boss_ent.get_component(BossComponent)
+        pos = boss_ent.get_component(PositionComponent)
+        current_time = self.world.clock.now()
+        
+        # 소환 대사 (쿨다운 15초)
+        if current_time - getattr(boss, 'last_swarm_time', 0) > rule.params.get("bark_cooldown", 15.0):
+            bark = self.patterns.get(boss.boss_id).get("on_skill_swarm")
+            if bark:
+                self._trigger_bark(boss_ent, bark)
+            boss.last_swarm_time = current_time
+        
+        # 부족한 만큼 또는 최대 5마리 소환
+        existing = self._count_monsters({rule.minion})[rule.minion]
+        num_to_spawn = min(rule.params.get("max_spawn", 5), rule.max_minions - existing)
+        spawned_any = False
+        for _i in range(num_to_spawn):
+            tx, ty = self._find_spawn_pos(pos.x, pos.y)
+            if self.world.engine._spawn_monster_at(tx, ty, pool=[rule.minion]):
+                spawned_any = True
+        
+        if spawned_any:
+            self._announce_skill("깨어나라, 나의 군대여!", "gray") # Center Alert
+            self.event_manager.push(MessageEvent(_("{}이(가) 해골 군단을 소환합니다!").format(boss.boss_id), "gray"))
+        return spawned_any
 
-        # [NEW] Leoric Summons Butcher Phantom (HP < 50%)
-        if hp_percent < 0.5 and not getattr(boss, 'summoned_phantom_butcher', False):
-             boss.summoned_phantom_butcher = True
-             self.event_manager.push(MessageEvent(_("!!! 레오닉이 도살자의 영혼을 소환합니다! !!!"), "red"))
-             tx, ty = self._find_spawn_pos(pos.x, pos.y)
-             self.world.engine._spawn_monster_at(tx, ty, pool=["BUTCHER"])
-             return True
+    def _skill_petrify(self, boss_ent, rule, p_pos, dist, map_comp, nerf_factor):
+        """[LEORIC] 석화 마법 (이미 석화 중이면 대사만)"""
+        boss = boss_ent.get_component(BossComponent)
+        player = self.world.get_player_entity()
+        bark = self.patterns.get(boss.boss_id).get("on_skill_petrify")
+        if bark:
+            self._trigger_bark(boss_ent, bark)
+        
+        if not player.has_component(PetrifiedComponent):
+            self._announce_skill("굳어버려라!", "yellow") # Center Alert
+            player.add_component(PetrifiedComponent(duration=3.0))
+            self.event_manager.push(MessageEvent(_("!!! {}의 마법으로 전신이 석화되었습니다! !!!").format(boss.boss_id), "yellow"))
+            # 석화 시 이펙트
+            if hasattr(self.world.engine, 'trigger_shake'):
+                self.world.engine.trigger_shake(5)
+        return True
 
-        return False
+    def _skill_gaze(self, boss_ent, rule, p_pos, dist, map_comp, nerf_factor):
+        """[LICH_KING] 메두사의 시선: 석화 스택 추가/갱신"""
+        boss = boss_ent.get_component(BossComponent)
+        player = self.world.get_player_entity()
+        bark = self.patterns.get(boss.boss_id).get("on_skill_gaze")
+        if bark: self._trigger_bark(boss_ent, bark)
+        
+        # 플레이어에게 석화 컴포넌트 추가/갱신 (효과 표의 STACK 규칙: 스택 +1, 지속시간 갱신)
+        p_comp = player.get_component(PetrifiedComponent)
+        if p_comp and p_comp.stacks >= STATUS_BY_COMPONENT[PetrifiedComponent].max_stacks:
+            self.event_manager.push(MessageEvent(_("!!! 이미 완전히 석화된 상태입니다! !!!"), "gray"))
+            return True
+        p_comp = apply_status(player, PetrifiedComponent(duration=5.0, stacks=1))
+        if p_comp.stacks > 1:
+            self._announce_skill("죽음의 냉기...", "cyan")
+            self.event_manager.push(MessageEvent(_("!!! 리치 왕의 시선에 몸이 더욱 굳어갑니다! (석화 {}스택) !!!").format(p_comp.stacks), "gray"))
+        else:
+            self._announce_skill("죽음의 시선...", "cyan")
+            self.event_manager.push(MessageEvent(_("!!! 리치 왕의 시선이 당신을 굳게 만듭니다! (석화 1스택) !!!"), "gray"))
+        return True
 
-    def _process_lich_king_logic(self, boss_ent, p_pos, dist, map_comp):
-        """리치 왕의 특수 AI 로직: 메두사의 시선, 대지의 저주, 연계 소환"""
+    def _skill_curse(self, boss_ent, rule, p_pos, dist, map_comp, nerf_factor):
+        """[LICH_KING] 대지의 저주: 짧은 속박 (StunComponent)"""
         boss = boss_ent.get_component(BossComponent)
-        stats = boss_ent.get_component(StatsComponent)
-        pattern = self.patterns.get(boss.boss_id)
-        current_time = time.time()
+        player = self.world.get_player_entity()
+        bark = self.patterns.get(boss.boss_id).get("on_skill_curse")
+        if bark: self._trigger_bark(boss_ent, bark)
         
-        player = self.world.get_player_entity() 
-        if not player: return False
-
-        # HP 20% 이하 (분노 상태) -> 쿨다운 감소
-        hp_percent = stats.current_hp / stats.max_hp
-        is_enraged = hp_percent <= 0.2
-        cooldown_mod = 0.5 if is_enraged else 1.0
-
-        # [NEW] Lich King Summons Leoric Phantom (HP < 50%)
-        if hp_percent < 0.5 and not getattr(boss, 'summoned_phantom_leoric', False):
-             boss.summoned_phantom_leoric = True
-             self.event_manager.push(MessageEvent(_("!!! 리치 왕이 해골 왕 레오닉을 되살려냅니다! !!!"), "red"))
-             # Find spawn near Boss
-             pos = boss_ent.get_component(PositionComponent)
-             tx, ty = self._find_spawn_pos(pos.x, pos.y)
-             self.world.engine._spawn_monster_at(tx, ty, pool=["LEORIC"])
-             return True
-
-        # 1. 메두사의 시선 (석화 스택) - 사거리 8
-        gaze_cd = 16.0 * cooldown_mod
-        if dist <= 8 and random.random() < 0.2:
-            if current_time - getattr(boss, 'last_gaze_time', 0) > gaze_cd:
-                boss.last_gaze_time = current_time
-                bark = pattern.get("on_skill_gaze")
-                if bark: self._trigger_bark(boss_ent, bark)
-                
-                # 플레이어에게 석화 컴포넌트 추가/갱신
-                p_comp = player.get_component(PetrifiedComponent)
-                if p_comp:
-                    if p_comp.stacks < p_comp.max_stacks:
-                        p_comp.stacks += 1
-                        p_comp.duration = 5.0 # 지속시간 갱신
-                        self._announce_skill("죽음의 냉기...", "cyan")
-                        self.event_manager.push(MessageEvent(_("!!! 리치 왕의 시선에 몸이 더욱 굳어갑니다! (석화 {}스택) !!!").format(p_comp.stacks), "gray"))
-                    else:
-                        self.event_manager.push(MessageEvent(_("!!! 이미 완전히 석화된 상태입니다! !!!"), "gray"))
-                else:
-                    player.add_component(PetrifiedComponent(duration=5.0, stacks=1))
-                    self._announce_skill("죽음의 시선...", "cyan")
-                    self.event_manager.push(MessageEvent(_("!!! 리치 왕의 시선이 당신을 굳게 만듭니다! (석화 1스택) !!!"), "gray"))
-                
-                return True
+        if not player.has_component(StunComponent):
+            self._announce_skill("대지가 너를 삼키리라...", "brown")
+            player.add_component(StunComponent(duration=2.0))
+            self.event_manager.push(MessageEvent(_("!!! 대지의 저주가 당신의 발을 묶습니다! !!!"), "brown"))
+        return True
 
-        # 2. 대지의 저주 (Root/속박) - 사거리 10
-        curse_cd = 20.0 * cooldown_mod
-        if dist <= 10 and random.random() < 0.15:
-            from .components import StatModifierComponent
-            # 이동 불가 디버프 (여기서는 간단히 Action Delay를 매우 크게 늘리거나 Root 컴포넌트 사용)
-            if current_time - getattr(boss, 'last_curse_time', 0) > curse_cd:
-                boss.last_curse_time = current_time
-                bark = pattern.get("on_skill_curse")
-                if bark: self._trigger_bark(boss_ent, bark)
-                
-                # 'Root' 효과: 지속시간 동안 아무것도 못하거나 이동만 못함 using StunComponent is easiest for "Stop Movement"
-                if not player.has_component(StunComponent):
-                    self._announce_skill("대지가 너를 삼키리라...", "brown")
-                    player.add_component(StunComponent(duration=2.0))
-                    self.event_manager.push(MessageEvent(_("!!! 대지의 저주가 당신의 발을 묶습니다! !!!"), "brown"))
+    def _skill_haste_minions(self, boss_ent, rule, p_pos, dist, map_comp, nerf_factor):
+        """[DIABLO] 광폭화 중 소환된 몬스터들의 행동 속도를 계속 올림 (행동 소비 없음)"""
+        haste_delay = rule.params.get("action_delay", 0.3)
+        for m_ent in self.world.get_entities_with_components({MonsterComponent, StatsComponent}):
+            if m_ent.get_component(MonsterComponent).is_summoned: # 소환된 환영/졸개들
+                m_stats = m_ent.get_component(StatsComponent)
+                if getattr(m_stats, 'action_delay', 0.6) > haste_delay:
+                    m_stats.action_delay = haste_delay
+        return False
+
+    def _skill_dash(self, boss_ent, rule, p_pos, dist, map_comp, nerf_factor):
+        """[Dash] 돌진: 벽을 돌아 플레이어 쪽으로 한 칸 (경로는 보스별로 캐시)"""
+        boss = boss_ent.get_component(BossComponent)
+        pos = boss_ent.get_component(PositionComponent)
+        self._trigger_bark(boss_ent, "거기 서라!")
+        self.event_manager.push(MessageEvent(_("{}이(가) 당신을 향해 급격히 돌진합니다!").format(boss.boss_id), "red"))
+        step = self.path_cache.next_step(boss_ent.entity_id, map_comp, (pos.x, pos.y), (p_pos.x, p_pos.y))
+        if step:
+            dx, dy = step
+            if map_comp.tiles[pos.y + dy][pos.x + dx] == '.':
+                pos.x += dx
+                pos.y += dy
                 return True
-    
+        return False
 
-    def _process_diablo_logic(self, boss_ent, p_pos, dist, map_comp):
-        """디아블로 전용 로직: 광폭화 효과 지속 관리"""
+    def _skill_spin(self, boss_ent, rule, p_pos, dist, map_comp, nerf_factor):
+        """[AoE] 대회전: 주변 8방향 공격"""
         boss = boss_ent.get_component(BossComponent)
-        stats = boss_ent.get_component(StatsComponent)
-        
-        # Enrage Phase (HP <= 20%)
-        # 지속적으로 소환된 몬스터들의 속도를 증가시킴
-        if stats.current_hp <= stats.max_hp * 0.2:
-            # 맵 상의 모는 MonsterComponent를 가진 엔티티 검색
-            all_monsters = self.world.get_entities_with_components({MonsterComponent, StatsComponent})
-            for m_ent in all_monsters:
-                m_comp = m_ent.get_component(MonsterComponent)
-                if m_comp.is_summoned: # 소환된 환영/졸개들
-                    m_stats = m_ent.get_component(StatsComponent)
-                    if getattr(m_stats, 'action_delay', 0.6) > 0.3:
-                         m_stats.action_delay = 0.3
-
-        # [NEW] Boss Summoning (Phantom Bosses)
-        # Diablo summons previous bosses at specific HP thresholds
-        # 75% -> Butcher
-        # 50% -> Leoric
-        # 25% -> Lich King
-        hp_pct = stats.current_hp / stats.max_hp
-        summon_id = None
+        self._trigger_bark(boss_ent, "모두 사라져라!")
+        from .events import DirectionalAttackEvent
+        self.event_manager.push(MessageEvent(_("{}의 대회전 공격!").format(boss.boss_id), "red"))
+        if nerf_factor < 1.0:
+            self.event_manager.push(MessageEvent(_("환영의 일격이라 위력이 약합니다."), "gray"))
         
-        if hp_pct <= 0.75 and not getattr(boss, 'summoned_butcher', False):
-            boss.summoned_butcher = True
-            summon_id = "BUTCHER"
-            msg = "도살자의 영혼이여, 나를 섬겨라!"
-            
-        elif hp_pct <= 0.50 and not getattr(boss, 'summoned_leoric', False):
-            boss.summoned_leoric = True
-            summon_id = "LEORIC"
-            msg = "해골 왕이여, 다시 일어나라!"
-            
-        elif hp_pct <= 0.25 and not getattr(boss, 'summoned_lich', False):
-            boss.summoned_lich = True
-            summon_id = "LICH_KING"
-            msg = "리치 왕이여, 겨울을 불러오라!"
-
-        if summon_id:
-            msg_event = f"[{boss.boss_id}] \"{msg}\""
-            self.event_manager.push(MessageEvent(msg_event, "red"))
-            
-            # Spawn the Boss Phantom
-            # Use _spawn_monster_at but we need to find a valid pos
-            tx, ty = self._find_spawn_pos(boss_ent.get_component(PositionComponent).x, boss_ent.get_component(PositionComponent).y)
-            if self.world.engine._spawn_monster_at(tx, ty, pool=[summon_id]):
-                self.event_manager.push(MessageEvent(_("!!! 디아블로가 {}의 환영을 소환했습니다! !!!").format(summon_id), "red"))
-                # [Balance] Phantoms should probably be weaker? Or Full Power?
-                # User asked "Summon ghosts of previous bosses".
-                # Let's keep them as normal spawns for maximum chaos.
-                # Mark them as summoned so Enrage buffs them
-                
-        return False
+        for ddy in [-1, 0, 1]:
+            for ddx in [-1, 0, 1]:
+                if ddx == 0 and ddy == 0: continue
+                self.event_manager.push(DirectionalAttackEvent(boss_ent.entity_id, ddx, ddy, range_dist=1))
+        return True
 
     def _apply_manual_knockback(self, attacker, target, map_comp):
         """AI 로직 내에서 간단한 넉백 적용"""
@@ -4036,13 +4144,14 @@ class BossSystem(System):
         if not boss: return
 
         # 쿨다운 체크
-        current_time = time.time()
+        current_time = self.world.clock.now()
         if not bypass_cooldown and hasattr(boss, 'last_bark_time'):
             if current_time - boss.last_bark_time < self.BARK_COOLDOWN:
                 return # 쿨다운 중이면 무시
         
+        # 타이핑/표시 상태는 렌더링 시 bark_started_at으로부터 계산 (BossComponent.bark_at)
         boss.active_bark = text
-        boss.visible_bark = ""
+        boss.bark_started_at = current_time
         boss.bark_display_timer = duration
         boss.last_bark_time = current_time
         # 로그에도 남김
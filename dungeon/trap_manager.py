@@ -13,6 +13,7 @@ from .components import (
     LevelComponent
 )
 from .events import MessageEvent, SoundEvent
+from .status_effects import apply_status
 
 
 class TrapDefinition:
@@ -135,21 +136,16 @@ class TrapSystem(System):
                         self.event_manager.push(MessageEvent(f"⚠️ 근처에서 함정의 기운이 느껴집니다! ({trap.trap_type})", "cyan"))
 
         # 1. STEP_ON 함정 처리 (기존 로직)
-        for entity in list(entities):
-            e_pos = entity.get_component(PositionComponent)
+        # [Fix] 몬스터는 스스로 발동하지 않음 (플레이어만 발동) - 플레이어 위치의 함정만 확인
+        if player.has_component(StatsComponent):
             for trap_ent in traps:
                 t_pos = trap_ent.get_component(PositionComponent)
                 trap = trap_ent.get_component(TrapComponent)
                 
-                # 같은 위치이고 아직 발동되지 않은 함정
                 # 같은 위치이고 아직 발동되지 않은 함정
                 if trap.trigger_type == "STEP_ON" and not trap.is_triggered:
-                    if e_pos.x == t_pos.x and e_pos.y == t_pos.y:
-                        # [Fix] 몬스터는 스스로 발동하지 않음 (플레이어만 발동)
-                        if entity.entity_id != player.entity_id:
-                            continue
-                            
-                        self.trigger_trap(entity, trap_ent)
+                    if player_pos.x == t_pos.x and player_pos.y == t_pos.y:
+                        self.trigger_trap(player, trap_ent)
         
         # 2. PROXIMITY 함정 처리 (벽 함정)
         for trap_ent in traps:
@@ -158,9 +154,8 @@ class TrapSystem(System):
                 t_pos = trap_ent.get_component(PositionComponent)
                 
                 # 플레이어 및 몬스터 모두 감지 대상에 포함
-                candidates = self.world.get_entities_with_components({PositionComponent, StatsComponent})
-                
-                for candidate in candidates:
+                for candidate in entities:
+                    if self.world.get_entity(candidate.entity_id) is not candidate: continue # 앞선 함정에 죽은 대상
                     c_pos = candidate.get_component(PositionComponent)
                     dist = abs(c_pos.x - t_pos.x) + abs(c_pos.y - t_pos.y)
                     
@@ -170,8 +165,7 @@ class TrapSystem(System):
                         break # 한 번 발동하면 루프 종료
         
         # 3. 자동 리셋 함정 처리 (압력판 등)
-        import time
-        current_time = time.time()
+        current_time = self.world.clock.now()
         for trap_ent in traps:
             trap = trap_ent.get_component(TrapComponent)
             if trap.is_triggered and trap.auto_reset:
@@ -190,10 +184,9 @@ class TrapSystem(System):
         trap_def = self.trap_defs.get(trap.trap_type)
         
         # 함정 발동 표시
-        import time
         trap.is_triggered = True
         trap.visible = True
-        trap.last_trigger_time = time.time()
+        trap.last_trigger_time = self.world.clock.now()
         
         # 사운드 및 메시지
         self.event_manager.push(SoundEvent("BASH", f"철컥! 함정이 발동되었습니다! ({trap.trap_type})"))
@@ -286,7 +279,7 @@ class TrapSystem(System):
         
         # 상태 이상 적용
         if trap.effect == "STUN":
-            victim.add_component(StunComponent(duration=2.0))
+            apply_status(victim, StunComponent(duration=2.0))
             self.event_manager.push(MessageEvent(f"{victim_name}이(가) 기절했습니다!", "yellow"))
         elif trap.effect == "POISON":
             if not victim.has_component(PoisonComponent):
@@ -335,15 +328,13 @@ class TrapSystem(System):
 
     def _fire_projectile(self, trap_ent, target, damage_multiplier: float = 1.0):
         """벽 함정에서 발사체 발사 (데미지 배율 지원)"""
-        import time
-        
         trap = trap_ent.get_component(TrapComponent)
         t_pos = trap_ent.get_component(PositionComponent)
         target_pos = target.get_component(PositionComponent)
         
         # 함정 발동 표시
         trap.is_triggered = True
-        trap.last_trigger_time = time.time()
+        trap.last_trigger_time = self.world.clock.now()
         
         # 사운드 및 메시지
         self.event_manager.push(SoundEvent("BASH", f"벽에서 발사체가 날아옵니다!"))
@@ -388,8 +379,7 @@ class TrapSystem(System):
             
             # 즉시 렌더링 (애니메이션 효과)
             if hasattr(self.world, 'engine'):
-                self.world.engine._render()
-                time.sleep(0.05)
+                self._animate(0.05)
             
             # 엔티티와 충돌 체크
             entities = self.world.get_entities_with_components({PositionComponent, StatsComponent})
@@ -417,7 +407,7 @@ class TrapSystem(System):
                     
                     # 상태 이상 적용
                     if trap.effect == "STUN":
-                        entity.add_component(StunComponent(duration=1.0))
+                        apply_status(entity, StunComponent(duration=1.0))
                         self.event_manager.push(MessageEvent(f"{victim_name}이(가) 기절했습니다!", "yellow"))
                     
                     # 시각적 피드백
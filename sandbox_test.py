@@ -122,8 +122,8 @@ class SandboxEngine(engine.Engine):
                         item.current_durability = item.max_durability
             print("[Sandbox] Set Player to Level 99 and Max Stats for stable testing.")
 
-    def _spawn_monster_at(self, x, y, monster_def=None, pool=None):
-        monster = super()._spawn_monster_at(x, y, monster_def, pool)
+    def _create_monster(self, x, y, spawn):
+        monster = super()._create_monster(x, y, spawn)
         if monster:
              ai = monster.get_component(AIComponent)
              if ai:
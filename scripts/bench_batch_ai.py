@@ -0,0 +1,80 @@
+"""
+대규모 무리 AI 벤치마크.
+
+100x80 동굴 맵에서 플레이어에게 도달 가능한 바닥에 평범한 근접 추적 몬스터를 대량(기본 1,000마리) 배치하고
+MonsterAISystem.process의 틱당 시간을 스칼라 경로와 NumPy 일괄 경로(use_batch_ai)로 비교합니다.
+모든 몬스터의 action_delay를 0으로 두어 매 틱 전원이 행동하는 최악의 경우를 측정합니다.
+
+--budget-ms를 주면 MonsterAISystem 프레임 예산을 걸고 틱당 이월된 몬스터 수를 함께 봅니다.
+
+Usage: python scripts/bench_batch_ai.py [--monsters 1000] [--ticks 30] [--seed 1234] [--width 100] [--height 80] [--budget-ms 20]
+"""
+import argparse
+import logging
+import os
+import statistics
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from bench_chase import setup
+from dungeon.batch_ai import batch_available
+from dungeon.components import DesiredPositionComponent, MonsterComponent, StatsComponent
+from dungeon.scheduler import FrameBudget
+from dungeon.systems import MonsterAISystem, MovementSystem
+
+
+def measure(use_batch: bool, seed: int, monsters: int, ticks: int, size, budget_ms=None):
+    engine, _field = setup(seed, monsters, size)
+    world = engine.world
+    ai_sys = world.get_system(MonsterAISystem)
+    ai_sys.use_batch_ai = use_batch
+    # 기본은 프레임 예산 없이 전원 처리 (최악의 경우 측정)
+    ai_sys.budget = FrameBudget(budget_ms)
+    move_sys = world.get_system(MovementSystem)
+    player = world.get_player_entity()
+    p_stats = player.get_component(StatsComponent)
+
+    count = len(world.get_entities_with_components({MonsterComponent}))
+    tick_ms = []
+    moves = 0
+    deferred = 0
+    for _ in range(ticks):
+        p_stats.current_hp = p_stats.max_hp
+        start = time.perf_counter()
+        ai_sys.process()
+        tick_ms.append((time.perf_counter() - start) * 1000)
+        moves += len(world.get_entities_with_components({DesiredPositionComponent}))
+        deferred += ai_sys.last_budget_report["deferred"]
+        move_sys.process()
+        world.event_manager.event_queue.clear()
+    return count, tick_ms, moves / ticks, deferred / ticks
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--monsters", type=int, default=1000)
+    parser.add_argument("--ticks", type=int, default=30)
+    parser.add_argument("--seed", type=int, default=1234)
+    parser.add_argument("--width", type=int, default=100)
+    parser.add_argument("--height", type=int, default=80)
+    parser.add_argument("--budget-ms", type=float, default=None, help="MonsterAISystem 프레임 예산 (ms)")
+    args = parser.parse_args()
+    logging.disable(logging.CRITICAL)
+
+    modes = [("scalar", False)]
+    if batch_available():
+        modes.append(("batch", True))
+    else:
+        print("NumPy not installed: batch mode skipped")
+
+    print(f"{'mode':<8}{'monsters':>10}{'ms/tick':>10}{'max ms':>10}{'moves/tick':>12}{'deferred':>10}")
+    for name, use_batch in modes:
+        count, tick_ms, moves, deferred = measure(use_batch, args.seed, args.monsters, args.ticks,
+                                                  (args.width, args.height), args.budget_ms)
+        print(f"{name:<8}{count:>10}{statistics.mean(tick_ms):>10.2f}{max(tick_ms):>10.2f}{moves:>12.1f}{deferred:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
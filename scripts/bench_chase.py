@@ -0,0 +1,139 @@
+"""
+추적 AI 벤치마크.
+
+플레이어 주변에 추적(CHASE) 몬스터를 대량 배치하고 MonsterAISystem.process의 틱당 시간과 경로 품질을 측정합니다.
+  - greedy : 기존 축 미끄러짐 방식
+  - flow   : 플레이어 기준 공유 Dijkstra 거리장 방식
+경로 품질은 남은 실제 걸음 수 평균, 플레이어에 인접한 몬스터 수, 이동하지 못한(막힌) 결정 수로 비교합니다.
+
+Usage: python scripts/bench_chase.py [--chasers 200] [--ticks 60] [--seed 1234]
+"""
+import argparse
+import logging
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from dungeon.balance_simulator import HeadlessEngine
+from dungeon.components import (
+    AIComponent, DesiredPositionComponent, MapComponent, MonsterComponent, PositionComponent, RenderComponent, StatsComponent
+)
+from dungeon.map import DungeonMap
+from dungeon.pathfinding import DistanceField, UNREACHED
+from dungeon.scheduler import FrameBudget
+from dungeon.systems import MonsterAISystem, MovementSystem
+
+
+def setup(seed: int, chasers: int, size=None):
+    engine = HeadlessEngine("Bench", seed=seed)
+    engine.floor_prefetcher.shutdown()
+    world = engine.world
+    for ent in list(world.get_entities_with_components({MonsterComponent})):
+        world.delete_entity(ent.entity_id)
+
+    player = world.get_player_entity()
+    p_pos = player.get_component(PositionComponent)
+    mc = world.get_entities_with_components({MapComponent})[0].get_component(MapComponent)
+    if size:
+        # 기본 층(60x40)보다 큰 무리가 필요하면 지정 크기의 동굴 맵으로 교체
+        dm = DungeonMap(size[0], size[1], random.Random(seed), map_type="CAVE")
+        engine.dungeon_map = dm
+        mc.width, mc.height, mc.tiles = dm.width, dm.height, dm.map_data
+        mc.version += 1
+        p_pos.x, p_pos.y = dm.start_x, dm.start_y
+
+    # 플레이어에게서 도달 가능한 바닥 타일에만 배치
+    field = DistanceField(max_distance=mc.width * mc.height)
+    field.update(mc, (p_pos.x, p_pos.y))
+    tiles = [(x, y) for y in range(mc.height) for x in range(mc.width)
+             if field.distance_at(x, y) > 1]
+    random.Random(seed).shuffle(tiles)
+    for x, y in tiles[:chasers]:
+        ent = world.create_entity()
+        world.add_component(ent.entity_id, PositionComponent(x, y))
+        world.add_component(ent.entity_id, MonsterComponent("BenchChaser"))
+        world.add_component(ent.entity_id, AIComponent(behavior=AIComponent.CHASE, detection_range=999))
+        world.add_component(ent.entity_id, RenderComponent('g', 'green'))
+        stats = StatsComponent(max_hp=10, current_hp=10, attack=0, defense=0)
+        stats.action_delay = 0
+        world.add_component(ent.entity_id, stats)
+
+    ai_sys = world.get_system(MonsterAISystem)
+    ai_sys.max_chase_range = mc.width + mc.height # 맵 전체를 추적 범위로
+    ai_sys.chase_field.max_distance = mc.width * mc.height
+    return engine, field
+
+
+def measure(use_flow: bool, seed: int, chasers: int, ticks: int):
+    engine, field = setup(seed, chasers)
+    world = engine.world
+    ai_sys = world.get_system(MonsterAISystem)
+    ai_sys.use_flow_field = use_flow
+    ai_sys.budget = FrameBudget() # 프레임 예산 없이 전원 처리 (최악의 경우 측정)
+    move_sys = world.get_system(MovementSystem)
+    player = world.get_player_entity()
+    p_stats = player.get_component(StatsComponent)
+
+    p_pos = player.get_component(PositionComponent)
+    mc = world.get_entities_with_components({MapComponent})[0].get_component(MapComponent)
+
+    tick_ms = []
+    step_us = []
+    stuck = 0
+    for _ in range(ticks):
+        p_stats.current_hp = p_stats.max_hp
+        start = time.perf_counter()
+        ai_sys.process()
+        tick_ms.append((time.perf_counter() - start) * 1000)
+
+        # 경로 결정 비용만 따로 측정 (틱 전체에는 타겟 선정, 경보 전파 등이 함께 포함됨)
+        chasers = [e.get_component(PositionComponent) for e in world.get_entities_with_components({MonsterComponent, PositionComponent})]
+        start = time.perf_counter()
+        if use_flow:
+            ai_sys.chase_field.update(mc, (p_pos.x, p_pos.y))
+            for pos in chasers:
+                ai_sys.chase_field.downhill_step(pos.x, pos.y)
+        else:
+            for pos in chasers:
+                ai_sys._greedy_step(mc, pos.x, pos.y, p_pos.x, p_pos.y)
+        step_us.append((time.perf_counter() - start) * 1e6 / max(1, len(chasers)))
+
+        for ent in world.get_entities_with_components({MonsterComponent, PositionComponent}):
+            pos = ent.get_component(PositionComponent)
+            if field.distance_at(pos.x, pos.y) > 1 and not ent.has_component(DesiredPositionComponent):
+                stuck += 1
+        move_sys.process()
+        world.event_manager.event_queue.clear()
+
+    remaining = []
+    adjacent = 0
+    for ent in world.get_entities_with_components({MonsterComponent, PositionComponent}):
+        pos = ent.get_component(PositionComponent)
+        d = field.distance_at(pos.x, pos.y)
+        if d != UNREACHED:
+            remaining.append(d)
+            adjacent += d == 1
+    return tick_ms, statistics.mean(step_us), statistics.mean(remaining), adjacent, stuck
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--chasers", type=int, default=200)
+    parser.add_argument("--ticks", type=int, default=60)
+    parser.add_argument("--seed", type=int, default=1234)
+    args = parser.parse_args()
+    logging.disable(logging.CRITICAL)
+
+    print(f"{args.chasers} chasers, {args.ticks} ticks")
+    print(f"{'mode':<8}{'ms/tick':>10}{'max ms':>10}{'us/step':>10}{'avg steps left':>16}{'adjacent':>10}{'stuck':>8}")
+    for name, use_flow in (("greedy", False), ("flow", True)):
+        tick_ms, step, left, adjacent, stuck = measure(use_flow, args.seed, args.chasers, args.ticks)
+        print(f"{name:<8}{statistics.mean(tick_ms):>10.2f}{max(tick_ms):>10.2f}{step:>10.2f}{left:>16.1f}{adjacent:>10}{stuck:>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+층 이동 멈춤(stall) 벤치마크.
+
+층 이동 전체(handle_map_transition_event: 월드 정리, 맵 준비, 엔티티 배치, 플레이어 복원)에
+걸리는 시간을 두 가지 방식으로 측정합니다.
+  - sync     : 백그라운드 선생성 없이 계단을 밟는 순간 맵 생성과 배치 계획을 수행
+  - prefetch : 현재 층 탐험 중 다음 층 맵과 배치 계획을 미리 만들어 두고 엔티티 생성만 수행
+또한 같은 시드에서 두 방식의 층(맵 구조와 엔티티 배치)이 동일한지 확인합니다.
+
+Usage: python scripts/bench_floor_transition.py [--floors N]
+"""
+import argparse
+import logging
+import os
+import statistics
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from dungeon.balance_simulator import HeadlessEngine
+from dungeon.components import PositionComponent, MonsterComponent, TrapComponent, ChestComponent
+from dungeon.events import MapTransitionEvent
+
+
+def floor_snapshot(engine):
+    """맵 구조와 몬스터/함정/상자의 종류와 위치"""
+    placed = []
+    for comp_type in (MonsterComponent, TrapComponent, ChestComponent):
+        for ent in engine.world.get_entities_with_components({comp_type, PositionComponent}):
+            pos = ent.get_component(PositionComponent)
+            comp = ent.get_component(comp_type)
+            placed.append((comp_type.__name__, getattr(comp, 'type_name', getattr(comp, 'trap_type', '')), pos.x, pos.y))
+    return engine.dungeon_map.map_data, placed
+
+
+def measure(prefetch: bool, floors: int, seed: int):
+    engine = HeadlessEngine("Bench", seed=seed)
+    engine.prefetch_enabled = prefetch
+    if not prefetch:
+        engine.floor_prefetcher.shutdown() # 생성자에서 예약된 선생성 작업 폐기
+    stalls = []
+    floors_seen = []
+    for _ in range(floors):
+        if prefetch:
+            # 플레이어가 층을 탐험하는 시간 동안 워커가 생성을 마친다고 가정
+            engine._prefetch_next_floor()
+            _cfg, w, h, mt = engine._get_floor_layout(engine.current_level + 1)
+            key = (engine.current_level + 1, engine._get_floor_seed(engine.current_level + 1), w, h, mt)
+            while not engine.floor_prefetcher.is_ready(key):
+                time.sleep(0.001)
+        start = time.perf_counter()
+        engine.handle_map_transition_event(MapTransitionEvent(target_level=engine.current_level + 1))
+        stalls.append((time.perf_counter() - start) * 1000)
+        floors_seen.append(floor_snapshot(engine))
+    engine.floor_prefetcher.shutdown()
+    return stalls, floors_seen
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--floors", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=1234)
+    args = parser.parse_args()
+    logging.disable(logging.CRITICAL)
+
+    sync_stalls, sync_floors = measure(False, args.floors, args.seed)
+    pre_stalls, pre_floors = measure(True, args.floors, args.seed)
+
+    print(f"Floor transition stall over {args.floors} floors (ms)")
+    print(f"{'mode':<10}{'mean':>10}{'median':>10}{'max':>10}")
+    for name, data in (("sync", sync_stalls), ("prefetch", pre_stalls)):
+        print(f"{name:<10}{statistics.mean(data):>10.2f}{statistics.median(data):>10.2f}{max(data):>10.2f}")
+    print(f"Identical floors: {sync_floors == pre_floors}")
+
+
+if __name__ == "__main__":
+    main()
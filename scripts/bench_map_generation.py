@@ -0,0 +1,49 @@
+"""
+맵 생성 시간 벤치마크.
+
+NORMAL / BSP / CAVE 생성기의 생성 시간을 여러 맵 크기에서 측정합니다.
+타일 1,000개당 시간이 크기와 무관하게 비슷하면 면적에 선형으로 동작하는 것입니다.
+
+Usage: python scripts/bench_map_generation.py [--repeat N] [--types NORMAL,BSP,CAVE]
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from dungeon.map import DungeonMap
+
+SIZES = [(60, 40), (100, 80), (200, 200), (300, 300), (500, 500)]
+
+
+def bench(map_type: str, width: int, height: int, repeat: int):
+    times = []
+    rooms = 0
+    for i in range(repeat):
+        start = time.perf_counter()
+        dm = DungeonMap(width, height, random.Random(i), map_type=map_type)
+        times.append((time.perf_counter() - start) * 1000)
+        rooms = len(dm.rooms)
+    return statistics.median(times), rooms
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--types", default="NORMAL,BSP,CAVE")
+    args = parser.parse_args()
+
+    print(f"{'type':<8}{'size':>10}{'rooms':>8}{'median ms':>12}{'ms/1k tiles':>14}")
+    for map_type in args.types.split(","):
+        for width, height in SIZES:
+            ms, rooms = bench(map_type, width, height, args.repeat)
+            per_k = ms / (width * height / 1000)
+            print(f"{map_type:<8}{f'{width}x{height}':>10}{rooms:>8}{ms:>12.2f}{per_k:>14.3f}")
+
+
+if __name__ == "__main__":
+    main()
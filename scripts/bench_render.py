@@ -0,0 +1,104 @@
+"""
+터미널 렌더러 출력량 벤치마크.
+
+헤드리스 엔진으로 보스전을 진행하면서 매 프레임 실제 게임 화면(Engine._render)을 Renderer에 그리고,
+프레임당 출력 바이트(UTF-8)를 세 가지 방식으로 비교합니다.
+  cells : 전체 화면, 칸마다 색상 코드 + 초기화 (이전 방식)
+  full  : 전체 화면, 색상이 바뀌는 곳에만 색상 코드
+  diff  : 직전 프레임과 달라진 칸만 (실제 출력)
+출력은 터미널 대신 메모리 스트림에 씁니다.
+
+Usage: python scripts/bench_render.py [--seed 1234] [--frames 600] [--boss BUTCHER] [--class WARRIOR]
+"""
+import argparse
+import contextlib
+import io
+import logging
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from dungeon.balance_simulator import HeadlessEngine, setup_player_for_test
+from dungeon.components import MonsterComponent, PositionComponent
+from dungeon.engine import Engine, GameState
+from dungeon.renderer import RESET, Renderer
+
+FRAME_TIME = 0.05   # 20 FPS
+TURN_FRAMES = 5     # 에이전트는 5프레임(0.25초)마다 한 번 행동
+
+
+class MeasuredRenderer(Renderer):
+    """실제 출력(변경된 칸만)과 함께, 같은 프레임을 전체 다시 그렸을 때의 바이트 수를 기록"""
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.cell_bytes = 0
+        self.full_bytes = 0
+
+    def render(self):
+        rows = []
+        for chars, colors in zip(self.chars, self.colors):
+            rows.append("".join(char if color == RESET or not char else f"{color}{char}{RESET}"
+                                for char, color in zip(chars, colors)))
+        self.cell_bytes += len(("\033[H" + "\n".join(rows)).encode("utf-8"))
+        full = "\033[H" + "\n".join(self._row_text(y, 0, self.width) for y in range(self.height))
+        self.full_bytes += len(full.encode("utf-8"))
+        super().render()
+
+
+def run(seed: int, frames: int, boss: str, class_id: str, width: int, height: int):
+    random.seed(seed)
+    engine = HeadlessEngine()
+    engine.current_level = 20
+    engine._initialize_world()
+    engine.dungeon_map.map_type = "BOSS"
+    cx, cy = engine.dungeon_map.width // 2, engine.dungeon_map.height // 2
+    monsters = engine.world.get_entities_with_components({MonsterComponent})
+    if not any(m.get_component(MonsterComponent).monster_id == boss for m in monsters):
+        engine._spawn_boss(cx + 5, cy, pool=[], boss_name=boss)
+    setup_player_for_test(engine, 20, 20, class_id)
+    p_pos = engine.world.get_player_entity().get_component(PositionComponent)
+    p_pos.x, p_pos.y = cx, cy
+    engine.renderer = MeasuredRenderer(width, height, stream=io.StringIO())
+
+    render_time = 0.0
+    for frame in range(frames):
+        engine.world.clock.advance(FRAME_TIME)
+        if engine.state == GameState.PLAYING and frame % TURN_FRAMES == 0:
+            action = engine._get_smart_agent_action()
+            if action:
+                engine.input_system.handle_input(action)
+        if engine._logic_tick():
+            break
+        start = time.perf_counter()
+        Engine._render(engine) # HeadlessEngine은 렌더링을 건너뛰므로 원래 구현을 직접 호출
+        render_time += time.perf_counter() - start
+    return engine.renderer, render_time
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--seed", type=int, default=1234)
+    parser.add_argument("--frames", type=int, default=600)
+    parser.add_argument("--boss", default="BUTCHER")
+    parser.add_argument("--class", dest="class_id", default="WARRIOR")
+    parser.add_argument("--width", type=int, default=120)
+    parser.add_argument("--height", type=int, default=40)
+    args = parser.parse_args()
+    logging.disable(logging.CRITICAL)
+
+    # 전투 로그(print)는 버림
+    with contextlib.redirect_stdout(io.StringIO()):
+        renderer, render_time = run(args.seed, args.frames, args.boss, args.class_id, args.width, args.height)
+    stats = renderer.stats
+    frames = stats["frames"]
+    print(f"frames {frames}, full redraws {stats['full_redraws']}, render {render_time / frames * 1000:.2f} ms/frame")
+    print(f"{'mode':<8}{'bytes/frame':>14}{'total KB':>12}{'vs cells':>10}")
+    for name, total in (("cells", renderer.cell_bytes), ("full", renderer.full_bytes), ("diff", stats["total_bytes"])):
+        print(f"{name:<8}{total / frames:>14.0f}{total / 1024:>12.0f}{renderer.cell_bytes / total:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
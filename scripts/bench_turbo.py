@@ -0,0 +1,90 @@
+"""
+헤드리스 터보 모드 벤치마크.
+
+balance_simulator의 보스전 시나리오(보스 x 직업)를 같은 시드로 터보 모드 끄고/켜고 실행해
+벽시계 1초당 진행한 게임 시간(sim s / wall s)과 결과 분포를 비교합니다.
+터보 모드는 렌더링/연출 대기/메시지 출력/사운드/AI 프레임 예산을 건너뛰고,
+플레이어가 행동할 수 없는 구간은 다음 예약 시각으로 바로 넘어가며, 할 일이 없는 시스템은 건너뜁니다.
+시드를 엔진에도 넘기므로 두 모드가 같은 층에서 같은 싸움을 합니다.
+
+목표: 같은 시드에서 결과 분포를 바꾸지 않고 일반 모드보다 sim/wall 기준 10배 이상 빠를 것 (아직 달성하지 못함).
+측정값 (seed 1234, 4개 직업 x 4개 보스): 일반 510, 터보 683 sim s/wall s로 약 1.3배입니다 (WARRIOR만: 약 1.5배).
+걸림돌: 보스전은 에이전트가 매 턴(1초) 행동하므로 건너뛸 빈 구간이 거의 없고, 매 턴 수십 마리가 추적 중이라
+행동 예약이 도래한 몬스터의 AI/이동을 처리해야 합니다. AI 비용을 0으로 만들어도 나머지 턴당 비용
+(이동, 이벤트, 에이전트 판단, 함정, 회복) 때문에 이 시나리오의 상한은 약 3.6배입니다.
+
+Usage: python scripts/bench_turbo.py [--seed 1234] [--classes WARRIOR,ROGUE,SORCERER,BARBARIAN]
+"""
+import argparse
+import contextlib
+import io
+import logging
+import os
+import random
+import sys
+import time
+from collections import Counter
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from dungeon.balance_simulator import HeadlessEngine, setup_player_for_test
+from dungeon.components import MonsterComponent, PositionComponent
+
+BOSSES = [("BUTCHER", 20), ("LEORIC", 25), ("LICH_KING", 28), ("DIABLO", 30)]
+TARGET_SPEEDUP = 10.0 # 터보 모드 목표 (sim/wall 기준, 일반 모드 대비)
+
+
+def run_fight(boss: str, floor: int, class_id: str, turbo: bool, seed: int):
+    random.seed(seed)
+    engine = HeadlessEngine(seed=seed, turbo=turbo)
+    engine.current_level = floor
+    engine._initialize_world()
+    engine.dungeon_map.map_type = "BOSS"
+    cx, cy = engine.dungeon_map.width // 2, engine.dungeon_map.height // 2
+    monsters = engine.world.get_entities_with_components({MonsterComponent})
+    if not any(m.get_component(MonsterComponent).monster_id == boss for m in monsters):
+        engine._spawn_boss(cx + 5, cy, pool=[], boss_name=boss)
+    setup_player_for_test(engine, floor, floor, class_id)
+    p_pos = engine.world.get_player_entity().get_component(PositionComponent)
+    p_pos.x, p_pos.y = cx, cy
+
+    start = time.perf_counter()
+    outcome = engine.run()
+    wall = time.perf_counter() - start
+    return outcome, engine.metrics.get("sim_seconds", 0.0), wall
+
+
+def measure(turbo: bool, classes, seed: int):
+    sim = wall = 0.0
+    outcomes = Counter()
+    for i, (boss, floor) in enumerate(BOSSES):
+        for class_id in classes:
+            # 전투 로그(print)는 버림
+            with contextlib.redirect_stdout(io.StringIO()):
+                outcome, s, w = run_fight(boss, floor, class_id, turbo, seed + i)
+            sim += s
+            wall += w
+            outcomes[outcome] += 1
+    return sim, wall, outcomes
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--seed", type=int, default=1234)
+    parser.add_argument("--classes", default="WARRIOR,ROGUE,SORCERER,BARBARIAN")
+    args = parser.parse_args()
+    logging.disable(logging.CRITICAL)
+    classes = args.classes.split(",")
+
+    print(f"{'mode':<8}{'sim s':>10}{'wall s':>10}{'sim/wall':>10}  outcomes")
+    rates = {}
+    for name, turbo in (("normal", False), ("turbo", True)):
+        sim, wall, outcomes = measure(turbo, classes, args.seed)
+        rates[name] = sim / wall
+        print(f"{name:<8}{sim:>10.0f}{wall:>10.2f}{rates[name]:>10.0f}  {dict(outcomes)}")
+    speedup = rates["turbo"] / rates["normal"]
+    print(f"Turbo speed-up: {speedup:.2f}x (target {TARGET_SPEEDUP:.0f}x: {'met' if speedup >= TARGET_SPEEDUP else 'NOT met'})")
+
+
+if __name__ == "__main__":
+    main()
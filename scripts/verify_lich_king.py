@@ -14,6 +14,7 @@ from dungeon.components import (
     PetrifiedComponent, StunComponent, MapComponent
 )
 from dungeon.constants import BOSS_SEQUENCE
+from dungeon.clock import RealClock
 
 class MockWorld:
     def __init__(self):
@@ -22,6 +23,7 @@ class MockWorld:
         self._systems = []
         self.event_manager = MockEventManager()
         self.engine = MockEngine(self)
+        self.clock = RealClock()
 
     def create_entity(self):
         ent = MockEntity(self.next_entity_id)
@@ -46,7 +46,7 @@ def run_boss_tests(iterations=10):
             sys.stdout.flush()
             
             for i in range(iterations):
-                engine = HeadlessEngine()
+                engine = HeadlessEngine(turbo=True)
                 engine.current_level = floor
                 
                 # 1. Initialize World
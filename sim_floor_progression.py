@@ -44,7 +44,7 @@ def simulate_progression():
             total_turns = 0
             
             for _ in range(iterations):
-                engine = HeadlessEngine()
+                engine = HeadlessEngine(turbo=True)
                 engine.current_level = floor
                 engine._initialize_world()
                 
@@ -0,0 +1,115 @@
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+from dungeon.boss_patterns import compile_boss_patterns
+from dungeon.data_manager import load_boss_patterns
+from dungeon.components import BossComponent, MapComponent, PositionComponent, StatsComponent
+from dungeon.config import BOSS_BARK_CHARS_PER_SEC
+from dungeon.ecs import World
+from dungeon.events import DirectionalAttackEvent
+from dungeon.systems import BossSystem
+
+
+def _boss_world(patterns):
+    world = World(SimpleNamespace(boss_patterns=patterns))
+    tiles = [list("#######")] + [list("#.....#") for _ in range(5)] + [list("#######")]
+    player = world.create_entity()
+    world.add_component(player.entity_id, PositionComponent(3, 3))
+    world.add_component(player.entity_id, StatsComponent(max_hp=100, current_hp=100, attack=1, defense=0))
+    map_ent = world.create_entity()
+    world.add_component(map_ent.entity_id, MapComponent(7, 7, tiles))
+    boss = world.create_entity()
+    world.add_component(boss.entity_id, PositionComponent(4, 3))
+    world.add_component(boss.entity_id, StatsComponent(max_hp=100, current_hp=100, attack=5, defense=0))
+    world.add_component(boss.entity_id, BossComponent("NEW_BOSS"))
+    return world, boss
+
+
+class TestBossPatternCompiler(unittest.TestCase):
+    def test_triggers_sorted_and_fired_once(self):
+        program = compile_boss_patterns(load_boss_patterns())["LICH_KING"]
+        thresholds = [t.threshold for t in program.triggers]
+        self.assertEqual(thresholds, sorted(thresholds, reverse=True))
+
+        boss = BossComponent("LICH_KING")
+        self.assertEqual(program.crossed(boss, 0.9), [])
+        fired = [t.key for t in program.crossed(boss, 0.4)]
+        self.assertIn("phase_1", fired)
+        self.assertIn("phantom_LEORIC", fired)
+        self.assertNotIn("phase_2", fired)
+        # 같은 임계값은 다시 발동하지 않음
+        self.assertEqual(program.crossed(boss, 0.4), [])
+        self.assertEqual([t.key for t in program.crossed(boss, 0.1)], ["0.33", "0.2", "phase_2"])
+
+    def test_one_phase_per_tick_and_strict_threshold(self):
+        program = compile_boss_patterns(load_boss_patterns())["LEORIC"]
+        # 두 페이즈를 한 번에 넘어도 한 틱에 하나씩 (다른 트리거는 그대로 한 번에)
+        boss = BossComponent("LEORIC")
+        fired = [t.key for t in program.crossed(boss, 0.1)]
+        self.assertIn("phase_1", fired)
+        self.assertIn("smite_10", fired)
+        self.assertNotIn("phase_2", fired)
+        self.assertEqual([t.key for t in program.crossed(boss, 0.1)], ["phase_2"])
+        self.assertEqual(program.crossed(boss, 0.1), [])
+        # 환영 소환은 HP 50% '미만'부터
+        boss = BossComponent("LEORIC")
+        self.assertNotIn("phantom_BUTCHER", [t.key for t in program.crossed(boss, 0.5)])
+        self.assertEqual([t.key for t in program.crossed(boss, 0.49)], ["phantom_BUTCHER"])
+
+    def test_json_skills_compiled_and_unknown_dropped(self):
+        patterns = {"NEW_BOSS": {"skills": [{"skill": "SPIN", "max_dist": 2}, {"skill": "NO_SUCH_SKILL"}]}}
+        with self.assertLogs(level="WARNING"):
+            program = compile_boss_patterns(patterns, known_skills={"SPIN", "DASH"})["NEW_BOSS"]
+        self.assertEqual([rule.skill for rule in program.skills], ["SPIN"])
+        self.assertEqual(program.skills[0].max_dist, 2)
+
+
+class TestBossSystemProgram(unittest.TestCase):
+    def test_new_boss_runs_from_data_only(self):
+        patterns = {"NEW_BOSS": {"skills": [{"skill": "SPIN", "max_dist": 1, "cooldown": 10.0, "timer": "last_skill_time"}]}}
+        world, boss = _boss_world(patterns)
+        boss_sys = BossSystem(world)
+        with patch('random.random', return_value=0.5), patch('time.time', return_value=100.0):
+            boss_sys.process()
+        attacks = [e for e in world.event_manager.event_queue if isinstance(e, DirectionalAttackEvent)]
+        self.assertEqual(len(attacks), 8)
+        b_comp = boss.get_component(BossComponent)
+        self.assertTrue(b_comp.is_engaged)
+        self.assertEqual(b_comp.last_skill_time, 100.0)
+        self.assertEqual(boss.get_component(StatsComponent).last_action_time, 100.0)
+
+    def test_external_cooldown_reset_reschedules(self):
+        patterns = {"NEW_BOSS": {"skills": [{"skill": "SPIN", "max_dist": 1}]}}
+        world, boss = _boss_world(patterns)
+        boss_sys = BossSystem(world)
+        with patch('random.random', return_value=0.5), patch('time.time', return_value=100.0):
+            boss_sys.process()
+        self.assertGreater(boss_sys.scheduler.due_at(boss.entity_id), 100.0)
+        boss.get_component(StatsComponent).last_action_time = 0
+        world.event_manager.event_queue.clear()
+        with patch('random.random', return_value=0.5), patch('time.time', return_value=100.1):
+            boss_sys.process()
+        self.assertTrue(any(isinstance(e, DirectionalAttackEvent) for e in world.event_manager.event_queue))
+
+
+class TestBossBarkTyping(unittest.TestCase):
+    def test_bark_text_depends_on_elapsed_time_only(self):
+        patterns = {"NEW_BOSS": {}}
+        world, boss = _boss_world(patterns)
+        boss_sys = BossSystem(world)
+        with patch('time.time', return_value=100.0):
+            boss_sys._trigger_bark(boss, "Fresh Meat!", duration=2.0)
+        b_comp = boss.get_component(BossComponent)
+        # 로직 틱을 여러 번 돌려도 표시 상태는 바뀌지 않음
+        with patch('time.time', return_value=100.0):
+            for _i in range(20):
+                boss_sys.process()
+        self.assertEqual(b_comp.bark_at(100.0), "F")
+        self.assertEqual(b_comp.bark_at(100.0 + 4 / BOSS_BARK_CHARS_PER_SEC), "Fresh")
+        typed = 100.0 + len("Fresh Meat!") / BOSS_BARK_CHARS_PER_SEC
+        self.assertEqual(b_comp.bark_at(typed + 1.9), "Fresh Meat!")
+        self.assertEqual(b_comp.bark_at(typed + 2.01), "")
+
+
+if __name__ == "__main__":
+    unittest.main()
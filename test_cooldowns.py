@@ -0,0 +1,43 @@
+import unittest
+from types import SimpleNamespace
+from dungeon.components import StatsComponent
+from dungeon.ecs import World
+from dungeon.scheduler import CooldownManager
+
+
+def _cooldown_world():
+    world = World(SimpleNamespace())
+    ent = world.create_entity()
+    world.add_component(ent.entity_id, StatsComponent(max_hp=100, current_hp=100, attack=1, defense=0))
+    return world, ent
+
+
+class TestCooldownManager(unittest.TestCase):
+    def test_bulk_query_purge_and_entity_delete(self):
+        world, ent = _cooldown_world()
+        cds = world.cooldowns
+        cds.set(ent.entity_id, "FIREBALL", 5.0, 100.0)
+        cds.set(ent.entity_id, "HEAL", 1.0, 100.0)
+        self.assertEqual(cds.active(ent.entity_id, 100.5), {"FIREBALL": 4.5, "HEAL": 0.5})
+        self.assertEqual(cds.active(ent.entity_id, 101.0), {"FIREBALL": 4.0})
+        self.assertEqual(cds.purge(101.0), 1)
+        self.assertEqual(len(cds), 1)
+
+        world.delete_entity(ent.entity_id)
+        self.assertEqual(len(cds), 0)
+        self.assertEqual(cds.purge(200.0), 0) # 지워진 엔티티의 힙 항목은 조용히 버려짐
+
+    def test_round_trip_keeps_remaining_time(self):
+        saved = CooldownManager()
+        saved.set(1, "WHIRLWIND", 8.0, 1000.0)
+        data = saved.to_dict(1003.0)
+        self.assertEqual(data, {"1": {"WHIRLWIND": 5.0}})
+
+        loaded = CooldownManager()
+        loaded.load(data, 50.0) # 불러온 쪽의 시계 기준이 달라도 남은 시간은 그대로
+        self.assertEqual(loaded.remaining(1, "WHIRLWIND", 52.0), 3.0)
+        self.assertEqual(loaded.remaining(1, "WHIRLWIND", 55.0), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,34 @@
+import unittest
+from types import SimpleNamespace
+from dungeon.components import PoisonComponent, StatsComponent, StunComponent
+from dungeon.ecs import World
+
+
+def _index_world():
+    world = World(SimpleNamespace())
+    ent = world.create_entity()
+    world.add_component(ent.entity_id, StatsComponent(max_hp=100, current_hp=100, attack=1, defense=0))
+    return world, ent
+
+
+class TestComponentIndex(unittest.TestCase):
+    def test_query_tracks_add_remove_and_delete(self):
+        world, ent = _index_world()
+        other = world.create_entity()
+        other.add_component(StatsComponent(max_hp=10, current_hp=10, attack=1, defense=0))
+        other.add_component(StunComponent(duration=5.0))
+        self.assertEqual(world.get_entities_with_components({StatsComponent}), [ent, other])
+        self.assertEqual(world.get_entities_with_components({StatsComponent, StunComponent}), [other])
+
+        ent.add_component(StunComponent(duration=5.0))
+        other.remove_component(StunComponent)
+        self.assertEqual(world.get_entities_with_components({StatsComponent, StunComponent}), [ent])
+
+        world.delete_entity(ent.entity_id)
+        ent.add_component(PoisonComponent(damage=1, duration=3.0)) # 삭제된 엔티티는 다시 색인되지 않음
+        self.assertEqual(world.get_entities_with_components({StatsComponent}), [other])
+        self.assertEqual(world.get_entities_with_components({PoisonComponent}), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,191 @@
+import random
+import shutil
+import tempfile
+import unittest
+from dungeon.map import DungeonMap, FLOOR, WALL, START_CHAR
+from dungeon.floor_prefetch import FloorPrefetcher, build_floor_map
+from dungeon.floor_cache import FloorCache
+from dungeon.balance_simulator import HeadlessEngine
+from dungeon.components import PositionComponent, MonsterComponent, TrapComponent, ChestComponent
+from dungeon.events import MapTransitionEvent
+from dungeon.modifiers import ModifierManager
+from dungeon.spawn_plan import SPAWN_MONSTER
+
+
+def _floor_snapshot(engine):
+    """층 구조와 몬스터/함정/상자 배치를 비교 가능한 형태로 추출"""
+    placed = []
+    for comp_type in (MonsterComponent, TrapComponent, ChestComponent):
+        for ent in engine.world.get_entities_with_components({comp_type, PositionComponent}):
+            pos = ent.get_component(PositionComponent)
+            placed.append((comp_type.__name__, pos.x, pos.y))
+    return engine.dungeon_map.map_data, sorted(placed)
+
+
+class TestFloorPrefetch(unittest.TestCase):
+    def test_prefetched_map_matches_sync(self):
+        key = (3, 987654, 60, 40, "NORMAL")
+        prefetcher = FloorPrefetcher()
+        prefetcher.schedule(key)
+        prefetched = prefetcher.take(key)
+        prefetcher.shutdown()
+
+        sync_map = build_floor_map(*key)
+        self.assertIsNotNone(prefetched)
+        self.assertEqual(prefetched.map_data, sync_map.map_data)
+        self.assertEqual((prefetched.start_x, prefetched.start_y), (sync_map.start_x, sync_map.start_y))
+        self.assertEqual((prefetched.exit_x, prefetched.exit_y), (sync_map.exit_x, sync_map.exit_y))
+
+    def test_worker_spawn_plan_matches_sync(self):
+        engine = HeadlessEngine("Plan", seed=31337)
+        map_config, width, height, map_type = engine._get_floor_layout(2)
+        key = (2, engine._get_floor_seed(2), width, height, map_type)
+        worker_map, worker_plan = engine.floor_prefetcher.take(key)
+        sync_map, sync_plan = engine._prepare_floor(key, map_config, "START")
+        engine.floor_prefetcher.shutdown()
+
+        def summary(plan):
+            return [(kind, x, y, data['def'].ID, data['prefix'] and data['prefix'].name, data['element'])
+                    if kind == SPAWN_MONSTER else (kind, x, y) for kind, x, y, data in plan.ops]
+
+        self.assertEqual(worker_map.map_data, sync_map.map_data)
+        self.assertEqual(summary(worker_plan), summary(sync_plan))
+        self.assertEqual(worker_plan.floor_rng.spawn.getstate(), sync_plan.floor_rng.spawn.getstate())
+
+    def test_monster_prefix_keeps_shared_definition(self):
+        # 워커와 메인 스레드가 몬스터 정의를 공유하므로 접두어 적용이 원본을 바꾸면 안 됨
+        engine = HeadlessEngine("Prefix", seed=1)
+        engine.floor_prefetcher.shutdown()
+        monster_def = engine.monster_defs["GOBLIN"]
+        flags_before = set(monster_def.flags)
+        manager = ModifierManager()
+        manager.prefixes = {"Burning": {"name_kr": "불타는", "element": "불", "flags": ["BURNING"]}}
+        prefixed = manager.apply_monster_prefix(monster_def, "Burning")
+        self.assertIn("BURNING", prefixed.flags)
+        self.assertIn("불", prefixed.flags)
+        self.assertEqual(monster_def.flags, flags_before)
+
+    def test_prefetched_transition_matches_sync(self):
+        sync = HeadlessEngine("Sync", seed=31337)
+        sync.prefetch_enabled = False
+        sync.floor_prefetcher.shutdown()
+        prefetched = HeadlessEngine("Prefetched", seed=31337)
+        for _ in range(3):
+            for engine in (sync, prefetched):
+                engine.handle_map_transition_event(MapTransitionEvent(target_level=engine.current_level + 1))
+            self.assertEqual(_floor_snapshot(prefetched), _floor_snapshot(sync))
+        prefetched.floor_prefetcher.shutdown()
+
+    def test_take_unknown_key_discards_stale(self):
+        prefetcher = FloorPrefetcher()
+        prefetcher.schedule((2, 1, 60, 40, "NORMAL"))
+        self.assertIsNone(prefetcher.take((2, 2, 60, 40, "NORMAL")))
+        self.assertFalse(prefetcher.is_ready((2, 1, 60, 40, "NORMAL")))
+        prefetcher.shutdown()
+
+
+class TestSeededFloors(unittest.TestCase):
+    def test_same_seed_reproduces_floor(self):
+        a = HeadlessEngine("SeedA", seed=4242)
+        b = HeadlessEngine("SeedB", seed=4242)
+        self.assertEqual(_floor_snapshot(a), _floor_snapshot(b))
+
+    def test_floor_cache_roundtrip(self):
+        cache_dir = tempfile.mkdtemp()
+        try:
+            first = HeadlessEngine("CacheA", seed=77, floor_cache=FloorCache(cache_dir))
+            cache = FloorCache(cache_dir)
+            second = HeadlessEngine("CacheB", seed=77, floor_cache=cache)
+            self.assertEqual(cache.hits, 1)
+            self.assertEqual(_floor_snapshot(first), _floor_snapshot(second))
+            self.assertEqual(second.dungeon_map.rooms[0].center, first.dungeon_map.rooms[0].center)
+        finally:
+            shutil.rmtree(cache_dir)
+
+
+class TestScalableGenerators(unittest.TestCase):
+    def _reachable(self, dm, sx, sy):
+        seen = {(sx, sy)}
+        stack = [(sx, sy)]
+        while stack:
+            x, y = stack.pop()
+            for nx, ny in ((x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)):
+                if (nx, ny) not in seen and not dm.is_wall(nx, ny):
+                    seen.add((nx, ny))
+                    stack.append((nx, ny))
+        return seen
+
+    def test_generators_connect_start_and_exit(self):
+        for map_type in ("BSP", "CAVE"):
+            for size in ((60, 40), (150, 120)):
+                dm = DungeonMap(size[0], size[1], random.Random(11), map_type=map_type)
+                self.assertGreater(len(dm.rooms), 1)
+                self.assertEqual(len(dm.map_data), size[1])
+                self.assertEqual(len(dm.map_data[0]), size[0])
+                self.assertIn((dm.exit_x, dm.exit_y), self._reachable(dm, dm.start_x, dm.start_y))
+                for room in dm.rooms:
+                    self.assertFalse(dm.is_wall(*room.center), f"{map_type} room center is a wall")
+
+
+class TestConnectivity(unittest.TestCase):
+    def test_exit_shares_component_with_start(self):
+        for seed in range(20):
+            dm = DungeonMap(60, 40, random.Random(seed))
+            self.assertTrue(dm.is_reachable(dm.exit_x, dm.exit_y))
+            for room in dm.rooms:
+                for x, y in room.floor_tiles:
+                    self.assertTrue(dm.is_reachable(x, y))
+
+    def test_room_spawns_land_on_reachable_tiles(self):
+        engine = HeadlessEngine("Reach", seed=2024)
+        dm = engine.dungeon_map
+        for ent in engine.world.get_entities_with_components({MonsterComponent, PositionComponent}):
+            if ent.entity_id == 1:
+                continue
+            pos = ent.get_component(PositionComponent)
+            self.assertTrue(dm.is_reachable(pos.x, pos.y), f"monster at unreachable ({pos.x}, {pos.y})")
+
+
+    def test_link_tunnel_keeps_stair_tiles(self):
+        dm = DungeonMap(30, 20, random.Random(1))
+        # 벽으로 막힌 두 구역에 시작점/출구를 놓고 연결 통로를 다시 파게 함
+        dm.map_data = [[WALL] * dm.width for _ in range(dm.height)]
+        dm.rooms, dm.corridors = [], []
+        for x, y in ((3, 3), (4, 3), (20, 12), (21, 12)):
+            dm.map_data[y][x] = FLOOR
+        dm.start_x, dm.start_y, dm.exit_x, dm.exit_y = 3, 3, 21, 12
+        dm.map_data[3][3] = START_CHAR
+        dm.map_data[12][21] = dm.exit_type
+        dm.analyze_connectivity()
+        self.assertEqual(dm.map_data[3][3], START_CHAR)
+        self.assertEqual(dm.map_data[12][21], dm.exit_type)
+        self.assertTrue(dm.is_reachable(dm.exit_x, dm.exit_y))
+
+
+class TestRoomGraph(unittest.TestCase):
+    def test_route_reaches_exit(self):
+        from dungeon.components import MapComponent
+        from dungeon.pathfinding import PathCache
+        for map_type in ("NORMAL", "BSP", "CAVE"):
+            dm = DungeonMap(100, 80, random.Random(11), map_type=map_type)
+            graph = dm.room_graph
+            start, goal = (dm.start_x, dm.start_y), (dm.exit_x, dm.exit_y)
+            route = graph.route(start, goal)
+            self.assertIsNotNone(route, map_type)
+            self.assertEqual(route[-1], goal)
+
+            # 영역 그래프로 중간 목표를 정하며 한 걸음씩 따라가면 출구에 도착
+            mc = MapComponent(dm.width, dm.height, dm.map_data)
+            cache = PathCache()
+            x, y = start
+            for _ in range(dm.width * dm.height):
+                if (x, y) == goal:
+                    break
+                dx, dy = cache.next_step(1, mc, (x, y), goal, room_graph=graph)
+                x, y = x + dx, y + dy
+                self.assertNotEqual(dm.map_data[y][x], '#')
+            self.assertEqual((x, y), goal, map_type)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,37 @@
+import unittest
+from dungeon.clock import FakeClock, FramePacer
+
+
+class TestFramePacer(unittest.TestCase):
+    def test_ticks_follow_elapsed_time_and_catchup_is_capped(self):
+        wall = FakeClock(0.0)
+        pacer = FramePacer(tick_rate=4, render_fps=10, max_catchup=5, source=wall)
+        wall.advance(0.625)
+        self.assertEqual(pacer.advance(), 2) # 0.125초는 다음 프레임으로 이월
+        wall.advance(0.125)
+        self.assertEqual(pacer.advance(), 1)
+        wall.advance(5.0) # 연출 대기 등으로 크게 밀림
+        self.assertEqual(pacer.advance(), 5)
+        self.assertEqual(pacer.dropped_ticks, 15)
+        self.assertEqual(pacer.ticks, 8)
+
+    def test_render_is_capped_and_sleep_uses_remaining_budget(self):
+        wall = FakeClock(0.0)
+        pacer = FramePacer(tick_rate=20, render_fps=10, source=wall)
+        self.assertTrue(pacer.render_due())
+        pacer.rendered()
+        wall.advance(0.05)
+        pacer.advance()
+        self.assertFalse(pacer.render_due())
+        wall.advance(0.01)
+        self.assertAlmostEqual(pacer.sleep_time(), 0.04) # 다음 틱까지
+        wall.advance(0.04)
+        pacer.advance()
+        self.assertTrue(pacer.render_due())
+        pacer.rendered()
+        self.assertAlmostEqual(pacer.stats["avg_frame_ms"], 100.0)
+        self.assertEqual(pacer.stats["frames"], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,371 @@
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+from dungeon.clock import FakeClock
+from dungeon.components import AIComponent, MapComponent, PositionComponent, StatsComponent, StunComponent, SleepComponent
+from dungeon.config import ALERT_SOURCES_PER_TICK
+from dungeon.batch_ai import BatchChasePlanner, batch_available
+from dungeon.ecs import Entity, World
+from dungeon.los import LineOfSight
+from dungeon.pathfinding import DistanceField, PathCache, UNREACHED, astar, build_passable
+from dungeon.scheduler import ActionScheduler, FrameBudget
+from dungeon.systems import MonsterAISystem
+
+
+def _make_map(rows):
+    tiles = [list(r) for r in rows]
+    return MapComponent(len(tiles[0]), len(tiles), tiles)
+
+
+class TestLineOfSight(unittest.TestCase):
+    ROWS = [
+        "#########",
+        "#.......#",
+        "#...#...#",
+        "#.......#",
+        "#########",
+    ]
+
+    def test_wall_blocks_sight(self):
+        mc = _make_map(self.ROWS)
+        los = LineOfSight()
+        self.assertFalse(los.can_see(mc, 2, 2, 6, 2))
+        self.assertTrue(los.can_see(mc, 1, 1, 7, 1))
+        # 대칭성: 방향이 바뀌어도 결과와 캐시 항목이 같음
+        self.assertEqual(los.can_see(mc, 6, 2, 2, 2), los.can_see(mc, 2, 2, 6, 2))
+        self.assertEqual(los.misses, 2)
+
+    def test_version_bump_invalidates_cache(self):
+        mc = _make_map(self.ROWS)
+        los = LineOfSight()
+        self.assertFalse(los.can_see(mc, 2, 2, 6, 2))
+        mc.tiles[2][4] = '.'
+        mc.version += 1
+        self.assertTrue(los.can_see(mc, 2, 2, 6, 2))
+
+    def test_batch_visibility(self):
+        mc = _make_map(self.ROWS)
+        los = LineOfSight()
+        visible = los.visible_from(mc, (2, 2), [(10, (3, 1)), (11, (6, 2)), (12, (7, 3))], radius=4)
+        # 11은 벽 뒤, 12는 반경 밖
+        self.assertEqual(visible, {10})
+
+
+class TestChaseField(unittest.TestCase):
+    # 목표(@ 위치 = (1, 1))와 몬스터 사이를 벽이 가로막아 탐욕 이동으로는 갇히는 구조
+    ROWS = [
+        "#######",
+        "#.....#",
+        "####..#",
+        "#.....#",
+        "#######",
+    ]
+
+    def test_distances_follow_corridors(self):
+        mc = _make_map(self.ROWS)
+        field = DistanceField()
+        self.assertTrue(field.update(mc, (1, 1)))
+        self.assertEqual(field.distance_at(1, 3), 8)
+        self.assertEqual(field.distance_at(0, 0), UNREACHED)
+        # 같은 목표/맵 버전이면 재계산하지 않음
+        self.assertFalse(field.update(mc, (1, 1)))
+
+    def test_downhill_walks_around_wall(self):
+        mc = _make_map(self.ROWS)
+        field = DistanceField()
+        field.update(mc, (1, 1))
+        x, y = 1, 3
+        for _ in range(8):
+            dx, dy = field.downhill_step(x, y)
+            x, y = x + dx, y + dy
+            self.assertNotEqual(mc.tiles[y][x], '#')
+        self.assertEqual((x, y), (1, 1))
+
+    def test_blocked_neighbour_is_avoided(self):
+        mc = _make_map(self.ROWS)
+        field = DistanceField()
+        field.update(mc, (1, 1))
+        # 두 방향 모두 내리막이면 차이가 큰 x축 우선, 막혀 있으면 다른 내리막으로
+        self.assertEqual(field.downhill_step(5, 3), (-1, 0))
+        self.assertEqual(field.downhill_step(5, 3, blocked={(4, 3)}), (0, -1))
+        # 유일한 내리막이 막히면 멀어지지 않고 제자리
+        self.assertIsNone(field.downhill_step(2, 3, blocked={(3, 3)}))
+
+
+class TestFleeMap(unittest.TestCase):
+    ROWS = [
+        "##########",
+        "#........#",
+        "#........#",
+        "#........#",
+        "##########",
+    ]
+
+    def test_flee_slides_along_wall(self):
+        mc = _make_map(self.ROWS)
+        field = DistanceField(with_safety=True)
+        field.update(mc, (3, 2))
+        # 반대 방향(x-1)은 벽이므로 단순 도주는 제자리에 붙지만, 도주 지도는 벽을 따라 빠져나감
+        dx, dy = field.flee_step(1, 2)
+        self.assertEqual(dx, 0)
+        self.assertGreater(field.distance_at(1, 2 + dy), field.distance_at(1, 2))
+
+    def test_flee_keeps_moving_away(self):
+        mc = _make_map(self.ROWS)
+        field = DistanceField(with_safety=True)
+        field.update(mc, (1, 2))
+        x, y = 2, 2
+        for _ in range(6):
+            step = field.flee_step(x, y)
+            if step is None:
+                break
+            x, y = x + step[0], y + step[1]
+        self.assertGreaterEqual(field.distance_at(x, y), 7)
+
+    def test_safety_disabled(self):
+        mc = _make_map(self.ROWS)
+        field = DistanceField()
+        field.update(mc, (3, 2))
+        self.assertIsNone(field.flee_step(1, 2))
+
+
+class TestAStar(unittest.TestCase):
+    ROWS = [
+        "#######",
+        "#.....#",
+        "####..#",
+        "#.....#",
+        "#######",
+    ]
+
+    def test_path_goes_around_wall(self):
+        mc = _make_map(self.ROWS)
+        path = astar(build_passable(mc), mc.width, (1, 3), (1, 1))
+        self.assertEqual(len(path), 8)
+        self.assertEqual(path[-1], (1, 1))
+        self.assertTrue(all(mc.tiles[y][x] != '#' for x, y in path))
+
+    def test_octile_is_shorter(self):
+        mc = _make_map(TestFleeMap.ROWS)
+        passable = build_passable(mc)
+        self.assertEqual(len(astar(passable, mc.width, (1, 1), (4, 3))), 5)
+        self.assertEqual(len(astar(passable, mc.width, (1, 1), (4, 3), diagonal=True)), 3)
+
+    def test_budget_and_partial(self):
+        mc = _make_map(self.ROWS)
+        passable = build_passable(mc)
+        self.assertIsNone(astar(passable, mc.width, (5, 3), (1, 1), max_nodes=2))
+        partial = astar(passable, mc.width, (5, 3), (1, 1), max_nodes=2, allow_partial=True)
+        self.assertTrue(partial)
+        self.assertNotEqual(partial[-1], (1, 1))
+        self.assertIsNone(astar(passable, mc.width, (1, 3), (0, 0)))
+
+    def test_cache_reuses_until_blocked(self):
+        mc = _make_map(self.ROWS)
+        cache = PathCache()
+        x, y = 1, 3
+        dx, dy = cache.next_step(7, mc, (x, y), (1, 1))
+        x, y = x + dx, y + dy
+        # 목표가 조금 움직여도 경로를 재사용
+        dx, dy = cache.next_step(7, mc, (x, y), (2, 1))
+        x, y = x + dx, y + dy
+        self.assertEqual((cache.replans, cache.reuses), (1, 1))
+        # 경로 위의 칸이 벽이 되면 다시 계산
+        mc.tiles[3][4] = '#'
+        mc.version += 1
+        cache.next_step(7, mc, (x, y), (2, 1))
+        self.assertEqual(cache.replans, 2)
+
+
+class TestActionScheduler(unittest.TestCase):
+    def test_only_due_entities_are_popped(self):
+        sched = ActionScheduler()
+        sched.schedule(1, 2.0)
+        sched.schedule(2, 0.5)
+        sched.schedule(3, 1.0)
+        self.assertEqual(sched.pop_due(1.0), [2, 3])
+        # 꺼낸 엔티티는 다시 예약할 때까지 일정에 없음
+        self.assertNotIn(2, sched)
+        self.assertEqual(sched.pop_due(1.5), [])
+        self.assertEqual(sched.pop_due(2.0), [1])
+
+    def test_reschedule(self):
+        sched = ActionScheduler()
+        sched.schedule(1, 1.0)
+        sched.schedule(1, 3.0) # 이전 항목은 꺼낼 때 버려짐
+        self.assertEqual(sched.pop_due(2.0), [])
+        self.assertEqual(sched.due_at(1), 3.0)
+        self.assertEqual(sched.pop_due(3.0), [1])
+
+    def test_sync_adds_and_drops(self):
+        sched = ActionScheduler()
+        sched.schedule(1, 9.0)
+        sched.sync([2, 3], now=1.0)
+        self.assertNotIn(1, sched)
+        self.assertEqual(sorted(sched.pop_due(1.0)), [2, 3])
+
+    def test_disabled_until_uses_longest_status(self):
+        ent = Entity(5)
+        self.assertEqual(MonsterAISystem._disabled_until(ent, 10.0), 0.0)
+        ent.add_component(StunComponent(duration=0.5))
+        ent.add_component(SleepComponent(duration=2.0))
+        self.assertEqual(MonsterAISystem._disabled_until(ent, 10.0), 12.0)
+
+
+class TestAlertPropagation(unittest.TestCase):
+    def _spawn(self, world, x, y, behavior=AIComponent.STATIONARY, faction="MONSTER"):
+        ent = world.create_entity()
+        world.add_component(ent.entity_id, PositionComponent(x, y))
+        world.add_component(ent.entity_id, AIComponent(behavior=behavior, faction=faction))
+        return ent
+
+    def test_flood_chains_through_nest_once(self):
+        world = World(None)
+        ai_sys = MonsterAISystem(world)
+        source = self._spawn(world, 0, 0, AIComponent.CHASE)
+        # 5칸 간격의 사슬: 발신자 반경(7) 밖의 몬스터도 연쇄로 깨어남
+        chain = [self._spawn(world, 5 * i, 0) for i in range(1, 4)]
+        far = self._spawn(world, 40, 0)
+        summon = self._spawn(world, 1, 0, faction="PLAYER")
+        ai_sys._alert_queue.append(source.entity_id)
+        ai_sys._alerted.add(source.entity_id)
+
+        entities = [source, *chain, far, summon]
+        while ai_sys._alert_queue:
+            ai_sys._propagate_alerts(entities, 0.0, {})
+        self.assertTrue(all(e.get_component(AIComponent).behavior == AIComponent.CHASE for e in chain))
+        self.assertEqual(far.get_component(AIComponent).behavior, AIComponent.STATIONARY)
+        self.assertEqual(summon.get_component(AIComponent).behavior, AIComponent.STATIONARY)
+        self.assertEqual(ai_sys._alerted, {source.entity_id, *(e.entity_id for e in chain)})
+
+    def test_sources_per_tick_are_capped(self):
+        world = World(None)
+        ai_sys = MonsterAISystem(world)
+        sources = [self._spawn(world, 20 * i, 0, AIComponent.CHASE) for i in range(ALERT_SOURCES_PER_TICK + 3)]
+        ai_sys._alert_queue.extend(e.entity_id for e in sources)
+        ai_sys._propagate_alerts(sources, 0.0, {})
+        self.assertEqual(len(ai_sys._alert_queue), 3)
+
+
+@unittest.skipUnless(batch_available(), "NumPy not installed")
+class TestBatchPlanner(unittest.TestCase):
+    ROWS = [
+        "##########",
+        "#........#",
+        "#.####...#",
+        "#....#...#",
+        "######...#",
+        "##########",
+    ]
+
+    def test_steps_match_scalar_field(self):
+        mc = _make_map(self.ROWS)
+        field = DistanceField()
+        goal = (1, 3)
+        field.update(mc, goal)
+        cells = [(x, y) for y in range(mc.height) for x in range(mc.width) if mc.tiles[y][x] == '.']
+        plan = BatchChasePlanner().plan([x for x, _y in cells], [y for _x, y in cells], [AIComponent.CHASE] * len(cells),
+                                        [5] * len(cells), goal, max_chase_range=99, field=field)
+        for i, (x, y) in enumerate(cells):
+            expected = field.downhill_step(x, y) if plan.dist[i] > 1 else None
+            got = (int(plan.dx[i]), int(plan.dy[i])) if plan.step_ok[i] else None
+            self.assertEqual(got, expected, (x, y))
+
+    def test_detection_and_chase_range(self):
+        plan = BatchChasePlanner().plan([2, 6, 9, 2], [1, 1, 1, 2],
+                                        [AIComponent.STATIONARY, AIComponent.STATIONARY, AIComponent.CHASE, AIComponent.CHASE],
+                                        [3, 3, 3, 3], (1, 1), max_chase_range=7)
+        # 탐지 범위 안 정지형 → 공격, 탐지 범위 밖 정지형 → 대기, 추적 범위 밖 추적형 → 추적 해제
+        self.assertEqual(plan.attack.tolist(), [True, False, False, False])
+        self.assertEqual(plan.idle.tolist(), [False, True, True, False])
+        self.assertEqual(plan.drop_chase.tolist(), [False, False, True, False])
+        self.assertEqual(plan.chase.tolist(), [True, False, False, True])
+
+
+class TestFrameBudget(unittest.TestCase):
+    def _world(self):
+        world = World(None)
+        player = world.create_entity()
+        world.add_component(player.entity_id, PositionComponent(10, 10))
+        world.add_component(player.entity_id, StatsComponent(max_hp=10, current_hp=10, attack=1, defense=0))
+        monsters = []
+        # 탐지 범위 0: 모두 할 일 없이 대기하므로 예산 분배만 확인
+        for x, y in ((30, 30), (31, 30), (32, 30), (33, 30), (11, 11)):
+            ent = world.create_entity()
+            world.add_component(ent.entity_id, PositionComponent(x, y))
+            world.add_component(ent.entity_id, AIComponent(detection_range=0))
+            world.add_component(ent.entity_id, StatsComponent(max_hp=5, current_hp=5, attack=1, defense=0))
+            monsters.append(ent.entity_id)
+        return world, monsters
+
+    def test_entity_budget_carries_over_round_robin(self):
+        world, monsters = self._world()
+        ai_sys = MonsterAISystem(world)
+        ai_sys.budget = FrameBudget(max_entities=2)
+        with patch('time.time', return_value=100.0):
+            ai_sys.process()
+        # 플레이어 옆 몬스터 + 예약 순서상 첫 몬스터만 처리, 나머지 3마리는 이월
+        self.assertEqual(ai_sys.last_budget_report["processed"], 2)
+        self.assertEqual(ai_sys.last_budget_report["deferred"], 3)
+        self.assertEqual(ai_sys.last_budget_report["used"], 1.0)
+        # 이월된 몬스터는 원래 시각으로, 처리된 몬스터는 대기 재확인 시각으로 예약
+        self.assertEqual([ai_sys.scheduler.due_at(eid) for eid in monsters[1:4]], [100.0] * 3)
+        self.assertGreater(ai_sys.scheduler.due_at(monsters[0]), 100.0)
+        with patch('time.time', return_value=100.01):
+            ai_sys.process()
+        self.assertEqual(ai_sys.last_budget_report["processed"], 2)
+        self.assertEqual(ai_sys.last_budget_report["deferred"], 1)
+
+    def test_unlimited_budget_processes_everyone(self):
+        world, _monsters = self._world()
+        ai_sys = MonsterAISystem(world)
+        ai_sys.budget = FrameBudget()
+        with patch('time.time', return_value=100.0):
+            ai_sys.process()
+        self.assertEqual(ai_sys.last_budget_report["processed"], 5)
+        self.assertEqual(ai_sys.last_budget_report["deferred"], 0)
+
+
+class TestTurboIdle(unittest.TestCase):
+    def _world(self, turbo):
+        engine = SimpleNamespace(turbo=turbo, player_step_interval=lambda: 1.0)
+        world = World(engine, clock=FakeClock(100.0))
+        player = world.create_entity()
+        world.add_component(player.entity_id, PositionComponent(10, 10))
+        world.add_component(player.entity_id, StatsComponent(max_hp=10, current_hp=10, attack=1, defense=0))
+        # 추적 범위(15)보다 25칸 먼 몬스터
+        monster = world.create_entity()
+        world.add_component(monster.entity_id, PositionComponent(50, 10))
+        world.add_component(monster.entity_id, AIComponent(behavior=AIComponent.CHASE, detection_range=5))
+        world.add_component(monster.entity_id, StatsComponent(max_hp=5, current_hp=5, attack=1, defense=0))
+        return world, player, monster.entity_id
+
+    def test_far_monster_waits_until_player_could_arrive(self):
+        world, _player, eid = self._world(turbo=True)
+        ai_sys = MonsterAISystem(world)
+        ai_sys.process()
+        # 한 칸에 1초씩 걸어와도 25초 동안은 추적 범위에 들 수 없음
+        self.assertEqual(ai_sys.scheduler.due_at(eid), 125.0)
+        world.clock.advance(1.0)
+        self.assertFalse(ai_sys.has_work())
+
+        world, _player, eid = self._world(turbo=False)
+        ai_sys = MonsterAISystem(world)
+        ai_sys.process()
+        self.assertEqual(ai_sys.scheduler.due_at(eid), 100.25)
+
+    def test_player_teleport_wakes_far_monster(self):
+        world, player, eid = self._world(turbo=True)
+        ai_sys = MonsterAISystem(world)
+        ai_sys.process()
+        world.clock.advance(1.0)
+        pos = player.get_component(PositionComponent)
+        pos.x = 40
+        self.assertTrue(ai_sys.has_work())
+        ai_sys.process()
+        # 깨어나 다시 판단했으므로 오래 쉬는 예약은 사라짐
+        self.assertLess(ai_sys.scheduler.due_at(eid), 125.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+import io
+import unittest
+from dungeon.renderer import COLOR_MAP, RESET, Renderer
+
+
+def _renderer(width=20, height=4):
+    stream = io.StringIO()
+    renderer = Renderer(width, height, stream=stream)
+    return renderer, stream
+
+
+def _frame(renderer, stream, draw):
+    stream.seek(0)
+    stream.truncate()
+    renderer.clear_buffer()
+    draw(renderer)
+    renderer.render()
+    return stream.getvalue()
+
+
+class TestDiffRenderer(unittest.TestCase):
+    def test_only_changed_cells_are_written(self):
+        renderer, stream = _renderer()
+        first = _frame(renderer, stream, lambda r: r.draw_text(0, 0, "HP 100", "red"))
+        self.assertTrue(first.startswith("\033[H")) # 첫 프레임은 전체 출력
+
+        unchanged = _frame(renderer, stream, lambda r: r.draw_text(0, 0, "HP 100", "red"))
+        self.assertEqual(unchanged, "")
+
+        out = _frame(renderer, stream, lambda r: r.draw_text(0, 0, "HP 95", "red"))
+        # 바뀐 칸(3~5열)만: 커서 이동 + "95" + 이전 "0"을 지우는 공백
+        self.assertTrue(out.startswith("\033[1;4H"))
+        self.assertNotIn("HP", out)
+        self.assertEqual(out, "\033[1;4H" + COLOR_MAP["red"] + "95" + RESET + " ")
+        self.assertEqual(renderer.stats["full_redraws"], 1)
+        self.assertLess(renderer.stats["last_bytes"], len(first))
+
+    def test_wide_char_rewrites_from_left_cell(self):
+        renderer, stream = _renderer()
+        _frame(renderer, stream, lambda r: r.draw_text(2, 1, "가나", "white"))
+        # 광폭 문자의 오른쪽 칸만 바뀌어도 왼쪽 칸부터 다시 씀
+        out = _frame(renderer, stream, lambda r: r.draw_text(2, 1, "가ab", "white"))
+        self.assertTrue(out.startswith("\033[2;5H"))
+        out = _frame(renderer, stream, lambda r: r.draw_text(2, 1, "가a", "white"))
+        self.assertTrue(out.startswith("\033[2;6H"))
+
+    def test_color_codes_only_where_color_changes(self):
+        renderer, stream = _renderer(width=12, height=1)
+        def draw(r):
+            r.draw_text(0, 0, "....", "dark_grey")
+            r.draw_char(4, 0, "@", "white_bg")
+            r.draw_text(5, 0, "..", "red")
+        out = _frame(renderer, stream, draw)
+        # 같은 색 4칸은 코드 한 번, 배경색 다음에는 초기화 후 새 색, 빈칸 앞에서 초기화
+        self.assertEqual(out, "\033[H" + COLOR_MAP["dark_grey"] + "...." + COLOR_MAP["white_bg"] + "@"
+                         + RESET + COLOR_MAP["red"] + ".." + RESET + " " * 5)
+
+    def test_invalidate_forces_full_redraw(self):
+        renderer, stream = _renderer()
+        _frame(renderer, stream, lambda r: r.draw_text(0, 0, "menu", "white"))
+        renderer.invalidate() # 다른 코드가 화면에 직접 그림
+        out = _frame(renderer, stream, lambda r: r.draw_text(0, 0, "menu", "white"))
+        self.assertTrue(out.startswith("\033[H"))
+        self.assertEqual(out.count("\n"), 3)
+        self.assertEqual(renderer.stats["full_redraws"], 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+import unittest
+from types import SimpleNamespace
+from dungeon.clock import FakeClock
+from dungeon.components import (ManaShieldComponent, PetrifiedComponent, PoisonComponent, StatModifierComponent,
+                                StatsComponent, StunComponent, SleepComponent)
+from dungeon.ecs import World
+from dungeon.status_effects import (STATUS_BY_COMPONENT, active_statuses, apply_status, clear_statuses, disabled_remaining,
+                                    modifier_totals, status_snapshot, top_status)
+
+
+def _status_world():
+    world = World(SimpleNamespace(), clock=FakeClock(100.0))
+    ent = world.create_entity()
+    ent.add_component(StatsComponent(max_hp=100, current_hp=100, attack=1, defense=0))
+    return world, ent
+
+
+class TestStatusEffectTable(unittest.TestCase):
+    def test_stacking_rules(self):
+        _world, ent = _status_world()
+        # IGNORE: 기절 중에 다시 기절시켜도 남은 시간은 늘어나지 않음 (마나 실드도 같음)
+        apply_status(ent, StunComponent(duration=2.0))
+        self.assertIsNone(apply_status(ent, StunComponent(duration=3.0)))
+        self.assertEqual(len(ent.get_components(StunComponent)), 1)
+        self.assertAlmostEqual(ent.get_component(StunComponent).duration, 2.0)
+        apply_status(ent, ManaShieldComponent(duration=10.0))
+        self.assertIsNone(apply_status(ent, ManaShieldComponent(duration=60.0)))
+        self.assertAlmostEqual(ent.get_component(ManaShieldComponent).duration, 10.0)
+        # REFRESH: 인스턴스는 하나, 남은 시간은 긴 쪽
+        apply_status(ent, SleepComponent(duration=2.0))
+        apply_status(ent, SleepComponent(duration=1.0))
+        apply_status(ent, SleepComponent(duration=3.0))
+        self.assertEqual(len(ent.get_components(SleepComponent)), 1)
+        self.assertAlmostEqual(ent.get_component(SleepComponent).duration, 3.0)
+        # IGNORE: 이미 중독이면 새 독은 무시
+        apply_status(ent, PoisonComponent(damage=5, duration=10.0))
+        self.assertIsNone(apply_status(ent, PoisonComponent(damage=50, duration=10.0)))
+        self.assertEqual(ent.get_component(PoisonComponent).damage, 5)
+        # STACK: 효과 표의 max_stacks까지 쌓이고 지속시간 갱신
+        for _ in range(4):
+            petrified = apply_status(ent, PetrifiedComponent(duration=5.0))
+        self.assertEqual(petrified.stacks, STATUS_BY_COMPONENT[PetrifiedComponent].max_stacks)
+        self.assertEqual(petrified.stacks, 3)
+        self.assertEqual(len(ent.get_components(PetrifiedComponent)), 1)
+
+    def test_priority_snapshot_and_cleanup_in_one_pass(self):
+        _world, ent = _status_world()
+        apply_status(ent, ManaShieldComponent(duration=60.0))
+        apply_status(ent, SleepComponent(duration=4.0))
+        apply_status(ent, PoisonComponent(damage=7, duration=10.0))
+        effect, _comp = top_status(ent)
+        self.assertEqual(effect.effect_id, "SLEEP")
+        self.assertEqual([e.effect_id for e, _c in active_statuses(ent)], ["SLEEP", "POISON", "MANA_SHIELD"])
+        self.assertIn(("POISON", 10.0, 1, 7), status_snapshot(ent))
+        self.assertAlmostEqual(disabled_remaining(ent), 4.0)
+
+        clear_statuses(ent)
+        self.assertEqual(active_statuses(ent), [])
+        self.assertEqual(disabled_remaining(ent), 0.0)
+        self.assertTrue(ent.has_component(StatsComponent))
+
+
+class TestModifierTotals(unittest.TestCase):
+    def test_totals_are_cached_until_modifiers_change(self):
+        _world, ent = _status_world()
+        potion = StatModifierComponent(str_mod=5, duration=30.0, source="ITEM_힘의 물약")
+        ent.add_component(potion)
+        rage = StatModifierComponent(dex_mod=2, duration=10.0, source="레이지")
+        rage.attack_multiplier = 2.0
+        rage.defense_multiplier = 1.5
+        ent.add_component(rage)
+
+        totals = modifier_totals(ent)
+        self.assertEqual((totals.str_mod, totals.dex_mod), (5, 2))
+        self.assertEqual((totals.attack_multiplier, totals.defense_multiplier), (2.0, 1.5))
+        self.assertIs(modifier_totals(ent), totals) # 변경이 없으면 다시 합산하지 않음
+
+        ent.remove_component_instance(rage) # 만료
+        totals = modifier_totals(ent)
+        self.assertEqual((totals.dex_mod, totals.attack_multiplier), (0, 1.0))
+        self.assertEqual(list(totals.sources), ["ITEM_힘의 물약"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+from dungeon.clock import FakeClock, ScaledClock
+from dungeon.components import BleedingComponent, PoisonComponent, StatsComponent, StunComponent
+from dungeon.ecs import World
+from dungeon.systems import TimeSystem
+
+
+def _time_world():
+    engine = SimpleNamespace(_get_entity_name=lambda entity: f"Entity {entity.entity_id}")
+    world = World(engine)
+    ent = world.create_entity()
+    world.add_component(ent.entity_id, StatsComponent(max_hp=100, current_hp=100, attack=1, defense=0))
+    return world, ent
+
+
+class TestTimeSystemTimers(unittest.TestCase):
+    def test_status_expires_at_its_time_only(self):
+        world, ent = _time_world()
+        time_sys = TimeSystem(world)
+        with patch('time.time', return_value=100.0):
+            ent.add_component(StunComponent(duration=2.0))
+        stun = ent.get_component(StunComponent)
+        with patch('time.time', return_value=101.0):
+            time_sys.process()
+            self.assertAlmostEqual(stun.duration, 1.0)
+        with patch('time.time', return_value=101.5):
+            stun.duration = 3.0 # 지속시간 갱신 -> 104.5에 만료
+        with patch('time.time', return_value=102.5):
+            time_sys.process()
+        self.assertTrue(ent.has_component(StunComponent))
+        with patch('time.time', return_value=104.5):
+            time_sys.process()
+        self.assertFalse(ent.has_component(StunComponent))
+
+    def test_poison_ticks_every_second(self):
+        world, ent = _time_world()
+        time_sys = TimeSystem(world)
+        with patch('time.time', return_value=100.0):
+            ent.add_component(PoisonComponent(damage=5, duration=3.5))
+            time_sys.process()
+        stats = ent.get_component(StatsComponent)
+        for now in (100.5, 101.0, 101.7, 102.0, 103.0, 103.5, 104.0):
+            with patch('time.time', return_value=now):
+                time_sys.process()
+        self.assertEqual(stats.current_hp, 85)
+        self.assertFalse(ent.has_component(PoisonComponent))
+
+    def test_dot_outcome_independent_of_tick_rate(self):
+        def run(step):
+            engine = SimpleNamespace(_get_entity_name=lambda entity: f"Entity {entity.entity_id}")
+            clock = FakeClock(100.0)
+            world = World(engine, clock=clock)
+            ent = world.create_entity()
+            world.add_component(ent.entity_id, StatsComponent(max_hp=100, current_hp=100, attack=1, defense=0))
+            time_sys = TimeSystem(world)
+            ent.add_component(PoisonComponent(damage=5, duration=3.5))
+            ent.add_component(BleedingComponent(damage=2, duration=5, tick_interval=0.5))
+            time_sys.process()
+            while clock.now() < 106.0:
+                clock.advance(step)
+                time_sys.process()
+            return ent.get_component(StatsComponent).current_hp
+
+        # 중독 3틱(15) + 출혈 10틱(20): 프레임 간격과 무관하게 같은 결과 (밀린 틱은 한 번에 적용)
+        with patch('random.random', side_effect=AssertionError), patch('random.expovariate', side_effect=AssertionError):
+            self.assertEqual(run(0.05), 65)
+            self.assertEqual(run(0.7), 65)
+            self.assertEqual(run(6.0), 65)
+
+    def test_components_off_world_do_not_age(self):
+        stun = StunComponent(duration=2.0)
+        self.assertEqual(stun.duration, 2.0)
+
+
+class TestWorldClock(unittest.TestCase):
+    def test_fake_clock_drives_timers_without_patching(self):
+        engine = SimpleNamespace(_get_entity_name=lambda entity: f"Entity {entity.entity_id}")
+        clock = FakeClock(500.0)
+        world = World(engine, clock=clock)
+        ent = world.create_entity()
+        world.add_component(ent.entity_id, StatsComponent(max_hp=100, current_hp=100, attack=1, defense=0))
+        time_sys = TimeSystem(world)
+        ent.add_component(StunComponent(duration=2.0))
+        self.assertEqual(ent.get_component(StunComponent).expires_at, 502.0)
+        clock.advance(1.5)
+        time_sys.process()
+        self.assertTrue(ent.has_component(StunComponent))
+        clock.advance(0.5)
+        time_sys.process()
+        self.assertFalse(ent.has_component(StunComponent))
+
+    def test_scaled_clock_keeps_continuity_on_rescale(self):
+        source = FakeClock(10.0)
+        clock = ScaledClock(4.0, source)
+        source.advance(1.0)
+        self.assertEqual(clock.now(), 14.0)
+        clock.scale = 1.0
+        source.advance(1.0)
+        self.assertEqual(clock.now(), 15.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
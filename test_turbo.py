@@ -0,0 +1,118 @@
+import unittest
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+from dungeon.balance_simulator import HeadlessEngine
+from dungeon.components import DesiredPositionComponent, MessageComponent, StatsComponent, StunComponent
+from dungeon.ecs import System, World
+from dungeon.events import MessageEvent
+from dungeon.sound_system import SoundSystem
+from dungeon.systems import MonsterAISystem, MovementSystem, RegenerationSystem, RenderSystem
+
+
+def _engine(turbo=True):
+    engine = HeadlessEngine("Turbo", seed=5, turbo=turbo)
+    return engine, engine.world.get_player_entity()
+
+
+class TestTurboStep(unittest.TestCase):
+    def test_stunned_player_jumps_to_next_due_time(self):
+        engine, player = _engine()
+        now = engine.world.clock.now()
+        player.add_component(StunComponent(duration=6.0))
+        # 아무것도 예약되지 않았으면 기절이 풀리는 시각까지 한 턴으로
+        self.assertEqual(engine.next_scheduled_time(), now + 6.0)
+        self.assertAlmostEqual(engine._turn_step(), 6.0)
+        # 그 전에 몬스터 행동이 예약되어 있으면 거기까지만
+        engine.world.get_system(MonsterAISystem).scheduler.schedule(99, now + 2.5)
+        self.assertAlmostEqual(engine._turn_step(), 2.5)
+
+    def test_step_never_shorter_than_agent_turn(self):
+        engine, player = _engine()
+        # 플레이어가 바로 행동할 수 있으면 에이전트 턴 간격 그대로
+        self.assertLessEqual(engine.next_scheduled_time(), engine.world.clock.now())
+        self.assertEqual(engine._turn_step(), HeadlessEngine.TURN_SECONDS)
+
+        normal, player = _engine(turbo=False)
+        player.add_component(StunComponent(duration=6.0))
+        self.assertEqual(normal._turn_step(), HeadlessEngine.TURN_SECONDS)
+
+    def test_next_scheduled_time_without_player(self):
+        engine, _player = _engine()
+        self.assertIsNone(engine.next_scheduled_time(include_player=False))
+        now = engine.world.clock.now()
+        engine.world.get_system(MonsterAISystem).scheduler.schedule(99, now + 3.0)
+        self.assertEqual(engine.next_scheduled_time(include_player=False), now + 3.0)
+
+    def test_idle_systems_report_no_work(self):
+        engine, player = _engine()
+        movement = engine.world.get_system(MovementSystem)
+        self.assertFalse(movement.has_work())
+        player.add_component(DesiredPositionComponent(dx=1, dy=0))
+        self.assertTrue(movement.has_work())
+
+        ai_sys = engine.world.get_system(MonsterAISystem)
+        ai_sys.process()
+        # 방금 모두 처리했으므로 다음 예약 시각 전까지는 할 일이 없음
+        self.assertFalse(ai_sys.has_work())
+        engine.world.clock.advance(ai_sys.scheduler.next_due() - engine.world.clock.now())
+        self.assertTrue(ai_sys.has_work())
+
+    def test_regeneration_catches_up_after_jump(self):
+        engine, player = _engine()
+        stats = player.get_component(StatsComponent)
+        stats.current_hp = stats.max_hp - 10
+        regen = engine.world.get_system(RegenerationSystem)
+        regen.last_hp_regen_time = engine.world.clock.now()
+        # 기절 구간을 한 턴에 건너뛰어도 지난 초만큼 회복하고, 남은 0.5초는 다음 턴으로 이월
+        engine.world.clock.advance(6.5)
+        regen.process()
+        self.assertEqual(stats.current_hp, stats.max_hp - 4)
+        engine.world.clock.advance(0.5)
+        regen.process()
+        self.assertEqual(stats.current_hp, stats.max_hp - 3)
+
+
+class TestTurboSkipsPresentation(unittest.TestCase):
+    def _world(self, turbo):
+        return World(SimpleNamespace(turbo=turbo, _render=Mock()))
+
+    def test_animate_does_not_render_or_sleep(self):
+        world = self._world(turbo=True)
+        with patch('time.sleep') as sleep:
+            System(world)._animate(0.15)
+        sleep.assert_not_called()
+        world.engine._render.assert_not_called()
+
+        world = self._world(turbo=False)
+        with patch('time.sleep') as sleep:
+            System(world)._animate(0.15)
+        sleep.assert_called_once_with(0.15)
+        world.engine._render.assert_called_once()
+
+    def test_message_log_is_skipped(self):
+        for turbo, expected in ((True, 0), (False, 1)):
+            world = self._world(turbo)
+            log = world.create_entity()
+            world.add_component(log.entity_id, MessageComponent())
+            RenderSystem(world).handle_message_event(MessageEvent("메시지"))
+            self.assertEqual(len(log.get_component(MessageComponent).messages), expected)
+
+    def test_sound_is_skipped(self):
+        world = self._world(turbo=True)
+        sound = SoundSystem(world)
+        with patch('subprocess.Popen') as popen:
+            sound._play_sound("HIT", "쾅")
+        popen.assert_not_called()
+        self.assertEqual(sound.last_played, {})
+        self.assertEqual(world.event_manager.event_queue, [])
+
+        world = self._world(turbo=False)
+        sound = SoundSystem(world)
+        with patch('subprocess.Popen'):
+            sound._play_sound("HIT", "쾅")
+        self.assertIn("HIT", sound.last_played)
+        self.assertEqual(len(world.event_manager.event_queue), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()